@@ -0,0 +1,87 @@
+"""
+Compara a quantidade de cidades expandidas e o tempo de consulta do A* com a heurística euclidiana e com
+a heurística ALT (pontos de referência), em um mapa geométrico aleatório com as coordenadas corretas e
+no mesmo mapa sem coordenadas, em que todas as cidades ficam em (0, 0). Termina com código de saída 1 se
+alguma distância divergir da do Dijkstra.
+
+Execute a partir da raiz do projeto:
+
+    python -m Benchmarks.benchmark_alt [quantidade_de_cidades]
+"""
+from os import path
+from random import Random
+from sys import argv, exit
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Exceptions.RotaNaoEncontradaError import RotaNaoEncontradaError
+from Models.Mapa import Mapa
+from Models.Rota import Rota
+
+CONSULTAS_POR_MAPA: int = 50
+ALGORITMOS: tuple[str, ...] = ("dijkstra", "a_estrela", "alt")
+
+def medir(mapa: 'Mapa', pares: list[tuple[str, str]], algoritmo: str) -> tuple[list[int], float, float]:
+    """
+    Calcula as rotas de todos os pares com o algoritmo especificado, sem o cache de rotas.
+
+    Retorna as distâncias, a média de cidades expandidas e o tempo médio por consulta, em milissegundos.
+    """
+    distancias: list[int] = []
+    expandidos: int = 0
+    inicio: float = perf_counter()
+
+    for nome_inicial, nome_final in pares:
+        rota: 'Rota' = Rota(mapa, nome_inicial, nome_final, algoritmo=algoritmo, usar_cache=False)
+        distancias.append(rota.distancia_percorrida)
+        expandidos += rota.nos_expandidos
+
+    return distancias, expandidos / len(pares), (perf_counter() - inicio) / len(pares) * 1000
+
+def main() -> None:
+    quantidade_de_cidades: int = int(argv[1]) if len(argv) > 1 else 10_000
+    aleatorio: Random = Random(5)
+    falhas: int = 0
+
+    with TemporaryDirectory() as diretorio:
+        cidades: dict[str, dict] = GeradorDeMapasController.gerar_geometrico_aleatorio(quantidade_de_cidades)
+        caminho_com_coordenadas: str = path.join(diretorio, "com_coordenadas.json")
+        GeradorDeMapasController.escrever_json(cidades, caminho_com_coordenadas)
+
+        for dados_da_cidade in cidades.values():
+            del dados_da_cidade["Coordenada"]
+        caminho_sem_coordenadas: str = path.join(diretorio, "sem_coordenadas.json")
+        GeradorDeMapasController.escrever_json(cidades, caminho_sem_coordenadas)
+
+        for descricao, caminho_pro_json in (("com coordenadas", caminho_com_coordenadas), ("sem coordenadas", caminho_sem_coordenadas)):
+            mapa: 'Mapa' = Mapa(caminho_pro_json)
+
+            inicio: float = perf_counter()
+            mapa.pontos_de_referencia()
+            tempo_de_preparo: float = perf_counter() - inicio
+
+            pares: list[tuple[str, str]] = []
+            while len(pares) < CONSULTAS_POR_MAPA:
+                par: tuple[str, str] = tuple(aleatorio.sample(mapa.lista_de_nomes_de_cidades, 2))
+                try:
+                    Rota(mapa, *par, usar_cache=False)
+                except RotaNaoEncontradaError:
+                    continue
+                pares.append(par)
+
+            print(f"mapa {descricao} com {quantidade_de_cidades} cidades | pontos de referência: {tempo_de_preparo:.2f} s")
+
+            distancias_de_referencia, _, _ = medir(mapa, pares, ALGORITMOS[0])
+
+            for algoritmo in ALGORITMOS:
+                distancias, expandidos, tempo_por_consulta = medir(mapa, pares, algoritmo)
+                divergencias: int = sum(distancia != referencia for distancia, referencia in zip(distancias, distancias_de_referencia))
+                falhas += divergencias
+
+                print(f"  {algoritmo:<10} {expandidos:9.0f} cidades expandidas | {tempo_por_consulta:7.2f} ms por consulta | divergências: {divergencias}")
+
+    exit(1 if falhas else 0)
+
+if __name__ == "__main__":
+    main()
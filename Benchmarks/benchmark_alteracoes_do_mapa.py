@@ -0,0 +1,132 @@
+"""
+Mede o custo das alterações de estradas em um Mapa já carregado, comparado com carregar de novo o JSON
+alterado, e quanto do trabalho guardado sobrevive a cada alteração: as rotas do cache mantidas e as
+árvores de caminhos mínimos reparadas. Confere as árvores reparadas com árvores calculadas do zero e as
+rotas mantidas no cache com o Dijkstra, e termina com código de saída 1 se alguma divergir.
+
+Execute a partir da raiz do projeto:
+
+    python -m Benchmarks.benchmark_alteracoes_do_mapa [quantidade_de_cidades]
+"""
+from os import path
+from random import Random
+from sys import argv, exit
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Controllers.RotaController import RotaController
+from Exceptions.RotaNaoEncontradaError import RotaNaoEncontradaError
+from Models.ArvoreDeCaminhosMinimos import ArvoreDeCaminhosMinimos
+from Models.CacheDeRotas import CacheDeRotas
+from Models.Mapa import Mapa
+from Models.Rota import Rota
+
+ALTERACOES: int = 200
+ROTAS_EM_CACHE: int = 500
+ARVORES_GUARDADAS: int = 8
+
+def sortear_estrada(mapa: 'Mapa', aleatorio: 'Random') -> tuple[str, str]:
+    """
+    Sorteia uma estrada existente do mapa.
+    """
+    indice: 'IndiceDeAdjacencia' = mapa.indice
+
+    while True:
+        cidade: int = aleatorio.randrange(len(indice))
+        vizinhas: list[int] = [indice.vizinhos[posicao] for posicao in range(indice.deslocamentos[cidade], indice.deslocamentos[cidade + 1]) if indice.vizinhos[posicao] != cidade]
+
+        if vizinhas:
+            return indice.nomes[cidade], indice.nomes[aleatorio.choice(vizinhas)]
+
+def conferir(mapa: 'Mapa', cache_de_rotas: 'CacheDeRotas') -> int:
+    """
+    Confere as árvores guardadas no mapa e as rotas do cache da versão atual do mapa.
+
+    Retorna a quantidade de divergências encontradas.
+    """
+    indice: 'IndiceDeAdjacencia' = mapa.indice
+    divergencias: int = 0
+
+    for origem in list(mapa.arvores_de_caminhos_minimos._arvores):
+        arvore: 'ArvoreDeCaminhosMinimos' = mapa.arvores_de_caminhos_minimos.buscar(origem)
+        divergencias += list(arvore.distancias) != list(ArvoreDeCaminhosMinimos(indice, origem).distancias)
+
+    for nome_a, nome_b, hash_do_mapa in list(cache_de_rotas._rotas):
+        if hash_do_mapa != mapa.hash_do_conteudo():
+            continue
+
+        _, distancia = cache_de_rotas.buscar(nome_a, nome_b, hash_do_mapa)
+        try:
+            _, distancia_de_referencia, _ = RotaController.buscar_com_dijkstra(indice, indice.id_da_cidade(nome_a), indice.id_da_cidade(nome_b))
+        except RotaNaoEncontradaError:
+            distancia_de_referencia = None
+
+        divergencias += distancia != distancia_de_referencia
+
+    return divergencias
+
+def main() -> None:
+    quantidade_de_cidades: int = int(argv[1]) if len(argv) > 1 else 10_000
+    aleatorio: Random = Random(17)
+    falhas: int = 0
+
+    with TemporaryDirectory() as diretorio:
+        caminho_pro_json: str = path.join(diretorio, f"geometrico_{quantidade_de_cidades}.json")
+        GeradorDeMapasController.escrever_json(GeradorDeMapasController.gerar_geometrico_aleatorio(quantidade_de_cidades), caminho_pro_json)
+
+        inicio: float = perf_counter()
+        mapa: 'Mapa' = Mapa(caminho_pro_json)
+        tempo_de_carregamento: float = perf_counter() - inicio
+
+        mapa.escala_admissivel_das_coordenadas()
+        Rota.cache_de_rotas = CacheDeRotas(ROTAS_EM_CACHE)
+
+        for nome in aleatorio.sample(mapa.lista_de_nomes_de_cidades, ARVORES_GUARDADAS):
+            mapa.arvore_de_caminhos_minimos(nome)
+
+        print(f"geométrico com {quantidade_de_cidades} cidades | carregamento do JSON: {tempo_de_carregamento * 1000:.1f} ms")
+
+        for operacao in ("alterar_distancia_da_estrada (mais longa)", "alterar_distancia_da_estrada (mais curta)", "remover_estrada + adicionar_estrada"):
+            tempo: float = 0
+            rotas_mantidas: int = 0
+            rotas_avaliadas: int = 0
+
+            for _ in range(ALTERACOES // 4):
+                while len(Rota.cache_de_rotas) < ROTAS_EM_CACHE:
+                    try:
+                        Rota(mapa, *aleatorio.sample(mapa.lista_de_nomes_de_cidades, 2))
+                    except RotaNaoEncontradaError:
+                        pass
+
+                nome_a, nome_b = sortear_estrada(mapa, aleatorio)
+                distancia: int = mapa.pegar_cidade_pelo_nome(nome_a).distancia_de_vizinho(nome_b)
+                rotas_avaliadas += len(Rota.cache_de_rotas)
+                mapa.hash_do_conteudo()
+
+                inicio = perf_counter()
+                if operacao.endswith("(mais longa)"):
+                    mapa.alterar_distancia_da_estrada(nome_a, nome_b, distancia * 2)
+                elif operacao.endswith("(mais curta)"):
+                    mapa.alterar_distancia_da_estrada(nome_a, nome_b, max(1, distancia // 2))
+                else:
+                    mapa.remover_estrada(nome_a, nome_b)
+                    mapa.adicionar_estrada(nome_a, nome_b, distancia)
+                tempo += perf_counter() - inicio
+
+                rotas_mantidas += sum(chave[2] == mapa.hash_do_conteudo() for chave in Rota.cache_de_rotas._rotas)
+
+            divergencias: int = conferir(mapa, Rota.cache_de_rotas)
+            falhas += divergencias
+
+            print(
+                f"  {operacao:<42} {tempo / (ALTERACOES // 4) * 1000:8.2f} ms por alteração"
+                f" | rotas mantidas no cache: {rotas_mantidas / rotas_avaliadas:6.1%} | divergências: {divergencias}"
+            )
+
+        print(f"  versão final do mapa: {mapa.versao} | árvores reparadas e mantidas: {len(mapa.arvores_de_caminhos_minimos)}")
+
+    exit(1 if falhas else 0)
+
+if __name__ == "__main__":
+    main()
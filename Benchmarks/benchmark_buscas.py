@@ -0,0 +1,66 @@
+"""
+Compara a quantidade de cidades expandidas e o tempo de consulta dos algoritmos de menor caminho da
+classe Rota em mapas geométricos aleatórios gerados pelo GeradorDeMapasController.
+
+Execute a partir da raiz do projeto:
+
+    python -m Benchmarks.benchmark_buscas
+"""
+from os import path
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Exceptions.RotaNaoEncontradaError import RotaNaoEncontradaError
+from Models.Mapa import Mapa
+from Models.Rota import Rota
+
+TAMANHOS: tuple[int, ...] = (1_000, 10_000, 50_000)
+CONSULTAS_POR_TAMANHO: int = 20
+ALGORITMOS: tuple[str, ...] = ("dijkstra", "a_estrela", "bidirecional", "bidirecional_a_estrela")
+
+def medir(mapa: 'Mapa', pares: list[tuple[str, str]], algoritmo: str) -> tuple[float, float]:
+    """
+    Executa as consultas de todos os pares com o algoritmo especificado.
+
+    Retorna a média de cidades expandidas e o tempo médio por consulta, em milissegundos.
+    """
+    expandidos: int = 0
+    inicio: float = perf_counter()
+
+    for nome_inicial, nome_final in pares:
+        expandidos += Rota(mapa, nome_inicial, nome_final, algoritmo=algoritmo, usar_cache=False).nos_expandidos
+
+    duracao: float = perf_counter() - inicio
+    return expandidos / len(pares), duracao / len(pares) * 1000
+
+def main() -> None:
+    aleatorio: Random = Random(42)
+
+    with TemporaryDirectory() as diretorio:
+        for quantidade in TAMANHOS:
+            caminho_pro_json: str = path.join(diretorio, f"geometrico_{quantidade}.json")
+            GeradorDeMapasController.escrever_json(GeradorDeMapasController.gerar_geometrico_aleatorio(quantidade), caminho_pro_json)
+            mapa: 'Mapa' = Mapa(caminho_pro_json)
+
+            pares: list[tuple[str, str]] = []
+            while len(pares) < CONSULTAS_POR_TAMANHO:
+                par: tuple[str, str] = tuple(aleatorio.sample(mapa.lista_de_nomes_de_cidades, 2))
+                try:
+                    Rota(mapa, *par, usar_cache=False)
+                except RotaNaoEncontradaError:
+                    continue
+                pares.append(par)
+
+            expandidos_dijkstra, _ = medir(mapa, pares, "dijkstra")
+
+            for algoritmo in ALGORITMOS:
+                expandidos, tempo = medir(mapa, pares, algoritmo)
+                print(
+                    f"{quantidade:>7} cidades | {algoritmo:<22} | {expandidos:>9.0f} expandidas"
+                    f" ({expandidos / expandidos_dijkstra:>4.0%} do dijkstra) | {tempo:>8.2f} ms por consulta"
+                )
+
+if __name__ == "__main__":
+    main()
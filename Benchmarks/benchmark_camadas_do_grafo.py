@@ -0,0 +1,88 @@
+"""
+Compara o tempo de geração das imagens PNG de rotas pela classe Grafo, que desenha o mapa inteiro a cada
+imagem, e pela classe GrafoEmCamadas, que desenha o mapa uma única vez como camada base e, a cada rota,
+desenha apenas o caminho por cima, em mapas geométricos aleatórios gerados pelo GeradorDeMapasController.
+
+A camada base é medida três vezes: desenhada, lida do cache em disco e obtida do cache em memória. Cada
+rota é medida inteira, até a gravação do PNG, e também apenas na montagem da imagem, sem a gravação. As
+imagens gravadas são apagadas ao final.
+
+Execute a partir da raiz do projeto, opcionalmente informando os tamanhos dos mapas:
+
+    python -m Benchmarks.benchmark_camadas_do_grafo [50 200 1000]
+"""
+from os import path, remove
+from random import Random
+from sys import argv
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Models.Grafo import Grafo
+from Models.GrafoEmCamadas import GrafoEmCamadas
+from Models.Mapa import Mapa
+from Models.Rota import Rota
+
+TAMANHOS_PADRAO: tuple[int, ...] = (50, 200, 1_000)
+ROTAS_POR_MAPA: int = 3
+NOME_DO_ARQUIVO: str = "benchmark_camadas_do_grafo"
+
+def cronometrar(funcao: callable) -> float:
+    """
+    Executa a função e retorna o tempo gasto, em milissegundos.
+    """
+    inicio: float = perf_counter()
+    funcao()
+    return (perf_counter() - inicio) * 1000
+
+def main() -> None:
+    tamanhos: list[int] = [int(tamanho) for tamanho in argv[1:]] or list(TAMANHOS_PADRAO)
+    aleatorio: Random = Random(11)
+
+    with TemporaryDirectory() as diretorio:
+        for quantidade in tamanhos:
+            caminho_pro_json: str = path.join(diretorio, f"geometrico_{quantidade}.json")
+            GeradorDeMapasController.escrever_json(GeradorDeMapasController.gerar_geometrico_aleatorio(quantidade), caminho_pro_json)
+            mapa: 'Mapa' = Mapa(caminho_pro_json)
+
+            caminhos: list[list[str]] = [
+                Rota(mapa, *aleatorio.sample(mapa.lista_de_nomes_de_cidades, 2)).caminho for _ in range(ROTAS_POR_MAPA)
+            ]
+
+            def gerar_com_o_grafo(caminho: list[str]) -> None:
+                Grafo(mapa, caminho).exibir_grafo_em_png(NOME_DO_ARQUIVO)
+                plt.close("all")
+
+            tempo_do_grafo: float = sum(cronometrar(lambda: gerar_com_o_grafo(caminho)) for caminho in caminhos) / len(caminhos)
+
+            diretorio_do_cache: str = path.join(diretorio, "camadas")
+            camadas: list['GrafoEmCamadas'] = []
+            tempo_da_base: float = cronometrar(lambda: camadas.append(GrafoEmCamadas(mapa, diretorio_do_cache=diretorio_do_cache)))
+            GrafoEmCamadas.camadas_em_memoria.clear()
+            tempo_do_disco: float = cronometrar(lambda: GrafoEmCamadas(mapa, diretorio_do_cache=diretorio_do_cache))
+            tempo_da_memoria: float = cronometrar(lambda: GrafoEmCamadas(mapa, diretorio_do_cache=diretorio_do_cache))
+
+            grafo_em_camadas: 'GrafoEmCamadas' = camadas[0]
+            tempo_da_montagem: float = sum(cronometrar(lambda: grafo_em_camadas.renderizar_rota(caminho)) for caminho in caminhos) / len(caminhos)
+            tempo_da_rota: float = sum(cronometrar(lambda: grafo_em_camadas.exibir_rota_em_png(caminho, NOME_DO_ARQUIVO)) for caminho in caminhos) / len(caminhos)
+
+            print(f"geométrico com {quantidade} cidades, {ROTAS_POR_MAPA} rotas")
+            for descricao, tempo in (
+                ("Grafo: desenho e PNG por rota", tempo_do_grafo),
+                ("GrafoEmCamadas: camada base desenhada", tempo_da_base),
+                ("GrafoEmCamadas: camada base do disco", tempo_do_disco),
+                ("GrafoEmCamadas: camada base da memória", tempo_da_memoria),
+                ("GrafoEmCamadas: montagem por rota", tempo_da_montagem),
+                ("GrafoEmCamadas: montagem e PNG por rota", tempo_da_rota)
+            ):
+                print(f"  {descricao:<42} {tempo:10.1f} ms")
+            print(f"  ganho por rota: {tempo_do_grafo / tempo_da_rota:.1f}x")
+
+    remove(path.join("Assets", "Images", f"{NOME_DO_ARQUIVO}.png"))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Mede o tempo e o pico de memória do carregamento de mapas em grade gerados pelo GeradorDeMapasController,
+comparando o carregamento atual, que lê e analisa o JSON uma única vez, com o carregamento antigo, que lia
+e analisava o arquivo três vezes (nomes, vizinhos e coordenadas), com o carregamento incremental, que lê
+uma cidade por vez sem manter o documento inteiro na memória, e com o carregamento do mapa compilado, que
+mapeia em memória o arquivo ".rmap" gerado a partir do JSON.
+
+Execute a partir da raiz do projeto, opcionalmente informando os tamanhos dos mapas:
+
+    python -m Benchmarks.benchmark_carregamento [10000 100000 1000000]
+"""
+from os import path
+from sys import argv
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from tracemalloc import start, stop, get_traced_memory
+
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Controllers.MapaController import MapaController
+from Models.Mapa import Mapa
+
+TAMANHOS_PADRAO: tuple[int, ...] = (10_000, 100_000, 1_000_000)
+
+def carregar_como_antes(caminho_pro_json: str) -> None:
+    """
+    Reproduz o custo de leitura do carregamento antigo: o JSON era lido e analisado uma vez para obter
+    os nomes e mais uma vez para cada uma das etapas de vizinhos e coordenadas.
+    """
+    for _ in range(2):
+        MapaController._converter_json_em_dicionario(caminho_pro_json)
+
+    Mapa(caminho_pro_json)
+
+def carregar_incrementalmente(caminho_pro_json: str) -> None:
+    """
+    Carrega o mapa lendo o JSON em blocos, uma cidade por vez.
+    """
+    Mapa(caminho_pro_json, carregamento_incremental=True)
+
+def carregar_compilado(caminho_pro_json: str) -> None:
+    """
+    Carrega o mapa da sua versão compilada, que já deve ter sido gerada.
+    """
+    Mapa(caminho_pro_json, usar_binario=True)
+
+def medir(funcao: callable, caminho_pro_json: str) -> tuple[float, float]:
+    """
+    Executa a função de carregamento duas vezes, uma para medir o tempo gasto, em segundos, e outra com o
+    tracemalloc ativo para medir o pico de memória alocada, em MB, já que o rastreamento deixa a execução
+    bem mais lenta.
+    """
+    inicio: float = perf_counter()
+    funcao(caminho_pro_json)
+    duracao: float = perf_counter() - inicio
+
+    start()
+    funcao(caminho_pro_json)
+    _, pico = get_traced_memory()
+    stop()
+
+    return duracao, pico / 1024 ** 2
+
+def main() -> None:
+    tamanhos: list[int] = [int(tamanho) for tamanho in argv[1:]] or list(TAMANHOS_PADRAO)
+
+    with TemporaryDirectory() as diretorio:
+        for quantidade in tamanhos:
+            caminho_pro_json: str = path.join(diretorio, f"grade_{quantidade}.json")
+            GeradorDeMapasController.escrever_json(GeradorDeMapasController.gerar_grade(quantidade), caminho_pro_json)
+            tamanho_do_arquivo: float = path.getsize(caminho_pro_json) / 1024 ** 2
+
+            tempo_antigo, pico_antigo = medir(carregar_como_antes, caminho_pro_json)
+            tempo_atual, pico_atual = medir(Mapa, caminho_pro_json)
+            tempo_incremental, pico_incremental = medir(carregar_incrementalmente, caminho_pro_json)
+
+            inicio_da_compilacao: float = perf_counter()
+            carregar_compilado(caminho_pro_json)
+            tempo_de_compilacao: float = perf_counter() - inicio_da_compilacao
+            tempo_compilado, pico_compilado = medir(carregar_compilado, caminho_pro_json)
+
+            print(
+                f"{quantidade:>9} cidades ({tamanho_do_arquivo:>7.1f} MB) | antes: {tempo_antigo:>7.2f} s, pico {pico_antigo:>8.1f} MB"
+                f" | agora: {tempo_atual:>7.2f} s, pico {pico_atual:>8.1f} MB ({tempo_antigo / tempo_atual:.1f}x mais rápido)"
+                f" | incremental: {tempo_incremental:>7.2f} s, pico {pico_incremental:>8.1f} MB"
+                f" | compilado: {tempo_compilado * 1000:>7.2f} ms, pico {pico_compilado:>8.1f} MB (compilação: {tempo_de_compilacao:.2f} s)"
+            )
+
+if __name__ == "__main__":
+    main()
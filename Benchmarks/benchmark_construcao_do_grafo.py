@@ -0,0 +1,95 @@
+"""
+Mede a construção do Grafo em um mapa em grade com cerca de um milhão de estradas, gerado pelo
+GeradorDeMapasController: a listagem das estradas pelo Mapa, a montagem do grafo do NetworkX e o destaque
+das estradas de uma rota longa, comparados à montagem anterior, que percorria as vizinhas de cada cidade e
+adicionava cada estrada duas vezes, e ao destaque anterior, que procurava cada cidade no caminho com
+`list.index`. Mede também a construção do Grafo com o desenho vetorizado, que não monta o grafo do
+NetworkX.
+
+Execute a partir da raiz do projeto, opcionalmente informando a quantidade de cidades:
+
+    python -m Benchmarks.benchmark_construcao_do_grafo [500000]
+"""
+from gc import collect
+from os import path
+from sys import argv
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import networkx as nx
+
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Models.Grafo import Grafo
+from Models.Mapa import Mapa
+from Models.Rota import Rota
+
+def montar_como_antes(mapa: 'Mapa') -> 'nx.Graph':
+    """
+    Monta o grafo do NetworkX como o Grafo fazia antes, percorrendo as vizinhas de cada cidade.
+    """
+    representacao: 'nx.Graph' = nx.Graph()
+    representacao.add_nodes_from(mapa.lista_de_nomes_de_cidades)
+
+    edges: list[tuple[str, str, dict[str, int]]] = []
+    for essa_cidade in mapa.todas_as_cidades:
+        for nome_de_vizinho in mapa.todas_as_cidades[essa_cidade].vizinhas:
+            edges.append((essa_cidade, nome_de_vizinho, {"dist": mapa.todas_as_cidades[essa_cidade].vizinhas[nome_de_vizinho]}))
+
+    representacao.add_edges_from(edges)
+    return representacao
+
+def colorir_como_antes(representacao: 'nx.Graph', caminho: list[str]) -> list[str]:
+    """
+    Define as cores das estradas como o Grafo fazia antes, com `list.index` a cada cidade do caminho.
+    """
+    nx.set_edge_attributes(representacao, "black", "color")
+
+    for nome_de_cidade in caminho:
+        indice_da_cidade_atual = caminho.index(nome_de_cidade)
+        if indice_da_cidade_atual + 1 == len(caminho): continue
+
+        representacao.edges[(nome_de_cidade, caminho[indice_da_cidade_atual + 1])]["color"] = "red"
+
+    return [representacao[cidade][vizinha]["color"] for cidade, vizinha in representacao.edges()]
+
+def cronometrar(descricao: str, funcao: callable) -> any:
+    """
+    Executa a função, imprime o tempo gasto e retorna o resultado da função.
+    """
+    inicio: float = perf_counter()
+    resultado: any = funcao()
+    print(f"  {descricao:<44} {perf_counter() - inicio:8.2f} s")
+    return resultado
+
+def main() -> None:
+    quantidade_de_cidades: int = int(argv[1]) if len(argv) > 1 else 500_000
+
+    with TemporaryDirectory() as diretorio:
+        caminho_pro_json: str = path.join(diretorio, "grade.json")
+        GeradorDeMapasController.escrever_json(GeradorDeMapasController.gerar_grade(quantidade_de_cidades), caminho_pro_json)
+        mapa: 'Mapa' = Mapa(caminho_pro_json)
+
+    caminho: list[str] = Rota(mapa, mapa.lista_de_nomes_de_cidades[0], mapa.lista_de_nomes_de_cidades[-1]).caminho
+    print(f"grade com {len(mapa.indice)} cidades e {len(mapa.indice.vizinhos) // 2} estradas, rota com {len(caminho)} cidades")
+
+    representacao: 'nx.Graph' = cronometrar("antes: montagem do grafo do NetworkX", lambda: montar_como_antes(mapa))
+    cores_antes: list[str] = cronometrar("antes: destaque da rota", lambda: colorir_como_antes(representacao, caminho))
+    del representacao
+    collect()
+
+    cronometrar("Mapa: listagem das estradas", mapa.estradas)
+    cronometrar("Mapa: listagem das estradas, reaproveitada", mapa.estradas)
+
+    grafo: 'Grafo' = cronometrar("Grafo vetorizado: construção e desenho", lambda: Grafo(mapa, caminho, vetorizado=True))
+    plt.close("all")
+    cronometrar("Grafo: montagem do grafo do NetworkX", lambda: grafo.representacao)
+    cronometrar("Grafo: destaque da rota", lambda: grafo._definir_cores_para_as_etiquetas(caminho))
+
+    cores: list[str] = grafo.atributos_do_desenho["edge_color"]
+    assert cores.count("red") == cores_antes.count("red") == len(caminho) - 1
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compara o tempo do desenho do Grafo pelo NetworkX, que cria um objeto do Matplotlib para cada cidade,
+estrada e etiqueta, e pelo desenho vetorizado, que desenha todas as estradas em uma única LineCollection,
+em mapas geométricos aleatórios gerados pelo GeradorDeMapasController, com uma rota destacada.
+
+Cada desenho é medido na construção do Grafo e na gravação do PNG de 300 DPI. O NetworkX só é medido até
+`ESTRADAS_DO_NETWORKX` estradas, por ser lento demais nos mapas maiores. A imagem gravada é apagada ao final.
+
+Execute a partir da raiz do projeto, opcionalmente informando as quantidades de cidades dos mapas:
+
+    python -m Benchmarks.benchmark_desenho_vetorizado [500 5000 50000]
+"""
+from os import path, remove
+from random import Random
+from sys import argv
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Models.Grafo import Grafo
+from Models.Mapa import Mapa
+from Models.Rota import Rota
+
+TAMANHOS_PADRAO: tuple[int, ...] = (500, 5_000, 50_000)
+ESTRADAS_DO_NETWORKX: int = 15_000
+NOME_DO_ARQUIVO: str = "benchmark_desenho_vetorizado"
+
+def cronometrar(mapa: 'Mapa', caminho: list[str], vetorizado: bool) -> tuple[float, float]:
+    """
+    Desenha o mapa e grava o PNG, retornando os tempos do desenho e da gravação, em segundos.
+    """
+    inicio: float = perf_counter()
+    grafo: 'Grafo' = Grafo(mapa, caminho, vetorizado=vetorizado)
+    desenho: float = perf_counter() - inicio
+
+    inicio = perf_counter()
+    grafo.exibir_grafo_em_png(NOME_DO_ARQUIVO)
+    gravacao: float = perf_counter() - inicio
+
+    plt.close("all")
+    return desenho, gravacao
+
+def main() -> None:
+    tamanhos: list[int] = [int(tamanho) for tamanho in argv[1:]] or list(TAMANHOS_PADRAO)
+    aleatorio: Random = Random(23)
+
+    with TemporaryDirectory() as diretorio:
+        for quantidade in tamanhos:
+            caminho_pro_json: str = path.join(diretorio, f"geometrico_{quantidade}.json")
+            GeradorDeMapasController.escrever_json(GeradorDeMapasController.gerar_geometrico_aleatorio(quantidade), caminho_pro_json)
+            mapa: 'Mapa' = Mapa(caminho_pro_json)
+            estradas: int = len(mapa.indice.vizinhos) // 2
+            caminho: list[str] = Rota(mapa, *aleatorio.sample(mapa.lista_de_nomes_de_cidades, 2)).caminho
+
+            print(f"geométrico com {quantidade} cidades e {estradas} estradas")
+            for descricao, vetorizado in (("NetworkX", False), ("vetorizado", True)):
+                if not vetorizado and estradas > ESTRADAS_DO_NETWORKX:
+                    print(f"  {descricao:<12} ignorado, acima de {ESTRADAS_DO_NETWORKX} estradas")
+                    continue
+
+                desenho, gravacao = cronometrar(mapa, caminho, vetorizado)
+                print(f"  {descricao:<12} desenho {desenho:8.2f} s   PNG {gravacao:8.2f} s   total {desenho + gravacao:8.2f} s")
+
+    remove(path.join("Assets", "Images", f"{NOME_DO_ARQUIVO}.png"))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Mede o custo da coleta de estatísticas nas rotas: calcula as mesmas rotas, sem o cache de rotas, sem
+estatísticas e com uma instância de Estatisticas, com e sem o cProfile e o tracemalloc, e mostra o tempo
+médio por rota de cada caso e as estatísticas acumuladas. Sem estatísticas, as buscas não fazem nenhuma
+contagem, então o tempo desse caso é o custo das buscas sem instrumentação.
+
+Execute a partir da raiz do projeto:
+
+    python -m Benchmarks.benchmark_estatisticas [quantidade_de_cidades]
+"""
+from os import path
+from random import Random
+from sys import argv
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Exceptions.RotaNaoEncontradaError import RotaNaoEncontradaError
+from Models.Estatisticas import Estatisticas
+from Models.Mapa import Mapa
+from Models.Rota import Rota
+
+CONSULTAS: int = 20
+REPETICOES: int = 3
+ALGORITMOS: tuple[str, ...] = ("dijkstra", "a_estrela", "bidirecional")
+
+def sortear_pares(mapa: 'Mapa', aleatorio: 'Random') -> list[tuple[str, str]]:
+    """
+    Sorteia pares de cidades distintas ligadas por algum caminho.
+    """
+    pares: list[tuple[str, str]] = []
+
+    while len(pares) < CONSULTAS:
+        par: tuple[str, str] = tuple(aleatorio.sample(mapa.lista_de_nomes_de_cidades, 2))
+        try:
+            Rota(mapa, *par, usar_cache=False)
+        except RotaNaoEncontradaError:
+            continue
+        pares.append(par)
+
+    return pares
+
+def medir(mapa: 'Mapa', pares: list[tuple[str, str]], algoritmo: str, criar_estatisticas: callable) -> tuple[float, 'Estatisticas | None']:
+    """
+    Calcula as rotas de todos os pares, repetindo a medição e ficando com a mais rápida.
+
+    Retorna o tempo médio por rota, em milissegundos, e as estatísticas da última repetição.
+    """
+    melhor_tempo: float = float("inf")
+    estatisticas: 'Estatisticas | None' = None
+
+    for _ in range(REPETICOES):
+        estatisticas = criar_estatisticas()
+        inicio: float = perf_counter()
+        for par in pares:
+            Rota(mapa, *par, algoritmo=algoritmo, usar_cache=False, estatisticas=estatisticas)
+        melhor_tempo = min(melhor_tempo, perf_counter() - inicio)
+
+    return melhor_tempo / len(pares) * 1000, estatisticas
+
+def main() -> None:
+    quantidade_de_cidades: int = int(argv[1]) if len(argv) > 1 else 20_000
+    aleatorio: Random = Random(19)
+
+    with TemporaryDirectory() as diretorio:
+        caminho_pro_json: str = path.join(diretorio, f"geometrico_{quantidade_de_cidades}.json")
+        GeradorDeMapasController.escrever_json(GeradorDeMapasController.gerar_geometrico_aleatorio(quantidade_de_cidades), caminho_pro_json)
+
+        estatisticas_do_mapa: Estatisticas = Estatisticas()
+        mapa: 'Mapa' = Mapa(caminho_pro_json, estatisticas=estatisticas_do_mapa)
+        print(f"geométrico com {quantidade_de_cidades} cidades | carregamento: {estatisticas_do_mapa}")
+
+        casos: dict[str, callable] = {
+            "sem estatísticas": lambda: None,
+            "com estatísticas": Estatisticas,
+            "com cProfile": lambda: Estatisticas(usar_cprofile=True),
+            "com tracemalloc": lambda: Estatisticas(usar_tracemalloc=True)
+        }
+
+        pares: list[tuple[str, str]] = sortear_pares(mapa, aleatorio)
+        mapa.escala_admissivel_das_coordenadas()
+
+        # Uma passagem sem medição aquece os dados do mapa e o alocador antes das medições.
+        for algoritmo in ALGORITMOS:
+            for par in pares:
+                Rota(mapa, *par, algoritmo=algoritmo, usar_cache=False)
+
+        for algoritmo in ALGORITMOS:
+            print(algoritmo)
+            tempo_de_referencia: float = 0
+
+            for caso, criar_estatisticas in casos.items():
+                tempo, estatisticas = medir(mapa, pares, algoritmo, criar_estatisticas)
+                tempo_de_referencia = tempo_de_referencia or tempo
+
+                print(f"  {caso:<18} {tempo:9.3f} ms por rota ({tempo / tempo_de_referencia:5.2f}x)")
+                if caso == "com estatísticas":
+                    print(f"    {estatisticas}")
+                elif caso == "com tracemalloc":
+                    print(f"    maior pico de memória de uma rota: {estatisticas.pico_de_memoria / 1024:.1f} KiB")
+
+if __name__ == "__main__":
+    main()
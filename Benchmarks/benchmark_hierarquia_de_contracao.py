@@ -0,0 +1,94 @@
+"""
+Mede o pré-processamento da hierarquia de contração e compara o tempo de consulta do modo
+"hierarquia_de_contracao" da classe Rota com o do Dijkstra e do A*, em grades e em mapas geométricos
+aleatórios gerados pelo GeradorDeMapasController. Termina com código de saída 1 se alguma distância
+divergir.
+
+Execute a partir da raiz do projeto:
+
+    python -m Benchmarks.benchmark_hierarquia_de_contracao [quantidade_de_cidades ...]
+"""
+from os import path
+from random import Random
+from sys import argv, exit
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Exceptions.RotaNaoEncontradaError import RotaNaoEncontradaError
+from Models.Mapa import Mapa
+from Models.Rota import Rota
+
+TAMANHOS_PADRAO: tuple[int, ...] = (2_000, 10_000)
+CONSULTAS_POR_MAPA: int = 100
+ALGORITMOS: tuple[str, ...] = ("dijkstra", "a_estrela", "hierarquia_de_contracao")
+GERADORES: dict[str, callable] = {
+    "grade": GeradorDeMapasController.gerar_grade,
+    "geometrico": GeradorDeMapasController.gerar_geometrico_aleatorio
+}
+
+def medir(mapa: 'Mapa', pares: list[tuple[str, str]], algoritmo: str) -> tuple[list[int], float]:
+    """
+    Calcula as rotas de todos os pares com o algoritmo especificado, sem o cache de rotas.
+
+    Retorna as distâncias e o tempo médio por consulta, em milissegundos.
+    """
+    distancias: list[int] = []
+    inicio: float = perf_counter()
+
+    for nome_inicial, nome_final in pares:
+        distancias.append(Rota(mapa, nome_inicial, nome_final, algoritmo=algoritmo, usar_cache=False).distancia_percorrida)
+
+    return distancias, (perf_counter() - inicio) / len(pares) * 1000
+
+def main() -> None:
+    tamanhos: list[int] = [int(tamanho) for tamanho in argv[1:]] or list(TAMANHOS_PADRAO)
+    aleatorio: Random = Random(11)
+    falhas: int = 0
+
+    with TemporaryDirectory() as diretorio:
+        for tipo, gerador in GERADORES.items():
+            for quantidade in tamanhos:
+                caminho_pro_json: str = path.join(diretorio, f"{tipo}_{quantidade}.json")
+                GeradorDeMapasController.escrever_json(gerador(quantidade), caminho_pro_json)
+                mapa: 'Mapa' = Mapa(caminho_pro_json)
+
+                inicio: float = perf_counter()
+                hierarquia: 'HierarquiaDeContracao' = mapa.hierarquia_de_contracao()
+                tempo_de_construcao: float = perf_counter() - inicio
+
+                mapa_recarregado: 'Mapa' = Mapa(caminho_pro_json)
+                inicio = perf_counter()
+                mapa_recarregado.hierarquia_de_contracao()
+                tempo_de_carregamento: float = perf_counter() - inicio
+
+                pares: list[tuple[str, str]] = []
+                while len(pares) < CONSULTAS_POR_MAPA:
+                    par: tuple[str, str] = tuple(aleatorio.sample(mapa.lista_de_nomes_de_cidades, 2))
+                    try:
+                        Rota(mapa, *par, usar_cache=False)
+                    except RotaNaoEncontradaError:
+                        continue
+                    pares.append(par)
+
+                print(
+                    f"{tipo} com {quantidade} cidades | construção: {tempo_de_construcao:.2f} s"
+                    f" | carregamento: {tempo_de_carregamento * 1000:.1f} ms | atalhos: {hierarquia.quantidade_de_atalhos()}"
+                )
+
+                distancias_de_referencia, tempo_de_referencia = medir(mapa, pares, ALGORITMOS[0])
+
+                for algoritmo in ALGORITMOS:
+                    distancias, tempo_por_consulta = medir(mapa, pares, algoritmo)
+                    divergencias: int = sum(distancia != referencia for distancia, referencia in zip(distancias, distancias_de_referencia))
+                    falhas += divergencias
+
+                    print(
+                        f"  {algoritmo:<24} {tempo_por_consulta:8.3f} ms por consulta"
+                        f" ({tempo_de_referencia / tempo_por_consulta:5.1f}x) | divergências: {divergencias}"
+                    )
+
+    exit(1 if falhas else 0)
+
+if __name__ == "__main__":
+    main()
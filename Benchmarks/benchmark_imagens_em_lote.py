@@ -0,0 +1,72 @@
+"""
+Mede a vazão, em imagens por segundo, da geração das imagens PNG de muitas rotas de um mapa geométrico
+aleatório: criando um Grafo por rota, como a aplicação fazia, e com a classe ImagensEmLote, no próprio
+processo e distribuída entre processos. O Grafo é medido em apenas algumas rotas, por ser muito mais lento.
+
+As imagens são gravadas em um diretório temporário, apagado ao final, e o desenho da camada base, feito uma
+única vez por mapa, é medido à parte.
+
+Execute a partir da raiz do projeto:
+
+    python -m Benchmarks.benchmark_imagens_em_lote [quantidade_de_cidades] [quantidade_de_rotas] [processos]
+"""
+from os import cpu_count, listdir, path
+from random import Random
+from sys import argv
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Models.Grafo import Grafo
+from Models.GrafoEmCamadas import GrafoEmCamadas
+from Models.ImagensEmLote import ImagensEmLote
+from Models.Mapa import Mapa
+from Models.RotasEmLote import RotasEmLote
+
+ROTAS_DO_GRAFO: int = 3
+
+def main() -> None:
+    quantidade_de_cidades: int = int(argv[1]) if len(argv) > 1 else 200
+    quantidade_de_rotas: int = int(argv[2]) if len(argv) > 2 else 200
+    processos: int = int(argv[3]) if len(argv) > 3 else cpu_count() or 1
+    aleatorio: Random = Random(17)
+
+    with TemporaryDirectory() as diretorio:
+        caminho_pro_json: str = path.join(diretorio, "geometrico.json")
+        GeradorDeMapasController.escrever_json(GeradorDeMapasController.gerar_geometrico_aleatorio(quantidade_de_cidades), caminho_pro_json)
+        mapa: 'Mapa' = Mapa(caminho_pro_json)
+
+        pares: list[tuple[str, str]] = [tuple(aleatorio.sample(mapa.lista_de_nomes_de_cidades, 2)) for _ in range(quantidade_de_rotas)]
+        caminhos: list[list[str]] = [caminho for _, _, caminho, _ in RotasEmLote(mapa, 1).calcular(pares) if caminho]
+        rotas: list[tuple[str, list[str]]] = [(f"rota_{numero}", caminho) for numero, caminho in enumerate(caminhos)]
+
+        print(f"geométrico com {quantidade_de_cidades} cidades, {len(rotas)} rotas")
+
+        inicio: float = perf_counter()
+        for caminho in caminhos[:ROTAS_DO_GRAFO]:
+            Grafo(mapa, caminho).figura.savefig(path.join(diretorio, "grafo.png"), dpi=300)
+            plt.close("all")
+        print(f"  Grafo por rota                     {ROTAS_DO_GRAFO / (perf_counter() - inicio):8.2f} imagens/s")
+
+        diretorio_do_cache: str = path.join(diretorio, "camadas")
+        inicio = perf_counter()
+        GrafoEmCamadas(mapa, diretorio_do_cache=diretorio_do_cache)
+        print(f"  camada base desenhada em           {perf_counter() - inicio:8.2f} s")
+
+        for quantidade_de_processos in sorted({1, processos}):
+            diretorio_das_imagens: str = path.join(diretorio, f"imagens_{quantidade_de_processos}")
+            lote: 'ImagensEmLote' = ImagensEmLote(mapa, quantidade_de_processos, diretorio_das_imagens, diretorio_do_cache=diretorio_do_cache)
+
+            inicio = perf_counter()
+            gravadas: int = sum(1 for _ in lote.gerar(rotas))
+            duracao: float = perf_counter() - inicio
+
+            assert gravadas == len(rotas) == len(listdir(diretorio_das_imagens))
+            print(f"  ImagensEmLote com {quantidade_de_processos:>2} processo(s)     {gravadas / duracao:8.2f} imagens/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Mede o tempo do cálculo de rotas alternativas (algoritmo de Yen) pela classe Rota, com o Dijkstra e com
+o A* nas buscas de desvio, no mapa da Romênia e em grades e mapas geométricos aleatórios gerados pelo
+GeradorDeMapasController. Confere se as distâncias estão em ordem crescente, se a primeira é a do menor
+caminho, se nenhuma rota repete cidades ou se repete, e se a distância de cada rota confere com as
+estradas percorridas. Termina com código de saída 1 se alguma conferência falhar.
+
+Execute a partir da raiz do projeto:
+
+    python -m Benchmarks.benchmark_k_menores_caminhos [quantidade_de_cidades]
+"""
+from os import path
+from random import Random
+from sys import argv, exit
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Exceptions.RotaNaoEncontradaError import RotaNaoEncontradaError
+from Models.Mapa import Mapa
+from Models.Rota import Rota
+
+QUANTIDADES_DE_ALTERNATIVAS: tuple[int, ...] = (5, 10)
+CONSULTAS_POR_MAPA: int = 10
+ALGORITMOS: tuple[str, ...] = ("dijkstra", "a_estrela")
+GERADORES: dict[str, callable] = {
+    "grade": GeradorDeMapasController.gerar_grade,
+    "geometrico": GeradorDeMapasController.gerar_geometrico_aleatorio
+}
+
+def conferir(mapa: 'Mapa', rota: 'Rota', alternativas: list[tuple[list[str], int]]) -> int:
+    """
+    Confere as alternativas calculadas para uma rota.
+
+    Retorna a quantidade de problemas encontrados.
+    """
+    problemas: int = 0
+    distancias: list[int] = [distancia for _, distancia in alternativas]
+
+    problemas += distancias[0] != rota.distancia_percorrida
+    problemas += distancias != sorted(distancias)
+    problemas += len({tuple(caminho) for caminho, _ in alternativas}) != len(alternativas)
+
+    for caminho, distancia in alternativas:
+        problemas += len(set(caminho)) != len(caminho)
+        problemas += caminho[0] != rota.cidade_inicial.nome or caminho[-1] != rota.nome_da_cidade_final
+        problemas += sum(mapa.pegar_cidade_pelo_nome(cidade).vizinhas.get(proxima, float("inf")) for cidade, proxima in zip(caminho, caminho[1:])) != distancia
+
+    return problemas
+
+def medir(mapa: 'Mapa', pares: list[tuple[str, str]], algoritmo: str, quantidade: int) -> tuple[int, float, float]:
+    """
+    Calcula as alternativas de todos os pares com o algoritmo especificado, sem o cache de rotas.
+
+    Retorna a quantidade de problemas encontrados, a média de alternativas por par e o tempo médio por
+    consulta, em milissegundos.
+    """
+    problemas: int = 0
+    alternativas_encontradas: int = 0
+    tempo: float = 0
+
+    for nome_inicial, nome_final in pares:
+        rota: 'Rota' = Rota(mapa, nome_inicial, nome_final, algoritmo=algoritmo, usar_cache=False)
+
+        inicio: float = perf_counter()
+        alternativas: list[tuple[list[str], int]] = rota.calcular_alternativas(quantidade)
+        tempo += perf_counter() - inicio
+
+        problemas += conferir(mapa, rota, alternativas)
+        alternativas_encontradas += len(alternativas)
+
+    return problemas, alternativas_encontradas / len(pares), tempo / len(pares) * 1000
+
+def sortear_pares(mapa: 'Mapa', aleatorio: 'Random') -> list[tuple[str, str]]:
+    """
+    Sorteia pares de cidades distintas ligadas por algum caminho.
+    """
+    pares: list[tuple[str, str]] = []
+
+    while len(pares) < CONSULTAS_POR_MAPA:
+        par: tuple[str, str] = tuple(aleatorio.sample(mapa.lista_de_nomes_de_cidades, 2))
+        try:
+            Rota(mapa, *par, usar_cache=False)
+        except RotaNaoEncontradaError:
+            continue
+        pares.append(par)
+
+    return pares
+
+def main() -> None:
+    quantidade_de_cidades: int = int(argv[1]) if len(argv) > 1 else 10_000
+    aleatorio: Random = Random(13)
+    falhas: int = 0
+
+    with TemporaryDirectory() as diretorio:
+        mapas: list[tuple[str, 'Mapa']] = [("Romênia", Mapa())]
+
+        for tipo, gerador in GERADORES.items():
+            caminho_pro_json: str = path.join(diretorio, f"{tipo}_{quantidade_de_cidades}.json")
+            GeradorDeMapasController.escrever_json(gerador(quantidade_de_cidades), caminho_pro_json)
+            mapas.append((f"{tipo} com {quantidade_de_cidades} cidades", Mapa(caminho_pro_json)))
+
+        for descricao, mapa in mapas:
+            pares: list[tuple[str, str]] = sortear_pares(mapa, aleatorio)
+            print(descricao)
+
+            for quantidade in QUANTIDADES_DE_ALTERNATIVAS:
+                for algoritmo in ALGORITMOS:
+                    problemas, alternativas_por_par, tempo_por_consulta = medir(mapa, pares, algoritmo, quantidade)
+                    falhas += problemas
+
+                    print(
+                        f"  k={quantidade:<3} {algoritmo:<10} {tempo_por_consulta:9.2f} ms por consulta"
+                        f" | {alternativas_por_par:5.1f} rotas por par | problemas: {problemas}"
+                    )
+
+    exit(1 if falhas else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Mede o desenho do mapa em ladrilhos pela classe MapaEmLadrilhos em um mapa geométrico aleatório gerado
+pelo GeradorDeMapasController: a indexação das cidades e estradas, o desenho de ladrilhos de cada nível
+ainda fora do cache, a leitura dos mesmos ladrilhos do cache em disco, e a consulta à GradeEspacial
+comparada à verificação de todas as estradas do mapa em cada ladrilho.
+
+Em cada nível são medidos até `LADRILHOS_POR_NIVEL` ladrilhos escolhidos ao acaso. Os ladrilhos são
+gravados em um diretório temporário, apagado ao final.
+
+Execute a partir da raiz do projeto:
+
+    python -m Benchmarks.benchmark_ladrilhos [quantidade_de_cidades]
+"""
+from os import path
+from random import Random
+from sys import argv
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import matplotlib
+matplotlib.use("Agg")
+
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Models.Mapa import Mapa
+from Models.MapaEmLadrilhos import MapaEmLadrilhos
+
+LADRILHOS_POR_NIVEL: int = 8
+
+def main() -> None:
+    quantidade_de_cidades: int = int(argv[1]) if len(argv) > 1 else 50_000
+    aleatorio: Random = Random(29)
+
+    with TemporaryDirectory() as diretorio:
+        caminho_pro_json: str = path.join(diretorio, "geometrico.json")
+        GeradorDeMapasController.escrever_json(GeradorDeMapasController.gerar_geometrico_aleatorio(quantidade_de_cidades), caminho_pro_json)
+        mapa: 'Mapa' = Mapa(caminho_pro_json)
+
+        inicio: float = perf_counter()
+        ladrilhos: 'MapaEmLadrilhos' = MapaEmLadrilhos(mapa, diretorio_do_cache=path.join(diretorio, "ladrilhos"))
+        print(f"geométrico com {quantidade_de_cidades} cidades e {len(mapa.indice.vizinhos) // 2} estradas")
+        print(f"  indexação                    {(perf_counter() - inicio) * 1000:10.1f} ms")
+        print(f"  {'nível':>5} {'desenho':>12} {'cache':>12} {'grade':>12} {'todas':>12}")
+
+        grade: 'GradeEspacial' = ladrilhos._grade_das_estradas
+        for nivel in range(ladrilhos.nivel_maximo + 1):
+            escolhidos: list[tuple[int, int]] = [
+                (aleatorio.randrange(2 ** nivel), aleatorio.randrange(2 ** nivel)) for _ in range(min(LADRILHOS_POR_NIVEL, 4 ** nivel))
+            ]
+
+            inicio = perf_counter()
+            for coluna, linha in escolhidos:
+                ladrilhos.obter_ladrilho(nivel, coluna, linha)
+            tempo_do_desenho: float = (perf_counter() - inicio) / len(escolhidos)
+
+            inicio = perf_counter()
+            for coluna, linha in escolhidos:
+                ladrilhos.obter_ladrilho(nivel, coluna, linha)
+            tempo_do_cache: float = (perf_counter() - inicio) / len(escolhidos)
+
+            lado_do_ladrilho: float = ladrilhos.lado / 2 ** nivel
+            regioes: list[tuple[float, float, float, float]] = [
+                (
+                    ladrilhos.origem[0] + coluna * lado_do_ladrilho, ladrilhos.origem[1] + linha * lado_do_ladrilho,
+                    ladrilhos.origem[0] + (coluna + 1) * lado_do_ladrilho, ladrilhos.origem[1] + (linha + 1) * lado_do_ladrilho
+                ) for coluna, linha in escolhidos
+            ]
+
+            inicio = perf_counter()
+            encontradas_pela_grade: list[int] = [len(grade.consultar(*regiao)) for regiao in regioes]
+            tempo_da_grade: float = (perf_counter() - inicio) / len(regioes)
+
+            inicio = perf_counter()
+            encontradas_em_todas: list[int] = [
+                int((
+                    (grade.retangulos[:, 0] <= maximo_x) & (grade.retangulos[:, 2] >= minimo_x) &
+                    (grade.retangulos[:, 1] <= maximo_y) & (grade.retangulos[:, 3] >= minimo_y)
+                ).sum()) for minimo_x, minimo_y, maximo_x, maximo_y in regioes
+            ]
+            tempo_de_todas: float = (perf_counter() - inicio) / len(regioes)
+
+            assert encontradas_pela_grade == encontradas_em_todas
+            print(
+                f"  {nivel:>5} {tempo_do_desenho * 1000:9.1f} ms {tempo_do_cache * 1000:9.3f} ms "
+                f"{tempo_da_grade * 1000:9.3f} ms {tempo_de_todas * 1000:9.3f} ms"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Mede a memória ocupada pelas cidades de mapas geométricos aleatórios gerados pelo GeradorDeMapasController,
+por cidade: a de uma Cidade que guarda as próprias vizinhas e coordenadas, como durante o carregamento do
+JSON, a de uma Cidade ligada ao índice de adjacência, como as de um Mapa já carregado, e a do Mapa inteiro
+depois do carregamento do JSON e do mapa compilado, sem contar as páginas do arquivo mapeado em memória,
+que não são alocadas pelo Python. Confere também se as cidades ligadas ao índice
+devolvem as mesmas vizinhas, distâncias e coordenadas das cidades com dicionário próprio, e termina com
+código de saída 1 se alguma divergir.
+
+Execute a partir da raiz do projeto, opcionalmente informando os tamanhos dos mapas:
+
+    python -m Benchmarks.benchmark_memoria_das_cidades [10000 100000 1000000]
+"""
+from gc import collect
+from os import path
+from sys import argv, exit
+from tempfile import TemporaryDirectory
+from tracemalloc import start, stop, get_traced_memory
+
+from Controllers.CidadeController import CidadeController
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Controllers.MapaBinarioController import MapaBinarioController
+from Models.Cidade import Cidade
+from Models.Mapa import Mapa
+
+TAMANHOS_PADRAO: tuple[int, ...] = (10_000, 100_000)
+
+def memoria_alocada(funcao: callable) -> tuple[int, object]:
+    """
+    Executa a função com o tracemalloc ativo.
+
+    Retorna a memória que continua alocada depois da execução, em bytes, e o resultado da função, que é
+    mantido vivo até a medição.
+    """
+    collect()
+    start()
+    resultado: object = funcao()
+    collect()
+    memoria, _ = get_traced_memory()
+    stop()
+    return memoria, resultado
+
+def cidades_com_dicionario(mapa: 'Mapa') -> list['Cidade']:
+    """
+    Monta uma cópia das cidades do mapa que guarda as próprias vizinhas e coordenadas.
+    """
+    cidades: dict[str, 'Cidade'] = {nome: Cidade(nome) for nome in mapa.lista_de_nomes_de_cidades}
+
+    for nome, cidade in cidades.items():
+        original: 'Cidade' = mapa.todas_as_cidades[nome]
+        for nome_da_vizinha, distancia in original.vizinhas.items():
+            cidade.vizinhas[nome_da_vizinha] = distancia
+        CidadeController.definir_coordenadas(cidade, original.coordenadas)
+
+    return list(cidades.values())
+
+def conferir(mapa: 'Mapa', cidades: list['Cidade']) -> int:
+    """
+    Confere as cidades ligadas ao índice com as cópias com dicionário próprio.
+
+    Retorna a quantidade de cidades divergentes.
+    """
+    divergencias: int = 0
+
+    for copia in cidades:
+        cidade: 'Cidade' = mapa.todas_as_cidades[copia.nome]
+        divergencias += dict(cidade.vizinhas) != copia.vizinhas or cidade.coordenadas != copia.coordenadas
+        divergencias += any(cidade.distancia_de_vizinho(nome) != distancia for nome, distancia in copia.vizinhas.items())
+
+    return divergencias
+
+def main() -> None:
+    tamanhos: list[int] = [int(tamanho) for tamanho in argv[1:]] or list(TAMANHOS_PADRAO)
+    falhas: int = 0
+
+    with TemporaryDirectory() as diretorio:
+        for quantidade in tamanhos:
+            caminho_pro_json: str = path.join(diretorio, f"geometrico_{quantidade}.json")
+            GeradorDeMapasController.escrever_json(GeradorDeMapasController.gerar_geometrico_aleatorio(quantidade), caminho_pro_json)
+
+            memoria_do_json, mapa = memoria_alocada(lambda: Mapa(caminho_pro_json))
+            MapaBinarioController.escrever(mapa.indice, MapaBinarioController.caminho_do_binario(caminho_pro_json))
+            memoria_do_binario, _ = memoria_alocada(lambda: Mapa(caminho_pro_json, usar_binario=True))
+
+            memoria_com_dicionario, copias = memoria_alocada(lambda: cidades_com_dicionario(mapa))
+            memoria_ligada, _ = memoria_alocada(lambda: [Cidade(nome, mapa.indice) for nome in mapa.lista_de_nomes_de_cidades])
+
+            divergencias: int = conferir(mapa, copias)
+            falhas += divergencias
+
+            print(f"geométrico com {quantidade} cidades")
+            print(f"  Cidade com dicionário próprio   {memoria_com_dicionario / quantidade:8.0f} B por cidade")
+            print(f"  Cidade ligada ao índice         {memoria_ligada / quantidade:8.0f} B por cidade ({memoria_com_dicionario / memoria_ligada:.1f}x menor)")
+            print(f"  Mapa carregado do JSON          {memoria_do_json / quantidade:8.0f} B por cidade")
+            print(f"  Mapa carregado do compilado     {memoria_do_binario / quantidade:8.0f} B por cidade, fora o arquivo mapeado em memória")
+            print(f"  divergências: {divergencias}")
+
+            del mapa, copias
+
+    exit(1 if falhas else 0)
+
+if __name__ == "__main__":
+    main()
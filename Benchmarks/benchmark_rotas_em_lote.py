@@ -0,0 +1,78 @@
+"""
+Compara o cálculo de uma matriz de origem e destino criando uma Rota por par com o cálculo em lote da
+classe RotasEmLote, no próprio processo e distribuído entre processos, e confere se as distâncias são
+as mesmas.
+
+Execute a partir da raiz do projeto:
+
+    python -m Benchmarks.benchmark_rotas_em_lote [quantidade_de_cidades] [origens] [destinos_por_origem]
+"""
+from os import cpu_count, path
+from random import Random
+from sys import argv, exit
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Exceptions.RotaNaoEncontradaError import RotaNaoEncontradaError
+from Models.Mapa import Mapa
+from Models.Rota import Rota
+from Models.RotasEmLote import RotasEmLote
+
+def calcular_por_rota(mapa: 'Mapa', pares: list[tuple[str, str]]) -> dict[tuple[str, str], int | None]:
+    """
+    Calcula a distância de cada par criando uma Rota para ele.
+    """
+    distancias: dict[tuple[str, str], int | None] = {}
+
+    for par in pares:
+        try:
+            distancias[par] = Rota(mapa, *par, usar_cache=False).distancia_percorrida
+        except RotaNaoEncontradaError:
+            distancias[par] = None
+
+    return distancias
+
+def calcular_em_lote(mapa: 'Mapa', pares: list[tuple[str, str]], processos: int) -> dict[tuple[str, str], int | None]:
+    """
+    Calcula a distância de cada par com a classe RotasEmLote.
+    """
+    return {(inicial, final): distancia for inicial, final, _, distancia in RotasEmLote(mapa, processos).calcular(pares)}
+
+def main() -> None:
+    quantidade_de_cidades: int = int(argv[1]) if len(argv) > 1 else 20_000
+    origens: int = int(argv[2]) if len(argv) > 2 else 40
+    destinos_por_origem: int = int(argv[3]) if len(argv) > 3 else 25
+    aleatorio: Random = Random(3)
+
+    with TemporaryDirectory() as diretorio:
+        caminho_pro_json: str = path.join(diretorio, "geometrico.json")
+        GeradorDeMapasController.escrever_json(GeradorDeMapasController.gerar_geometrico_aleatorio(quantidade_de_cidades), caminho_pro_json)
+
+        for descricao, mapa in (("json", Mapa(caminho_pro_json)), ("compilado", Mapa(caminho_pro_json, usar_binario=True))):
+            nomes: list[str] = list(mapa.lista_de_nomes_de_cidades)
+            pares: list[tuple[str, str]] = [
+                (origem, destino)
+                for origem in aleatorio.sample(nomes, origens)
+                for destino in aleatorio.sample(nomes, destinos_por_origem)
+            ]
+
+            inicio: float = perf_counter()
+            esperado: dict[tuple[str, str], int | None] = calcular_por_rota(mapa, pares)
+            tempo_por_rota: float = perf_counter() - inicio
+
+            print(f"mapa {descricao:<9} | {len(pares)} pares | uma Rota por par: {tempo_por_rota:.2f} s")
+
+            for processos in sorted({1, cpu_count() or 1}):
+                inicio = perf_counter()
+                obtido: dict[tuple[str, str], int | None] = calcular_em_lote(mapa, pares, processos)
+                tempo_em_lote: float = perf_counter() - inicio
+
+                if obtido != esperado:
+                    print(f"  em lote com {processos} processo(s): distâncias divergentes")
+                    exit(1)
+
+                print(f"  em lote com {processos} processo(s): {tempo_em_lote:.2f} s ({tempo_por_rota / tempo_em_lote:.1f}x)")
+
+if __name__ == "__main__":
+    main()
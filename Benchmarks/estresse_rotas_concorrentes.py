@@ -0,0 +1,86 @@
+"""
+Teste de estresse das rotas concorrentes: calcula milhares de rotas em paralelo, em um pool de threads que
+compartilha um único Mapa carregado, e confere se cada resultado é idêntico ao da mesma rota calculada em
+série. As rotas em série não usam o cache de rotas, e as paralelas usam um cache pequeno compartilhado, para
+exercitar também as remoções do cache sob concorrência. Como rotas empatadas podem seguir caminhos
+diferentes conforme o algoritmo que as guardou no cache, as rotas paralelas são comparadas pela distância.
+Termina com código de saída 1 se alguma rota divergir.
+
+Execute a partir da raiz do projeto:
+
+    python -m Benchmarks.estresse_rotas_concorrentes [quantidade_de_rotas]
+"""
+from concurrent.futures import ThreadPoolExecutor
+from os import path
+from random import Random
+from sys import argv, exit
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Exceptions.RotaNaoEncontradaError import RotaNaoEncontradaError
+from Models.Mapa import Mapa
+from Models.CacheDeRotas import CacheDeRotas
+from Models.Rota import Rota
+
+QUANTIDADE_PADRAO_DE_ROTAS: int = 5_000
+ALGORITMOS: tuple[str, ...] = ("dijkstra", "a_estrela", "bidirecional", "bidirecional_a_estrela", "hierarquia_de_contracao", "profundidade")
+
+def calcular(mapa: 'Mapa', consulta: tuple[str, str, str], usar_cache: bool) -> tuple[str, str, int] | str:
+    """
+    Calcula a rota de uma consulta (cidade inicial, cidade final, algoritmo) e retorna as pontas do caminho
+    e a distância, ou o nome da exceção lançada.
+    """
+    try:
+        rota: 'Rota' = Rota(mapa, *consulta[:2], algoritmo=consulta[2], usar_cache=usar_cache)
+        return rota.caminho[0], rota.caminho[-1], rota.distancia_percorrida
+    except RotaNaoEncontradaError as erro:
+        return type(erro).__name__
+
+def main() -> None:
+    quantidade_de_rotas: int = int(argv[1]) if len(argv) > 1 else QUANTIDADE_PADRAO_DE_ROTAS
+    aleatorio: Random = Random(7)
+
+    with TemporaryDirectory() as diretorio:
+        caminho_pro_json: str = path.join(diretorio, "geometrico.json")
+        GeradorDeMapasController.escrever_json(GeradorDeMapasController.gerar_geometrico_aleatorio(2_000), caminho_pro_json)
+        mapas: dict[str, 'Mapa'] = {
+            "json": Mapa(caminho_pro_json),
+            "compilado": Mapa(caminho_pro_json, usar_binario=True),
+            "padrao": Mapa()
+        }
+
+        falhas: int = 0
+        Rota.cache_de_rotas = CacheDeRotas(capacidade=256)
+
+        for descricao, mapa in mapas.items():
+            nomes: list[str] = list(mapa.lista_de_nomes_de_cidades)
+            consultas: list[tuple[str, str, str]] = [
+                (*aleatorio.sample(nomes, 2), aleatorio.choice(ALGORITMOS if len(nomes) < 100 else ALGORITMOS[:-1]))
+                for _ in range(quantidade_de_rotas)
+            ]
+
+            inicio: float = perf_counter()
+            resultados_em_serie: list = [calcular(mapa, consulta, False) for consulta in consultas]
+            tempo_em_serie: float = perf_counter() - inicio
+
+            inicio = perf_counter()
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                resultados_em_paralelo: list = list(executor.map(lambda consulta: calcular(mapa, consulta, True), consultas))
+            tempo_em_paralelo: float = perf_counter() - inicio
+
+            divergencias: int = sum(serie != paralelo for serie, paralelo in zip(resultados_em_serie, resultados_em_paralelo))
+            falhas += divergencias
+
+            print(
+                f"mapa {descricao:<9} | {quantidade_de_rotas} rotas | série: {tempo_em_serie:.2f} s"
+                f" | 16 threads: {tempo_em_paralelo:.2f} s | divergências: {divergencias}"
+            )
+
+        cache: 'CacheDeRotas' = Rota.cache_de_rotas
+        print(f"cache de rotas | acertos: {cache.acertos} | falhas: {cache.falhas} | remoções: {cache.remocoes}")
+
+    exit(1 if falhas else 0)
+
+if __name__ == "__main__":
+    main()
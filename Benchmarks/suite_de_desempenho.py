@@ -0,0 +1,193 @@
+"""
+Mede o desempenho da aplicação em mapas sintéticos de vários tipos e tamanhos, gerados pelo
+GeradorDeMapasController: o carregamento do Mapa a partir do JSON e do mapa compilado, as consultas da
+classe Rota com cada algoritmo, a construção do Grafo e a renderização do PNG. O Grafo e o PNG só são
+medidos nos mapas de até `--limite-do-grafo` cidades, já que o desenho com o NetworkX não foi feito para
+mapas grandes.
+
+Os resultados são gravados em JSON, junto do commit e do ambiente em que foram medidos, para que medições
+de commits diferentes possam ser comparadas com a opção `--comparar`.
+
+Execute a partir da raiz do projeto:
+
+    python -m Benchmarks.suite_de_desempenho [--tamanhos 1000 10000 1000000] [--geradores grade rodoviario]
+                                             [--saida resultados.json] [--comparar resultados_anteriores.json]
+"""
+from argparse import ArgumentParser, Namespace
+from datetime import datetime, timezone
+from json import dump, load
+from os import makedirs, path, remove
+from platform import platform, python_version
+from random import Random
+from subprocess import CalledProcessError, run
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Controllers.MapaBinarioController import MapaBinarioController
+from Exceptions.RotaNaoEncontradaError import RotaNaoEncontradaError
+from Models.Grafo import Grafo
+from Models.Mapa import Mapa
+from Models.Rota import Rota
+
+GERADORES: dict[str, callable] = {
+    "grade": GeradorDeMapasController.gerar_grade,
+    "geometrico": GeradorDeMapasController.gerar_geometrico_aleatorio,
+    "livre_de_escala": GeradorDeMapasController.gerar_livre_de_escala,
+    "rodoviario": GeradorDeMapasController.gerar_rodoviario
+}
+TAMANHOS_PADRAO: tuple[int, ...] = (1_000, 10_000, 100_000)
+ALGORITMOS_PADRAO: tuple[str, ...] = ("dijkstra", "a_estrela", "bidirecional", "alt")
+CONSULTAS_POR_MAPA: int = 20
+LIMITE_DO_GRAFO: int = 2_000
+DIRETORIO_DOS_RESULTADOS: str = path.join("Benchmarks", "resultados")
+
+def ler_argumentos() -> 'Namespace':
+    """
+    Lê as opções da linha de comando.
+    """
+    leitor: 'ArgumentParser' = ArgumentParser(description="Mede o desempenho da aplicação em mapas sintéticos.")
+    leitor.add_argument("--tamanhos", type=int, nargs="+", default=list(TAMANHOS_PADRAO), help="quantidades de cidades dos mapas")
+    leitor.add_argument("--geradores", nargs="+", choices=list(GERADORES), default=list(GERADORES), help="tipos de mapa gerados")
+    leitor.add_argument("--algoritmos", nargs="+", choices=Rota.ALGORITMOS, default=list(ALGORITMOS_PADRAO), help="algoritmos da classe Rota medidos")
+    leitor.add_argument("--consultas", type=int, default=CONSULTAS_POR_MAPA, help="rotas calculadas por mapa e algoritmo")
+    leitor.add_argument("--limite-do-grafo", type=int, default=LIMITE_DO_GRAFO, help="maior mapa em que o Grafo e o PNG são medidos")
+    leitor.add_argument("--saida", help="arquivo JSON dos resultados (padrão: Benchmarks/resultados/desempenho_<commit>.json)")
+    leitor.add_argument("--comparar", help="arquivo JSON de uma medição anterior, comparado com a atual")
+    return leitor.parse_args()
+
+def commit_atual() -> str | None:
+    """
+    Retorna o commit atual do repositório, com o sufixo "-modificado" se houver alterações não gravadas, ou
+    None se o git não estiver disponível.
+    """
+    try:
+        commit: str = run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        alteracoes: str = run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True, check=True).stdout
+    except (OSError, CalledProcessError):
+        return None
+
+    return commit + ("-modificado" if alteracoes else "")
+
+def cronometrar(funcao: callable) -> float:
+    """
+    Executa a função e retorna o tempo gasto, em segundos.
+    """
+    inicio: float = perf_counter()
+    funcao()
+    return perf_counter() - inicio
+
+def sortear_pares(mapa: 'Mapa', aleatorio: 'Random', quantidade: int) -> list[tuple[str, str]]:
+    """
+    Sorteia pares de cidades distintas ligadas por algum caminho.
+    """
+    pares: list[tuple[str, str]] = []
+
+    while len(pares) < quantidade:
+        par: tuple[str, str] = tuple(aleatorio.sample(mapa.lista_de_nomes_de_cidades, 2))
+        try:
+            Rota(mapa, *par, usar_cache=False)
+        except RotaNaoEncontradaError:
+            continue
+        pares.append(par)
+
+    return pares
+
+def medir_mapa(tipo: str, quantidade: int, argumentos: 'Namespace', diretorio: str, aleatorio: 'Random') -> list[dict]:
+    """
+    Gera um mapa e executa todas as medições nele.
+
+    Retorna uma medição por item medido, com o tempo em segundos.
+    """
+    medicoes: list[dict] = []
+
+    def registrar(medida: str, segundos: float) -> None:
+        medicoes.append({"gerador": tipo, "cidades": quantidade, "medida": medida, "segundos": segundos})
+        print(f"  {medida:<28} {segundos * 1000:12.2f} ms")
+
+    caminho_pro_json: str = path.join(diretorio, f"{tipo}_{quantidade}.json")
+    registrar("geracao", cronometrar(lambda: GeradorDeMapasController.escrever_json(GERADORES[tipo](quantidade), caminho_pro_json)))
+
+    mapas: list['Mapa'] = []
+    registrar("carregamento_json", cronometrar(lambda: mapas.append(Mapa(caminho_pro_json))))
+    mapa: 'Mapa' = mapas[0]
+
+    MapaBinarioController.escrever(mapa.indice, MapaBinarioController.caminho_do_binario(caminho_pro_json))
+    registrar("carregamento_binario", cronometrar(lambda: Mapa(caminho_pro_json, usar_binario=True)))
+
+    pares: list[tuple[str, str]] = sortear_pares(mapa, aleatorio, argumentos.consultas)
+
+    for algoritmo in argumentos.algoritmos:
+        # A primeira rota prepara os dados do algoritmo, como os pontos de referência, e é medida à parte.
+        registrar(f"preparo_{algoritmo}", cronometrar(lambda: Rota(mapa, *pares[0], algoritmo=algoritmo, usar_cache=False)))
+
+        tempo_total: float = sum(cronometrar(lambda: Rota(mapa, *par, algoritmo=algoritmo, usar_cache=False)) for par in pares)
+        registrar(f"rota_{algoritmo}", tempo_total / len(pares))
+
+    if quantidade <= argumentos.limite_do_grafo:
+        caminho: list[str] = Rota(mapa, *pares[0]).caminho
+
+        grafos: list['Grafo'] = []
+        registrar("construcao_do_grafo", cronometrar(lambda: grafos.append(Grafo(mapa, caminho))))
+
+        nome_do_arquivo: str = f"suite_de_desempenho_{tipo}_{quantidade}"
+        registrar("renderizacao_png", cronometrar(lambda: grafos[0].exibir_grafo_em_png(nome_do_arquivo)))
+        remove(path.join("Assets", "Images", f"{nome_do_arquivo}.png"))
+        plt.close("all")
+
+    return medicoes
+
+def comparar(medicoes: list[dict], caminho_anterior: str) -> None:
+    """
+    Mostra a razão entre o tempo atual e o de uma medição anterior, para cada item medido nas duas.
+    """
+    with open(caminho_anterior) as arquivo:
+        anterior: dict = load(arquivo)
+
+    tempos_anteriores: dict[tuple[str, int, str], float] = {
+        (medicao["gerador"], medicao["cidades"], medicao["medida"]): medicao["segundos"] for medicao in anterior["medicoes"]
+    }
+
+    print(f"\ncomparação com {anterior.get('commit') or caminho_anterior} (razão < 1 indica que ficou mais rápido)")
+
+    for medicao in medicoes:
+        tempo_anterior: float | None = tempos_anteriores.get((medicao["gerador"], medicao["cidades"], medicao["medida"]))
+
+        if tempo_anterior:
+            print(f"  {medicao['gerador']:<16} {medicao['cidades']:>9} {medicao['medida']:<28} {medicao['segundos'] / tempo_anterior:6.2f}x")
+
+def main() -> None:
+    argumentos: 'Namespace' = ler_argumentos()
+    aleatorio: Random = Random(23)
+    commit: str | None = commit_atual()
+    medicoes: list[dict] = []
+
+    with TemporaryDirectory() as diretorio:
+        for tipo in argumentos.geradores:
+            for quantidade in argumentos.tamanhos:
+                print(f"{tipo} com {quantidade} cidades")
+                medicoes.extend(medir_mapa(tipo, quantidade, argumentos, diretorio, aleatorio))
+
+    caminho_da_saida: str = argumentos.saida or path.join(DIRETORIO_DOS_RESULTADOS, f"desempenho_{commit or 'sem_commit'}.json")
+    makedirs(path.dirname(caminho_da_saida) or ".", exist_ok=True)
+
+    with open(caminho_da_saida, 'w') as arquivo:
+        dump({
+            "commit": commit,
+            "data": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": python_version(),
+            "plataforma": platform(),
+            "medicoes": medicoes
+        }, arquivo, indent=2)
+
+    print(f"\nresultados gravados em {caminho_da_saida}")
+
+    if argumentos.comparar:
+        comparar(medicoes, argumentos.comparar)
+
+if __name__ == "__main__":
+    main()
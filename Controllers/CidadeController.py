@@ -4,8 +4,11 @@ class CidadeController:
     """
     A classe CidadeController fornece métodos estáticos para gerenciar operações relacionadas à Cidade.
 
-    Esses métodos incluem a definição de vizinhos entre cidades, a atribuição de coordenadas a uma cidade
-    e a obtenção da lista de vizinhos de uma cidade específica.
+    Esses métodos incluem a definição de vizinhos entre cidades, a atribuição de coordenadas a uma cidade e
+    a obtenção da lista de vizinhos de uma cidade específica.
+
+    As vizinhas e as coordenadas das cidades de um Mapa já carregado são lidas do índice de adjacência e
+    não podem ser alteradas por este controlador: elas são alteradas pelos métodos do próprio Mapa.
     """
 
     @staticmethod
@@ -29,6 +32,12 @@ class CidadeController:
         -------
         None
             Este método não retorna nada.
+
+        Lança
+        ------
+        TypeError
+            Se alguma das cidades pertencer a um Mapa já carregado, cujas estradas são alteradas pelo
+            Mapa.adicionar_estrada, Mapa.alterar_distancia_da_estrada e Mapa.remover_estrada.
         """
 
         vizinhoA.vizinhas[vizinhoB.nome] = distancia
@@ -53,6 +62,12 @@ class CidadeController:
         -------
         None
             Este método não retorna nada.
+
+        Lança
+        ------
+        TypeError
+            Se a cidade pertencer a um Mapa já carregado, cujas coordenadas são alteradas pelo
+            Mapa.definir_coordenadas.
         """
 
         qual_cidade.coordenadas = coordenadas
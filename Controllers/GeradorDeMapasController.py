@@ -0,0 +1,307 @@
+from json import dump
+from math import ceil, hypot
+from random import Random
+
+class GeradorDeMapasController:
+    """
+    A classe GeradorDeMapasController fornece métodos estáticos para gerar mapas sintéticos no mesmo formato
+    JSON do mapa padrão, com as chaves "Vizinhos" e "Coordenada" para cada cidade.
+
+    Os mapas gerados servem para medir o desempenho da aplicação em escalas muito maiores que a do mapa da
+    Romênia, com estruturas diferentes: grades, mapas geométricos aleatórios, mapas livres de escala e
+    mapas com a hierarquia de ruas, avenidas e rodovias de uma malha viária. As distâncias entre vizinhos
+    são números inteiros, nunca menores que a distância em linha reta entre as coordenadas das duas
+    cidades.
+    """
+
+    @staticmethod
+    def gerar_grade(quantidade_de_cidades: int, semente: int = 0) -> dict[str, dict]:
+        """
+        Gera um mapa em forma de grade quadrada, onde cada cidade é ligada às cidades imediatamente acima,
+        abaixo, à esquerda e à direita dela.
+
+        A grade tem o menor lado que comporta a quantidade de cidades pedida, e a última linha pode ficar
+        incompleta. As cidades ficam a 10 unidades de coordenada umas das outras, e cada estrada tem entre
+        10 e 13 unidades de distância.
+
+        Parâmetros
+        ----------
+        quantidade_de_cidades : int
+            A quantidade de cidades do mapa gerado.
+        semente : int, opcional
+            A semente do gerador de números aleatórios, para que o mesmo mapa possa ser gerado novamente.
+            O padrão é 0.
+
+        Retorna
+        -------
+        dict[str, dict]
+            Um dicionário no formato do JSON de mapas da aplicação.
+        """
+        aleatorio: Random = Random(semente)
+        lado: int = ceil(quantidade_de_cidades ** 0.5)
+
+        mapa: dict[str, dict] = {
+            GeradorDeMapasController._nome_da_cidade(indice): {"Vizinhos": {}, "Coordenada": {"x": float(indice % lado * 10), "y": float(indice // lado * 10)}}
+            for indice in range(quantidade_de_cidades)
+        }
+
+        for indice in range(quantidade_de_cidades):
+            if indice % lado + 1 < lado and indice + 1 < quantidade_de_cidades:
+                GeradorDeMapasController._ligar_cidades(mapa, indice, indice + 1, aleatorio.randint(10, 13))
+            if indice + lado < quantidade_de_cidades:
+                GeradorDeMapasController._ligar_cidades(mapa, indice, indice + lado, aleatorio.randint(10, 13))
+
+        return mapa
+
+    @staticmethod
+    def gerar_geometrico_aleatorio(quantidade_de_cidades: int, vizinhos_por_cidade: int = 3, semente: int = 0) -> dict[str, dict]:
+        """
+        Gera um mapa geométrico aleatório, onde cada cidade é ligada às cidades mais próximas dela.
+
+        As cidades são espalhadas uniformemente em um quadrado e ligadas às suas `vizinhos_por_cidade`
+        vizinhas mais próximas. A busca pelas mais próximas usa uma grade de células para não comparar
+        todas as cidades entre si. A distância de cada estrada é a distância em linha reta acrescida de
+        até 30% de desvio.
+
+        Parâmetros
+        ----------
+        quantidade_de_cidades : int
+            A quantidade de cidades do mapa gerado.
+        vizinhos_por_cidade : int, opcional
+            Quantas das cidades mais próximas cada cidade recebe como vizinhas. O padrão é 3.
+        semente : int, opcional
+            A semente do gerador de números aleatórios, para que o mesmo mapa possa ser gerado novamente.
+            O padrão é 0.
+
+        Retorna
+        -------
+        dict[str, dict]
+            Um dicionário no formato do JSON de mapas da aplicação.
+        """
+        aleatorio: Random = Random(semente)
+        lado: float = quantidade_de_cidades ** 0.5 * 10
+        pontos: list[tuple[float, float]] = [(aleatorio.uniform(0, lado), aleatorio.uniform(0, lado)) for _ in range(quantidade_de_cidades)]
+
+        tamanho_da_celula: float = 10.0
+        celulas: dict[tuple[int, int], list[int]] = {}
+        for indice, (x, y) in enumerate(pontos):
+            celulas.setdefault((int(x // tamanho_da_celula), int(y // tamanho_da_celula)), []).append(indice)
+
+        mapa: dict[str, dict] = {
+            GeradorDeMapasController._nome_da_cidade(indice): {"Vizinhos": {}, "Coordenada": {"x": round(x, 3), "y": round(y, 3)}}
+            for indice, (x, y) in enumerate(pontos)
+        }
+
+        for indice, (x, y) in enumerate(pontos):
+            celula_x, celula_y = int(x // tamanho_da_celula), int(y // tamanho_da_celula)
+            candidatos: list[tuple[float, int]] = []
+            raio: int = 1
+
+            while len(candidatos) < vizinhos_por_cidade + 1 and raio <= quantidade_de_cidades:
+                candidatos = [
+                    (hypot(x - pontos[outro][0], y - pontos[outro][1]), outro)
+                    for dx in range(-raio, raio + 1)
+                    for dy in range(-raio, raio + 1)
+                    for outro in celulas.get((celula_x + dx, celula_y + dy), ())
+                ]
+                raio *= 2
+
+            for distancia_em_linha_reta, outro in sorted(candidatos)[1:vizinhos_por_cidade + 1]:
+                distancia: int = max(1, ceil(distancia_em_linha_reta * aleatorio.uniform(1.0, 1.3)))
+                GeradorDeMapasController._ligar_cidades(mapa, indice, outro, distancia)
+
+        return mapa
+
+    @staticmethod
+    def gerar_livre_de_escala(quantidade_de_cidades: int, estradas_por_cidade: int = 2, semente: int = 0) -> dict[str, dict]:
+        """
+        Gera um mapa livre de escala, em que poucas cidades concentram a maior parte das estradas, como os
+        centros de distribuição de uma malha logística ou os aeroportos de uma rede aérea.
+
+        O mapa é montado pelo modelo de Barabási-Albert: as primeiras cidades são todas ligadas entre si, e
+        cada cidade seguinte é ligada a `estradas_por_cidade` cidades já existentes, escolhidas com
+        probabilidade proporcional à quantidade de estradas que cada uma já tem. As cidades são espalhadas
+        uniformemente em um quadrado, sem relação com as ligações, então as estradas podem ser longas e a
+        heurística euclidiana orienta pouco as buscas. A distância de cada estrada é a distância em linha
+        reta acrescida de até 30% de desvio.
+
+        Parâmetros
+        ----------
+        quantidade_de_cidades : int
+            A quantidade de cidades do mapa gerado.
+        estradas_por_cidade : int, opcional
+            Quantas estradas cada cidade nova cria até as cidades já existentes. O padrão é 2.
+        semente : int, opcional
+            A semente do gerador de números aleatórios, para que o mesmo mapa possa ser gerado novamente.
+            O padrão é 0.
+
+        Retorna
+        -------
+        dict[str, dict]
+            Um dicionário no formato do JSON de mapas da aplicação.
+        """
+        aleatorio: Random = Random(semente)
+        lado: float = quantidade_de_cidades ** 0.5 * 10
+        pontos: list[tuple[float, float]] = [(aleatorio.uniform(0, lado), aleatorio.uniform(0, lado)) for _ in range(quantidade_de_cidades)]
+
+        mapa: dict[str, dict] = {
+            GeradorDeMapasController._nome_da_cidade(indice): {"Vizinhos": {}, "Coordenada": {"x": round(x, 3), "y": round(y, 3)}}
+            for indice, (x, y) in enumerate(pontos)
+        }
+
+        # Cada cidade aparece uma vez para cada estrada que tem, então sortear uma posição desta lista
+        # escolhe as cidades com probabilidade proporcional à quantidade de estradas.
+        extremidades: list[int] = []
+        cidades_iniciais: int = min(quantidade_de_cidades, estradas_por_cidade + 1)
+
+        def ligar(indice_a: int, indice_b: int) -> None:
+            distancia_em_linha_reta: float = hypot(pontos[indice_a][0] - pontos[indice_b][0], pontos[indice_a][1] - pontos[indice_b][1])
+            GeradorDeMapasController._ligar_cidades(mapa, indice_a, indice_b, max(1, ceil(distancia_em_linha_reta * aleatorio.uniform(1.0, 1.3))))
+            extremidades.extend((indice_a, indice_b))
+
+        for indice in range(cidades_iniciais):
+            for outro in range(indice):
+                ligar(indice, outro)
+
+        for indice in range(cidades_iniciais, quantidade_de_cidades):
+            escolhidas: set[int] = set()
+
+            while len(escolhidas) < estradas_por_cidade:
+                escolhidas.add(extremidades[aleatorio.randrange(len(extremidades))])
+
+            for outro in escolhidas:
+                ligar(indice, outro)
+
+        return mapa
+
+    @staticmethod
+    def gerar_rodoviario(quantidade_de_cidades: int, espacamento_das_avenidas: int = 8, espacamento_das_rodovias: int = 32, semente: int = 0) -> dict[str, dict]:
+        """
+        Gera um mapa com a hierarquia de uma malha viária: ruas lentas e incompletas, avenidas mais rápidas
+        e rodovias que ligam pontos distantes sem acessos intermediários.
+
+        As cidades formam uma grade, como em `gerar_grade`, com as coordenadas deslocadas aleatoriamente em
+        até 3 unidades. A cada `espacamento_das_avenidas` linhas e colunas há uma avenida, completa e com
+        distâncias próximas da linha reta. Entre as avenidas ficam as ruas, com distâncias de 20% a 60%
+        maiores que a linha reta, das quais uma em cada cinco não existe. A cada `espacamento_das_rodovias`
+        linhas e colunas, os cruzamentos são ligados aos próximos cruzamentos da mesma linha e da mesma
+        coluna por rodovias, um pouco mais curtas que o caminho pelas avenidas.
+
+        Parâmetros
+        ----------
+        quantidade_de_cidades : int
+            A quantidade de cidades do mapa gerado.
+        espacamento_das_avenidas : int, opcional
+            A quantidade de linhas e colunas entre duas avenidas. O padrão é 8.
+        espacamento_das_rodovias : int, opcional
+            A quantidade de linhas e colunas entre dois cruzamentos ligados por rodovias. O padrão é 32.
+        semente : int, opcional
+            A semente do gerador de números aleatórios, para que o mesmo mapa possa ser gerado novamente.
+            O padrão é 0.
+
+        Retorna
+        -------
+        dict[str, dict]
+            Um dicionário no formato do JSON de mapas da aplicação.
+        """
+        aleatorio: Random = Random(semente)
+        lado: int = ceil(quantidade_de_cidades ** 0.5)
+        pontos: list[tuple[float, float]] = [
+            (indice % lado * 10 + aleatorio.uniform(-3, 3), indice // lado * 10 + aleatorio.uniform(-3, 3))
+            for indice in range(quantidade_de_cidades)
+        ]
+
+        mapa: dict[str, dict] = {
+            GeradorDeMapasController._nome_da_cidade(indice): {"Vizinhos": {}, "Coordenada": {"x": round(x, 3), "y": round(y, 3)}}
+            for indice, (x, y) in enumerate(pontos)
+        }
+
+        def ligar(indice_a: int, indice_b: int, desvio_minimo: float, desvio_maximo: float) -> None:
+            distancia_em_linha_reta: float = hypot(pontos[indice_a][0] - pontos[indice_b][0], pontos[indice_a][1] - pontos[indice_b][1])
+            GeradorDeMapasController._ligar_cidades(mapa, indice_a, indice_b, max(1, ceil(distancia_em_linha_reta * aleatorio.uniform(desvio_minimo, desvio_maximo))))
+
+        for indice in range(quantidade_de_cidades):
+            linha, coluna = divmod(indice, lado)
+
+            for vizinha, na_avenida in ((indice + 1, linha % espacamento_das_avenidas == 0), (indice + lado, coluna % espacamento_das_avenidas == 0)):
+                if vizinha >= quantidade_de_cidades or (vizinha == indice + 1 and coluna + 1 == lado):
+                    continue
+
+                if na_avenida:
+                    ligar(indice, vizinha, 1.0, 1.05)
+                elif aleatorio.random() >= 0.2:
+                    ligar(indice, vizinha, 1.2, 1.6)
+
+            if linha % espacamento_das_rodovias == 0 and coluna % espacamento_das_rodovias == 0:
+                if coluna + espacamento_das_rodovias < lado and indice + espacamento_das_rodovias < quantidade_de_cidades:
+                    ligar(indice, indice + espacamento_das_rodovias, 1.0, 1.01)
+                if indice + espacamento_das_rodovias * lado < quantidade_de_cidades:
+                    ligar(indice, indice + espacamento_das_rodovias * lado, 1.0, 1.01)
+
+        return mapa
+
+    @staticmethod
+    def escrever_json(mapa: dict[str, dict], caminho_pro_json: str) -> None:
+        """
+        Escreve um mapa gerado em um arquivo JSON, no formato lido pela classe Mapa.
+
+        Parâmetros
+        ----------
+        mapa : dict[str, dict]
+            O mapa gerado por um dos métodos desta classe.
+        caminho_pro_json : str
+            O caminho do arquivo JSON que será escrito.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        with open(caminho_pro_json, 'w') as arquivo:
+            dump(mapa, arquivo)
+
+    # Metódo privado
+    @staticmethod
+    def _nome_da_cidade(indice: int) -> str:
+        """
+        Retorna o nome da cidade sintética de índice especificado.
+
+        Parâmetros
+        ----------
+        indice : int
+            O índice da cidade no mapa gerado.
+
+        Retorna
+        -------
+        str
+            O nome da cidade, já no formato capitalizado usado pela classe Cidade.
+        """
+        return f"Cidade {indice}"
+
+    # Metódo privado
+    @staticmethod
+    def _ligar_cidades(mapa: dict[str, dict], indice_a: int, indice_b: int, distancia: int) -> None:
+        """
+        Liga duas cidades do mapa gerado nos dois sentidos, como faz o CidadeController.definir_vizinhos.
+
+        Parâmetros
+        ----------
+        mapa : dict[str, dict]
+            O mapa gerado que está sendo construído.
+        indice_a : int
+            O índice de uma das cidades.
+        indice_b : int
+            O índice da outra cidade.
+        distancia : int
+            A distância entre as duas cidades.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        nome_a: str = GeradorDeMapasController._nome_da_cidade(indice_a)
+        nome_b: str = GeradorDeMapasController._nome_da_cidade(indice_b)
+
+        mapa[nome_a]["Vizinhos"][nome_b] = distancia
+        mapa[nome_b]["Vizinhos"][nome_a] = distancia
@@ -0,0 +1,298 @@
+from matplotlib import rcParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+from matplotlib.figure import Figure
+from matplotlib.image import imsave
+from Models.Grafo import Grafo
+import networkx as nx
+import numpy as np
+
+class GrafoController:
+    """
+    A classe GrafoController fornece métodos estáticos para desenhar o mapa e as rotas em imagens, sem o
+    pyplot: cada desenho é feito em uma figura própria, com o Agg, e nunca na figura atual do pyplot.
+
+    Por não dependerem de nenhum estado global, esses métodos podem ser usados em várias threads e em
+    vários processos ao mesmo tempo, como fazem as classes GrafoEmCamadas e ImagensEmLote.
+    """
+    # Fração da extensão das estradas que o NetworkX deixa livre em cada lado ao ajustar os eixos.
+    FOLGA_DAS_ESTRADAS: float = 0.05
+    # A compressão mais rápida do PNG; as imagens do mapa são quase todas brancas e comprimem bem mesmo assim.
+    NIVEL_DE_COMPRESSAO: int = 1
+    COR_DA_ROTA: str = "red"
+    # Com 72 pontos por polegada, cada ponto dos tamanhos do desenho dos ladrilhos ocupa um pixel.
+    DPI_DOS_LADRILHOS: int = 72
+    FONTE_DOS_NOMES_NOS_LADRILHOS: int = 8
+    FONTE_DAS_DISTANCIAS_NOS_LADRILHOS: int = 7
+
+    @staticmethod
+    def calcular_limites(indice: 'IndiceDeAdjacencia') -> tuple[float, float, float, float]:
+        """
+        Calcula os limites dos eixos a partir das coordenadas das cidades, iguais aos do ajuste automático
+        dos eixos no desenho do Grafo: a folga que o NetworkX acrescenta em volta das estradas, seguida da
+        margem do Matplotlib.
+
+        Os limites dependem apenas do conteúdo do mapa, então desenhos feitos em momentos ou processos
+        diferentes sobre o mesmo mapa ficam sempre alinhados.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa.
+
+        Retorna
+        -------
+        tuple[float, float, float, float]
+            O x mínimo, o x máximo, o y mínimo e o y máximo dos eixos.
+        """
+        limites: list[float] = []
+
+        for coordenadas, margem in ((indice.coordenadas_x, rcParams["axes.xmargin"]), (indice.coordenadas_y, rcParams["axes.ymargin"])):
+            minimo: float = min(coordenadas, default=0.0)
+            maximo: float = max(coordenadas, default=0.0)
+            amplitude: float = (maximo - minimo) * (1 + 2 * GrafoController.FOLGA_DAS_ESTRADAS)
+            folga: float = (maximo - minimo) * GrafoController.FOLGA_DAS_ESTRADAS + amplitude * margem or 1.0
+            limites.extend((minimo - folga, maximo + folga))
+
+        return tuple(limites)
+
+    @staticmethod
+    def criar_figura(limites: tuple[float, float, float, float], dpi: int, tamanho: tuple[float, float] = None) -> tuple['Figure', 'Axes']:
+        """
+        Cria uma figura com o Agg, com eixos ocupando a figura inteira e presos aos limites especificados.
+
+        Parâmetros
+        ----------
+        limites : tuple[float, float, float, float]
+            O x mínimo, o x máximo, o y mínimo e o y máximo dos eixos.
+        dpi : int
+            A resolução da figura, em pontos por polegada.
+        tamanho : tuple[float, float], opcional
+            A largura e a altura da figura, em polegadas. O padrão é None, que usa o tamanho padrão das
+            figuras do pyplot.
+
+        Retorna
+        -------
+        tuple[Figure, Axes]
+            A figura e os seus eixos.
+        """
+        figura: 'Figure' = Figure(figsize=tamanho or rcParams["figure.figsize"], dpi=dpi)
+        FigureCanvasAgg(figura)
+
+        eixos: 'Axes' = figura.add_axes((0, 0, 1, 1))
+        eixos.set_axis_off()
+        eixos.set_xlim(limites[0], limites[1])
+        eixos.set_ylim(limites[2], limites[3])
+        eixos.set_autoscale_on(False)
+
+        return figura, eixos
+
+    @staticmethod
+    def desenhar_mapa(mapa: 'Mapa', limites: tuple[float, float, float, float], dpi: int) -> 'np.ndarray':
+        """
+        Desenha o mapa inteiro com a classe Grafo, sem nenhum caminho destacado, e rasteriza o desenho.
+
+        Parâmetros
+        ----------
+        mapa : Mapa
+            O mapa desenhado.
+        limites : tuple[float, float, float, float]
+            Os limites dos eixos, como calculados por `calcular_limites`.
+        dpi : int
+            A resolução da imagem, em pontos por polegada.
+
+        Retorna
+        -------
+        np.ndarray
+            A imagem do mapa, em RGBA.
+        """
+        figura, eixos = GrafoController.criar_figura(limites, dpi)
+
+        Grafo(mapa, eixos=eixos)
+
+        figura.canvas.draw()
+        return np.asarray(figura.canvas.buffer_rgba()).copy()
+
+    @staticmethod
+    def compor_rota(camada_base: 'np.ndarray', indice: 'IndiceDeAdjacencia', limites: tuple[float, float, float, float], dpi: int, caminho: list[int]) -> 'np.ndarray':
+        """
+        Monta a imagem de uma rota: uma cópia da imagem do mapa com as estradas do caminho destacadas.
+
+        A rota é desenhada em uma figura transparente e combinada com a imagem do mapa apenas nos pontos em
+        que foi desenhada.
+
+        Parâmetros
+        ----------
+        camada_base : np.ndarray
+            A imagem do mapa, em RGBA e opaca, como desenhada por `desenhar_mapa`.
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa.
+        limites : tuple[float, float, float, float]
+            Os limites dos eixos da imagem do mapa.
+        dpi : int
+            A resolução da imagem do mapa, em pontos por polegada.
+        caminho : list[int]
+            Os identificadores das cidades do caminho, na ordem da rota.
+
+        Retorna
+        -------
+        np.ndarray
+            A imagem da rota, em RGBA.
+        """
+        figura, eixos = GrafoController.criar_figura(limites, dpi)
+        figura.patch.set_alpha(0)
+        GrafoController._desenhar_rota(eixos, indice, caminho)
+        figura.canvas.draw()
+
+        camada_da_rota: 'np.ndarray' = np.asarray(figura.canvas.buffer_rgba())
+        desenhados: tuple['np.ndarray', 'np.ndarray'] = np.nonzero(camada_da_rota[:, :, 3])
+
+        imagem: 'np.ndarray' = camada_base.copy()
+        frente: 'np.ndarray' = camada_da_rota[desenhados].astype(np.uint16)
+        fundo: 'np.ndarray' = imagem[desenhados].astype(np.uint16)
+        opacidade: 'np.ndarray' = frente[:, 3:]
+
+        # O Agg guarda as cores sem multiplicá-las pela opacidade, e a camada base é opaca.
+        fundo[:, :3] = (frente[:, :3] * opacidade + fundo[:, :3] * (255 - opacidade) + 127) // 255
+        imagem[desenhados] = fundo
+
+        return imagem
+
+    @staticmethod
+    def desenhar_ladrilho(
+        limites: tuple[float, float, float, float], tamanho: int, segmentos: 'np.ndarray', coordenadas: 'np.ndarray',
+        tamanho_das_cidades: float, largura_das_estradas: float, nomes: list[str] = None, distancias: list[int | float] = None
+    ) -> 'np.ndarray':
+        """
+        Desenha um ladrilho quadrado do mapa: as estradas e as cidades de uma região, e opcionalmente os nomes
+        das cidades e as distâncias das estradas, com as cores do desenho do Grafo.
+
+        As estradas e as cidades de fora da região também podem ser passadas, como as que ficam perto da
+        borda do ladrilho, para que os seus traços e etiquetas continuem no ladrilho vizinho.
+
+        Parâmetros
+        ----------
+        limites : tuple[float, float, float, float]
+            O x mínimo, o x máximo, o y mínimo e o y máximo da região do ladrilho.
+        tamanho : int
+            O lado do ladrilho, em pixels.
+        segmentos : np.ndarray
+            As estradas, uma por linha, com as coordenadas das suas duas cidades, no formato dos segmentos de
+            uma LineCollection.
+        coordenadas : np.ndarray
+            As coordenadas das cidades, uma por linha.
+        tamanho_das_cidades : float
+            O tamanho das cidades, em pixels quadrados. Com 0, as cidades não são desenhadas.
+        largura_das_estradas : float
+            A largura das estradas, em pixels.
+        nomes : list[str], opcional
+            Os nomes das cidades, na ordem de `coordenadas`. O padrão é None, que não desenha os nomes.
+        distancias : list[int | float], opcional
+            As distâncias das estradas, na ordem de `segmentos`. O padrão é None, que não desenha as
+            distâncias.
+
+        Retorna
+        -------
+        np.ndarray
+            A imagem do ladrilho, em RGBA.
+        """
+        lado_em_polegadas: float = tamanho / GrafoController.DPI_DOS_LADRILHOS
+        figura, eixos = GrafoController.criar_figura(limites, GrafoController.DPI_DOS_LADRILHOS, (lado_em_polegadas, lado_em_polegadas))
+        atributos: dict[str, any] = Grafo.ATRIBUTOS_PADRAO_DO_DESENHO
+
+        # Todas as estradas têm a mesma cor e largura, então formam um único caminho, com um trecho por estrada,
+        # que o Agg desenha de uma vez, sem criar um objeto por estrada como a LineCollection.
+        codigos: 'np.ndarray' = np.tile(np.array([Path.MOVETO, Path.LINETO], dtype=Path.code_type), len(segmentos))
+        estradas: 'Path' = Path(segmentos.reshape(-1, 2), codigos)
+        # O add_artist não percorre o caminho para atualizar os limites dos eixos, que já são fixos.
+        eixos.add_artist(PathPatch(estradas, fill=False, edgecolor="black", linewidth=largura_das_estradas, zorder=1))
+        if tamanho_das_cidades > 0:
+            eixos.scatter(coordenadas[:, 0], coordenadas[:, 1], s=tamanho_das_cidades, c=atributos["node_color"], linewidths=0, zorder=2)
+
+        for (coordenada_x, coordenada_y), distancia in zip(segmentos.mean(axis=1), distancias or []):
+            eixos.text(
+                coordenada_x, coordenada_y, distancia, fontsize=GrafoController.FONTE_DAS_DISTANCIAS_NOS_LADRILHOS,
+                horizontalalignment="center", verticalalignment="center", zorder=3,
+                bbox={"boxstyle": "round", "ec": (1.0, 1.0, 1.0), "fc": (1.0, 1.0, 1.0)}
+            )
+
+        for (coordenada_x, coordenada_y), nome in zip(coordenadas, nomes or []):
+            eixos.text(
+                coordenada_x, coordenada_y, nome, fontsize=GrafoController.FONTE_DOS_NOMES_NOS_LADRILHOS, color=atributos["font_color"],
+                horizontalalignment="center", verticalalignment="center", zorder=4
+            )
+
+        figura.canvas.draw()
+        return np.asarray(figura.canvas.buffer_rgba()).copy()
+
+    @staticmethod
+    def gravar_png(imagem: 'np.ndarray', destino: 'str | BinaryIO', dpi: int) -> None:
+        """
+        Grava uma imagem RGBA em PNG.
+
+        Parâmetros
+        ----------
+        imagem : np.ndarray
+            A imagem, em RGBA.
+        destino : str | BinaryIO
+            O caminho do arquivo da imagem, ou o próprio arquivo, aberto para escrita binária.
+        dpi : int
+            A resolução gravada no PNG, em pontos por polegada.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        imsave(destino, imagem, format="png", dpi=dpi, pil_kwargs={"compress_level": GrafoController.NIVEL_DE_COMPRESSAO})
+
+    # Metódo privado
+    @staticmethod
+    def _desenhar_rota(eixos: 'Axes', indice: 'IndiceDeAdjacencia', caminho: list[int]) -> None:
+        """
+        Desenha as estradas do caminho em vermelho e, por cima delas, as cidades e as distâncias do caminho,
+        com os mesmos atributos do desenho do Grafo. Nos mapas desenhados de forma vetorizada, o tamanho das
+        cidades e a largura das estradas acompanham os do desenho vetorizado.
+
+        Parâmetros
+        ----------
+        eixos : Axes
+            Os eixos em que a rota é desenhada.
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa.
+        caminho : list[int]
+            Os identificadores das cidades do caminho, na ordem da rota.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        atributos: dict[str, any] = dict(Grafo.ATRIBUTOS_PADRAO_DO_DESENHO)
+        if len(indice.vizinhos) // 2 > Grafo.ESTRADAS_PARA_DESENHO_VETORIZADO:
+            atributos["node_size"], atributos["width"] = Grafo.dimensoes_do_desenho_vetorizado(len(indice))
+
+        rota: 'nx.Graph' = nx.Graph()
+        rota.add_edges_from(
+            (indice.nomes[cidade], indice.nomes[proxima], {"dist": indice.distancia_da_estrada(cidade, proxima)})
+            for cidade, proxima in zip(caminho, caminho[1:])
+        )
+        posicoes: dict[str, tuple[float, float]] = {
+            indice.nomes[cidade]: (indice.coordenadas_x[cidade], indice.coordenadas_y[cidade]) for cidade in caminho
+        }
+
+        nx.draw_networkx_edges(rota, posicoes, ax=eixos, edge_color=GrafoController.COR_DA_ROTA, width=atributos["width"], node_size=atributos["node_size"])
+        nx.draw_networkx_nodes(
+            rota, posicoes, ax=eixos, node_color=atributos["node_color"], node_size=atributos["node_size"],
+            linewidths=None if atributos["node_size"] >= Grafo.ATRIBUTOS_PADRAO_DO_DESENHO["node_size"] else 0
+        )
+        nx.draw_networkx_labels(rota, posicoes, ax=eixos, font_color=atributos["font_color"], font_size=atributos["font_size"])
+        nx.draw_networkx_edge_labels(
+            rota,
+            pos = posicoes,
+            ax = eixos,
+            edge_labels = {(cidade, vizinha): dados["dist"] for cidade, vizinha, dados in rota.edges(data=True)},
+            font_size = 4,
+            label_pos = 0.5
+        )
@@ -0,0 +1,122 @@
+from math import hypot, inf
+
+class HeuristicaController:
+    """
+    A classe HeuristicaController fornece métodos estáticos para criar as heurísticas usadas pela busca A*.
+
+    Uma heurística é qualquer função que recebe o identificador de uma cidade no IndiceDeAdjacencia do mapa e o
+    identificador da cidade final e retorna uma estimativa, em unidades de distância, do quanto falta para
+    chegar ao destino. Para que a busca A* continue encontrando o menor caminho, essa estimativa nunca pode ser
+    maior que a distância real.
+    """
+
+    @staticmethod
+    def criar_heuristica_euclidiana(mapa: 'Mapa', escala: float = None) -> callable:
+        """
+        Cria uma heurística baseada na distância euclidiana entre as coordenadas das cidades.
+
+        As coordenadas do JSON não estão na mesma unidade das distâncias entre vizinhos, então a distância
+        euclidiana é multiplicada por um fator de escala. Se nenhum fator for informado, é usado o maior
+        fator que mantém a heurística admissível para o mapa, calculado por `calcular_escala_admissivel`.
+
+        Parâmetros
+        ----------
+        mapa : Mapa
+            O mapa cujas coordenadas serão usadas pela heurística.
+        escala : float, opcional
+            O fator que converte a distância euclidiana em unidades de distância do mapa. O padrão é None,
+            que calcula automaticamente o fator admissível.
+
+        Retorna
+        -------
+        callable
+            Uma função que recebe o identificador de uma cidade e o da cidade final e retorna a estimativa
+            de distância restante.
+        """
+        if escala is None:
+            escala = mapa.escala_admissivel_das_coordenadas()
+
+        coordenadas_x, coordenadas_y = mapa.indice.coordenadas_x, mapa.indice.coordenadas_y
+
+        def heuristica_euclidiana(cidade: int, cidade_final: int) -> float:
+            return escala * hypot(coordenadas_x[cidade] - coordenadas_x[cidade_final], coordenadas_y[cidade] - coordenadas_y[cidade_final])
+
+        return heuristica_euclidiana
+
+    @staticmethod
+    def criar_heuristica_alt(mapa: 'Mapa', pontos: 'PontosDeReferencia' = None) -> callable:
+        """
+        Cria uma heurística ALT (A*, "landmarks" e desigualdade triangular), que não depende das coordenadas
+        das cidades.
+
+        Para cada ponto de referência `L`, a desigualdade triangular garante que a distância entre uma
+        cidade `v` e a cidade final `t` é de pelo menos `|d(L, t) - d(L, v)|`. A heurística retorna o maior
+        desses limites entre todos os pontos, o que a torna admissível e consistente mesmo em mapas com
+        coordenadas ausentes ou incorretas. Se apenas uma das duas cidades for alcançável a partir de um
+        ponto, as duas estão em regiões desconexas e a estimativa é infinita.
+
+        Parâmetros
+        ----------
+        mapa : Mapa
+            O mapa cujos pontos de referência serão usados pela heurística.
+        pontos : PontosDeReferencia, opcional
+            Os pontos de referência. O padrão é None, que usa os pontos do próprio mapa, retornados por
+            `Mapa.pontos_de_referencia`.
+
+        Retorna
+        -------
+        callable
+            Uma função que recebe o identificador de uma cidade e o da cidade final e retorna a estimativa
+            de distância restante.
+        """
+        if pontos is None:
+            pontos = mapa.pontos_de_referencia()
+
+        vetores_de_distancias: list['array'] = pontos.distancias
+
+        def heuristica_alt(cidade: int, cidade_final: int) -> float:
+            estimativa: float = 0.0
+
+            for distancias in vetores_de_distancias:
+                # Quando nenhuma das duas cidades é alcançável pelo ponto, a diferença é NaN e é ignorada.
+                diferenca: float = abs(distancias[cidade_final] - distancias[cidade])
+                if diferenca > estimativa:
+                    estimativa = diferenca
+
+            return estimativa
+
+        return heuristica_alt
+
+    @staticmethod
+    def calcular_escala_admissivel(mapa: 'Mapa') -> float:
+        """
+        Calcula o maior fator de escala que torna a heurística euclidiana admissível para o mapa.
+
+        O fator é a menor razão entre a distância de uma estrada e a distância euclidiana entre as duas
+        cidades que ela conecta. Com ele, nenhuma estrada é mais curta que a estimativa em linha reta, e
+        pela desigualdade triangular nenhum caminho também é, o que torna a heurística admissível e
+        consistente. Estradas entre cidades com as mesmas coordenadas são ignoradas.
+
+        Parâmetros
+        ----------
+        mapa : Mapa
+            O mapa cujas estradas e coordenadas serão avaliadas.
+
+        Retorna
+        -------
+        float
+            O fator de escala admissível, ou 0.0 se nenhuma estrada ligar cidades com coordenadas distintas.
+        """
+        indice: 'IndiceDeAdjacencia' = mapa.indice
+        coordenadas_x, coordenadas_y = indice.coordenadas_x, indice.coordenadas_y
+        menor_razao: float = inf
+
+        for cidade in range(len(indice)):
+            for posicao in range(indice.deslocamentos[cidade], indice.deslocamentos[cidade + 1]):
+                vizinho: int = indice.vizinhos[posicao]
+                distancia_em_linha_reta: float = hypot(coordenadas_x[cidade] - coordenadas_x[vizinho], coordenadas_y[cidade] - coordenadas_y[vizinho])
+
+                if distancia_em_linha_reta > 0:
+                    menor_razao = min(menor_razao, indice.pesos[posicao] / distancia_em_linha_reta)
+
+        return menor_razao if menor_razao != inf else 0.0
@@ -0,0 +1,532 @@
+from array import array
+from heapq import heappush, heappop
+from itertools import chain
+from math import inf
+from os import path, replace
+from struct import Struct, error as StructError
+from sys import byteorder
+from tempfile import mkstemp
+from Models.HierarquiaDeContracao import HierarquiaDeContracao
+from Controllers.RotaController import RotaController
+from Exceptions.RotaNaoEncontradaError import RotaNaoEncontradaError
+
+class HierarquiaDeContracaoController:
+    """
+    A classe HierarquiaDeContracaoController fornece métodos estáticos para construir a hierarquia de
+    contração de um IndiceDeAdjacencia, gravá-la ao lado do arquivo do mapa, carregá-la de volta e
+    calcular rotas sobre ela.
+
+    A ordem de contração segue a heurística da diferença de arestas: a cada passo é contraída a cidade cuja
+    contração cria menos atalhos em relação às estradas que remove, somada à quantidade de vizinhas já
+    contraídas e ao nível da cidade na hierarquia, o que espalha as contrações pelo mapa. As prioridades
+    são atualizadas de forma preguiçosa: a cidade retirada da fila tem a prioridade recalculada e volta
+    para a fila se deixou de ser a menor. Um atalho só é criado quando uma busca local, que
+    ignora a cidade sendo contraída, não encontra outro caminho tão curto entre as duas vizinhas (a
+    "testemunha"). A busca de testemunhas é limitada para que o pré-processamento termine rápido, o que
+    pode criar alguns atalhos desnecessários, mas nunca compromete o menor caminho.
+
+    O arquivo gravado começa com um cabeçalho fixo, que inclui o resumo do conteúdo do mapa, e segue com
+    os vetores da hierarquia, na ordem: deslocamentos, pesos, vizinhos, meios e ordem de contração.
+    """
+    ASSINATURA: bytes = b"RCHC"
+    VERSAO_DO_FORMATO: int = 1
+    EXTENSAO: str = ".rch"
+    # Assinatura, ordem dos bytes, tipo dos pesos, versão, cidades, arestas de subida e resumo do mapa.
+    CABECALHO: 'Struct' = Struct("<4scc2xIQQ16s")
+    # Quantidade máxima de cidades expandidas por cada busca de testemunhas.
+    LIMITE_DA_BUSCA_DE_TESTEMUNHAS: int = 60
+
+    @staticmethod
+    def caminho_da_hierarquia(caminho_do_mapa: str) -> str:
+        """
+        Retorna o caminho do arquivo da hierarquia correspondente a um arquivo de mapa, ao lado dele.
+
+        Parâmetros
+        ----------
+        caminho_do_mapa : str
+            O caminho para o arquivo do mapa, JSON ou compilado.
+
+        Retorna
+        -------
+        str
+            O caminho do arquivo da hierarquia, com a extensão ".rch" no lugar da extensão do mapa.
+        """
+        return path.splitext(caminho_do_mapa)[0] + HierarquiaDeContracaoController.EXTENSAO
+
+    @staticmethod
+    def precisa_construir(caminho_da_hierarquia: str, hash_do_mapa: str) -> bool:
+        """
+        Verifica se a hierarquia precisa ser construída novamente.
+
+        Isso acontece quando o arquivo não existe, quando foi gerado para um mapa com outro conteúdo ou
+        quando foi gerado em outra versão do formato ou em uma máquina com outra ordem de bytes.
+
+        Parâmetros
+        ----------
+        caminho_da_hierarquia : str
+            O caminho para o arquivo da hierarquia.
+        hash_do_mapa : str
+            O resumo do conteúdo do mapa atual.
+
+        Retorna
+        -------
+        bool
+            True se a hierarquia precisar ser construída novamente, False caso contrário.
+        """
+        if not path.exists(caminho_da_hierarquia):
+            return True
+
+        with open(caminho_da_hierarquia, 'rb') as arquivo:
+            cabecalho: bytes = arquivo.read(HierarquiaDeContracaoController.CABECALHO.size)
+
+        if not HierarquiaDeContracaoController._cabecalho_valido(cabecalho):
+            return True
+
+        return HierarquiaDeContracaoController.CABECALHO.unpack(cabecalho)[-1].hex() != hash_do_mapa
+
+    @staticmethod
+    def construir(indice: 'IndiceDeAdjacencia', hash_do_mapa: str) -> 'HierarquiaDeContracao':
+        """
+        Constrói a hierarquia de contração de um mapa.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa.
+        hash_do_mapa : str
+            O resumo do conteúdo do mapa, guardado na hierarquia para identificar o mapa de origem.
+
+        Retorna
+        -------
+        HierarquiaDeContracao
+            A hierarquia com as arestas de subida de cada cidade, incluindo os atalhos.
+        """
+        quantidade_de_cidades: int = len(indice)
+        deslocamentos, vizinhos, pesos = indice.deslocamentos, indice.vizinhos, indice.pesos
+
+        # Cada cidade ainda não contraída guarda as vizinhas também não contraídas, com a distância e a
+        # cidade contraída que a ligação substitui (-1 nas estradas originais).
+        ligacoes: list[dict[int, tuple[int, int]]] = [{} for _ in range(quantidade_de_cidades)]
+        for cidade in range(quantidade_de_cidades):
+            for posicao in range(deslocamentos[cidade], deslocamentos[cidade + 1]):
+                vizinha: int = vizinhos[posicao]
+                if vizinha != cidade and pesos[posicao] < ligacoes[cidade].get(vizinha, (inf,))[0]:
+                    ligacoes[cidade][vizinha] = (pesos[posicao], -1)
+                    ligacoes[vizinha][cidade] = (pesos[posicao], -1)
+
+        vizinhas_contraidas: list[int] = [0] * quantidade_de_cidades
+        niveis: list[int] = [0] * quantidade_de_cidades
+        prioridades: list[int] = [0] * quantidade_de_cidades
+        fila: list[tuple[int, int]] = []
+
+        for cidade in range(quantidade_de_cidades):
+            prioridades[cidade] = HierarquiaDeContracaoController._prioridade(ligacoes, vizinhas_contraidas, niveis, cidade)[0]
+            heappush(fila, (prioridades[cidade], cidade))
+
+        ordem: 'array' = array('i', [-1]) * quantidade_de_cidades
+        arestas_de_subida: list[dict[int, tuple[int, int]]] = [{} for _ in range(quantidade_de_cidades)]
+        posicao_na_ordem: int = 0
+
+        while fila:
+            prioridade, cidade = heappop(fila)
+
+            if ordem[cidade] >= 0 or prioridade != prioridades[cidade]:
+                continue
+
+            prioridade, atalhos = HierarquiaDeContracaoController._prioridade(ligacoes, vizinhas_contraidas, niveis, cidade)
+            if fila and prioridade > fila[0][0]:
+                prioridades[cidade] = prioridade
+                heappush(fila, (prioridade, cidade))
+                continue
+
+            ordem[cidade] = posicao_na_ordem
+            posicao_na_ordem += 1
+            arestas_de_subida[cidade] = ligacoes[cidade]
+            ligacoes[cidade] = {}
+
+            for vizinha in arestas_de_subida[cidade]:
+                del ligacoes[vizinha][cidade]
+                vizinhas_contraidas[vizinha] += 1
+                niveis[vizinha] = max(niveis[vizinha], niveis[cidade] + 1)
+
+            for cidade_a, cidade_b, distancia in atalhos:
+                if distancia < ligacoes[cidade_a].get(cidade_b, (inf,))[0]:
+                    ligacoes[cidade_a][cidade_b] = (distancia, cidade)
+                    ligacoes[cidade_b][cidade_a] = (distancia, cidade)
+
+
+        deslocamentos_de_subida: 'array' = array('q', [0])
+        vizinhos_de_subida: 'array' = array('i')
+        pesos_de_subida: 'array' = array(indice.tipo_dos_pesos())
+        meios: 'array' = array('i')
+
+        for cidade in range(quantidade_de_cidades):
+            for vizinha, (distancia, meio) in sorted(arestas_de_subida[cidade].items()):
+                vizinhos_de_subida.append(vizinha)
+                pesos_de_subida.append(distancia)
+                meios.append(meio)
+            deslocamentos_de_subida.append(len(vizinhos_de_subida))
+
+        return HierarquiaDeContracao(hash_do_mapa, ordem, deslocamentos_de_subida, vizinhos_de_subida, pesos_de_subida, meios)
+
+    @staticmethod
+    def escrever(hierarquia: 'HierarquiaDeContracao', caminho_da_hierarquia: str) -> None:
+        """
+        Grava a hierarquia de contração em arquivo.
+
+        O arquivo é escrito primeiro com um nome temporário exclusivo e depois renomeado, de modo que outros
+        processos que estejam carregando a mesma hierarquia nunca encontrem um arquivo pela metade, mesmo
+        que mais de um processo a grave ao mesmo tempo.
+
+        Parâmetros
+        ----------
+        hierarquia : HierarquiaDeContracao
+            A hierarquia que será gravada.
+        caminho_da_hierarquia : str
+            O caminho do arquivo que será escrito.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        cabecalho: bytes = HierarquiaDeContracaoController.CABECALHO.pack(
+            HierarquiaDeContracaoController.ASSINATURA,
+            byteorder[0].encode(),
+            hierarquia.pesos.typecode.encode(),
+            HierarquiaDeContracaoController.VERSAO_DO_FORMATO,
+            len(hierarquia),
+            len(hierarquia.vizinhos),
+            bytes.fromhex(hierarquia.hash_do_mapa)
+        )
+
+        descritor, caminho_temporario = mkstemp(suffix=".tmp", dir=path.dirname(caminho_da_hierarquia) or ".")
+
+        with open(descritor, 'wb') as arquivo:
+            arquivo.write(cabecalho)
+            for vetor in (hierarquia.deslocamentos, hierarquia.pesos, hierarquia.vizinhos, hierarquia.meios, hierarquia.ordem):
+                vetor.tofile(arquivo)
+
+        replace(caminho_temporario, caminho_da_hierarquia)
+
+    @staticmethod
+    def carregar(caminho_da_hierarquia: str) -> 'HierarquiaDeContracao':
+        """
+        Carrega uma hierarquia de contração gravada em arquivo.
+
+        Parâmetros
+        ----------
+        caminho_da_hierarquia : str
+            O caminho para o arquivo da hierarquia.
+
+        Retorna
+        -------
+        HierarquiaDeContracao
+            A hierarquia gravada no arquivo.
+
+        Lança
+        ------
+        FileNotFoundError
+            Se o arquivo não for encontrado.
+        ValueError
+            Se o arquivo não for uma hierarquia válida nesta versão do formato.
+        """
+        try:
+            with open(caminho_da_hierarquia, 'rb') as arquivo:
+                cabecalho: bytes = arquivo.read(HierarquiaDeContracaoController.CABECALHO.size)
+
+                if not HierarquiaDeContracaoController._cabecalho_valido(cabecalho):
+                    raise ValueError("Hierarquia de contração inválida ou gerada em outra versão do formato.")
+
+                _, _, tipo_dos_pesos, _, quantidade_de_cidades, quantidade_de_arestas, hash_do_mapa = HierarquiaDeContracaoController.CABECALHO.unpack(cabecalho)
+
+                vetores: list['array'] = []
+                for tipo, quantidade in (('q', quantidade_de_cidades + 1), (tipo_dos_pesos.decode(), quantidade_de_arestas), ('i', quantidade_de_arestas), ('i', quantidade_de_arestas), ('i', quantidade_de_cidades)):
+                    vetor: 'array' = array(tipo)
+                    vetor.fromfile(arquivo, quantidade)
+                    vetores.append(vetor)
+        except FileNotFoundError as erro_de_caminho_nao_encontrado:
+            raise FileNotFoundError("Arquivo não encontrado.") from erro_de_caminho_nao_encontrado
+        except EOFError as erro_de_arquivo_incompleto:
+            raise ValueError("Hierarquia de contração incompleta.") from erro_de_arquivo_incompleto
+
+        deslocamentos, pesos, vizinhos, meios, ordem = vetores
+
+        return HierarquiaDeContracao(hash_do_mapa.hex(), ordem, deslocamentos, vizinhos, pesos, meios)
+
+    @staticmethod
+    def buscar(hierarquia: 'HierarquiaDeContracao', indice: 'IndiceDeAdjacencia', origem: int, destino: int, estatisticas: 'Estatisticas' = None) -> tuple[list[int], int, int]:
+        """
+        Calcula o menor caminho entre duas cidades sobre a hierarquia de contração.
+
+        São feitas duas buscas de Dijkstra, uma a partir de cada cidade, que só sobem na hierarquia, ou
+        seja, só seguem arestas para cidades contraídas depois. O menor caminho é o de menor soma das
+        distâncias das duas buscas em uma cidade alcançada por ambas. Cada lado para quando a menor
+        prioridade da sua fila alcança a distância desse caminho. Uma cidade que pode ser alcançada mais
+        perto por uma aresta vinda de uma cidade acima dela não é expandida ("stall-on-demand"), pois a sua
+        distância atual não é a menor. Por fim, os atalhos do caminho são desempacotados nas estradas
+        originais do mapa.
+
+        Parâmetros
+        ----------
+        hierarquia : HierarquiaDeContracao
+            A hierarquia de contração do mapa.
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa, usado apenas na mensagem de erro.
+        origem : int
+            O identificador da cidade de partida.
+        destino : int
+            O identificador da cidade de chegada.
+        estatisticas : Estatisticas, opcional
+            As estatísticas em que as operações da busca são contadas, com as estradas examinadas contadas
+            sobre a hierarquia. O padrão é None, que não conta nada.
+
+        Retorna
+        -------
+        tuple[list[int], int, int]
+            O caminho, como lista de identificadores de cidades da inicial até a final, com os atalhos já
+            desempacotados, a distância total percorrida e a quantidade de cidades expandidas.
+
+        Lança
+        ------
+        RotaNaoEncontradaError
+            Se não existir nenhum caminho entre as duas cidades.
+        """
+        deslocamentos, vizinhos, pesos = hierarquia.deslocamentos, hierarquia.vizinhos, hierarquia.pesos
+
+        distancias: tuple[dict[int, int], dict[int, int]] = ({origem: 0}, {destino: 0})
+        antecessores: tuple[dict[int, tuple[int, int]], dict[int, tuple[int, int]]] = ({}, {})
+        visitadas: tuple[set[int], set[int]] = (set(), set())
+        filas: tuple[list[tuple[int, int]], list[tuple[int, int]]] = ([(0, origem)], [(0, destino)])
+        empurrar, retirar = RotaController._operacoes_da_fila(estatisticas)
+
+        melhor_distancia: float = inf
+        cidade_de_encontro: int = -1
+
+        while True:
+            topo_da_ida: float = filas[0][0][0] if filas[0] else inf
+            topo_da_volta: float = filas[1][0][0] if filas[1] else inf
+
+            if min(topo_da_ida, topo_da_volta) >= melhor_distancia:
+                break
+
+            lado: int = 0 if topo_da_ida <= topo_da_volta else 1
+            distancia_atual, atual = retirar(filas[lado])
+
+            if atual in visitadas[lado]:
+                continue
+
+            visitadas[lado].add(atual)
+
+            distancia_do_outro_lado: float = distancias[1 - lado].get(atual, inf)
+            if distancia_atual + distancia_do_outro_lado < melhor_distancia:
+                melhor_distancia = distancia_atual + distancia_do_outro_lado
+                cidade_de_encontro = atual
+
+            arestas: range = range(deslocamentos[atual], deslocamentos[atual + 1])
+            if any(distancias[lado].get(vizinhos[posicao], inf) + pesos[posicao] < distancia_atual for posicao in arestas):
+                continue
+
+            for posicao in arestas:
+                vizinho: int = vizinhos[posicao]
+                nova_distancia: int = distancia_atual + pesos[posicao]
+
+                if nova_distancia < distancias[lado].get(vizinho, inf):
+                    distancias[lado][vizinho] = nova_distancia
+                    antecessores[lado][vizinho] = (atual, posicao)
+                    empurrar(filas[lado], (nova_distancia, vizinho))
+
+        if estatisticas is not None:
+            estatisticas.registrar_busca(deslocamentos, chain(*visitadas), 2)
+
+        if cidade_de_encontro < 0:
+            raise RotaNaoEncontradaError(RotaController._mensagem_de_rota_inexistente(indice, origem, destino))
+
+        caminho_de_ida: list[int] = HierarquiaDeContracaoController._desempacotar_caminho(hierarquia, antecessores[0], cidade_de_encontro)
+        caminho_de_volta: list[int] = HierarquiaDeContracaoController._desempacotar_caminho(hierarquia, antecessores[1], cidade_de_encontro)
+
+        return caminho_de_ida + caminho_de_volta[::-1][1:], melhor_distancia, len(visitadas[0]) + len(visitadas[1])
+
+    # Metódo privado
+    @staticmethod
+    def _prioridade(ligacoes: list[dict[int, tuple[int, int]]], vizinhas_contraidas: list[int], niveis: list[int], cidade: int) -> tuple[int, list[tuple[int, int, int]]]:
+        """
+        Simula a contração de uma cidade e calcula a sua prioridade na ordem de contração.
+
+        Parâmetros
+        ----------
+        ligacoes : list[dict[int, tuple[int, int]]]
+            As ligações entre as cidades ainda não contraídas.
+        vizinhas_contraidas : list[int]
+            A quantidade de vizinhas já contraídas de cada cidade.
+        niveis : list[int]
+            O nível de cada cidade na hierarquia, um a mais que o da vizinha contraída de maior nível.
+        cidade : int
+            O identificador da cidade.
+
+        Retorna
+        -------
+        tuple[int, list[tuple[int, int, int]]]
+            A prioridade da cidade, em que valores menores são contraídos antes, e os atalhos que a sua
+            contração criaria, como (cidade A, cidade B, distância).
+        """
+        vizinhas: list[tuple[int, int]] = [(vizinha, distancia) for vizinha, (distancia, _) in ligacoes[cidade].items()]
+        atalhos: list[tuple[int, int, int]] = []
+
+        for posicao, (cidade_a, distancia_a) in enumerate(vizinhas[:-1]):
+            demais_vizinhas: list[tuple[int, int]] = vizinhas[posicao + 1:]
+            limite: int = distancia_a + max(distancia for _, distancia in demais_vizinhas)
+            testemunhas: dict[int, int] = HierarquiaDeContracaoController._buscar_testemunhas(ligacoes, cidade_a, cidade, limite)
+
+            for cidade_b, distancia_b in demais_vizinhas:
+                if testemunhas.get(cidade_b, inf) > distancia_a + distancia_b:
+                    atalhos.append((cidade_a, cidade_b, distancia_a + distancia_b))
+
+        return len(atalhos) - len(vizinhas) + vizinhas_contraidas[cidade] + niveis[cidade], atalhos
+
+    # Metódo privado
+    @staticmethod
+    def _buscar_testemunhas(ligacoes: list[dict[int, tuple[int, int]]], origem: int, ignorada: int, limite: int) -> dict[int, int]:
+        """
+        Faz uma busca de Dijkstra local a partir de uma cidade, sem passar pela cidade sendo contraída.
+
+        A busca não segue caminhos mais longos que o limite e para depois de expandir
+        `LIMITE_DA_BUSCA_DE_TESTEMUNHAS` cidades. As distâncias retornadas podem não ser as menores, mas
+        sempre correspondem a caminhos que existem, então bastam para descartar atalhos.
+
+        Parâmetros
+        ----------
+        ligacoes : list[dict[int, tuple[int, int]]]
+            As ligações entre as cidades ainda não contraídas.
+        origem : int
+            O identificador da cidade de partida.
+        ignorada : int
+            O identificador da cidade sendo contraída.
+        limite : int
+            A maior distância de interesse.
+
+        Retorna
+        -------
+        dict[int, int]
+            A distância de um caminho da origem até cada cidade alcançada sem passar pela cidade ignorada.
+        """
+        distancias: dict[int, int] = {origem: 0}
+        fila: list[tuple[int, int]] = [(0, origem)]
+        expandidas: int = 0
+
+        while fila and expandidas < HierarquiaDeContracaoController.LIMITE_DA_BUSCA_DE_TESTEMUNHAS:
+            distancia_atual, atual = heappop(fila)
+
+            if distancia_atual > distancias[atual]:
+                continue
+
+            expandidas += 1
+
+            for vizinha, (distancia, _) in ligacoes[atual].items():
+                nova_distancia: int = distancia_atual + distancia
+
+                if vizinha != ignorada and nova_distancia <= limite and nova_distancia < distancias.get(vizinha, inf):
+                    distancias[vizinha] = nova_distancia
+                    heappush(fila, (nova_distancia, vizinha))
+
+        return distancias
+
+    # Metódo privado
+    @staticmethod
+    def _desempacotar_caminho(hierarquia: 'HierarquiaDeContracao', antecessores: dict[int, tuple[int, int]], ate: int) -> list[int]:
+        """
+        Reconstrói o caminho de uma das buscas até uma cidade, trocando cada atalho pelas estradas originais
+        que ele substitui.
+
+        Parâmetros
+        ----------
+        hierarquia : HierarquiaDeContracao
+            A hierarquia de contração do mapa.
+        antecessores : dict[int, tuple[int, int]]
+            A cidade anterior de cada cidade alcançada pela busca e a posição da aresta usada.
+        ate : int
+            O identificador da cidade onde o caminho termina.
+
+        Retorna
+        -------
+        list[int]
+            O caminho, como lista de identificadores de cidades, da cidade de partida da busca até a
+            cidade informada.
+        """
+        arestas: list[tuple[int, int, int]] = []
+        atual: int = ate
+
+        while atual in antecessores:
+            anterior, posicao = antecessores[atual]
+            arestas.append((anterior, atual, posicao))
+            atual = anterior
+
+        caminho: list[int] = [atual]
+        pendentes: list[tuple[int, int, int]] = arestas
+
+        while pendentes:
+            cidade_a, cidade_b, posicao = pendentes.pop()
+            meio: int = hierarquia.meios[posicao]
+
+            if meio < 0:
+                caminho.append(cidade_b)
+                continue
+
+            pendentes.append((meio, cidade_b, HierarquiaDeContracaoController._posicao_da_aresta(hierarquia, meio, cidade_b)))
+            pendentes.append((cidade_a, meio, HierarquiaDeContracaoController._posicao_da_aresta(hierarquia, meio, cidade_a)))
+
+        return caminho
+
+    # Metódo privado
+    @staticmethod
+    def _posicao_da_aresta(hierarquia: 'HierarquiaDeContracao', de: int, para: int) -> int:
+        """
+        Retorna a posição da aresta de subida entre duas cidades, procurando entre as arestas da primeira.
+
+        Parâmetros
+        ----------
+        hierarquia : HierarquiaDeContracao
+            A hierarquia de contração do mapa.
+        de : int
+            O identificador da cidade contraída antes, dona da aresta.
+        para : int
+            O identificador da outra cidade.
+
+        Retorna
+        -------
+        int
+            A posição da aresta nos vetores da hierarquia.
+        """
+        for posicao in range(hierarquia.deslocamentos[de], hierarquia.deslocamentos[de + 1]):
+            if hierarquia.vizinhos[posicao] == para:
+                return posicao
+
+        raise ValueError("Hierarquia de contração inconsistente: atalho sem aresta correspondente.")
+
+    # Metódo privado
+    @staticmethod
+    def _cabecalho_valido(cabecalho: bytes) -> bool:
+        """
+        Verifica se um cabeçalho foi gerado por esta versão do formato, nesta ordem de bytes.
+
+        Parâmetros
+        ----------
+        cabecalho : bytes
+            Os primeiros bytes do arquivo da hierarquia.
+
+        Retorna
+        -------
+        bool
+            True se o cabeçalho for válido, False caso contrário.
+        """
+        try:
+            assinatura, ordem_dos_bytes, tipo_dos_pesos, versao, *_ = HierarquiaDeContracaoController.CABECALHO.unpack(cabecalho)
+        except StructError:
+            return False
+
+        return (
+            assinatura == HierarquiaDeContracaoController.ASSINATURA
+            and ordem_dos_bytes == byteorder[0].encode()
+            and tipo_dos_pesos in (b'q', b'd')
+            and versao == HierarquiaDeContracaoController.VERSAO_DO_FORMATO
+        )
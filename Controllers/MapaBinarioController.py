@@ -0,0 +1,218 @@
+from array import array
+from mmap import mmap, ACCESS_READ
+from os import path, replace
+from struct import Struct, error as StructError
+from sys import byteorder
+from Models.IndiceDeAdjacencia import IndiceDeAdjacencia
+from Models.TabelaDeNomes import TabelaDeNomes
+
+class MapaBinarioController:
+    """
+    A classe MapaBinarioController fornece métodos estáticos para compilar o IndiceDeAdjacencia de um mapa em
+    um arquivo binário versionado e para carregá-lo de volta mapeando o arquivo em memória (`mmap`).
+
+    O arquivo começa com um cabeçalho fixo e segue com as seções do índice gravadas lado a lado, na ordem:
+    deslocamentos, pesos, coordenadas X e Y, deslocamentos dos nomes, vizinhos, ordem alfabética dos nomes
+    e o bloco de texto com os nomes. As seções de 8 bytes vêm antes das de 4 bytes para que todas fiquem
+    alinhadas sem preenchimento. Ao carregar, cada seção vira uma `memoryview` do próprio arquivo mapeado,
+    sem cópia, então processos que carregam o mesmo arquivo compartilham as mesmas páginas de memória.
+    """
+    ASSINATURA: bytes = b"RMAP"
+    VERSAO_DO_FORMATO: int = 1
+    EXTENSAO: str = ".rmap"
+    # Assinatura, ordem dos bytes, tipo dos pesos, versão, cidades, posições de vizinhos e tamanho do texto.
+    CABECALHO: 'Struct' = Struct("<4scc2xIQQQ4x")
+
+    @staticmethod
+    def caminho_do_binario(caminho_pro_json: str) -> str:
+        """
+        Retorna o caminho do arquivo compilado correspondente a um JSON de mapa, ao lado dele.
+
+        Parâmetros
+        ----------
+        caminho_pro_json : str
+            O caminho para o arquivo JSON do mapa.
+
+        Retorna
+        -------
+        str
+            O caminho do arquivo compilado, com a extensão ".rmap" no lugar da extensão do JSON.
+        """
+        return path.splitext(caminho_pro_json)[0] + MapaBinarioController.EXTENSAO
+
+    @staticmethod
+    def precisa_compilar(caminho_pro_json: str, caminho_do_binario: str) -> bool:
+        """
+        Verifica se o arquivo compilado precisa ser gerado novamente a partir do JSON.
+
+        Isso acontece quando o arquivo compilado não existe, quando o JSON foi modificado depois dele ou
+        quando ele foi gerado em outra versão do formato ou em uma máquina com outra ordem de bytes.
+
+        Parâmetros
+        ----------
+        caminho_pro_json : str
+            O caminho para o arquivo JSON do mapa.
+        caminho_do_binario : str
+            O caminho para o arquivo compilado.
+
+        Retorna
+        -------
+        bool
+            True se o arquivo compilado precisar ser gerado novamente, False caso contrário.
+        """
+        if not path.exists(caminho_do_binario):
+            return True
+        if path.getmtime(caminho_pro_json) > path.getmtime(caminho_do_binario):
+            return True
+
+        with open(caminho_do_binario, 'rb') as arquivo:
+            return not MapaBinarioController._cabecalho_valido(arquivo.read(MapaBinarioController.CABECALHO.size))
+
+    @staticmethod
+    def escrever(indice: 'IndiceDeAdjacencia', caminho_do_binario: str) -> None:
+        """
+        Grava o índice de adjacência de um mapa no formato binário compilado.
+
+        O arquivo é escrito primeiro com um nome temporário e depois renomeado, de modo que outros processos
+        que estejam carregando o mesmo mapa nunca encontrem um arquivo pela metade.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice que será gravado.
+        caminho_do_binario : str
+            O caminho do arquivo compilado que será escrito.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        nomes_codificados: list[bytes] = [nome.encode("utf-8") for nome in indice.nomes]
+        deslocamentos_dos_nomes: 'array' = array('q', [0])
+        for nome_codificado in nomes_codificados:
+            deslocamentos_dos_nomes.append(deslocamentos_dos_nomes[-1] + len(nome_codificado))
+
+        ordem_alfabetica: 'array' = array('i', sorted(range(len(indice)), key=indice.nomes.__getitem__))
+        tipo_dos_pesos: str = indice.tipo_dos_pesos()
+
+        cabecalho: bytes = MapaBinarioController.CABECALHO.pack(
+            MapaBinarioController.ASSINATURA,
+            byteorder[0].encode(),
+            tipo_dos_pesos.encode(),
+            MapaBinarioController.VERSAO_DO_FORMATO,
+            len(indice),
+            len(indice.vizinhos),
+            deslocamentos_dos_nomes[-1]
+        )
+
+        secoes: list = [
+            array('q', indice.deslocamentos),
+            array(tipo_dos_pesos, indice.pesos),
+            array('d', indice.coordenadas_x),
+            array('d', indice.coordenadas_y),
+            deslocamentos_dos_nomes,
+            array('i', indice.vizinhos),
+            ordem_alfabetica
+        ]
+
+        caminho_temporario: str = caminho_do_binario + ".tmp"
+
+        with open(caminho_temporario, 'wb') as arquivo:
+            arquivo.write(cabecalho)
+            for secao in secoes:
+                secao.tofile(arquivo)
+            arquivo.write(b"".join(nomes_codificados))
+
+        replace(caminho_temporario, caminho_do_binario)
+
+    @staticmethod
+    def carregar(caminho_do_binario: str) -> 'IndiceDeAdjacencia':
+        """
+        Carrega um mapa compilado, mapeando o arquivo em memória sem copiar o seu conteúdo.
+
+        Parâmetros
+        ----------
+        caminho_do_binario : str
+            O caminho para o arquivo compilado.
+
+        Retorna
+        -------
+        IndiceDeAdjacencia
+            O índice de adjacência do mapa, com vetores que são visões do arquivo mapeado.
+
+        Lança
+        ------
+        FileNotFoundError
+            Se o arquivo não for encontrado.
+        ValueError
+            Se o arquivo não for um mapa compilado válido nesta versão do formato.
+        """
+        try:
+            with open(caminho_do_binario, 'rb') as arquivo:
+                mapeamento: 'mmap' = mmap(arquivo.fileno(), 0, access=ACCESS_READ)
+        except FileNotFoundError as erro_de_caminho_nao_encontrado:
+            raise FileNotFoundError("Arquivo não encontrado.") from erro_de_caminho_nao_encontrado
+        except ValueError as erro_de_mapeamento:
+            raise ValueError("Mapa compilado inválido.") from erro_de_mapeamento
+
+        if not MapaBinarioController._cabecalho_valido(mapeamento[:MapaBinarioController.CABECALHO.size]):
+            raise ValueError("Mapa compilado inválido ou gerado em outra versão do formato.")
+
+        _, _, tipo_dos_pesos, _, quantidade_de_cidades, quantidade_de_posicoes, tamanho_do_texto = MapaBinarioController.CABECALHO.unpack_from(mapeamento)
+
+        visao: 'memoryview' = memoryview(mapeamento)
+        posicao: int = MapaBinarioController.CABECALHO.size
+
+        def proxima_secao(tipo: str, quantidade: int) -> 'memoryview':
+            nonlocal posicao
+
+            tamanho: int = quantidade * array(tipo).itemsize
+            secao: 'memoryview' = visao[posicao:posicao + tamanho].cast(tipo)
+            posicao += tamanho
+
+            return secao
+
+        deslocamentos: 'memoryview' = proxima_secao('q', quantidade_de_cidades + 1)
+        pesos: 'memoryview' = proxima_secao(tipo_dos_pesos.decode(), quantidade_de_posicoes)
+        coordenadas_x: 'memoryview' = proxima_secao('d', quantidade_de_cidades)
+        coordenadas_y: 'memoryview' = proxima_secao('d', quantidade_de_cidades)
+        deslocamentos_dos_nomes: 'memoryview' = proxima_secao('q', quantidade_de_cidades + 1)
+        vizinhos: 'memoryview' = proxima_secao('i', quantidade_de_posicoes)
+        ordem_alfabetica: 'memoryview' = proxima_secao('i', quantidade_de_cidades)
+        texto: 'memoryview' = proxima_secao('B', tamanho_do_texto)
+
+        if posicao != len(visao):
+            raise ValueError("Mapa compilado inválido ou incompleto.")
+
+        nomes: 'TabelaDeNomes' = TabelaDeNomes(deslocamentos_dos_nomes, ordem_alfabetica, texto)
+
+        return IndiceDeAdjacencia(nomes, nomes.ids_por_nome, deslocamentos, vizinhos, pesos, coordenadas_x, coordenadas_y)
+
+    # Metódo privado
+    @staticmethod
+    def _cabecalho_valido(cabecalho: bytes) -> bool:
+        """
+        Verifica se um cabeçalho foi gerado por esta versão do formato, nesta ordem de bytes.
+
+        Parâmetros
+        ----------
+        cabecalho : bytes
+            Os primeiros bytes do arquivo compilado.
+
+        Retorna
+        -------
+        bool
+            True se o cabeçalho for válido, False caso contrário.
+        """
+        try:
+            assinatura, ordem_dos_bytes, tipo_dos_pesos, versao, *_ = MapaBinarioController.CABECALHO.unpack(cabecalho)
+        except StructError:
+            return False
+
+        return (
+            assinatura == MapaBinarioController.ASSINATURA
+            and ordem_dos_bytes == byteorder[0].encode()
+            and tipo_dos_pesos in (b'q', b'd')
+            and versao == MapaBinarioController.VERSAO_DO_FORMATO
+        )
@@ -1,35 +1,12 @@
-from json import loads, JSONDecodeError
+from json import loads, JSONDecoder, JSONDecodeError
+from re import compile as compilar_regex
+from typing import Iterator
 
-class MapaController:
-    # Metódo privado
-    @staticmethod
-    def _pegar_nomes_de_todas_as_cidades_do_json(caminho_pro_json: str) -> list[str]:
-        """
-        Lê um arquivo JSON, analisa seu conteúdo em um dicionário Python e retorna uma lista de 
-        strings consistindo das primeiras chaves imediatas do objeto JSON analisado.
-
-        Este método é adaptado para trabalhar com JSONs específicos que seguem um formato compatível
-        com o projeto em questão. No contexto deste projeto, espera-se que as primeiras chaves imediatas
-        do objeto JSON sejam os nomes de todas as cidades relevantes para o estudo.
-
-        Retorna uma lista contendo os nomes de todas as cidades presentes no JSON.
-
-        Parâmetros
-        ----------
-        caminho_pro_json : str
-            O caminho para o arquivo JSON que comporta as relações entre cidades.
-
-        Retorna
-        -------
-        list[str]
-            Uma lista contendo os nomes de todas as cidades presentes no JSON.
-        """
-        arquivo_legivel: dict[str, any] = MapaController._converter_json_em_dicionario(caminho_pro_json)
-        
-        lista_de_cidades: list[str] = list(arquivo_legivel.keys())
-        
-        return lista_de_cidades
+ESPACOS_EM_BRANCO = compilar_regex(r'[ \t\n\r]*')
+# Maior trecho do fim do buffer que ainda pode ser o começo de um valor válido, como "-Infinity" ou "\uXXXX".
+TAMANHO_DO_VALOR_INCOMPLETO = 16
 
+class MapaController:
     # Metódo privado
     @staticmethod
     def _converter_json_em_dicionario(caminho_pro_json: str) -> dict[str, any]:
@@ -65,7 +42,7 @@ class MapaController:
             arquivo_legivel: dict[str] = loads(json_em_texto)
 
         except JSONDecodeError as erro_de_decodificacao:
-            raise JSONDecodeError("Conteúdo de JSON inválido.") from erro_de_decodificacao
+            raise JSONDecodeError("Conteúdo de JSON inválido.", erro_de_decodificacao.doc, erro_de_decodificacao.pos) from erro_de_decodificacao
         
         if not isinstance(arquivo_legivel, dict):
             raise ValueError("Objeto JSON não foi corretamente renderizado.")
@@ -109,3 +86,210 @@ class MapaController:
             raise ValueError("Erro de leitura.") from excecao_generica
 
         return arquivo_em_texto
+
+    # Metódo privado
+    @staticmethod
+    def _iterar_cidades_do_json(caminho_pro_json: str, tamanho_do_bloco: int = 1 << 16) -> Iterator[tuple[str, dict]]:
+        """
+        Lê um arquivo JSON de mapa de forma incremental, entregando uma cidade por vez, sem nunca manter o
+        documento inteiro na memória.
+
+        São aceitos dois formatos. O formato padrão, um único objeto cujas chaves são os nomes das cidades,
+        é lido em blocos de `tamanho_do_bloco` caracteres, e cada cidade é decodificada assim que o seu
+        objeto termina de chegar no bloco. Arquivos com extensão ".jsonl" seguem a variante delimitada por
+        linhas, em que cada linha é um objeto JSON com uma ou mais cidades no mesmo formato do padrão.
+
+        Parâmetros
+        ----------
+        caminho_pro_json : str
+            O caminho para o arquivo JSON que comporta as relações entre cidades.
+        tamanho_do_bloco : int, opcional
+            A quantidade de caracteres lidos do arquivo de cada vez. O padrão é 65536.
+
+        Retorna
+        -------
+        Iterator[tuple[str, dict]]
+            Os pares de nome de cidade e conteúdo correspondente no JSON, na ordem do arquivo.
+
+        Lança
+        ------
+        JSONDecodeError
+            Se o conteúdo do JSON for inválido.
+        ValueError
+            Se o objeto JSON não foi corretamente renderizado ou se ocorrer um erro de leitura.
+        FileNotFoundError
+            Se o arquivo não for encontrado.
+        """
+        try:
+            arquivo = open(caminho_pro_json, 'r')
+        except FileNotFoundError as erro_de_caminho_nao_encontrado:
+            raise FileNotFoundError("Arquivo não encontrado.") from erro_de_caminho_nao_encontrado
+
+        with arquivo:
+            if caminho_pro_json.endswith(".jsonl"):
+                yield from MapaController._iterar_cidades_por_linha(arquivo)
+            else:
+                yield from MapaController._iterar_cidades_do_objeto(arquivo, tamanho_do_bloco)
+
+    # Metódo privado
+    @staticmethod
+    def _iterar_cidades_por_linha(arquivo: 'TextIO') -> Iterator[tuple[str, dict]]:
+        """
+        Entrega as cidades de um arquivo na variante delimitada por linhas do formato de mapas.
+
+        Cada linha não vazia deve conter um objeto JSON completo, cujas chaves são nomes de cidades, como um
+        pedaço do formato padrão.
+
+        Parâmetros
+        ----------
+        arquivo : TextIO
+            O arquivo já aberto para leitura.
+
+        Retorna
+        -------
+        Iterator[tuple[str, dict]]
+            Os pares de nome de cidade e conteúdo correspondente, na ordem do arquivo.
+
+        Lança
+        ------
+        JSONDecodeError
+            Se alguma linha tiver conteúdo JSON inválido.
+        ValueError
+            Se alguma linha não for um objeto JSON.
+        """
+        for linha in arquivo:
+            if not linha.strip():
+                continue
+
+            try:
+                cidades_da_linha: dict[str, dict] = loads(linha)
+            except JSONDecodeError as erro_de_decodificacao:
+                raise JSONDecodeError("Conteúdo de JSON inválido.", erro_de_decodificacao.doc, erro_de_decodificacao.pos) from erro_de_decodificacao
+
+            if not isinstance(cidades_da_linha, dict):
+                raise ValueError("Objeto JSON não foi corretamente renderizado.")
+
+            yield from cidades_da_linha.items()
+
+    # Metódo privado
+    @staticmethod
+    def _iterar_cidades_do_objeto(arquivo: 'TextIO', tamanho_do_bloco: int) -> Iterator[tuple[str, dict]]:
+        """
+        Entrega as cidades do objeto JSON principal de um arquivo no formato padrão, lendo-o em blocos.
+
+        O texto lido fica em um buffer do qual cada chave e cada objeto de cidade são decodificados com o
+        `JSONDecoder.raw_decode`. Quando um valor ainda não chegou por completo, o próximo bloco é lido e a
+        decodificação é refeita. Um erro de decodificação longe do fim do buffer não pode ser de um valor
+        incompleto, e é lançado sem que o restante do arquivo seja lido. O trecho já consumido é descartado do buffer, de modo que a memória usada
+        fica limitada ao tamanho do bloco somado ao tamanho da maior cidade. Depois do fim do objeto, o
+        restante do arquivo é lido e só pode conter espaços em branco, como no `json.loads`.
+
+        Parâmetros
+        ----------
+        arquivo : TextIO
+            O arquivo já aberto para leitura.
+        tamanho_do_bloco : int
+            A quantidade de caracteres lidos do arquivo de cada vez.
+
+        Retorna
+        -------
+        Iterator[tuple[str, dict]]
+            Os pares de nome de cidade e conteúdo correspondente, na ordem do arquivo.
+
+        Lança
+        ------
+        JSONDecodeError
+            Se o conteúdo do JSON for inválido.
+        ValueError
+            Se o objeto JSON não foi corretamente renderizado.
+        """
+        decodificador: JSONDecoder = JSONDecoder()
+        buffer: str = ""
+        posicao: int = 0
+        fim_do_arquivo: bool = False
+
+        def ler_proximo_bloco() -> None:
+            nonlocal buffer, posicao, fim_do_arquivo
+
+            try:
+                bloco: str = arquivo.read(tamanho_do_bloco)
+            except Exception as excecao_generica:
+                raise ValueError("Erro de leitura.") from excecao_generica
+
+            fim_do_arquivo = not bloco
+            buffer = buffer[posicao:] + bloco
+            posicao = 0
+
+        def proximo_caractere() -> str:
+            nonlocal posicao
+
+            while True:
+                posicao = ESPACOS_EM_BRANCO.match(buffer, posicao).end()
+                if posicao < len(buffer):
+                    return buffer[posicao]
+                if fim_do_arquivo:
+                    raise ValueError("Objeto JSON não foi corretamente renderizado.")
+                ler_proximo_bloco()
+
+        def decodificar_valor() -> object:
+            nonlocal posicao
+
+            while True:
+                try:
+                    valor, posicao = decodificador.raw_decode(buffer, posicao)
+                    return valor
+                except JSONDecodeError as erro_de_decodificacao:
+                    # Só um erro no fim do buffer, ou em um texto que chega até ele, pode vir de um valor
+                    # incompleto. Um erro antes disso é lançado sem ler o restante do arquivo.
+                    incompleto: bool = (
+                        erro_de_decodificacao.pos >= len(buffer) - TAMANHO_DO_VALOR_INCOMPLETO
+                        or erro_de_decodificacao.msg.startswith("Unterminated string")
+                    )
+                    if fim_do_arquivo or not incompleto:
+                        raise JSONDecodeError("Conteúdo de JSON inválido.", erro_de_decodificacao.doc, erro_de_decodificacao.pos) from erro_de_decodificacao
+                    ler_proximo_bloco()
+
+        def consumir_o_fim() -> None:
+            nonlocal posicao
+
+            while True:
+                posicao = ESPACOS_EM_BRANCO.match(buffer, posicao).end()
+                if posicao < len(buffer):
+                    raise JSONDecodeError("Conteúdo de JSON inválido.", buffer, posicao)
+                if fim_do_arquivo:
+                    return
+                ler_proximo_bloco()
+
+        def consumir(esperado: str) -> None:
+            nonlocal posicao
+
+            if proximo_caractere() != esperado:
+                raise JSONDecodeError("Conteúdo de JSON inválido.", buffer, posicao)
+            posicao += 1
+
+        consumir("{")
+
+        if proximo_caractere() == "}":
+            posicao += 1
+            consumir_o_fim()
+            return
+
+        while True:
+            if proximo_caractere() != '"':
+                raise JSONDecodeError("Conteúdo de JSON inválido.", buffer, posicao)
+
+            nome_de_cidade: str = decodificar_valor()
+            consumir(":")
+            proximo_caractere()
+            dados_da_cidade: dict = decodificar_valor()
+
+            if not isinstance(dados_da_cidade, dict):
+                raise ValueError("Objeto JSON não foi corretamente renderizado.")
+
+            yield nome_de_cidade, dados_da_cidade
+
+            if proximo_caractere() == "}":
+                posicao += 1
+                consumir_o_fim()
+                return
+            consumir(",")
@@ -0,0 +1,100 @@
+import numpy as np
+from Controllers.RotaController import RotaController
+
+class MatrizDeDistanciasController:
+    """
+    A classe MatrizDeDistanciasController fornece métodos estáticos que calculam a menor distância entre
+    todos os pares de cidades de um IndiceDeAdjacencia, usados pela classe MatrizDeDistancias.
+
+    Os dois métodos de cálculo retornam uma matriz NumPy quadrada de ponto flutuante, indexada pelos
+    identificadores das cidades no índice, em que a linha `i` guarda as distâncias a partir da cidade `i`
+    e os pares sem caminho entre si ficam com distância infinita.
+    """
+    METODOS: tuple[str, ...] = ("dijkstra", "floyd_warshall")
+    # O Floyd-Warshall vetorizado faz cerca de n³ operações em NumPy, e o Dijkstra repetido cerca de n * m
+    # operações em Python, cada uma em torno de 250 vezes mais lenta. O Floyd-Warshall é escolhido quando
+    # n² ≤ FATOR_DE_CUSTO_DO_FLOYD_WARSHALL * m, ou seja, em mapas pequenos ou densos.
+    FATOR_DE_CUSTO_DO_FLOYD_WARSHALL: int = 250
+    # Acima desta quantidade de cidades, as matrizes temporárias do Floyd-Warshall ocupam memória demais.
+    LIMITE_DE_CIDADES_DO_FLOYD_WARSHALL: int = 4_000
+
+    @staticmethod
+    def escolher_metodo(indice: 'IndiceDeAdjacencia') -> str:
+        """
+        Escolhe o método de cálculo mais rápido para o índice, a partir da quantidade de cidades e de
+        estradas.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa.
+
+        Retorna
+        -------
+        str
+            "floyd_warshall" para mapas pequenos ou densos e "dijkstra" para os demais.
+        """
+        quantidade_de_cidades: int = len(indice)
+
+        if (
+            quantidade_de_cidades <= MatrizDeDistanciasController.LIMITE_DE_CIDADES_DO_FLOYD_WARSHALL
+            and quantidade_de_cidades ** 2 <= MatrizDeDistanciasController.FATOR_DE_CUSTO_DO_FLOYD_WARSHALL * len(indice.vizinhos)
+        ):
+            return "floyd_warshall"
+
+        return "dijkstra"
+
+    @staticmethod
+    def calcular_com_dijkstra(indice: 'IndiceDeAdjacencia') -> 'np.ndarray':
+        """
+        Calcula a matriz de distâncias com uma busca de Dijkstra completa a partir de cada cidade.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa.
+
+        Retorna
+        -------
+        np.ndarray
+            A matriz de distâncias entre todos os pares de cidades.
+        """
+        quantidade_de_cidades: int = len(indice)
+        distancias: 'np.ndarray' = np.full((quantidade_de_cidades, quantidade_de_cidades), np.inf)
+
+        for origem in range(quantidade_de_cidades):
+            distancias_da_origem, _ = RotaController.buscar_a_partir_de_uma_origem(indice, origem)
+            distancias[origem, list(distancias_da_origem)] = list(distancias_da_origem.values())
+
+        return distancias
+
+    @staticmethod
+    def calcular_com_floyd_warshall(indice: 'IndiceDeAdjacencia') -> 'np.ndarray':
+        """
+        Calcula a matriz de distâncias com o algoritmo de Floyd-Warshall vetorizado em NumPy.
+
+        A matriz começa com a distância de cada estrada, e a cada passo `k` todas as distâncias são
+        relaxadas de uma só vez pelo caminho que passa pela cidade `k`, em uma única operação sobre a
+        matriz inteira.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa.
+
+        Retorna
+        -------
+        np.ndarray
+            A matriz de distâncias entre todos os pares de cidades.
+        """
+        quantidade_de_cidades: int = len(indice)
+        distancias: 'np.ndarray' = np.full((quantidade_de_cidades, quantidade_de_cidades), np.inf)
+
+        origens: 'np.ndarray' = np.repeat(np.arange(quantidade_de_cidades), np.diff(np.asarray(indice.deslocamentos)))
+        np.minimum.at(distancias, (origens, np.asarray(indice.vizinhos)), np.asarray(indice.pesos, dtype=float))
+        np.fill_diagonal(distancias, 0)
+
+        for intermediaria in range(quantidade_de_cidades):
+            np.minimum(distancias, distancias[:, intermediaria, None] + distancias[intermediaria], out=distancias)
+
+        return distancias
@@ -0,0 +1,294 @@
+from array import array
+from math import inf
+from os import path, replace
+from random import Random
+from struct import Struct, error as StructError
+from sys import byteorder
+from tempfile import mkstemp
+from Models.PontosDeReferencia import PontosDeReferencia
+from Controllers.RotaController import RotaController
+
+class PontosDeReferenciaController:
+    """
+    A classe PontosDeReferenciaController fornece métodos estáticos para escolher os pontos de referência
+    de um IndiceDeAdjacencia, usados pela heurística ALT, e para gravá-los ao lado do arquivo do mapa e
+    carregá-los de volta.
+
+    Os pontos são escolhidos pela estratégia do ponto mais distante: o primeiro é a cidade mais distante
+    de uma cidade sorteada, e cada ponto seguinte é a cidade mais distante de todos os pontos já
+    escolhidos. Assim os pontos ficam espalhados pelas bordas do mapa, onde as estimativas são melhores.
+    Em mapas com regiões desconexas, os pontos ficam na região da cidade sorteada, que quase sempre é a
+    maior, e só passam para outra região quando todas as cidades da primeira já forem pontos.
+
+    O arquivo gravado começa com um cabeçalho fixo, que inclui o resumo do conteúdo do mapa, e segue com
+    os identificadores dos pontos e o vetor de distâncias de cada ponto.
+    """
+    ASSINATURA: bytes = b"RALT"
+    VERSAO_DO_FORMATO: int = 1
+    EXTENSAO: str = ".ralt"
+    QUANTIDADE_PADRAO: int = 8
+    # Assinatura, ordem dos bytes, versão, cidades, pontos de referência e resumo do mapa.
+    CABECALHO: 'Struct' = Struct("<4sc3xIQI16s")
+
+    @staticmethod
+    def caminho_dos_pontos(caminho_do_mapa: str) -> str:
+        """
+        Retorna o caminho do arquivo dos pontos de referência correspondente a um arquivo de mapa, ao lado
+        dele.
+
+        Parâmetros
+        ----------
+        caminho_do_mapa : str
+            O caminho para o arquivo do mapa, JSON ou compilado.
+
+        Retorna
+        -------
+        str
+            O caminho do arquivo dos pontos, com a extensão ".ralt" no lugar da extensão do mapa.
+        """
+        return path.splitext(caminho_do_mapa)[0] + PontosDeReferenciaController.EXTENSAO
+
+    @staticmethod
+    def precisa_escolher(caminho_dos_pontos: str, hash_do_mapa: str, quantidade: int) -> bool:
+        """
+        Verifica se os pontos de referência precisam ser escolhidos novamente.
+
+        Isso acontece quando o arquivo não existe, quando foi gerado para um mapa com outro conteúdo ou com
+        outra quantidade de pontos, ou quando foi gerado em outra versão do formato ou em uma máquina com
+        outra ordem de bytes.
+
+        Parâmetros
+        ----------
+        caminho_dos_pontos : str
+            O caminho para o arquivo dos pontos de referência.
+        hash_do_mapa : str
+            O resumo do conteúdo do mapa atual.
+        quantidade : int
+            A quantidade de pontos de referência desejada.
+
+        Retorna
+        -------
+        bool
+            True se os pontos precisarem ser escolhidos novamente, False caso contrário.
+        """
+        if not path.exists(caminho_dos_pontos):
+            return True
+
+        with open(caminho_dos_pontos, 'rb') as arquivo:
+            cabecalho: bytes = arquivo.read(PontosDeReferenciaController.CABECALHO.size)
+
+        if not PontosDeReferenciaController._cabecalho_valido(cabecalho):
+            return True
+
+        *_, quantidade_gravada, hash_gravado = PontosDeReferenciaController.CABECALHO.unpack(cabecalho)
+
+        return quantidade_gravada != quantidade or hash_gravado.hex() != hash_do_mapa
+
+    @staticmethod
+    def escolher(indice: 'IndiceDeAdjacencia', hash_do_mapa: str, quantidade: int = QUANTIDADE_PADRAO, semente: int = 0) -> 'PontosDeReferencia':
+        """
+        Escolhe os pontos de referência de um mapa pela estratégia do ponto mais distante e calcula as
+        distâncias de cada um até todas as cidades.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa.
+        hash_do_mapa : str
+            O resumo do conteúdo do mapa, guardado junto dos pontos para identificar o mapa de origem.
+        quantidade : int, opcional
+            A quantidade de pontos de referência. É limitada à quantidade de cidades do mapa. O padrão é 8.
+        semente : int, opcional
+            A semente do sorteio da cidade inicial. O padrão é 0.
+
+        Retorna
+        -------
+        PontosDeReferencia
+            Os pontos de referência escolhidos e as suas distâncias até todas as cidades.
+        """
+        quantidade_de_cidades: int = len(indice)
+        cidades: 'array' = array('i')
+        distancias: list['array'] = []
+
+        if quantidade_de_cidades == 0:
+            return PontosDeReferencia(hash_do_mapa, cidades, distancias)
+
+        candidata: int = PontosDeReferenciaController._mais_distante(PontosDeReferenciaController._calcular_distancias(indice, Random(semente).randrange(quantidade_de_cidades)))
+        menores_distancias: list[float] = [inf] * quantidade_de_cidades
+
+        while len(cidades) < min(quantidade, quantidade_de_cidades):
+            distancias_do_ponto: 'array' = PontosDeReferenciaController._calcular_distancias(indice, candidata)
+            cidades.append(candidata)
+            distancias.append(distancias_do_ponto)
+
+            for cidade, distancia in enumerate(distancias_do_ponto):
+                if distancia < menores_distancias[cidade]:
+                    menores_distancias[cidade] = distancia
+
+            candidata = PontosDeReferenciaController._mais_distante(menores_distancias)
+
+        return PontosDeReferencia(hash_do_mapa, cidades, distancias)
+
+    @staticmethod
+    def escrever(pontos: 'PontosDeReferencia', caminho_dos_pontos: str) -> None:
+        """
+        Grava os pontos de referência em arquivo.
+
+        O arquivo é escrito primeiro com um nome temporário exclusivo e depois renomeado, de modo que outros
+        processos que estejam carregando os mesmos pontos nunca encontrem um arquivo pela metade.
+
+        Parâmetros
+        ----------
+        pontos : PontosDeReferencia
+            Os pontos de referência que serão gravados.
+        caminho_dos_pontos : str
+            O caminho do arquivo que será escrito.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        quantidade_de_cidades: int = len(pontos.distancias[0]) if pontos.distancias else 0
+
+        cabecalho: bytes = PontosDeReferenciaController.CABECALHO.pack(
+            PontosDeReferenciaController.ASSINATURA,
+            byteorder[0].encode(),
+            PontosDeReferenciaController.VERSAO_DO_FORMATO,
+            quantidade_de_cidades,
+            len(pontos),
+            bytes.fromhex(pontos.hash_do_mapa)
+        )
+
+        descritor, caminho_temporario = mkstemp(suffix=".tmp", dir=path.dirname(caminho_dos_pontos) or ".")
+
+        with open(descritor, 'wb') as arquivo:
+            arquivo.write(cabecalho)
+            pontos.cidades.tofile(arquivo)
+            for distancias_do_ponto in pontos.distancias:
+                distancias_do_ponto.tofile(arquivo)
+
+        replace(caminho_temporario, caminho_dos_pontos)
+
+    @staticmethod
+    def carregar(caminho_dos_pontos: str) -> 'PontosDeReferencia':
+        """
+        Carrega os pontos de referência gravados em arquivo.
+
+        Parâmetros
+        ----------
+        caminho_dos_pontos : str
+            O caminho para o arquivo dos pontos de referência.
+
+        Retorna
+        -------
+        PontosDeReferencia
+            Os pontos de referência gravados no arquivo.
+
+        Lança
+        ------
+        FileNotFoundError
+            Se o arquivo não for encontrado.
+        ValueError
+            Se o arquivo não for um arquivo de pontos de referência válido nesta versão do formato.
+        """
+        try:
+            with open(caminho_dos_pontos, 'rb') as arquivo:
+                cabecalho: bytes = arquivo.read(PontosDeReferenciaController.CABECALHO.size)
+
+                if not PontosDeReferenciaController._cabecalho_valido(cabecalho):
+                    raise ValueError("Pontos de referência inválidos ou gerados em outra versão do formato.")
+
+                _, _, _, quantidade_de_cidades, quantidade_de_pontos, hash_do_mapa = PontosDeReferenciaController.CABECALHO.unpack(cabecalho)
+
+                cidades: 'array' = array('i')
+                cidades.fromfile(arquivo, quantidade_de_pontos)
+
+                distancias: list['array'] = []
+                for _ in range(quantidade_de_pontos):
+                    distancias_do_ponto: 'array' = array('d')
+                    distancias_do_ponto.fromfile(arquivo, quantidade_de_cidades)
+                    distancias.append(distancias_do_ponto)
+        except FileNotFoundError as erro_de_caminho_nao_encontrado:
+            raise FileNotFoundError("Arquivo não encontrado.") from erro_de_caminho_nao_encontrado
+        except EOFError as erro_de_arquivo_incompleto:
+            raise ValueError("Pontos de referência incompletos.") from erro_de_arquivo_incompleto
+
+        return PontosDeReferencia(hash_do_mapa.hex(), cidades, distancias)
+
+    # Metódo privado
+    @staticmethod
+    def _calcular_distancias(indice: 'IndiceDeAdjacencia', origem: int) -> 'array':
+        """
+        Calcula a menor distância de uma cidade até todas as outras.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa.
+        origem : int
+            O identificador da cidade de origem.
+
+        Retorna
+        -------
+        array
+            A menor distância até cada cidade, ou infinito se a cidade não for alcançável.
+        """
+        distancias: 'array' = array('d', [inf]) * len(indice)
+        distancias_da_origem, _ = RotaController.buscar_a_partir_de_uma_origem(indice, origem)
+
+        for cidade, distancia in distancias_da_origem.items():
+            distancias[cidade] = distancia
+
+        return distancias
+
+    # Metódo privado
+    @staticmethod
+    def _mais_distante(distancias: 'Sequence[float]') -> int:
+        """
+        Retorna a cidade alcançada de maior distância, ou uma cidade não alcançada se todas as cidades
+        alcançadas estiverem à distância zero.
+
+        Parâmetros
+        ----------
+        distancias : Sequence[float]
+            A distância de cada cidade, indexada pelo seu identificador.
+
+        Retorna
+        -------
+        int
+            O identificador da cidade mais distante.
+        """
+        mais_distante: int = max(range(len(distancias)), key=lambda cidade: distancias[cidade] if distancias[cidade] != inf else -1)
+
+        if distancias[mais_distante] <= 0 and inf in distancias:
+            return distancias.index(inf)
+
+        return mais_distante
+
+    # Metódo privado
+    @staticmethod
+    def _cabecalho_valido(cabecalho: bytes) -> bool:
+        """
+        Verifica se um cabeçalho foi gerado por esta versão do formato, nesta ordem de bytes.
+
+        Parâmetros
+        ----------
+        cabecalho : bytes
+            Os primeiros bytes do arquivo dos pontos de referência.
+
+        Retorna
+        -------
+        bool
+            True se o cabeçalho for válido, False caso contrário.
+        """
+        try:
+            assinatura, ordem_dos_bytes, versao, *_ = PontosDeReferenciaController.CABECALHO.unpack(cabecalho)
+        except StructError:
+            return False
+
+        return (
+            assinatura == PontosDeReferenciaController.ASSINATURA
+            and ordem_dos_bytes == byteorder[0].encode()
+            and versao == PontosDeReferenciaController.VERSAO_DO_FORMATO
+        )
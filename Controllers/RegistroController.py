@@ -0,0 +1,65 @@
+from logging import Formatter, Handler, StreamHandler, getLogger, INFO, NOTSET
+from Models.FormatadorJson import FormatadorJson
+
+class RegistroController:
+    """
+    A classe RegistroController fornece métodos estáticos para ativar e desativar o registro dos eventos
+    da aplicação, feito pelo módulo `logging`.
+
+    Os eventos são emitidos pelos registradores dos módulos de Models, como o "Models.Rota", e ficam
+    desativados por padrão: sem nenhum manipulador configurado, nem as mensagens são formatadas. Ativar o
+    registro por este controlador equivale a configurar o registrador "Models" pelo próprio `logging`.
+    """
+    REGISTRADOR_DA_APLICACAO: str = "Models"
+
+    @staticmethod
+    def ativar(nivel: int = INFO, fluxo: 'TextIO' = None, em_json: bool = False) -> 'Handler':
+        """
+        Passa a escrever os eventos da aplicação a partir do nível especificado.
+
+        Parâmetros
+        ----------
+        nivel : int, opcional
+            O menor nível dos eventos escritos, como `logging.INFO`, que inclui as rotas criadas, ou
+            `logging.DEBUG`, que inclui também o início de cada rota. O padrão é `logging.INFO`.
+        fluxo : TextIO, opcional
+            O fluxo em que os eventos são escritos. O padrão é None, que usa a saída de erro padrão.
+        em_json : bool, opcional
+            Se True, cada evento é escrito como um objeto JSON em uma linha, com os campos de tempo e de
+            contexto do evento. O padrão é False, que escreve apenas a mensagem.
+
+        Retorna
+        -------
+        Handler
+            O manipulador criado, que pode ser passado ao `desativar`.
+        """
+        manipulador: 'StreamHandler' = StreamHandler(fluxo)
+        manipulador.setFormatter(FormatadorJson() if em_json else Formatter("%(message)s"))
+
+        registrador: 'Logger' = getLogger(RegistroController.REGISTRADOR_DA_APLICACAO)
+        registrador.addHandler(manipulador)
+        registrador.setLevel(nivel)
+
+        return manipulador
+
+    @staticmethod
+    def desativar(manipulador: 'Handler') -> None:
+        """
+        Deixa de escrever os eventos da aplicação pelo manipulador criado pelo `ativar`.
+
+        Parâmetros
+        ----------
+        manipulador : Handler
+            O manipulador retornado pelo `ativar`.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        registrador: 'Logger' = getLogger(RegistroController.REGISTRADOR_DA_APLICACAO)
+        registrador.removeHandler(manipulador)
+        manipulador.close()
+
+        if not registrador.handlers:
+            registrador.setLevel(NOTSET)
@@ -0,0 +1,525 @@
+from heapq import heappush, heappop
+from itertools import chain
+from math import inf
+from Exceptions.RotaNaoEncontradaError import RotaNaoEncontradaError
+
+class RotaController:
+    """
+    A classe RotaController fornece métodos estáticos com os algoritmos de busca usados pela classe Rota.
+
+    Os algoritmos percorrem o IndiceDeAdjacencia do mapa usando apenas os identificadores inteiros das
+    cidades, sem consultar objetos Cidade nem manipular nomes durante a busca. Cada algoritmo recebe o
+    índice e os identificadores das cidades inicial e final, e retorna o caminho encontrado, como lista de
+    identificadores, junto da distância total percorrida e da quantidade de cidades expandidas durante a
+    busca, sem alterar o estado do mapa.
+    """
+
+    @staticmethod
+    def buscar_com_dijkstra(indice: 'IndiceDeAdjacencia', origem: int, destino: int, cidades_bloqueadas: set[int] = None, estradas_bloqueadas: dict[int, set[int]] = None, estatisticas: 'Estatisticas' = None) -> tuple[list[int], int, int]:
+        """
+        Calcula o menor caminho entre duas cidades usando o algoritmo de Dijkstra.
+
+        A fronteira da busca é mantida em uma fila de prioridade (heap binário), ordenada pela distância
+        acumulada desde a cidade inicial. A busca termina assim que a cidade final é retirada da fila,
+        momento em que sua distância é garantidamente mínima. A implementação é iterativa, então não
+        depende do limite de recursão do Python.
+
+        Cidades e estradas podem ser bloqueadas, como nas buscas de desvio de `buscar_k_menores_caminhos`.
+        As cidades bloqueadas entram na busca como se já tivessem sido expandidas, então não custam nada
+        a mais por estrada percorrida.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa no qual a rota será calculada.
+        origem : int
+            O identificador da cidade de partida.
+        destino : int
+            O identificador da cidade de chegada.
+        cidades_bloqueadas : set[int], opcional
+            Os identificadores das cidades pelas quais o caminho não pode passar. O padrão é None.
+        estradas_bloqueadas : dict[int, set[int]], opcional
+            Para cada cidade, os identificadores das vizinhas para as quais o caminho não pode seguir a
+            partir dela. O padrão é None.
+        estatisticas : Estatisticas, opcional
+            As estatísticas em que as operações da busca são contadas. O padrão é None, que não conta nada.
+
+        Retorna
+        -------
+        tuple[list[int], int, int]
+            O caminho, como lista de identificadores de cidades da inicial até a final, a distância total
+            percorrida e a quantidade de cidades expandidas.
+
+        Lança
+        ------
+        RotaNaoEncontradaError
+            Se não existir nenhum caminho entre as duas cidades.
+        """
+        deslocamentos, vizinhos, pesos = indice.deslocamentos, indice.vizinhos, indice.pesos
+
+        distancias: dict[int, int] = {origem: 0}
+        antecessores: dict[int, int] = {}
+        visitadas: set[int] = set(cidades_bloqueadas) if cidades_bloqueadas else set()
+        quantidade_de_bloqueadas: int = len(visitadas)
+        fila: list[tuple[int, int]] = [(0, origem)]
+        empurrar, retirar = RotaController._operacoes_da_fila(estatisticas)
+
+        while fila:
+            distancia_atual, atual = retirar(fila)
+
+            if atual in visitadas:
+                continue
+            if atual == destino:
+                if estatisticas is not None:
+                    estatisticas.registrar_busca(deslocamentos, visitadas.difference(cidades_bloqueadas or ()))
+                return RotaController._reconstruir_caminho(antecessores, destino), distancia_atual, len(visitadas) - quantidade_de_bloqueadas
+
+            visitadas.add(atual)
+            vizinhas_bloqueadas: set[int] | None = estradas_bloqueadas.get(atual) if estradas_bloqueadas else None
+
+            for posicao in range(deslocamentos[atual], deslocamentos[atual + 1]):
+                vizinho: int = vizinhos[posicao]
+                if vizinho in visitadas:
+                    continue
+                if vizinhas_bloqueadas and vizinho in vizinhas_bloqueadas:
+                    continue
+
+                nova_distancia: int = distancia_atual + pesos[posicao]
+
+                if nova_distancia < distancias.get(vizinho, inf):
+                    distancias[vizinho] = nova_distancia
+                    antecessores[vizinho] = atual
+                    empurrar(fila, (nova_distancia, vizinho))
+
+        if estatisticas is not None:
+            estatisticas.registrar_busca(deslocamentos, visitadas.difference(cidades_bloqueadas or ()))
+        raise RotaNaoEncontradaError(RotaController._mensagem_de_rota_inexistente(indice, origem, destino))
+
+    @staticmethod
+    def buscar_com_a_estrela(indice: 'IndiceDeAdjacencia', origem: int, destino: int, heuristica: callable, cidades_bloqueadas: set[int] = None, estradas_bloqueadas: dict[int, set[int]] = None, estatisticas: 'Estatisticas' = None) -> tuple[list[int], int, int]:
+        """
+        Calcula o menor caminho entre duas cidades usando o algoritmo A*.
+
+        Funciona como o algoritmo de Dijkstra, mas a fila de prioridade é ordenada pela distância acumulada
+        somada à estimativa da heurística até a cidade final. Com uma heurística admissível e consistente,
+        o caminho retornado continua sendo o menor, e menos cidades precisam ser expandidas. Cidades e
+        estradas podem ser bloqueadas como no `buscar_com_dijkstra`.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa no qual a rota será calculada.
+        origem : int
+            O identificador da cidade de partida.
+        destino : int
+            O identificador da cidade de chegada.
+        heuristica : callable
+            Uma função que recebe o identificador de uma cidade e o da cidade final e retorna a estimativa
+            de distância restante, como as criadas pelo HeuristicaController.
+        cidades_bloqueadas : set[int], opcional
+            Os identificadores das cidades pelas quais o caminho não pode passar. O padrão é None.
+        estradas_bloqueadas : dict[int, set[int]], opcional
+            Para cada cidade, os identificadores das vizinhas para as quais o caminho não pode seguir a
+            partir dela. O padrão é None.
+        estatisticas : Estatisticas, opcional
+            As estatísticas em que as operações da busca são contadas. O padrão é None, que não conta nada.
+
+        Retorna
+        -------
+        tuple[list[int], int, int]
+            O caminho, como lista de identificadores de cidades da inicial até a final, a distância total
+            percorrida e a quantidade de cidades expandidas.
+
+        Lança
+        ------
+        RotaNaoEncontradaError
+            Se não existir nenhum caminho entre as duas cidades.
+        """
+        deslocamentos, vizinhos, pesos = indice.deslocamentos, indice.vizinhos, indice.pesos
+
+        distancias: dict[int, int] = {origem: 0}
+        antecessores: dict[int, int] = {}
+        visitadas: set[int] = set(cidades_bloqueadas) if cidades_bloqueadas else set()
+        quantidade_de_bloqueadas: int = len(visitadas)
+        fila: list[tuple[float, int, int]] = [(heuristica(origem, destino), 0, origem)]
+        empurrar, retirar = RotaController._operacoes_da_fila(estatisticas)
+
+        while fila:
+            _, distancia_atual, atual = retirar(fila)
+
+            if atual in visitadas:
+                continue
+            if atual == destino:
+                if estatisticas is not None:
+                    estatisticas.registrar_busca(deslocamentos, visitadas.difference(cidades_bloqueadas or ()))
+                return RotaController._reconstruir_caminho(antecessores, destino), distancia_atual, len(visitadas) - quantidade_de_bloqueadas
+
+            visitadas.add(atual)
+            vizinhas_bloqueadas: set[int] | None = estradas_bloqueadas.get(atual) if estradas_bloqueadas else None
+
+            for posicao in range(deslocamentos[atual], deslocamentos[atual + 1]):
+                vizinho: int = vizinhos[posicao]
+                if vizinho in visitadas:
+                    continue
+                if vizinhas_bloqueadas and vizinho in vizinhas_bloqueadas:
+                    continue
+
+                nova_distancia: int = distancia_atual + pesos[posicao]
+
+                if nova_distancia < distancias.get(vizinho, inf):
+                    distancias[vizinho] = nova_distancia
+                    antecessores[vizinho] = atual
+                    empurrar(fila, (nova_distancia + heuristica(vizinho, destino), nova_distancia, vizinho))
+
+        if estatisticas is not None:
+            estatisticas.registrar_busca(deslocamentos, visitadas.difference(cidades_bloqueadas or ()))
+        raise RotaNaoEncontradaError(RotaController._mensagem_de_rota_inexistente(indice, origem, destino))
+
+    @staticmethod
+    def buscar_bidirecional(indice: 'IndiceDeAdjacencia', origem: int, destino: int, heuristica: callable = None, estatisticas: 'Estatisticas' = None) -> tuple[list[int], int, int]:
+        """
+        Calcula o menor caminho entre duas cidades com duas buscas simultâneas, uma partindo da cidade
+        inicial e outra partindo da cidade final.
+
+        As estradas do mapa são sempre de mão dupla, já que o CidadeController.definir_vizinhos registra a
+        vizinhança nos dois sentidos, então a busca reversa percorre as mesmas listas de vizinhos da busca
+        direta. A cada passo avança o lado cuja fila tem a menor prioridade, e toda estrada que liga uma
+        cidade alcançada por um lado a uma cidade alcançada pelo outro atualiza o melhor caminho conhecido.
+        A busca termina quando a soma das menores prioridades das duas filas alcança a distância desse
+        caminho, pois nenhum caminho ainda não descoberto pode ser mais curto.
+
+        Sem heurística, as duas buscas são de Dijkstra. Com heurística, as duas passam a ser A* usando o
+        potencial médio `(h(v, final) - h(v, inicial)) / 2` na busca direta e o seu oposto na reversa.
+        Assim os dois lados enxergam os mesmos custos reduzidos e o critério de parada continua válido.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa no qual a rota será calculada.
+        origem : int
+            O identificador da cidade de partida.
+        destino : int
+            O identificador da cidade de chegada.
+        heuristica : callable, opcional
+            Uma heurística consistente, como as criadas pelo HeuristicaController. O padrão é None, que
+            executa o Dijkstra bidirecional.
+        estatisticas : Estatisticas, opcional
+            As estatísticas em que as operações da busca são contadas. O padrão é None, que não conta nada.
+
+        Retorna
+        -------
+        tuple[list[int], int, int]
+            O caminho, como lista de identificadores de cidades da inicial até a final, a distância total
+            percorrida e a quantidade de cidades expandidas somando as duas buscas.
+
+        Lança
+        ------
+        RotaNaoEncontradaError
+            Se não existir nenhum caminho entre as duas cidades.
+        """
+        if origem == destino:
+            return [origem], 0, 0
+
+        deslocamentos, vizinhos, pesos = indice.deslocamentos, indice.vizinhos, indice.pesos
+
+        def potencial(cidade: int) -> float:
+            if heuristica is None:
+                return 0
+            return (heuristica(cidade, destino) - heuristica(cidade, origem)) / 2
+
+        # Índice 0 é a busca direta e índice 1 é a busca reversa, cujo potencial é o oposto do direto.
+        sinais: tuple[int, int] = (1, -1)
+        distancias: tuple[dict[int, int], dict[int, int]] = ({origem: 0}, {destino: 0})
+        antecessores: tuple[dict[int, int], dict[int, int]] = ({}, {})
+        visitadas: tuple[set[int], set[int]] = (set(), set())
+        filas: tuple[list, list] = ([(potencial(origem), 0, origem)], [(-potencial(destino), 0, destino)])
+        empurrar, retirar = RotaController._operacoes_da_fila(estatisticas)
+
+        melhor_distancia: float = inf
+        cidade_de_encontro: int = None
+
+        while filas[0] and filas[1]:
+            if filas[0][0][0] + filas[1][0][0] >= melhor_distancia:
+                break
+
+            lado: int = 0 if filas[0][0][0] <= filas[1][0][0] else 1
+            distancias_do_lado, distancias_do_outro_lado = distancias[lado], distancias[1 - lado]
+            visitadas_do_lado: set[int] = visitadas[lado]
+
+            _, distancia_atual, atual = retirar(filas[lado])
+
+            if atual in visitadas_do_lado:
+                continue
+
+            visitadas_do_lado.add(atual)
+
+            for posicao in range(deslocamentos[atual], deslocamentos[atual + 1]):
+                vizinho: int = vizinhos[posicao]
+                if vizinho in visitadas_do_lado:
+                    continue
+
+                nova_distancia: int = distancia_atual + pesos[posicao]
+
+                if nova_distancia < distancias_do_lado.get(vizinho, inf):
+                    distancias_do_lado[vizinho] = nova_distancia
+                    antecessores[lado][vizinho] = atual
+                    empurrar(filas[lado], (nova_distancia + sinais[lado] * potencial(vizinho), nova_distancia, vizinho))
+
+                if vizinho in distancias_do_outro_lado:
+                    distancia_pelo_encontro: int = nova_distancia + distancias_do_outro_lado[vizinho]
+
+                    if distancia_pelo_encontro < melhor_distancia:
+                        melhor_distancia = distancia_pelo_encontro
+                        cidade_de_encontro = vizinho
+
+        if estatisticas is not None:
+            estatisticas.registrar_busca(deslocamentos, chain(*visitadas), 2)
+
+        if cidade_de_encontro is None:
+            raise RotaNaoEncontradaError(RotaController._mensagem_de_rota_inexistente(indice, origem, destino))
+
+        caminho_de_ida: list[int] = RotaController._reconstruir_caminho(antecessores[0], cidade_de_encontro)
+        caminho_de_volta: list[int] = RotaController._reconstruir_caminho(antecessores[1], cidade_de_encontro)
+        caminho_de_volta.reverse()
+
+        return caminho_de_ida + caminho_de_volta[1:], melhor_distancia, len(visitadas[0]) + len(visitadas[1])
+
+    @staticmethod
+    def buscar_a_partir_de_uma_origem(indice: 'IndiceDeAdjacencia', origem: int, destinos: set[int] = None) -> tuple[dict[int, int], dict[int, int]]:
+        """
+        Calcula as menores distâncias de uma cidade de origem até várias cidades com uma única busca de
+        Dijkstra.
+
+        A busca não para em um destino específico: continua expandindo até que todos os destinos tenham
+        sido alcançados, ou até esgotar o mapa se nenhum destino for informado. Assim, o resultado de uma
+        única busca atende a todas as rotas que partem da mesma origem.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa no qual as rotas serão calculadas.
+        origem : int
+            O identificador da cidade de partida.
+        destinos : set[int], opcional
+            Os identificadores das cidades de chegada de interesse. O padrão é None, que calcula a distância
+            até todas as cidades alcançáveis.
+
+        Retorna
+        -------
+        tuple[dict[int, int], dict[int, int]]
+            As distâncias definitivas até cada cidade expandida e o antecessor de cada cidade alcançada no
+            menor caminho a partir da origem. Destinos ausentes do primeiro dicionário não são alcançáveis.
+        """
+        deslocamentos, vizinhos, pesos = indice.deslocamentos, indice.vizinhos, indice.pesos
+
+        distancias: dict[int, int] = {origem: 0}
+        distancias_definitivas: dict[int, int] = {}
+        antecessores: dict[int, int] = {}
+        fila: list[tuple[int, int]] = [(0, origem)]
+        destinos_restantes: int = len(destinos) if destinos is not None else -1
+
+        while fila and destinos_restantes != 0:
+            distancia_atual, atual = heappop(fila)
+
+            if atual in distancias_definitivas:
+                continue
+
+            distancias_definitivas[atual] = distancia_atual
+            if destinos is not None and atual in destinos:
+                destinos_restantes -= 1
+
+            for posicao in range(deslocamentos[atual], deslocamentos[atual + 1]):
+                vizinho: int = vizinhos[posicao]
+                if vizinho in distancias_definitivas:
+                    continue
+
+                nova_distancia: int = distancia_atual + pesos[posicao]
+
+                if nova_distancia < distancias.get(vizinho, inf):
+                    distancias[vizinho] = nova_distancia
+                    antecessores[vizinho] = atual
+                    heappush(fila, (nova_distancia, vizinho))
+
+        return distancias_definitivas, antecessores
+
+    @staticmethod
+    def buscar_k_menores_caminhos(indice: 'IndiceDeAdjacencia', origem: int, destino: int, quantidade: int, heuristica: callable = None) -> list[tuple[list[int], int]]:
+        """
+        Calcula os menores caminhos sem repetição de cidades entre duas cidades, em ordem crescente de
+        distância, usando o algoritmo de Yen.
+
+        O primeiro caminho é o menor caminho. Cada caminho seguinte é escolhido entre candidatos gerados a
+        partir do último caminho aceito: para cada cidade dele, o candidato mantém o trecho até essa cidade
+        (a raiz) e procura um desvio até a cidade final que não passe pelas cidades da raiz nem siga a
+        mesma próxima estrada de algum caminho já aceito com a mesma raiz. Como na variante de Lawler, os
+        desvios só partem das cidades a partir do ponto em que o último caminho aceito se afastou do
+        caminho que o originou, já que os desvios anteriores a esse ponto já foram gerados antes.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa no qual os caminhos serão calculados.
+        origem : int
+            O identificador da cidade de partida.
+        destino : int
+            O identificador da cidade de chegada.
+        quantidade : int
+            A quantidade máxima de caminhos retornados.
+        heuristica : callable, opcional
+            Uma heurística consistente, como as criadas pelo HeuristicaController, usada pelas buscas de
+            desvio com o A*. O padrão é None, que usa o Dijkstra.
+
+        Retorna
+        -------
+        list[tuple[list[int], int]]
+            Até `quantidade` caminhos, cada um como lista de identificadores de cidades da inicial até a
+            final, junto da sua distância, do menor para o maior. Menos caminhos são retornados se o mapa
+            não tiver caminhos diferentes suficientes.
+
+        Lança
+        ------
+        RotaNaoEncontradaError
+            Se não existir nenhum caminho entre as duas cidades.
+        """
+        def buscar(origem_do_desvio: int, cidades_bloqueadas: set[int], estradas_bloqueadas: dict[int, set[int]]) -> tuple[list[int], int, int]:
+            if heuristica is None:
+                return RotaController.buscar_com_dijkstra(indice, origem_do_desvio, destino, cidades_bloqueadas, estradas_bloqueadas)
+            return RotaController.buscar_com_a_estrela(indice, origem_do_desvio, destino, heuristica, cidades_bloqueadas, estradas_bloqueadas)
+
+        if quantidade < 1:
+            return []
+
+        caminho, distancia, _ = buscar(origem, None, None)
+        # Cada caminho aceito guarda as distâncias acumuladas até cada cidade e a posição do seu desvio.
+        aceitos: list[tuple[list[int], list[int], int]] = [(caminho, RotaController._distancias_acumuladas(indice, caminho), 0)]
+        candidatos: list[tuple[int, list[int], int]] = []
+        vistos: set[tuple[int, ...]] = {tuple(caminho)}
+
+        while len(aceitos) < quantidade:
+            ultimo_caminho, distancias_acumuladas, posicao_do_desvio = aceitos[-1]
+
+            for posicao in range(posicao_do_desvio, len(ultimo_caminho) - 1):
+                raiz: list[int] = ultimo_caminho[:posicao + 1]
+                estradas_bloqueadas: dict[int, set[int]] = {}
+
+                for caminho_aceito, _, _ in aceitos:
+                    if caminho_aceito[:posicao + 1] == raiz:
+                        estradas_bloqueadas.setdefault(caminho_aceito[posicao], set()).add(caminho_aceito[posicao + 1])
+
+                try:
+                    desvio, distancia_do_desvio, _ = buscar(raiz[-1], set(raiz[:-1]), estradas_bloqueadas)
+                except RotaNaoEncontradaError:
+                    continue
+
+                caminho_candidato: list[int] = raiz[:-1] + desvio
+                if tuple(caminho_candidato) not in vistos:
+                    vistos.add(tuple(caminho_candidato))
+                    heappush(candidatos, (distancias_acumuladas[posicao] + distancia_do_desvio, caminho_candidato, posicao))
+
+            if not candidatos:
+                break
+
+            _, caminho, posicao_do_desvio = heappop(candidatos)
+            aceitos.append((caminho, RotaController._distancias_acumuladas(indice, caminho), posicao_do_desvio))
+
+        return [(caminho, distancias_acumuladas[-1]) for caminho, distancias_acumuladas, _ in aceitos]
+
+    # Metódo privado
+    @staticmethod
+    def _operacoes_da_fila(estatisticas: 'Estatisticas | None') -> tuple[callable, callable]:
+        """
+        Retorna as funções de inserção e remoção usadas nas filas de prioridade de uma busca.
+
+        Sem estatísticas, são as próprias funções do `heapq`, e a busca não faz nenhuma contagem. Com
+        estatísticas, são os métodos que contam cada operação antes de executá-la.
+
+        Parâmetros
+        ----------
+        estatisticas : Estatisticas | None
+            As estatísticas da busca, ou None.
+
+        Retorna
+        -------
+        tuple[callable, callable]
+            As funções de inserção e de remoção.
+        """
+        if estatisticas is None:
+            return heappush, heappop
+        return estatisticas.empurrar, estatisticas.retirar
+
+    # Metódo privado
+    @staticmethod
+    def _distancias_acumuladas(indice: 'IndiceDeAdjacencia', caminho: list[int]) -> list[int]:
+        """
+        Calcula a distância percorrida desde o início de um caminho até cada uma das suas cidades.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa.
+        caminho : list[int]
+            O caminho, como lista de identificadores de cidades.
+
+        Retorna
+        -------
+        list[int]
+            A distância acumulada até cada cidade do caminho, começando por 0.
+        """
+        distancias_acumuladas: list[int] = [0]
+
+        for cidade, proxima_cidade in zip(caminho, caminho[1:]):
+            distancias_acumuladas.append(distancias_acumuladas[-1] + indice.distancia_da_estrada(cidade, proxima_cidade))
+
+        return distancias_acumuladas
+
+    # Metódo privado
+    @staticmethod
+    def _reconstruir_caminho(antecessores: dict[int, int], destino: int) -> list[int]:
+        """
+        Reconstrói o caminho percorrido a partir do dicionário de antecessores gerado por uma busca.
+
+        Parte da cidade final e segue os antecessores até a cidade inicial, que é a única sem antecessor
+        registrado. O resultado é invertido para ficar na ordem de percurso.
+
+        Parâmetros
+        ----------
+        antecessores : dict[int, int]
+            Um dicionário onde cada chave é o identificador de uma cidade e o valor é o identificador da
+            cidade anterior a ela no menor caminho encontrado.
+        destino : int
+            O identificador da cidade onde o caminho termina.
+
+        Retorna
+        -------
+        list[int]
+            O caminho, da cidade inicial até a final.
+        """
+        caminho: list[int] = [destino]
+
+        while caminho[-1] in antecessores:
+            caminho.append(antecessores[caminho[-1]])
+
+        caminho.reverse()
+        return caminho
+
+    # Metódo privado
+    @staticmethod
+    def _mensagem_de_rota_inexistente(indice: 'IndiceDeAdjacencia', origem: int, destino: int) -> str:
+        """
+        Monta a mensagem de erro usada quando não existe caminho entre duas cidades.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência usado na busca.
+        origem : int
+            O identificador da cidade de partida.
+        destino : int
+            O identificador da cidade de chegada.
+
+        Retorna
+        -------
+        str
+            A mensagem de erro com os nomes das duas cidades.
+        """
+        return f"Não existe rota entre '{indice.nomes[origem]}' e '{indice.nomes[destino]}'."
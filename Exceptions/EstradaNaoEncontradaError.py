@@ -0,0 +1,2 @@
+class EstradaNaoEncontradaError(Exception):
+    """Exceção lançada quando não existe estrada entre duas cidades do mapa."""
\ No newline at end of file
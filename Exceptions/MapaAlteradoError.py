@@ -0,0 +1,2 @@
+class MapaAlteradoError(Exception):
+    """Exceção lançada quando um resultado calculado sobre o mapa é usado depois de o mapa ser alterado."""
\ No newline at end of file
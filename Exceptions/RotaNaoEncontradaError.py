@@ -0,0 +1,2 @@
+class RotaNaoEncontradaError(Exception):
+    """Exceção lançada quando não existe caminho entre duas cidades do mapa."""
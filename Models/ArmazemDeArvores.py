@@ -0,0 +1,219 @@
+from collections import OrderedDict
+from threading import Lock
+from Models.ArvoreDeCaminhosMinimos import ArvoreDeCaminhosMinimos
+
+class ArmazemDeArvores:
+    """
+    A classe ArmazemDeArvores guarda as árvores de caminhos mínimos já calculadas de um mapa, indexadas
+    pelo identificador da cidade de origem, dentro de um limite de memória.
+
+    Quando a memória ocupada pelas árvores passa do limite, a árvore usada há mais tempo é descartada (LRU).
+    Assim, as origens consultadas com frequência, como os depósitos de uma transportadora, continuam em
+    memória. Todas as operações são protegidas por uma trava, então o armazém pode ser usado por várias
+    threads. O cálculo de uma árvore é feito fora da trava, e se duas threads calcularem a mesma árvore ao
+    mesmo tempo, apenas a primeira a ser guardada é mantida.
+
+    Atributos Públicos
+    ------------------
+    indice : IndiceDeAdjacencia
+        O índice de adjacência do mapa das árvores.
+    limite_de_bytes : int
+        A memória máxima ocupada pelas árvores guardadas.
+    bytes_em_uso : int
+        A memória ocupada pelas árvores guardadas no momento.
+    acertos : int
+        A quantidade de árvores encontradas já calculadas.
+    falhas : int
+        A quantidade de árvores que precisaram ser calculadas.
+    remocoes : int
+        A quantidade de árvores descartadas por falta de espaço.
+    """
+    LIMITE_PADRAO_DE_BYTES: int = 64 * 1024 * 1024
+
+    indice: 'IndiceDeAdjacencia'
+    limite_de_bytes: int
+    bytes_em_uso: int
+    acertos: int
+    falhas: int
+    remocoes: int
+
+    def __init__(self, indice: 'IndiceDeAdjacencia', limite_de_bytes: int = LIMITE_PADRAO_DE_BYTES) -> None:
+        """
+        Construtor da classe ArmazemDeArvores.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa das árvores.
+        limite_de_bytes : int, opcional
+            A memória máxima ocupada pelas árvores guardadas. O padrão é 64 MiB.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self.indice = indice
+        self.limite_de_bytes = limite_de_bytes
+        self.bytes_em_uso = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+        self._arvores: 'OrderedDict[int, ArvoreDeCaminhosMinimos]' = OrderedDict()
+        self._trava: 'Lock' = Lock()
+
+    def __len__(self) -> int:
+        """
+        Retorna a quantidade de árvores guardadas.
+
+        Retorna
+        -------
+        int
+            A quantidade de árvores guardadas.
+        """
+        return len(self._arvores)
+
+    def __contains__(self, origem: int) -> bool:
+        """
+        Verifica se a árvore de uma origem está guardada, sem alterar a ordem de uso.
+
+        Parâmetros
+        ----------
+        origem : int
+            O identificador da cidade de origem.
+
+        Retorna
+        -------
+        bool
+            True se a árvore estiver guardada, False caso contrário.
+        """
+        return origem in self._arvores
+
+    def buscar(self, origem: int) -> 'ArvoreDeCaminhosMinimos | None':
+        """
+        Retorna a árvore de uma origem se ela já estiver guardada, sem calculá-la.
+
+        Parâmetros
+        ----------
+        origem : int
+            O identificador da cidade de origem.
+
+        Retorna
+        -------
+        ArvoreDeCaminhosMinimos | None
+            A árvore da origem, ou None se ela não estiver guardada.
+        """
+        with self._trava:
+            arvore: 'ArvoreDeCaminhosMinimos | None' = self._arvores.get(origem)
+
+            if arvore is not None:
+                self._arvores.move_to_end(origem)
+                self.acertos += 1
+
+            return arvore
+
+    def pegar(self, origem: int) -> 'ArvoreDeCaminhosMinimos':
+        """
+        Retorna a árvore de uma origem, calculando-a e guardando-a se ela ainda não estiver guardada.
+
+        Uma árvore maior que o limite de memória é calculada e retornada, mas não é guardada.
+
+        Parâmetros
+        ----------
+        origem : int
+            O identificador da cidade de origem.
+
+        Retorna
+        -------
+        ArvoreDeCaminhosMinimos
+            A árvore de caminhos mínimos da origem.
+        """
+        arvore: 'ArvoreDeCaminhosMinimos | None' = self.buscar(origem)
+
+        if arvore is not None:
+            return arvore
+
+        arvore = ArvoreDeCaminhosMinimos(self.indice, origem)
+
+        with self._trava:
+            self.falhas += 1
+
+            if origem in self._arvores:
+                return self._arvores[origem]
+            if arvore.tamanho_em_bytes() > self.limite_de_bytes:
+                return arvore
+
+            self._arvores[origem] = arvore
+            self.bytes_em_uso += arvore.tamanho_em_bytes()
+            self._descartar_excedentes()
+
+        return arvore
+
+    def limpar(self) -> None:
+        """
+        Descarta todas as árvores guardadas.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        with self._trava:
+            self._arvores.clear()
+            self.bytes_em_uso = 0
+
+    def reparar_estrada(self, cidade_a: int, cidade_b: int) -> None:
+        """
+        Repara todas as árvores guardadas depois que a estrada entre duas cidades foi criada, removida ou
+        teve a sua distância alterada no índice.
+
+        Parâmetros
+        ----------
+        cidade_a : int
+            O identificador de uma das cidades da estrada.
+        cidade_b : int
+            O identificador da outra cidade da estrada.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        with self._trava:
+            for arvore in self._arvores.values():
+                arvore.reparar_estrada(cidade_a, cidade_b)
+
+    def acrescentar_cidade(self) -> None:
+        """
+        Acrescenta a todas as árvores guardadas uma cidade recém adicionada ao índice.
+
+        Como cada árvore cresce, as usadas há mais tempo são descartadas se a memória ocupada passar do
+        limite.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        with self._trava:
+            for arvore in self._arvores.values():
+                arvore.acrescentar_cidade()
+
+            self.bytes_em_uso = sum(arvore.tamanho_em_bytes() for arvore in self._arvores.values())
+            self._descartar_excedentes()
+
+    # Metódo privado
+    def _descartar_excedentes(self) -> None:
+        """
+        Descarta as árvores usadas há mais tempo até que a memória ocupada volte a caber no limite. Deve ser
+        chamado com a trava já adquirida.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        while self.bytes_em_uso > self.limite_de_bytes:
+            _, arvore_removida = self._arvores.popitem(last=False)
+            self.bytes_em_uso -= arvore_removida.tamanho_em_bytes()
+            self.remocoes += 1
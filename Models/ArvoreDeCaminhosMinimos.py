@@ -0,0 +1,310 @@
+from array import array
+from heapq import heappush, heappop
+from math import inf
+from Controllers.RotaController import RotaController
+from Exceptions.RotaNaoEncontradaError import RotaNaoEncontradaError
+
+class ArvoreDeCaminhosMinimos:
+    """
+    A classe ArvoreDeCaminhosMinimos guarda os menores caminhos de uma cidade de origem até todas as outras
+    cidades de um mapa, calculados por uma única busca de Dijkstra.
+
+    Para cada cidade, a árvore guarda a menor distância a partir da origem e a cidade anterior no menor
+    caminho, em vetores indexados pelos identificadores do IndiceDeAdjacencia. Depois de criada, cada rota
+    a partir da origem é obtida percorrendo os antecessores do destino até a origem, sem nenhuma busca, em
+    tempo proporcional ao tamanho do caminho. Como as estradas são de mão dupla, a mesma árvore também
+    responde às rotas de qualquer cidade até a origem, percorrendo o caminho no sentido inverso.
+
+    Quando uma estrada do mapa muda, a árvore é reparada em vez de calculada de novo. Se a estrada ficou
+    mais curta ou foi criada, a melhoria é propagada a partir da cidade beneficiada. Se ficou mais longa ou
+    foi removida e fazia parte da árvore, apenas as cidades que dependiam dela são recalculadas, a partir
+    das vizinhas que não foram afetadas. Nos outros casos a árvore continua correta sem nenhuma alteração.
+
+    Atributos Públicos
+    ------------------
+    indice : IndiceDeAdjacencia
+        O índice de adjacência do mapa em que a árvore foi calculada.
+    origem : int
+        O identificador da cidade de origem.
+    distancias : array
+        A menor distância da origem até cada cidade, ou -1 se a cidade não for alcançável.
+    antecessores : array
+        O identificador da cidade anterior no menor caminho até cada cidade, ou -1 para a origem e para as
+        cidades não alcançáveis.
+    """
+    indice: 'IndiceDeAdjacencia'
+    origem: int
+    distancias: 'array'
+    antecessores: 'array'
+
+    def __init__(self, indice: 'IndiceDeAdjacencia', origem: int) -> None:
+        """
+        Construtor da classe ArvoreDeCaminhosMinimos.
+
+        Calcula a árvore com uma busca de Dijkstra completa a partir da cidade de origem.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa.
+        origem : int
+            O identificador da cidade de origem.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        quantidade_de_cidades: int = len(indice)
+        distancias_da_origem, antecessores_da_origem = RotaController.buscar_a_partir_de_uma_origem(indice, origem)
+
+        self.indice = indice
+        self.origem = origem
+        self.distancias = array(indice.tipo_dos_pesos(), [-1]) * quantidade_de_cidades
+        self.antecessores = array('i', [-1]) * quantidade_de_cidades
+
+        for cidade, distancia in distancias_da_origem.items():
+            self.distancias[cidade] = distancia
+        for cidade, antecessor in antecessores_da_origem.items():
+            self.antecessores[cidade] = antecessor
+
+    def tamanho_em_bytes(self) -> int:
+        """
+        Retorna a memória ocupada pelos vetores da árvore.
+
+        Retorna
+        -------
+        int
+            A quantidade de bytes dos vetores de distâncias e de antecessores.
+        """
+        return len(self.distancias) * self.distancias.itemsize + len(self.antecessores) * self.antecessores.itemsize
+
+    def alcanca(self, destino: int) -> bool:
+        """
+        Verifica se existe caminho entre a origem e uma cidade.
+
+        Parâmetros
+        ----------
+        destino : int
+            O identificador da cidade.
+
+        Retorna
+        -------
+        bool
+            True se a cidade for alcançável a partir da origem, False caso contrário.
+        """
+        return self.distancias[destino] >= 0
+
+    def distancia_ate(self, destino: int) -> int:
+        """
+        Retorna a menor distância entre a origem e uma cidade.
+
+        Parâmetros
+        ----------
+        destino : int
+            O identificador da cidade.
+
+        Retorna
+        -------
+        int
+            A menor distância entre a origem e a cidade.
+
+        Lança
+        ------
+        RotaNaoEncontradaError
+            Se não existir caminho entre a origem e a cidade.
+        """
+        if not self.alcanca(destino):
+            raise RotaNaoEncontradaError(RotaController._mensagem_de_rota_inexistente(self.indice, self.origem, destino))
+
+        return self.distancias[destino]
+
+    def caminho_ate(self, destino: int) -> list[int]:
+        """
+        Retorna o menor caminho da origem até uma cidade, percorrendo os antecessores a partir dela.
+
+        Parâmetros
+        ----------
+        destino : int
+            O identificador da cidade.
+
+        Retorna
+        -------
+        list[int]
+            O caminho, como lista de identificadores de cidades da origem até a cidade informada.
+
+        Lança
+        ------
+        RotaNaoEncontradaError
+            Se não existir caminho entre a origem e a cidade.
+        """
+        if not self.alcanca(destino):
+            raise RotaNaoEncontradaError(RotaController._mensagem_de_rota_inexistente(self.indice, self.origem, destino))
+
+        antecessores: 'array' = self.antecessores
+        caminho: list[int] = [destino]
+
+        while caminho[-1] != self.origem:
+            caminho.append(antecessores[caminho[-1]])
+
+        caminho.reverse()
+        return caminho
+
+    def reparar_estrada(self, cidade_a: int, cidade_b: int) -> None:
+        """
+        Atualiza a árvore depois que a estrada entre duas cidades foi criada, removida ou teve a sua
+        distância alterada no índice.
+
+        Parâmetros
+        ----------
+        cidade_a : int
+            O identificador de uma das cidades da estrada.
+        cidade_b : int
+            O identificador da outra cidade da estrada.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        if self.distancias.typecode != self.indice.tipo_dos_pesos():
+            self.distancias = array(self.indice.tipo_dos_pesos(), self.distancias)
+
+        distancia_da_estrada: int | float = self.indice.distancia_da_estrada(cidade_a, cidade_b)
+
+        for cidade, vizinha in ((cidade_a, cidade_b), (cidade_b, cidade_a)):
+            if self.antecessores[vizinha] == cidade and self.distancias[cidade] + distancia_da_estrada > self.distancias[vizinha]:
+                self._recalcular_dependentes(vizinha)
+
+        if distancia_da_estrada == inf:
+            return
+
+        for cidade, vizinha in ((cidade_a, cidade_b), (cidade_b, cidade_a)):
+            if self.alcanca(cidade):
+                nova_distancia: int | float = self.distancias[cidade] + distancia_da_estrada
+
+                if not self.alcanca(vizinha) or nova_distancia < self.distancias[vizinha]:
+                    self._propagar_melhoria(vizinha, nova_distancia, cidade)
+
+    def acrescentar_cidade(self) -> None:
+        """
+        Acrescenta à árvore uma cidade recém adicionada ao índice, ainda sem estradas e, portanto, não
+        alcançável.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self.distancias.append(-1)
+        self.antecessores.append(-1)
+
+    # Metódo privado
+    def _propagar_melhoria(self, cidade: int, distancia: int | float, antecessor: int) -> None:
+        """
+        Aplica uma distância menor a uma cidade e a propaga para as cidades cujo menor caminho passe a
+        depender dela, com uma busca de Dijkstra que só avança enquanto encontra melhorias.
+
+        Parâmetros
+        ----------
+        cidade : int
+            O identificador da cidade beneficiada.
+        distancia : int | float
+            A nova distância da origem até a cidade.
+        antecessor : int
+            A cidade anterior no novo menor caminho.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        deslocamentos, vizinhos, pesos = self.indice.deslocamentos, self.indice.vizinhos, self.indice.pesos
+        distancias, antecessores = self.distancias, self.antecessores
+
+        distancias[cidade] = distancia
+        antecessores[cidade] = antecessor
+        fila: list[tuple[int, int]] = [(distancia, cidade)]
+
+        while fila:
+            distancia_atual, atual = heappop(fila)
+
+            if distancia_atual != distancias[atual]:
+                continue
+
+            for posicao in range(deslocamentos[atual], deslocamentos[atual + 1]):
+                vizinho: int = vizinhos[posicao]
+                nova_distancia: int | float = distancia_atual + pesos[posicao]
+
+                if distancias[vizinho] < 0 or nova_distancia < distancias[vizinho]:
+                    distancias[vizinho] = nova_distancia
+                    antecessores[vizinho] = atual
+                    heappush(fila, (nova_distancia, vizinho))
+
+    # Metódo privado
+    def _recalcular_dependentes(self, cidade: int) -> None:
+        """
+        Recalcula a distância de uma cidade e de todas as cidades cujo menor caminho passava por ela, depois
+        que a estrada até a cidade ficou mais longa ou foi removida.
+
+        As demais cidades não são afetadas, pois os seus menores caminhos não usam a estrada alterada e
+        nenhuma distância do mapa diminuiu. As cidades dependentes partem da melhor distância oferecida
+        pelas vizinhas não afetadas e são recalculadas com uma busca de Dijkstra restrita a elas.
+
+        Parâmetros
+        ----------
+        cidade : int
+            O identificador da cidade cuja estrada até o antecessor mudou.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        deslocamentos, vizinhos, pesos = self.indice.deslocamentos, self.indice.vizinhos, self.indice.pesos
+        distancias, antecessores = self.distancias, self.antecessores
+
+        dependentes: list[int] = [cidade]
+        afetadas: set[int] = {cidade}
+
+        for dependente in dependentes:
+            for posicao in range(deslocamentos[dependente], deslocamentos[dependente + 1]):
+                vizinho: int = vizinhos[posicao]
+                if antecessores[vizinho] == dependente and vizinho not in afetadas:
+                    afetadas.add(vizinho)
+                    dependentes.append(vizinho)
+
+        for dependente in dependentes:
+            distancias[dependente] = -1
+            antecessores[dependente] = -1
+
+        fila: list[tuple[int, int]] = []
+
+        for dependente in dependentes:
+            for posicao in range(deslocamentos[dependente], deslocamentos[dependente + 1]):
+                vizinho: int = vizinhos[posicao]
+
+                if vizinho not in afetadas and distancias[vizinho] >= 0:
+                    nova_distancia: int | float = distancias[vizinho] + pesos[posicao]
+
+                    if distancias[dependente] < 0 or nova_distancia < distancias[dependente]:
+                        distancias[dependente] = nova_distancia
+                        antecessores[dependente] = vizinho
+
+            if distancias[dependente] >= 0:
+                heappush(fila, (distancias[dependente], dependente))
+
+        while fila:
+            distancia_atual, atual = heappop(fila)
+
+            if distancia_atual != distancias[atual]:
+                continue
+
+            for posicao in range(deslocamentos[atual], deslocamentos[atual + 1]):
+                vizinho: int = vizinhos[posicao]
+                nova_distancia: int | float = distancia_atual + pesos[posicao]
+
+                if vizinho in afetadas and (distancias[vizinho] < 0 or nova_distancia < distancias[vizinho]):
+                    distancias[vizinho] = nova_distancia
+                    antecessores[vizinho] = atual
+                    heappush(fila, (nova_distancia, vizinho))
@@ -0,0 +1,234 @@
+from collections import OrderedDict
+from threading import Lock
+
+class CacheDeRotas:
+    """
+    A classe CacheDeRotas guarda as rotas já calculadas, para que pares de cidades consultados com
+    frequência não precisem ser recalculados a cada nova Rota.
+
+    A chave de cada rota é formada pelos nomes das duas cidades, em ordem alfabética, e pelo resumo do
+    conteúdo do Mapa em que a rota foi calculada. Como as estradas são de mão dupla, a rota de A até B também
+    responde à consulta de B até A, com o caminho invertido. Quando o mapa muda, o seu resumo muda junto, e
+    as rotas da versão anterior deixam de ser encontradas, a não ser as que o Mapa transferir para a nova
+    versão por `revalidar`, por não terem sido afetadas pela alteração.
+
+    O cache tem capacidade limitada e descarta a rota usada há mais tempo (LRU) quando fica cheio. Todas as
+    operações são protegidas por uma trava, então um mesmo cache pode ser usado por várias threads.
+
+    Atributos Públicos
+    ------------------
+    capacidade : int
+        A quantidade máxima de rotas guardadas.
+    acertos : int
+        A quantidade de consultas respondidas pelo cache.
+    falhas : int
+        A quantidade de consultas que não estavam no cache.
+    remocoes : int
+        A quantidade de rotas descartadas por falta de espaço.
+    """
+    CAPACIDADE_PADRAO: int = 1024
+
+    capacidade: int
+    acertos: int
+    falhas: int
+    remocoes: int
+
+    def __init__(self, capacidade: int = CAPACIDADE_PADRAO) -> None:
+        """
+        Construtor da classe CacheDeRotas.
+
+        Parâmetros
+        ----------
+        capacidade : int, opcional
+            A quantidade máxima de rotas guardadas. O padrão é 1024.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+
+        Lança
+        ------
+        ValueError
+            Se a capacidade não for positiva.
+        """
+        if capacidade < 1:
+            raise ValueError("A capacidade do cache de rotas deve ser positiva.")
+
+        self.capacidade = capacidade
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+        self._rotas: 'OrderedDict[tuple[str, str, str], tuple[tuple[str, ...], int]]' = OrderedDict()
+        self._trava: 'Lock' = Lock()
+
+    def __len__(self) -> int:
+        """
+        Retorna a quantidade de rotas guardadas.
+
+        Retorna
+        -------
+        int
+            A quantidade de rotas guardadas.
+        """
+        return len(self._rotas)
+
+    def buscar(self, nome_da_cidade_inicial: str, nome_da_cidade_final: str, hash_do_mapa: str) -> tuple[list[str], int] | None:
+        """
+        Procura a rota entre duas cidades, em qualquer um dos sentidos.
+
+        Parâmetros
+        ----------
+        nome_da_cidade_inicial : str
+            O nome da cidade inicial da rota.
+        nome_da_cidade_final : str
+            O nome da cidade final da rota.
+        hash_do_mapa : str
+            O resumo do conteúdo do mapa, como retornado por `Mapa.hash_do_conteudo`.
+
+        Retorna
+        -------
+        tuple[list[str], int] | None
+            O caminho, da cidade inicial até a final, e a distância percorrida, ou None se a rota não
+            estiver no cache.
+        """
+        chave: tuple[str, str, str] = CacheDeRotas._chave(nome_da_cidade_inicial, nome_da_cidade_final, hash_do_mapa)
+
+        with self._trava:
+            rota: tuple[tuple[str, ...], int] | None = self._rotas.get(chave)
+
+            if rota is None:
+                self.falhas += 1
+                return None
+
+            self._rotas.move_to_end(chave)
+            self.acertos += 1
+
+        caminho, distancia = rota
+        if caminho[0] != nome_da_cidade_inicial.title():
+            caminho = caminho[::-1]
+
+        return list(caminho), distancia
+
+    def guardar(self, nome_da_cidade_inicial: str, nome_da_cidade_final: str, hash_do_mapa: str, caminho: list[str], distancia: int) -> None:
+        """
+        Guarda a rota entre duas cidades, descartando a rota usada há mais tempo se o cache estiver cheio.
+
+        Parâmetros
+        ----------
+        nome_da_cidade_inicial : str
+            O nome da cidade inicial da rota.
+        nome_da_cidade_final : str
+            O nome da cidade final da rota.
+        hash_do_mapa : str
+            O resumo do conteúdo do mapa, como retornado por `Mapa.hash_do_conteudo`.
+        caminho : list[str]
+            O caminho, da cidade inicial até a final.
+        distancia : int
+            A distância percorrida.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        chave: tuple[str, str, str] = CacheDeRotas._chave(nome_da_cidade_inicial, nome_da_cidade_final, hash_do_mapa)
+
+        with self._trava:
+            self._rotas[chave] = (tuple(caminho), distancia)
+            self._rotas.move_to_end(chave)
+
+            while len(self._rotas) > self.capacidade:
+                self._rotas.popitem(last=False)
+                self.remocoes += 1
+
+    def invalidar(self, hash_do_mapa: str = None) -> int:
+        """
+        Descarta as rotas de uma versão de mapa, ou todas as rotas.
+
+        Não é necessário chamar este método para que rotas desatualizadas deixem de ser usadas, já que o
+        resumo do mapa faz parte da chave. Ele apenas libera mais cedo o espaço ocupado por elas.
+
+        Parâmetros
+        ----------
+        hash_do_mapa : str, opcional
+            O resumo do conteúdo do mapa cujas rotas serão descartadas. O padrão é None, que descarta todas.
+
+        Retorna
+        -------
+        int
+            A quantidade de rotas descartadas.
+        """
+        with self._trava:
+            if hash_do_mapa is None:
+                quantidade: int = len(self._rotas)
+                self._rotas.clear()
+                return quantidade
+
+            chaves: list[tuple[str, str, str]] = [chave for chave in self._rotas if chave[2] == hash_do_mapa]
+            for chave in chaves:
+                del self._rotas[chave]
+
+            return len(chaves)
+
+    def revalidar(self, hash_antigo: str, hash_novo: str, ainda_valida: callable) -> int:
+        """
+        Transfere para uma nova versão do mapa as rotas da versão anterior que continuam corretas nela, e
+        descarta as demais.
+
+        É usado pelo Mapa quando ele é alterado, para que apenas as rotas afetadas pela alteração precisem
+        ser calculadas de novo. As rotas mantêm a sua posição na ordem de uso.
+
+        Parâmetros
+        ----------
+        hash_antigo : str
+            O resumo do conteúdo do mapa antes da alteração.
+        hash_novo : str
+            O resumo do conteúdo do mapa depois da alteração.
+        ainda_valida : callable
+            Uma função que recebe o caminho de uma rota, como tupla de nomes de cidades, e a sua distância,
+            e retorna True se a rota continua sendo o menor caminho na nova versão do mapa.
+
+        Retorna
+        -------
+        int
+            A quantidade de rotas transferidas.
+        """
+        transferidas: int = 0
+
+        with self._trava:
+            rotas: 'OrderedDict[tuple[str, str, str], tuple[tuple[str, ...], int]]' = OrderedDict()
+
+            for chave, rota in self._rotas.items():
+                if chave[2] != hash_antigo:
+                    rotas[chave] = rota
+                elif ainda_valida(*rota):
+                    rotas[(chave[0], chave[1], hash_novo)] = rota
+                    transferidas += 1
+
+            self._rotas = rotas
+
+        return transferidas
+
+    # Metódo privado
+    @staticmethod
+    def _chave(nome_da_cidade_inicial: str, nome_da_cidade_final: str, hash_do_mapa: str) -> tuple[str, str, str]:
+        """
+        Monta a chave de uma rota, que é a mesma para os dois sentidos.
+
+        Parâmetros
+        ----------
+        nome_da_cidade_inicial : str
+            O nome da cidade inicial da rota.
+        nome_da_cidade_final : str
+            O nome da cidade final da rota.
+        hash_do_mapa : str
+            O resumo do conteúdo do mapa.
+
+        Retorna
+        -------
+        tuple[str, str, str]
+            Os nomes capitalizados das duas cidades, em ordem alfabética, e o resumo do mapa.
+        """
+        nome_a, nome_b = sorted((nome_da_cidade_inicial.title(), nome_da_cidade_final.title()))
+        return nome_a, nome_b, hash_do_mapa
@@ -1,39 +1,53 @@
+from sys import intern
+from Models.VizinhasDaCidade import VizinhasDaCidade
+
 class Cidade:
     """
-    A classe Cidade representa de forma abstrata uma instância de um ponto no mapa, com nome, cidades 
+    A classe Cidade representa de forma abstrata uma instância de um ponto no mapa, com nome, cidades
     vizinhas e as distâncias até elas. Armazena também as coordenadas dessa Cidade, para melhor visualização
     em um gráfico, caso esse dado seja fornecido corretamente.
+
+    Para ocupar pouca memória em mapas com milhões de cidades, a classe usa `__slots__` e o nome da cidade
+    é internado, então é o mesmo objeto de texto usado pelo índice e pelas rotas. Uma cidade pode guardar
+    as próprias vizinhas em um dicionário, como durante o carregamento do JSON, ou estar ligada ao
+    IndiceDeAdjacencia do mapa, como todas as cidades de um Mapa já carregado. Ligada ao índice, a cidade
+    guarda apenas o nome e o índice: `vizinhas` passa a ser uma visão somente leitura dos vetores do índice,
+    que reflete as alterações feitas pelo Mapa, e as coordenadas são lidas do índice.
     """
+    __slots__ = ("nome", "_vizinhas", "_coordenadas", "_indice")
 
     nome: str
-    vizinhas: dict[str, int]
-    coordenadas: dict[str, float]
 
-    def __init__(self, nome: str) -> None:
+    def __init__(self, nome: str, indice: 'IndiceDeAdjacencia' = None) -> None:
         """
         Construtor da classe Cidade.
 
-        Este método inicializa uma instância da classe Cidade com o nome fornecido, 
+        Este método inicializa uma instância da classe Cidade com o nome fornecido,
         com a primeira letra de cada palavra em maiúscula e as demais em minúscula.
 
         Parâmetros
         ----------
         nome : str
             O nome da cidade que será atribuído à instância de Cidade.
+        indice : IndiceDeAdjacencia, opcional
+            O índice de adjacência em que a cidade já está registrada, de onde as vizinhas e as
+            coordenadas são lidas. O padrão é None, que cria a cidade sem vizinhas e sem coordenadas.
 
         Retorna
         -------
         None
             Este método não retorna nada.
         """
-        self.nome = nome.title()
-        self.vizinhas = {}
+        self.nome = intern(nome.title())
+        self._vizinhas = {} if indice is None else None
+        self._coordenadas = None
+        self._indice = indice
 
     def __str__(self) -> str:
         """
         Retorna uma representação em string da instância de Cidade.
 
-        Esta representação inclui o nome da cidade e uma lista de suas cidades vizinhas, 
+        Esta representação inclui o nome da cidade e uma lista de suas cidades vizinhas,
         com as respectivas distâncias em quilômetros.
 
         Retorna
@@ -44,6 +58,116 @@ class Cidade:
         vizinhas_str = ', '.join(f"{cidade.nome if isinstance(cidade, Cidade) else cidade} ({distancia} km)" for cidade, distancia in self.vizinhas.items())
         return f"A cidade {self.nome} possui essas vizinhas: {vizinhas_str}"
 
+    @property
+    def vizinhas(self) -> 'dict[str, int] | VizinhasDaCidade':
+        """
+        As cidades vizinhas, do nome de cada uma para a distância até ela.
+
+        Retorna
+        -------
+        dict[str, int] | VizinhasDaCidade
+            O dicionário de vizinhas da cidade, ou, se ela estiver ligada a um índice, uma visão somente
+            leitura das vizinhas registradas no índice.
+        """
+        if self._indice is None:
+            return self._vizinhas
+        return VizinhasDaCidade(self._indice, self._indice.ids_por_nome[self.nome])
+
+    @property
+    def ponto(self) -> tuple[float, float]:
+        """
+        As coordenadas X e Y da cidade, como um par de números de ponto flutuante.
+
+        Retorna
+        -------
+        tuple[float, float]
+            As coordenadas da cidade.
+
+        Lança
+        ------
+        AttributeError
+            Se a cidade não tiver coordenadas.
+        """
+        if self._coordenadas is not None:
+            return self._coordenadas
+        if self._indice is None:
+            raise AttributeError(f"A cidade '{self.nome}' não possui coordenadas.")
+
+        identificador: int = self._indice.ids_por_nome[self.nome]
+        return self._indice.coordenadas_x[identificador], self._indice.coordenadas_y[identificador]
+
+    @property
+    def coordenadas(self) -> dict[str, float]:
+        """
+        As coordenadas da cidade, no formato {"x": float, "y": float} do JSON do mapa.
+
+        O dicionário é montado a cada acesso a partir de `ponto`, então alterá-lo não altera a cidade. As
+        coordenadas devem ser alteradas pelo CidadeController.definir_coordenadas, ou, nas cidades ligadas
+        ao índice, pelo Mapa.definir_coordenadas.
+
+        Retorna
+        -------
+        dict[str, float]
+            As coordenadas da cidade.
+
+        Lança
+        ------
+        AttributeError
+            Se a cidade não tiver coordenadas.
+        """
+        x, y = self.ponto
+        return {"x": x, "y": y}
+
+    @coordenadas.setter
+    def coordenadas(self, coordenadas: dict[str, float]) -> None:
+        """
+        Define as coordenadas da cidade a partir de um dicionário no formato {"x": float, "y": float}.
+
+        Como as vizinhas, as coordenadas de uma cidade ligada ao índice são somente leitura: o índice é lido
+        pelo desenho do mapa e pelas heurísticas das rotas, então elas só podem ser alteradas pelo Mapa.
+
+        Parâmetros
+        ----------
+        coordenadas : dict[str, float]
+            As coordenadas da cidade.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+
+        Lança
+        ------
+        TypeError
+            Se a cidade estiver ligada a um índice.
+        """
+        if self._indice is not None:
+            raise TypeError(f"As coordenadas da cidade '{self.nome}' devem ser alteradas pelo Mapa.definir_coordenadas.")
+
+        self._coordenadas = (float(coordenadas["x"]), float(coordenadas["y"]))
+
+    def ligar_ao_indice(self, indice: 'IndiceDeAdjacencia') -> None:
+        """
+        Passa a ler as vizinhas e as coordenadas da cidade do índice de adjacência, descartando o
+        dicionário de vizinhas e as coordenadas guardadas na própria cidade.
+
+        O índice já deve conter a cidade, com as mesmas vizinhas e coordenadas, como o índice construído
+        pelo `IndiceDeAdjacencia.a_partir_das_cidades`.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência em que a cidade está registrada.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self._indice = indice
+        self._vizinhas = None
+        self._coordenadas = None
+
     def distancia_de_vizinho(self, qual_vizinho: str) -> int:
         """
         Retorna a distância de uma cidade até um vizinho especificado.
@@ -60,4 +184,4 @@ class Cidade:
         int
             A distância em quilômetros da cidade até o vizinho especificado.
         """
-        return self.vizinhas[qual_vizinho]
\ No newline at end of file
+        return self.vizinhas[qual_vizinho]
@@ -0,0 +1,113 @@
+from collections.abc import Mapping
+from Models.Cidade import Cidade
+
+class CidadesDoIndice(Mapping):
+    """
+    A classe CidadesDoIndice é uma visão de dicionário somente leitura, do nome de cada cidade para o seu
+    objeto Cidade, que instancia as cidades sob demanda a partir de um IndiceDeAdjacencia.
+
+    É usada pelos mapas carregados de um arquivo compilado, em que instanciar todas as cidades durante o
+    carregamento desperdiçaria o ganho de tempo do mapeamento em memória. Cada cidade é montada na primeira
+    vez em que é acessada e guardada para os acessos seguintes. Se duas threads montarem a mesma cidade ao
+    mesmo tempo, apenas a primeira a ser guardada é mantida, e ambas recebem o mesmo objeto.
+    """
+
+    def __init__(self, indice: 'IndiceDeAdjacencia') -> None:
+        """
+        Construtor da classe CidadesDoIndice.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência de onde as cidades serão montadas.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self._indice = indice
+        self._cidades_montadas: dict[str, 'Cidade'] = {}
+
+    def __getitem__(self, nome: str) -> 'Cidade':
+        """
+        Retorna a cidade com o nome especificado, montando-a a partir do índice se for o primeiro acesso.
+
+        Parâmetros
+        ----------
+        nome : str
+            O nome da cidade.
+
+        Retorna
+        -------
+        Cidade
+            A cidade correspondente ao nome, ligada ao índice.
+
+        Lança
+        ------
+        KeyError
+            Se a cidade não existir no índice.
+        """
+        cidade: 'Cidade' = self._cidades_montadas.get(nome)
+
+        if cidade is None:
+            cidade = self._cidades_montadas.setdefault(nome, self._montar_cidade(self._indice.ids_por_nome[nome]))
+
+        return cidade
+
+    def __iter__(self) -> 'Iterator[str]':
+        """
+        Percorre os nomes das cidades, na ordem dos identificadores do índice.
+
+        Retorna
+        -------
+        Iterator[str]
+            Os nomes das cidades.
+        """
+        return iter(self._indice.nomes)
+
+    def __len__(self) -> int:
+        """
+        Retorna a quantidade de cidades do índice.
+
+        Retorna
+        -------
+        int
+            A quantidade de cidades do índice.
+        """
+        return len(self._indice)
+
+    def descartar(self, nome: str) -> None:
+        """
+        Esquece a cidade já montada com o nome especificado, para que ela não seja mais retornada depois de
+        removida do índice.
+
+        Parâmetros
+        ----------
+        nome : str
+            O nome da cidade.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self._cidades_montadas.pop(nome, None)
+
+    # Metódo privado
+    def _montar_cidade(self, identificador: int) -> 'Cidade':
+        """
+        Instancia a cidade de identificador especificado, ligada ao índice, de onde ela lê as vizinhas e
+        as coordenadas.
+
+        Parâmetros
+        ----------
+        identificador : int
+            O identificador da cidade no índice.
+
+        Retorna
+        -------
+        Cidade
+            A cidade montada.
+        """
+        return Cidade(self._indice.nomes[identificador], self._indice)
@@ -0,0 +1,271 @@
+from contextlib import contextmanager
+from cProfile import Profile
+from heapq import heappush, heappop
+from pstats import Stats
+from time import perf_counter
+import tracemalloc
+
+class Estatisticas:
+    """
+    A classe Estatisticas acumula medições do trabalho feito pelas rotas e pelo mapa, para investigar
+    consultas lentas.
+
+    A coleta é opcional: uma instância só é preenchida quando é passada para a Rota ou para o Mapa, e sem
+    ela as buscas não fazem nenhuma contagem. Com ela, as filas de prioridade das buscas passam a usar os
+    métodos `empurrar` e `retirar` desta classe, que contam as operações, e as cidades expandidas e as
+    estradas examinadas são somadas ao final de cada busca. A mesma instância pode ser passada para várias
+    rotas e para o mapa, acumulando as medições de todos.
+
+    Os tempos são acumulados por fase, em segundos. O Mapa registra as fases "leitura", "cidades",
+    "indice", "compilacao" e "mapeamento" do carregamento, e "hierarquia_de_contracao" e
+    "pontos_de_referencia" no preparo desses dados. A Rota registra as fases "cache", "preparo", "busca" e
+    "reconstrucao", esta última com a conversão do caminho para nomes e a gravação no cache.
+
+    Atributos Públicos
+    ------------------
+    buscas : int
+        A quantidade de buscas executadas.
+    nos_expandidos : int
+        A quantidade de cidades expandidas pelas buscas.
+    arestas_relaxadas : int
+        A quantidade de estradas examinadas a partir das cidades expandidas.
+    insercoes_na_fila : int
+        A quantidade de inserções nas filas de prioridade, incluindo as cidades iniciais das buscas.
+    remocoes_da_fila : int
+        A quantidade de remoções das filas de prioridade.
+    acertos_de_cache : int
+        A quantidade de rotas respondidas pelo cache de rotas ou por uma árvore de caminhos mínimos.
+    falhas_de_cache : int
+        A quantidade de rotas procuradas no cache de rotas e nas árvores sem sucesso.
+    tempos_das_fases : dict[str, float]
+        O tempo acumulado em cada fase, em segundos.
+    usar_cprofile : bool
+        Se as consultas medidas com `perfilar` são executadas sob o cProfile.
+    usar_tracemalloc : bool
+        Se o pico de memória das consultas medidas com `perfilar` é registrado com o tracemalloc.
+    perfil : pstats.Stats
+        O perfil do cProfile acumulado nas consultas medidas. É None se o cProfile não for usado.
+    pico_de_memoria : int
+        O maior pico de memória alocada entre as consultas medidas, em bytes. É 0 se o tracemalloc não
+        for usado.
+    """
+    buscas: int
+    nos_expandidos: int
+    arestas_relaxadas: int
+    insercoes_na_fila: int
+    remocoes_da_fila: int
+    acertos_de_cache: int
+    falhas_de_cache: int
+    tempos_das_fases: dict[str, float]
+    usar_cprofile: bool
+    usar_tracemalloc: bool
+    perfil: 'Stats'
+    pico_de_memoria: int
+
+    def __init__(self, usar_cprofile: bool = False, usar_tracemalloc: bool = False) -> None:
+        """
+        Construtor da classe Estatisticas.
+
+        Parâmetros
+        ----------
+        usar_cprofile : bool, opcional
+            Se True, as consultas medidas com `perfilar` são executadas sob o cProfile. O padrão é False.
+        usar_tracemalloc : bool, opcional
+            Se True, o pico de memória das consultas medidas com `perfilar` é registrado com o
+            tracemalloc. O padrão é False.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self.usar_cprofile = usar_cprofile
+        self.usar_tracemalloc = usar_tracemalloc
+        self.zerar()
+
+    def __str__(self) -> str:
+        """
+        Retorna um resumo das medições, com os contadores e os tempos de cada fase em milissegundos.
+
+        Retorna
+        -------
+        str
+            Uma representação em string da instância de Estatisticas.
+        """
+        fases: str = ", ".join(f"{fase}={segundos * 1000:.2f}ms" for fase, segundos in self.tempos_das_fases.items())
+        return (
+            f"buscas={self.buscas} nos_expandidos={self.nos_expandidos} arestas_relaxadas={self.arestas_relaxadas}"
+            f" insercoes_na_fila={self.insercoes_na_fila} remocoes_da_fila={self.remocoes_da_fila}"
+            f" acertos_de_cache={self.acertos_de_cache} falhas_de_cache={self.falhas_de_cache} fases=[{fases}]"
+        )
+
+    def zerar(self) -> None:
+        """
+        Descarta todas as medições acumuladas, mantendo as opções de perfilamento.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self.buscas = 0
+        self.nos_expandidos = 0
+        self.arestas_relaxadas = 0
+        self.insercoes_na_fila = 0
+        self.remocoes_da_fila = 0
+        self.acertos_de_cache = 0
+        self.falhas_de_cache = 0
+        self.tempos_das_fases = {}
+        self.perfil = None
+        self.pico_de_memoria = 0
+
+    def como_dicionario(self) -> dict[str, object]:
+        """
+        Retorna as medições em um dicionário pronto para ser gravado em JSON.
+
+        Retorna
+        -------
+        dict[str, object]
+            Os contadores, os tempos de cada fase em segundos e o pico de memória.
+        """
+        return {
+            "buscas": self.buscas,
+            "nos_expandidos": self.nos_expandidos,
+            "arestas_relaxadas": self.arestas_relaxadas,
+            "insercoes_na_fila": self.insercoes_na_fila,
+            "remocoes_da_fila": self.remocoes_da_fila,
+            "acertos_de_cache": self.acertos_de_cache,
+            "falhas_de_cache": self.falhas_de_cache,
+            "tempos_das_fases": dict(self.tempos_das_fases),
+            "pico_de_memoria": self.pico_de_memoria
+        }
+
+    @contextmanager
+    def fase(self, nome: str) -> 'Iterator[None]':
+        """
+        Mede o tempo do bloco `with` e o soma ao tempo acumulado da fase.
+
+        Parâmetros
+        ----------
+        nome : str
+            O nome da fase.
+
+        Retorna
+        -------
+        Iterator[None]
+            O gerenciador de contexto que mede o bloco.
+        """
+        inicio: float = perf_counter()
+        try:
+            yield
+        finally:
+            self.tempos_das_fases[nome] = self.tempos_das_fases.get(nome, 0.0) + perf_counter() - inicio
+
+    @contextmanager
+    def perfilar(self) -> 'Iterator[None]':
+        """
+        Executa o bloco `with` sob o cProfile e o tracemalloc, conforme as opções da instância.
+
+        O perfil do bloco é somado a `perfil`, e o pico de memória alocada durante o bloco atualiza
+        `pico_de_memoria`, descontada a memória que já estava alocada no começo do bloco. Se o tracemalloc já
+        estiver ativo, ele continua ativo ao final; caso contrário, é ativado apenas durante o bloco. Sem
+        nenhuma das opções, o bloco é executado normalmente.
+
+        Retorna
+        -------
+        Iterator[None]
+            O gerenciador de contexto que perfila o bloco.
+        """
+        perfilador: 'Profile | None' = Profile() if self.usar_cprofile else None
+        ativou_o_tracemalloc: bool = self.usar_tracemalloc and not tracemalloc.is_tracing()
+
+        memoria_inicial: int = 0
+
+        if ativou_o_tracemalloc:
+            tracemalloc.start()
+        elif self.usar_tracemalloc:
+            tracemalloc.reset_peak()
+            memoria_inicial = tracemalloc.get_traced_memory()[0]
+        if perfilador is not None:
+            perfilador.enable()
+
+        try:
+            yield
+        finally:
+            if perfilador is not None:
+                perfilador.disable()
+                if self.perfil is None:
+                    self.perfil = Stats(perfilador)
+                else:
+                    self.perfil.add(perfilador)
+
+            if self.usar_tracemalloc:
+                self.pico_de_memoria = max(self.pico_de_memoria, tracemalloc.get_traced_memory()[1] - memoria_inicial)
+            if ativou_o_tracemalloc:
+                tracemalloc.stop()
+
+    def empurrar(self, fila: list, item: tuple) -> None:
+        """
+        Insere um item em uma fila de prioridade, como o `heapq.heappush`, contando a inserção.
+
+        Parâmetros
+        ----------
+        fila : list
+            A fila de prioridade.
+        item : tuple
+            O item inserido.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self.insercoes_na_fila += 1
+        heappush(fila, item)
+
+    def retirar(self, fila: list) -> tuple:
+        """
+        Retira o menor item de uma fila de prioridade, como o `heapq.heappop`, contando a remoção.
+
+        Parâmetros
+        ----------
+        fila : list
+            A fila de prioridade.
+
+        Retorna
+        -------
+        tuple
+            O menor item da fila.
+        """
+        self.remocoes_da_fila += 1
+        return heappop(fila)
+
+    def registrar_busca(self, deslocamentos: 'Sequence[int]', expandidas: 'Iterable[int]', cidades_iniciais: int = 1) -> None:
+        """
+        Soma as cidades expandidas e as estradas examinadas a partir delas ao final de uma busca.
+
+        As estradas são contadas pelos deslocamentos do índice percorrido pela busca, então nenhuma
+        contagem é feita durante a própria busca. Também soma às inserções as cidades iniciais, com as
+        quais as filas já são criadas.
+
+        Parâmetros
+        ----------
+        deslocamentos : Sequence[int]
+            Os deslocamentos do índice ou da hierarquia percorrida pela busca.
+        expandidas : Iterable[int]
+            Os identificadores das cidades expandidas.
+        cidades_iniciais : int, opcional
+            A quantidade de cidades com que as filas da busca foram criadas: 2 nas buscas bidirecionais.
+            O padrão é 1.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self.buscas += 1
+        self.insercoes_na_fila += cidades_iniciais
+
+        for cidade in expandidas:
+            self.nos_expandidos += 1
+            self.arestas_relaxadas += deslocamentos[cidade + 1] - deslocamentos[cidade]
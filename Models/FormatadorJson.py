@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+from json import dumps
+from logging import Formatter, LogRecord
+
+# Atributos que todo LogRecord possui. Os demais foram passados pelo `extra` de quem registrou o evento.
+ATRIBUTOS_PADRAO: frozenset[str] = frozenset(vars(LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+class FormatadorJson(Formatter):
+    """
+    A classe FormatadorJson formata cada evento do `logging` como um objeto JSON em uma única linha, para
+    que os registros possam ser lidos por ferramentas de análise de logs.
+
+    Cada linha traz o momento do evento em UTC, o nível, o nome do registrador e a mensagem já formatada,
+    seguidos de todos os campos passados pelo `extra` de quem registrou o evento, como os campos de tempo
+    dos eventos da classe Rota. Valores que não podem ser convertidos em JSON são gravados como texto.
+    """
+
+    def format(self, record: 'LogRecord') -> str:
+        """
+        Formata um evento como um objeto JSON.
+
+        Parâmetros
+        ----------
+        record : LogRecord
+            O evento registrado.
+
+        Retorna
+        -------
+        str
+            O objeto JSON do evento, em uma única linha.
+        """
+        campos: dict[str, object] = {
+            "momento": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "nivel": record.levelname,
+            "registrador": record.name,
+            "mensagem": record.getMessage()
+        }
+        campos.update((nome, valor) for nome, valor in vars(record).items() if nome not in ATRIBUTOS_PADRAO)
+
+        if record.exc_info:
+            campos["excecao"] = self.formatException(record.exc_info)
+
+        return dumps(campos, ensure_ascii=False, default=str)
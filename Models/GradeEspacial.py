@@ -0,0 +1,180 @@
+import numpy as np
+
+class GradeEspacial:
+    """
+    A classe GradeEspacial é um índice espacial de retângulos, como as caixas envolventes das estradas de
+    um mapa, sobre uma grade uniforme de células quadradas que cobre uma região quadrada do plano.
+
+    Cada retângulo é guardado em todas as células que toca, e os retângulos de cada célula ficam contíguos em
+    um único vetor, no mesmo formato de vetores de deslocamentos do IndiceDeAdjacencia. Uma consulta percorre
+    apenas as células que tocam a região consultada e descarta os retângulos que não a tocam de fato; em
+    regiões que cobrem boa parte da grade, todos os retângulos são verificados diretamente. Retângulos que
+    tocariam mais de `CELULAS_POR_RETANGULO_LONGO` células, como estradas muito longas, não são repetidos em
+    cada célula: ficam em uma lista à parte, verificada em toda consulta.
+
+    Atributos Públicos
+    ------------------
+    origem : tuple[float, float]
+        O canto inferior esquerdo da região coberta pela grade.
+    lado : float
+        O lado da região coberta pela grade.
+    celulas_por_lado : int
+        A quantidade de células em cada lado da grade.
+    retangulos : np.ndarray
+        Os retângulos indexados, um por linha, com o x mínimo, o y mínimo, o x máximo e o y máximo.
+    deslocamentos : np.ndarray
+        A posição, em `itens`, dos retângulos de cada célula: os da célula `c` ficam entre
+        `deslocamentos[c]` e `deslocamentos[c + 1]`. As células são numeradas linha a linha, de baixo para
+        cima.
+    itens : np.ndarray
+        As posições, em `retangulos`, dos retângulos de cada célula.
+    longos : np.ndarray
+        As posições, em `retangulos`, dos retângulos guardados fora das células.
+    """
+    # Quantidade média de retângulos por célula usada para escolher o tamanho da grade.
+    RETANGULOS_POR_CELULA: int = 4
+    CELULAS_POR_LADO_MAXIMAS: int = 1_024
+    CELULAS_POR_RETANGULO_LONGO: int = 64
+    # Fração dos retângulos a partir da qual é mais rápido verificar todos do que juntar os das células.
+    FRACAO_PARA_VERIFICAR_TODOS: float = 0.03
+
+    origem: tuple[float, float]
+    lado: float
+    celulas_por_lado: int
+    retangulos: 'np.ndarray'
+    deslocamentos: 'np.ndarray'
+    itens: 'np.ndarray'
+    longos: 'np.ndarray'
+
+    def __init__(self, retangulos: 'np.ndarray', origem: tuple[float, float], lado: float, celulas_por_lado: int = None) -> None:
+        """
+        Construtor da classe GradeEspacial.
+
+        Parâmetros
+        ----------
+        retangulos : np.ndarray
+            Os retângulos indexados, um por linha, com o x mínimo, o y mínimo, o x máximo e o y máximo. Um
+            ponto é um retângulo com os mínimos iguais aos máximos.
+        origem : tuple[float, float]
+            O canto inferior esquerdo da região coberta pela grade. Os retângulos fora da região ficam nas
+            células da borda.
+        lado : float
+            O lado da região coberta pela grade. Deve ser positivo.
+        celulas_por_lado : int, opcional
+            A quantidade de células em cada lado da grade. O padrão é None, que escolhe a menor potência de
+            2 com cerca de `RETANGULOS_POR_CELULA` retângulos por célula, até `CELULAS_POR_LADO_MAXIMAS`.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self.retangulos = np.asarray(retangulos, dtype=np.float64).reshape(-1, 4)
+        self.origem = origem
+        self.lado = lado
+
+        if celulas_por_lado is None:
+            celulas_por_lado = 1
+            while celulas_por_lado < GradeEspacial.CELULAS_POR_LADO_MAXIMAS and celulas_por_lado ** 2 * GradeEspacial.RETANGULOS_POR_CELULA < len(self.retangulos):
+                celulas_por_lado *= 2
+        self.celulas_por_lado = celulas_por_lado
+
+        minimos_x, minimos_y = self._celulas_dos_pontos(self.retangulos[:, 0], self.retangulos[:, 1])
+        maximos_x, maximos_y = self._celulas_dos_pontos(self.retangulos[:, 2], self.retangulos[:, 3])
+        larguras: 'np.ndarray' = maximos_x - minimos_x + 1
+        quantidades: 'np.ndarray' = larguras * (maximos_y - minimos_y + 1)
+
+        longos: 'np.ndarray' = quantidades > GradeEspacial.CELULAS_POR_RETANGULO_LONGO
+        self.longos = np.flatnonzero(longos)
+        quantidades[longos] = 0
+
+        # Cada retângulo é repetido uma vez por célula que toca, e a sua posição entre as repetições dá a
+        # coluna e a linha da célula dentro do intervalo de células do retângulo.
+        repetidos: 'np.ndarray' = np.repeat(np.arange(len(self.retangulos)), quantidades)
+        inicios: 'np.ndarray' = np.cumsum(quantidades) - quantidades
+        posicoes: 'np.ndarray' = np.arange(len(repetidos)) - inicios[repetidos]
+        colunas: 'np.ndarray' = minimos_x[repetidos] + posicoes % larguras[repetidos]
+        linhas: 'np.ndarray' = minimos_y[repetidos] + posicoes // larguras[repetidos]
+        celulas: 'np.ndarray' = linhas * celulas_por_lado + colunas
+
+        ordem: 'np.ndarray' = np.argsort(celulas, kind="stable")
+        self.itens = repetidos[ordem]
+        self.deslocamentos = np.concatenate(([0], np.cumsum(np.bincount(celulas, minlength=celulas_por_lado ** 2))))
+
+    def __len__(self) -> int:
+        """
+        Retorna a quantidade de retângulos indexados.
+
+        Retorna
+        -------
+        int
+            A quantidade de retângulos.
+        """
+        return len(self.retangulos)
+
+    def consultar(self, minimo_x: float, minimo_y: float, maximo_x: float, maximo_y: float) -> 'np.ndarray':
+        """
+        Retorna os retângulos que tocam uma região retangular.
+
+        Parâmetros
+        ----------
+        minimo_x : float
+            O x mínimo da região.
+        minimo_y : float
+            O y mínimo da região.
+        maximo_x : float
+            O x máximo da região.
+        maximo_y : float
+            O y máximo da região.
+
+        Retorna
+        -------
+        np.ndarray
+            As posições, em `retangulos`, dos retângulos que tocam a região, em ordem crescente e sem
+            repetições.
+        """
+        (coluna_inicial, coluna_final), (linha_inicial, linha_final) = self._celulas_dos_pontos(
+            np.array([minimo_x, maximo_x]), np.array([minimo_y, maximo_y])
+        )
+
+        inicios: 'np.ndarray' = self.deslocamentos[np.arange(linha_inicial, linha_final + 1) * self.celulas_por_lado + coluna_inicial]
+        fins: 'np.ndarray' = self.deslocamentos[np.arange(linha_inicial, linha_final + 1) * self.celulas_por_lado + coluna_final + 1]
+
+        candidatos: 'np.ndarray | None' = None
+        encontrados: 'np.ndarray' = self.retangulos
+        if (fins - inicios).sum() < len(self.retangulos) * GradeEspacial.FRACAO_PARA_VERIFICAR_TODOS:
+            candidatos = np.unique(np.concatenate([self.itens[inicio:fim] for inicio, fim in zip(inicios, fins)] + [self.longos]))
+            encontrados = self.retangulos[candidatos]
+
+        tocam: 'np.ndarray' = (
+            (encontrados[:, 0] <= maximo_x) & (encontrados[:, 2] >= minimo_x) & (encontrados[:, 1] <= maximo_y) & (encontrados[:, 3] >= minimo_y)
+        )
+
+        return np.flatnonzero(tocam) if candidatos is None else candidatos[tocam]
+
+    # Metódo privado
+    def _celulas_dos_pontos(self, coordenadas_x: 'np.ndarray', coordenadas_y: 'np.ndarray') -> tuple['np.ndarray', 'np.ndarray']:
+        """
+        Retorna a coluna e a linha da célula de cada ponto, limitadas às células da grade.
+
+        Parâmetros
+        ----------
+        coordenadas_x : np.ndarray
+            As coordenadas x dos pontos.
+        coordenadas_y : np.ndarray
+            As coordenadas y dos pontos.
+
+        Retorna
+        -------
+        tuple[np.ndarray, np.ndarray]
+            As colunas e as linhas das células.
+        """
+        tamanho_da_celula: float = self.lado / self.celulas_por_lado
+
+        colunas: 'np.ndarray' = np.floor((coordenadas_x - self.origem[0]) / tamanho_da_celula)
+        linhas: 'np.ndarray' = np.floor((coordenadas_y - self.origem[1]) / tamanho_da_celula)
+
+        return (
+            np.clip(colunas, 0, self.celulas_por_lado - 1).astype(np.int64),
+            np.clip(linhas, 0, self.celulas_por_lado - 1).astype(np.int64)
+        )
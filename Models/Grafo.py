@@ -1,18 +1,36 @@
+from math import degrees, sqrt
+from matplotlib.collections import LineCollection
 from Models.Mapa import Mapa
 import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
 
 class Grafo:
     """
     A classe Grafo representa a estrutura de dados gráfica que contém as informações sobre as conexões entre
     as cidades e suas representações visuais.
 
+    O grafo pode ser desenhado de duas formas. O desenho do NetworkX cria um objeto do Matplotlib para cada
+    cidade, estrada e etiqueta, o que só é viável em mapas pequenos. O desenho vetorizado lê as coordenadas dos
+    vetores do índice de adjacência do mapa e as estradas listadas de uma só vez pelo Mapa, desenha todas as
+    estradas em uma única LineCollection e todas as cidades em um único gráfico de dispersão, reduz o tamanho
+    das cidades e a largura das estradas em mapas densos e mantém apenas as etiquetas que cabem na figura sem
+    se sobrepor, até um limite de etiquetas. Por padrão, o desenho vetorizado é usado nos mapas com mais de
+    `ESTRADAS_PARA_DESENHO_VETORIZADO` estradas.
+
     Atributos Públicos
     ------------------
     mapa : 'Mapa'
         O mapa associado ao grafo, contendo as informações sobre as cidades e suas conexões.
     representacao : 'nx.Graph'
-        A representação gráfica do grafo, utilizando a biblioteca NetworkX.
+        A representação gráfica do grafo, utilizando a biblioteca NetworkX, montada a partir das estradas
+        listadas pelo Mapa. No desenho vetorizado, que não a usa, ela só é construída no primeiro acesso.
+    vetorizado : bool
+        Se o grafo foi desenhado de forma vetorizada, sem o NetworkX.
+    figura : 'Figure'
+        A figura do Matplotlib em que o grafo é desenhado.
+    eixos : 'Axes'
+        Os eixos do Matplotlib em que o grafo é desenhado, ou None para desenhar em uma nova figura do pyplot.
     atributos_do_desenho : dict[str, any]
         Um dicionário contendo os atributos de desenho do grafo, como cor, tamanho e largura das arestas,
         bem como a posição dos nós no espaço gráfico. Por padrão, inclui os seguintes atributos:
@@ -26,9 +44,7 @@ class Grafo:
         - 'font_size': Tamanho da fonte das etiquetas, padrão 5.
 
     """
-    mapa: 'Mapa'
-    representacao: 'nx.Graph'
-    atributos_do_desenho: dict[str, any] = {
+    ATRIBUTOS_PADRAO_DO_DESENHO: dict[str, any] = {
         "pos": {},
         "node_color": "skyblue",
         "node_size": 500,
@@ -38,8 +54,25 @@ class Grafo:
         "font_color": "black",
         "font_size": 5
     }
+    ESTRADAS_PARA_DESENHO_VETORIZADO: int = 2_000
+    # Dimensões do desenho vetorizado em mapas densos; veja `dimensoes_do_desenho_vetorizado`.
+    FRACAO_OCUPADA_PELAS_CIDADES: float = 0.1
+    CIDADES_NA_LARGURA_PADRAO: int = 100
+    LARGURA_MINIMA_DAS_ESTRADAS: float = 0.1
+    # Quantidade máxima de etiquetas de cada tipo (nomes de cidades e distâncias) no desenho vetorizado.
+    LIMITE_DE_ETIQUETAS: int = 100
+    # Espaço reservado para cada etiqueta do desenho vetorizado, em pontos, para que elas não se sobreponham.
+    ESPACO_DO_NOME_DA_CIDADE: tuple[float, float] = (40.0, 8.0)
+    ESPACO_DA_DISTANCIA: tuple[float, float] = (14.0, 7.0)
+
+    mapa: 'Mapa'
+    vetorizado: bool
+    figura: 'Figure'
+    eixos: 'Axes' = None
+    atributos_do_desenho: dict[str, any]
+    _representacao: 'nx.Graph' = None
 
-    def __init__(self, qual_mapa_para_representar: 'Mapa', caminho: list[str] = None) -> None:
+    def __init__(self, qual_mapa_para_representar: 'Mapa', caminho: list[str] = None, eixos: 'Axes' = None, vetorizado: bool = None) -> None:
         """
         Inicializa um objeto da classe Grafo para representar um mapa em forma de grafo.
 
@@ -55,6 +88,14 @@ class Grafo:
             Uma lista de nomes de cidades que definirá um caminho específico
             a ser destacado no grafo. Por padrão, é None, o que significa
             que nenhum caminho será destacado.
+        eixos : Axes, opcional
+            Os eixos de uma figura do Matplotlib em que o grafo deve ser desenhado, como os de uma figura
+            criada sem o pyplot. Por padrão, é None, o que desenha o grafo em uma nova figura do pyplot, para
+            que cada Grafo tenha a sua própria figura.
+        vetorizado : bool, opcional
+            Se True, o grafo é desenhado de forma vetorizada, e se False, pelo NetworkX. Por padrão, é None,
+            o que usa o desenho vetorizado apenas nos mapas com mais de `ESTRADAS_PARA_DESENHO_VETORIZADO`
+            estradas.
 
         Retorna
         -------
@@ -62,18 +103,84 @@ class Grafo:
             Este método não retorna nada diretamente, mas inicializa o objeto
             Grafo com a representação gráfica do mapa.
         """
-        self.representacao = nx.Graph()
         self.mapa = qual_mapa_para_representar
+        self.vetorizado = Grafo.usar_desenho_vetorizado(self.mapa) if vetorizado is None else vetorizado
+        self.eixos = eixos
+        self.figura = plt.figure() if eixos is None else eixos.figure
+        self.atributos_do_desenho = dict(self.ATRIBUTOS_PADRAO_DO_DESENHO)
+
+        if self.vetorizado:
+            self._desenhar_grafo_vetorizado(caminho)
+            return
 
-        self._adicionar_cidades_ao_grafo()
-        self._adicionar_conexoes_ao_grafo()
-        
         self._definir_coordenadas_de_cada_cidade()
 
         self._definir_cores_para_as_etiquetas(caminho)
 
         self._desenhar_grafo()
 
+    @property
+    def representacao(self) -> 'nx.Graph':
+        """
+        A representação do mapa como um grafo do NetworkX, construída no primeiro acesso.
+
+        Retorna
+        -------
+        nx.Graph
+            O grafo, com as cidades como nós e as estradas como arestas, com a distância no atributo "dist".
+        """
+        if self._representacao is None:
+            self._representacao = nx.Graph()
+            self._adicionar_cidades_ao_grafo()
+            self._adicionar_conexoes_ao_grafo()
+
+        return self._representacao
+
+    @staticmethod
+    def usar_desenho_vetorizado(mapa: 'Mapa') -> bool:
+        """
+        Indica se o mapa é grande o bastante para ser desenhado, por padrão, de forma vetorizada.
+
+        Parâmetros
+        ----------
+        mapa : Mapa
+            O mapa desenhado.
+
+        Retorna
+        -------
+        bool
+            True se o mapa tiver mais de `ESTRADAS_PARA_DESENHO_VETORIZADO` estradas.
+        """
+        return len(mapa.indice.vizinhos) // 2 > Grafo.ESTRADAS_PARA_DESENHO_VETORIZADO
+
+    @staticmethod
+    def dimensoes_do_desenho_vetorizado(quantidade_de_cidades: int) -> tuple[float, float]:
+        """
+        Retorna o tamanho das cidades e a largura das estradas no desenho vetorizado.
+
+        Nos mapas pequenos, são os mesmos do desenho do NetworkX. Nos maiores, o tamanho das cidades diminui
+        para que elas cubram no máximo `FRACAO_OCUPADA_PELAS_CIDADES` da figura, e a largura das estradas
+        diminui com a raiz quadrada da quantidade de cidades, sem ficar menor que `LARGURA_MINIMA_DAS_ESTRADAS`.
+
+        Parâmetros
+        ----------
+        quantidade_de_cidades : int
+            A quantidade de cidades do mapa.
+
+        Retorna
+        -------
+        tuple[float, float]
+            O tamanho das cidades, em pontos quadrados, e a largura das estradas, em pontos.
+        """
+        largura_da_figura, altura_da_figura = plt.rcParams["figure.figsize"]
+        area_da_figura: float = largura_da_figura * altura_da_figura * 72 ** 2
+        quantidade_de_cidades = max(quantidade_de_cidades, 1)
+
+        tamanho_das_cidades: float = min(Grafo.ATRIBUTOS_PADRAO_DO_DESENHO["node_size"], Grafo.FRACAO_OCUPADA_PELAS_CIDADES * area_da_figura / quantidade_de_cidades)
+        largura_das_estradas: float = Grafo.ATRIBUTOS_PADRAO_DO_DESENHO["width"] * min(1.0, sqrt(Grafo.CIDADES_NA_LARGURA_PADRAO / quantidade_de_cidades))
+
+        return tamanho_das_cidades, max(largura_das_estradas, Grafo.LARGURA_MINIMA_DAS_ESTRADAS)
+
     # Metódo privado
     def _adicionar_cidades_ao_grafo(self) -> None:
         """
@@ -93,29 +200,24 @@ class Grafo:
     # Metódo privado
     def _adicionar_conexoes_ao_grafo(self) -> None:
         """
-        Adiciona as conexões entre os nós ao grafo de acordo com o JSON fornecido à instância
-        de Mapa passada para esta instância de Grafo atual.
+        Adiciona as conexões entre os nós ao grafo a partir das estradas listadas de uma só vez pelo Mapa.
 
-        As conexões são representadas como edges, que são uma lista de tuplas. Cada tupla contém
-        o nome de uma cidade, o nome de sua vizinha e um dicionário com a propriedade "dist",
-        correspondente à distância entre as duas cidades. A estrutura complexa das tuplas é uma
-        exigência da biblioteca NetworkX, permitindo outras propriedades além da distância, como
-        o peso (weight), que não é aplicável ao escopo do projeto atual.
+        Cada estrada é adicionada uma única vez, com a distância na propriedade "dist" da aresta. As
+        cidades são convertidas de identificador para nome por uma lista com os nomes de todas elas, sem
+        percorrer as vizinhas de cada cidade.
 
         Retorna
         -------
         None
             Este método não retorna nada.
         """
-        edges: list[tuple[str, str, dict[str, int]]] = []
-
-        for essa_cidade in self.mapa.todas_as_cidades:
-            for nome_de_vizinho in self.mapa.todas_as_cidades[essa_cidade].vizinhas:
-                distancia_ate_vizinha: int = self.mapa.todas_as_cidades[essa_cidade].vizinhas[nome_de_vizinho]
-
-                edges.append((essa_cidade, nome_de_vizinho, {"dist": distancia_ate_vizinha}))
+        origens, destinos, distancias = self.mapa.estradas()
+        nomes: list[str] = list(self.mapa.indice.nomes)
 
-        self.representacao.add_edges_from(edges)
+        self.representacao.add_weighted_edges_from(
+            zip([nomes[cidade] for cidade in origens.tolist()], [nomes[cidade] for cidade in destinos.tolist()], distancias.tolist()),
+            weight="dist"
+        )
 
     # Metódo privado
     def _definir_coordenadas_de_cada_cidade(self) -> None:
@@ -123,21 +225,18 @@ class Grafo:
         Define as coordenadas de cada nódulo no grafo para desenhar o mapa corretamente.
 
         Cria um dicionário onde cada chave é o nome de uma cidade e o valor é uma tupla de dois
-        valores de ponto flutuante, representando as coordenadas X e Y da cidade. Essas coordenadas
-        são definidas como a posição dos nós no grafo.
+        valores de ponto flutuante, representando as coordenadas X e Y da cidade, lidas dos vetores de
+        coordenadas do índice de adjacência do mapa. Essas coordenadas são definidas como a posição dos
+        nós no grafo.
 
         Retorna
         -------
         None
             Este método não retorna nada.
         """
-        coordenadas: dict[str, tuple[float]] = {}
-
-        for nome_da_cidade in self.mapa.todas_as_cidades:
-            conjunto_de_coordenadas: dict[str, float] = self.mapa.todas_as_cidades[nome_da_cidade].coordenadas
-            coordenadas[nome_da_cidade] = (conjunto_de_coordenadas["x"], conjunto_de_coordenadas["y"])
+        indice: 'IndiceDeAdjacencia' = self.mapa.indice
 
-        self.atributos_do_desenho["pos"] = coordenadas
+        self.atributos_do_desenho["pos"] = dict(zip(indice.nomes, zip(indice.coordenadas_x, indice.coordenadas_y)))
     
     # Metódo privado
     def _definir_etiqueta_para_distancias(self) -> dict[tuple[str, str], int]:
@@ -168,6 +267,8 @@ class Grafo:
         Esta função atribui cores às etiquetas das arestas do grafo representado.
         Se um caminho for fornecido, as arestas que compõem esse caminho serão
         destacados com uma cor vermelha, enquanto as demais manterão a cor preta.
+        As arestas do caminho são guardadas em um conjunto, com as duas ordens de
+        cada par de cidades, então cada aresta do grafo é verificada uma única vez.
 
         Parâmetros
         ----------
@@ -181,22 +282,15 @@ class Grafo:
             Esta função não retorna nada.
 
         """
-        nx.set_edge_attributes(self.representacao, "black", "color")        
+        edges_a_serem_pintadas: set[tuple[str, str]] = set()
 
         if caminho:
-            edges_a_serem_pintadas: list[tuple[str, str]] = []
+            edges_a_serem_pintadas.update(zip(caminho, caminho[1:]))
+            edges_a_serem_pintadas.update(zip(caminho[1:], caminho))
 
-            for nome_de_cidade in caminho:
-                indice_da_cidade_atual = caminho.index(nome_de_cidade)
-                if indice_da_cidade_atual + 1 == len(caminho): continue
-
-                edge: tuple[str, str] = (nome_de_cidade, caminho[indice_da_cidade_atual + 1])
-                edges_a_serem_pintadas.append(edge)
-        
-            for edge in edges_a_serem_pintadas:
-                self.representacao.edges[edge]["color"] = "red"
-
-        self.atributos_do_desenho["edge_color"] = [self.representacao[cidade][vizinha]["color"] for cidade, vizinha in self.representacao.edges()]
+        self.atributos_do_desenho["edge_color"] = [
+            "red" if edge in edges_a_serem_pintadas else "black" for edge in self.representacao.edges()
+        ]
 
     # Método privado
     def _desenhar_grafo(self) -> None:
@@ -214,15 +308,161 @@ class Grafo:
         """
         etiqueta_distancia_vizinhos: dict[tuple[str, str], int] = self._definir_etiqueta_para_distancias()
         
-        nx.draw(self.representacao, **self.atributos_do_desenho)
+        nx.draw(self.representacao, ax=self.eixos, **self.atributos_do_desenho)
         nx.draw_networkx_edge_labels(
             self.representacao,
             pos = self.atributos_do_desenho["pos"],
+            ax = self.eixos,
             edge_labels = etiqueta_distancia_vizinhos,
             font_size = 4,
             label_pos = 0.5
         )
     
+    # Método privado
+    def _desenhar_grafo_vetorizado(self, caminho: list[str] = None) -> None:
+        """
+        Desenha o grafo de forma vetorizada, a partir das coordenadas do índice de adjacência do mapa e das
+        estradas listadas pelo Mapa.
+
+        Todas as estradas são desenhadas em uma LineCollection, com as do caminho em vermelho em uma segunda
+        LineCollection por cima, e todas as cidades em um único gráfico de dispersão. Os eixos são ajustados
+        com a mesma folga do desenho do NetworkX, e as etiquetas são escolhidas pelo `_escolher_etiquetas`.
+
+        Parâmetros
+        ----------
+        caminho : list[str], opcional
+            Uma lista de strings contendo o caminho que deve ser destacado no grafo.
+            Por padrão, é None, o que significa que nenhum caminho será destacado.
+
+        Retorna
+        -------
+        None
+            Esta função não retorna nada.
+        """
+        indice: 'IndiceDeAdjacencia' = self.mapa.indice
+        atributos: dict[str, any] = self.atributos_do_desenho
+        eixos: 'Axes' = self.eixos if self.eixos is not None else self.figura.add_axes((0, 0, 1, 1))
+        tamanho_das_cidades, largura_das_estradas = Grafo.dimensoes_do_desenho_vetorizado(len(indice))
+
+        coordenadas_x: 'np.ndarray' = Grafo._copiar_vetor(indice.coordenadas_x)
+        coordenadas_y: 'np.ndarray' = Grafo._copiar_vetor(indice.coordenadas_y)
+        origens, destinos, distancias = self.mapa.estradas()
+
+        cidades_do_caminho: list[int] = [self.mapa.pegar_id_da_cidade_pelo_nome(nome) for nome in caminho or []]
+        estradas_do_caminho: set[int] = {
+            min(cidade, proxima) * len(indice) + max(cidade, proxima) for cidade, proxima in zip(cidades_do_caminho, cidades_do_caminho[1:])
+        }
+        destacadas: 'np.ndarray' = np.isin(origens * len(indice) + destinos, list(estradas_do_caminho))
+
+        segmentos: 'np.ndarray' = np.stack((
+            np.column_stack((coordenadas_x[origens], coordenadas_y[origens])),
+            np.column_stack((coordenadas_x[destinos], coordenadas_y[destinos]))
+        ), axis=1)
+
+        eixos.add_collection(LineCollection(segmentos[~destacadas], colors="black", linewidths=largura_das_estradas, zorder=1))
+        eixos.add_collection(LineCollection(segmentos[destacadas], colors="red", linewidths=largura_das_estradas, zorder=1))
+        # O contorno das cidades, da largura padrão das linhas, só é mantido no tamanho padrão das cidades, já
+        # que nos mapas densos ele cobriria as estradas.
+        eixos.scatter(
+            coordenadas_x, coordenadas_y, s=tamanho_das_cidades, c=atributos["node_color"], zorder=2,
+            linewidths=None if tamanho_das_cidades >= atributos["node_size"] else 0
+        )
+
+        if len(segmentos):
+            minimos: 'np.ndarray' = segmentos.min(axis=(0, 1))
+            maximos: 'np.ndarray' = segmentos.max(axis=(0, 1))
+            folga: 'np.ndarray' = (maximos - minimos) * 0.05
+            eixos.update_datalim((minimos - folga, maximos + folga))
+        eixos.autoscale_view()
+        eixos.set_axis_off()
+        self.figura.set_facecolor("w")
+
+        # O caminho vem antes das demais cidades e estradas, para que as suas etiquetas sejam escolhidas primeiro.
+        cidades: 'np.ndarray' = np.concatenate((np.array(cidades_do_caminho, dtype=np.int64), np.arange(len(indice))))
+        for cidade in self._escolher_etiquetas(np.column_stack((coordenadas_x[cidades], coordenadas_y[cidades])), Grafo.ESPACO_DO_NOME_DA_CIDADE, eixos):
+            eixos.text(
+                coordenadas_x[cidades[cidade]], coordenadas_y[cidades[cidade]], indice.nomes[cidades[cidade]],
+                fontsize=atributos["font_size"], color=atributos["font_color"], horizontalalignment="center", verticalalignment="center"
+            )
+
+        estradas: 'np.ndarray' = np.concatenate((np.flatnonzero(destacadas), np.flatnonzero(~destacadas)))
+        meios: 'np.ndarray' = segmentos[estradas].mean(axis=1)
+        direcoes: 'np.ndarray' = eixos.transData.transform(segmentos[estradas, 1]) - eixos.transData.transform(segmentos[estradas, 0])
+        for estrada in self._escolher_etiquetas(meios, Grafo.ESPACO_DA_DISTANCIA, eixos):
+            # Como no NetworkX, a distância acompanha a inclinação da estrada, sem ficar de cabeça para baixo.
+            angulo: float = degrees(np.arctan2(direcoes[estrada, 1], direcoes[estrada, 0]))
+            angulo = angulo - 180 if angulo > 90 else angulo + 180 if angulo < -90 else angulo
+            eixos.text(
+                meios[estrada, 0], meios[estrada, 1], distancias[estradas[estrada]].item(),
+                fontsize=4, rotation=angulo, rotation_mode="anchor", horizontalalignment="center", verticalalignment="center",
+                bbox={"boxstyle": "round", "ec": (1.0, 1.0, 1.0), "fc": (1.0, 1.0, 1.0)}, zorder=1
+            )
+
+    # Método privado
+    def _escolher_etiquetas(self, pontos: 'np.ndarray', espaco: tuple[float, float], eixos: 'Axes') -> 'np.ndarray':
+        """
+        Escolhe quais etiquetas do desenho vetorizado são desenhadas.
+
+        Até `LIMITE_DE_ETIQUETAS` etiquetas, todas são desenhadas. Acima disso, a figura é dividida em células
+        do espaço reservado para cada etiqueta, e só a primeira etiqueta de cada célula visível é mantida. Se
+        ainda sobrarem etiquetas demais, as células são ampliadas na proporção do excesso, e as etiquetas que
+        passarem do limite são descartadas.
+
+        Parâmetros
+        ----------
+        pontos : np.ndarray
+            As coordenadas de cada etiqueta, no sistema de coordenadas do mapa, em ordem de prioridade.
+        espaco : tuple[float, float]
+            A largura e a altura reservadas para cada etiqueta, em pontos.
+        eixos : Axes
+            Os eixos do desenho, já com os limites definidos.
+
+        Retorna
+        -------
+        np.ndarray
+            As posições das etiquetas escolhidas em `pontos`, em ordem crescente.
+        """
+        if len(pontos) <= Grafo.LIMITE_DE_ETIQUETAS:
+            return np.arange(len(pontos))
+
+        em_pixels: 'np.ndarray' = eixos.transData.transform(pontos)
+        largura, altura = self.figura.canvas.get_width_height()
+        visiveis: 'np.ndarray' = np.flatnonzero(
+            (em_pixels[:, 0] >= 0) & (em_pixels[:, 0] < largura) & (em_pixels[:, 1] >= 0) & (em_pixels[:, 1] < altura)
+        )
+        tamanho_da_celula: 'np.ndarray' = np.array(espaco) * self.figura.dpi / 72
+
+        for _ in range(2):
+            celulas: 'np.ndarray' = (em_pixels[visiveis] // tamanho_da_celula).astype(np.int64)
+            _, primeiras = np.unique(celulas[:, 0] * (altura + 1) + celulas[:, 1], return_index=True)
+            escolhidas: 'np.ndarray' = visiveis[np.sort(primeiras)]
+
+            if len(escolhidas) <= Grafo.LIMITE_DE_ETIQUETAS:
+                break
+            tamanho_da_celula *= sqrt(len(escolhidas) / Grafo.LIMITE_DE_ETIQUETAS)
+
+        return escolhidas[:Grafo.LIMITE_DE_ETIQUETAS]
+
+    # Método privado
+    @staticmethod
+    def _copiar_vetor(vetor: 'array | memoryview') -> 'np.ndarray':
+        """
+        Copia um vetor do índice de adjacência para um vetor do NumPy do mesmo tipo.
+
+        A cópia não mantém referência ao vetor original, que continua podendo crescer nas alterações do mapa.
+
+        Parâmetros
+        ----------
+        vetor : array | memoryview
+            O vetor do índice.
+
+        Retorna
+        -------
+        np.ndarray
+            A cópia do vetor.
+        """
+        return np.asarray(memoryview(vetor)).copy()
+
     def exibir_grafo_em_janela(self) -> None:
         """
         Exibe o grafo representado pelo objeto Mapa em uma janela separada.
@@ -251,4 +491,4 @@ class Grafo:
         None
             Esta função não retorna nada.
         """
-        plt.savefig(f"Assets/Images/{nome_do_arquivo}.png", dpi=300)
\ No newline at end of file
+        self.figura.savefig(f"Assets/Images/{nome_do_arquivo}.png", dpi=300)
\ No newline at end of file
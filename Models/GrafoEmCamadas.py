@@ -0,0 +1,211 @@
+from collections import OrderedDict
+from os import makedirs, path, replace
+from tempfile import mkstemp
+from threading import Lock
+from matplotlib.image import imread
+from Controllers.GrafoController import GrafoController
+import numpy as np
+
+class GrafoEmCamadas:
+    """
+    A classe GrafoEmCamadas gera as mesmas imagens PNG da classe Grafo, mas separa o desenho em duas camadas:
+    a camada base, com todas as cidades, estradas e distâncias do mapa, e a camada da rota, com apenas as
+    estradas do caminho destacadas em vermelho.
+
+    A camada base é desenhada uma única vez por mapa, pela própria classe Grafo, e guardada como imagem. A
+    chave da camada é o resumo do conteúdo do Mapa e a resolução, então ela é reaproveitada por todas as
+    rotas do mesmo mapa, e por outras execuções da aplicação pelo cache em disco, e nunca é reaproveitada
+    depois de uma alteração no mapa. Cada imagem de rota copia a camada base e desenha por cima somente as
+    estradas, as cidades e as distâncias do caminho, o que custa uma fração do desenho do mapa inteiro.
+
+    Os desenhos são feitos pelo GrafoController, sem o pyplot, então a classe pode ser usada fora da thread
+    principal e não interfere na figura atual do pyplot usada pelo Grafo.
+
+    Atributos Públicos
+    ------------------
+    mapa : 'Mapa'
+        O mapa desenhado.
+    dpi : int
+        A resolução das imagens, em pontos por polegada.
+    diretorio_do_cache : str | None
+        O diretório em que as camadas base são guardadas em disco, ou None para guardá-las apenas na memória.
+    limites : tuple[float, float, float, float]
+        Os limites dos eixos das imagens (x mínimo, x máximo, y mínimo, y máximo), que alinham a camada da
+        rota com a camada base.
+    camada_base : np.ndarray
+        A imagem da camada base, em RGBA.
+    """
+    # Alterar o desenho da camada base exige incrementar esta versão, que invalida as camadas em disco.
+    VERSAO_DO_DESENHO: int = 2
+    DPI_PADRAO: int = 300
+    DIRETORIO_PADRAO_DO_CACHE: str = path.join("Assets", "Images", "Camadas")
+    # Cada camada de 300 DPI ocupa cerca de 11 MB na memória.
+    CAPACIDADE_DA_MEMORIA: int = 4
+
+    camadas_em_memoria: 'OrderedDict[tuple[str, int], np.ndarray]' = OrderedDict()
+    _trava_da_memoria: 'Lock' = Lock()
+
+    mapa: 'Mapa'
+    dpi: int
+    diretorio_do_cache: str | None
+    limites: tuple[float, float, float, float]
+    camada_base: 'np.ndarray'
+
+    def __init__(self, mapa: 'Mapa', dpi: int = DPI_PADRAO, diretorio_do_cache: str | None = DIRETORIO_PADRAO_DO_CACHE) -> None:
+        """
+        Construtor da classe GrafoEmCamadas.
+
+        Obtém a camada base do mapa da memória, do cache em disco ou, se ela ainda não existir, desenhando o
+        mapa inteiro com a classe Grafo.
+
+        Parâmetros
+        ----------
+        mapa : Mapa
+            O mapa que será desenhado.
+        dpi : int, opcional
+            A resolução das imagens, em pontos por polegada. O padrão é 300, o mesmo das imagens do Grafo.
+        diretorio_do_cache : str | None, opcional
+            O diretório em que as camadas base são guardadas em disco. O padrão é "Assets/Images/Camadas".
+            None guarda as camadas apenas na memória.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self.mapa = mapa
+        self.dpi = dpi
+        self.diretorio_do_cache = diretorio_do_cache
+        self.limites = GrafoController.calcular_limites(mapa.indice)
+        self.camada_base = self._obter_camada_base()
+
+    def renderizar_rota(self, caminho: list[str] = None) -> 'np.ndarray':
+        """
+        Monta a imagem de uma rota: a camada base com as estradas do caminho destacadas por cima.
+
+        Parâmetros
+        ----------
+        caminho : list[str], opcional
+            Os nomes das cidades do caminho, na ordem da rota. O padrão é None, que retorna a própria camada
+            base, que não deve ser alterada.
+
+        Retorna
+        -------
+        np.ndarray
+            A imagem da rota, em RGBA.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se alguma cidade do caminho não existir no mapa.
+        """
+        if not caminho or len(caminho) < 2:
+            return self.camada_base
+
+        identificadores: list[int] = [self.mapa.pegar_id_da_cidade_pelo_nome(nome) for nome in caminho]
+        return GrafoController.compor_rota(self.camada_base, self.mapa.indice, self.limites, self.dpi, identificadores)
+
+    def exibir_grafo_em_png(self, nome_do_arquivo: str) -> None:
+        """
+        Gera uma imagem PNG do mapa, sem nenhuma rota destacada, a partir da camada base.
+
+        A imagem é salva no diretório Assets/Images com o nome passado.
+
+        Parâmetros
+        ----------
+        nome_do_arquivo : str
+            O nome da imagem, sem a extensão.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        GrafoController.gravar_png(self.camada_base, path.join("Assets", "Images", f"{nome_do_arquivo}.png"), self.dpi)
+
+    def exibir_rota_em_png(self, caminho: list[str], nome_do_arquivo: str) -> None:
+        """
+        Gera uma imagem PNG do mapa com as estradas do caminho destacadas em vermelho.
+
+        A imagem é salva no diretório Assets/Images com o nome passado, e tem o mesmo desenho da imagem gerada
+        pelo Grafo criado com o mesmo caminho.
+
+        Parâmetros
+        ----------
+        caminho : list[str]
+            Os nomes das cidades do caminho, na ordem da rota.
+        nome_do_arquivo : str
+            O nome da imagem, sem a extensão.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        GrafoController.gravar_png(self.renderizar_rota(caminho), path.join("Assets", "Images", f"{nome_do_arquivo}.png"), self.dpi)
+
+    # Metódo privado
+    def _obter_camada_base(self) -> 'np.ndarray':
+        """
+        Obtém a camada base do mapa, procurando primeiro na memória, depois no cache em disco e, por fim,
+        desenhando o mapa inteiro. A camada obtida é guardada na memória e, se for desenhada, também em disco.
+
+        Retorna
+        -------
+        np.ndarray
+            A imagem da camada base, em RGBA.
+        """
+        chave: tuple[str, int] = (self.mapa.hash_do_conteudo(), self.dpi)
+
+        with GrafoEmCamadas._trava_da_memoria:
+            camada: 'np.ndarray | None' = GrafoEmCamadas.camadas_em_memoria.get(chave)
+            if camada is not None:
+                GrafoEmCamadas.camadas_em_memoria.move_to_end(chave)
+                return camada
+
+        caminho_da_camada: str | None = None
+        if self.diretorio_do_cache is not None:
+            caminho_da_camada = path.join(self.diretorio_do_cache, f"{chave[0]}_{self.dpi}dpi_v{GrafoEmCamadas.VERSAO_DO_DESENHO}.png")
+
+        if caminho_da_camada is not None and path.exists(caminho_da_camada):
+            camada = (imread(caminho_da_camada) * 255).round().astype(np.uint8)
+        else:
+            camada = GrafoController.desenhar_mapa(self.mapa, self.limites, self.dpi)
+            if caminho_da_camada is not None:
+                self._gravar_camada(camada, caminho_da_camada)
+
+        with GrafoEmCamadas._trava_da_memoria:
+            GrafoEmCamadas.camadas_em_memoria[chave] = camada
+            GrafoEmCamadas.camadas_em_memoria.move_to_end(chave)
+            while len(GrafoEmCamadas.camadas_em_memoria) > GrafoEmCamadas.CAPACIDADE_DA_MEMORIA:
+                GrafoEmCamadas.camadas_em_memoria.popitem(last=False)
+
+        return camada
+
+    # Metódo privado
+    def _gravar_camada(self, camada: 'np.ndarray', caminho_da_camada: str) -> None:
+        """
+        Grava a camada base em disco, primeiro em um arquivo temporário, que então substitui o definitivo, para
+        que outra execução, ou outro processo que desenhe a mesma camada ao mesmo tempo, nunca leia uma camada
+        gravada pela metade.
+
+        Parâmetros
+        ----------
+        camada : np.ndarray
+            A imagem da camada base, em RGBA.
+        caminho_da_camada : str
+            O caminho do arquivo da camada.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        makedirs(self.diretorio_do_cache, exist_ok=True)
+
+        descritor, caminho_temporario = mkstemp(suffix=".tmp", dir=self.diretorio_do_cache)
+
+        with open(descritor, 'wb') as arquivo:
+            GrafoController.gravar_png(camada, arquivo, self.dpi)
+
+        replace(caminho_temporario, caminho_da_camada)
@@ -0,0 +1,90 @@
+class HierarquiaDeContracao:
+    """
+    A classe HierarquiaDeContracao guarda o resultado do pré-processamento de um mapa em uma hierarquia de
+    contração ("contraction hierarchy"), usada pelo modo "hierarquia_de_contracao" da classe Rota.
+
+    No pré-processamento, as cidades são contraídas uma a uma, em ordem crescente de importância. Ao
+    contrair uma cidade, cada par de vizinhas cujo menor caminho passava por ela ganha um atalho com a soma
+    das duas distâncias. Cada cidade guarda apenas as estradas e atalhos que sobem para cidades contraídas
+    depois dela, no mesmo formato CSR do IndiceDeAdjacencia: os vizinhos da cidade `i` ocupam as posições
+    de `deslocamentos[i]` até `deslocamentos[i + 1]` dos vetores `vizinhos`, `pesos` e `meios`.
+
+    Atributos Públicos
+    ------------------
+    hash_do_mapa : str
+        O resumo do conteúdo do mapa em que a hierarquia foi calculada, como retornado por
+        `Mapa.hash_do_conteudo`.
+    ordem : array
+        A posição de cada cidade na ordem de contração.
+    deslocamentos : array
+        A posição inicial das arestas de subida de cada cidade, com uma posição extra no final.
+    vizinhos : array
+        A cidade de destino de cada aresta de subida.
+    pesos : array
+        A distância de cada aresta de subida.
+    meios : array
+        A cidade contraída que cada atalho substitui, ou -1 nas estradas originais do mapa.
+    """
+    hash_do_mapa: str
+    ordem: 'array'
+    deslocamentos: 'array'
+    vizinhos: 'array'
+    pesos: 'array'
+    meios: 'array'
+
+    def __init__(self, hash_do_mapa: str, ordem: 'array', deslocamentos: 'array', vizinhos: 'array', pesos: 'array', meios: 'array') -> None:
+        """
+        Construtor da classe HierarquiaDeContracao.
+
+        Recebe os vetores já montados. Normalmente a hierarquia é criada pelo
+        HierarquiaDeContracaoController, seja pelo pré-processamento de um mapa ou pela leitura de uma
+        hierarquia gravada em arquivo.
+
+        Parâmetros
+        ----------
+        hash_do_mapa : str
+            O resumo do conteúdo do mapa em que a hierarquia foi calculada.
+        ordem : array
+            A posição de cada cidade na ordem de contração.
+        deslocamentos : array
+            A posição inicial das arestas de subida de cada cidade, com uma posição extra no final.
+        vizinhos : array
+            A cidade de destino de cada aresta de subida.
+        pesos : array
+            A distância de cada aresta de subida.
+        meios : array
+            A cidade contraída que cada atalho substitui, ou -1 nas estradas originais do mapa.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self.hash_do_mapa = hash_do_mapa
+        self.ordem = ordem
+        self.deslocamentos = deslocamentos
+        self.vizinhos = vizinhos
+        self.pesos = pesos
+        self.meios = meios
+
+    def __len__(self) -> int:
+        """
+        Retorna a quantidade de cidades da hierarquia.
+
+        Retorna
+        -------
+        int
+            A quantidade de cidades da hierarquia.
+        """
+        return len(self.ordem)
+
+    def quantidade_de_atalhos(self) -> int:
+        """
+        Retorna a quantidade de atalhos criados no pré-processamento.
+
+        Retorna
+        -------
+        int
+            A quantidade de arestas de subida que não são estradas originais do mapa.
+        """
+        return sum(1 for meio in self.meios if meio >= 0)
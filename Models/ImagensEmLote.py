@@ -0,0 +1,207 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from math import ceil
+from os import cpu_count, makedirs, path
+from Models.GrafoEmCamadas import GrafoEmCamadas
+from Controllers.GrafoController import GrafoController
+from Controllers.MapaBinarioController import MapaBinarioController
+
+class ImagensEmLote:
+    """
+    A classe ImagensEmLote gera as imagens PNG de uma lista grande de rotas de um mesmo Mapa, como as
+    imagens de todas as viagens de um dia, distribuindo o trabalho entre processos.
+
+    A camada base do mapa é obtida uma única vez, pela classe GrafoEmCamadas, no processo principal. Cada
+    processo de um `ProcessPoolExecutor` recebe essa camada e o índice de adjacência do mapa ao ser
+    iniciado e, a cada rota, desenha apenas o caminho sobre a camada base pelo GrafoController, em figuras
+    próprias com o Agg, sem o pyplot. Assim nenhum processo compartilha figuras com outro, e as rotas de um
+    lote nunca acumulam desenhos umas das outras. Se o mapa foi carregado da versão compilada, os processos
+    recebem apenas o caminho do arquivo e o mapeiam em memória por conta própria.
+
+    Atributos Públicos
+    ------------------
+    mapa : Mapa
+        O mapa das rotas.
+    processos : int
+        A quantidade de processos usados. Com 1, as imagens são geradas no próprio processo.
+    diretorio : str
+        O diretório em que as imagens são gravadas.
+    dpi : int
+        A resolução das imagens, em pontos por polegada.
+    diretorio_do_cache : str | None
+        O diretório do cache em disco das camadas base, como no GrafoEmCamadas.
+    """
+    # Quantidade aproximada de lotes enviados a cada processo, para equilibrar a carga entre eles.
+    LOTES_POR_PROCESSO: int = 4
+    DIRETORIO_PADRAO: str = path.join("Assets", "Images")
+
+    mapa: 'Mapa'
+    processos: int
+    diretorio: str
+    dpi: int
+    diretorio_do_cache: str | None
+    # Índice, camada base, limites, resolução e diretório carregados em cada processo pelo `_inicializar_processo`.
+    _estado_do_processo: tuple = None
+
+    def __init__(self, mapa: 'Mapa', processos: int = None, diretorio: str = DIRETORIO_PADRAO, dpi: int = GrafoEmCamadas.DPI_PADRAO, diretorio_do_cache: str | None = GrafoEmCamadas.DIRETORIO_PADRAO_DO_CACHE) -> None:
+        """
+        Construtor da classe ImagensEmLote.
+
+        Parâmetros
+        ----------
+        mapa : Mapa
+            O mapa das rotas.
+        processos : int, opcional
+            A quantidade de processos usados. O padrão é None, que usa a quantidade de processadores da
+            máquina.
+        diretorio : str, opcional
+            O diretório em que as imagens são gravadas, criado se não existir. O padrão é "Assets/Images".
+        dpi : int, opcional
+            A resolução das imagens, em pontos por polegada. O padrão é 300, o mesmo das imagens do Grafo.
+        diretorio_do_cache : str | None, opcional
+            O diretório do cache em disco das camadas base. O padrão é "Assets/Images/Camadas". None guarda
+            a camada base apenas na memória.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self.mapa = mapa
+        self.processos = processos or cpu_count() or 1
+        self.diretorio = diretorio
+        self.dpi = dpi
+        self.diretorio_do_cache = diretorio_do_cache
+
+    def gerar(self, rotas: 'Iterable[tuple[str, list[str]]]') -> 'Iterator[str]':
+        """
+        Gera a imagem PNG de cada rota, devolvendo os caminhos dos arquivos conforme ficam prontos.
+
+        Os caminhos não seguem a ordem das rotas recebidas, e sim a ordem em que os lotes terminam. Rotas com
+        menos de duas cidades geram a imagem do mapa sem nenhum caminho destacado.
+
+        Parâmetros
+        ----------
+        rotas : Iterable[tuple[str, list[str]]]
+            O nome do arquivo de cada imagem, sem a extensão, e os nomes das cidades do caminho da rota, na
+            ordem da rota, como o `caminho` de uma Rota.
+
+        Retorna
+        -------
+        Iterator[str]
+            O caminho de cada imagem gravada.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se alguma cidade de algum caminho não for encontrada no mapa. A verificação é feita antes de
+            qualquer imagem ser gerada.
+        """
+        imagens: list[tuple[str, list[int]]] = [
+            (nome_do_arquivo, [self.mapa.pegar_id_da_cidade_pelo_nome(nome) for nome in caminho]) for nome_do_arquivo, caminho in rotas
+        ]
+
+        if not imagens:
+            return
+
+        makedirs(self.diretorio, exist_ok=True)
+        grafo_em_camadas: 'GrafoEmCamadas' = GrafoEmCamadas(self.mapa, self.dpi, self.diretorio_do_cache)
+        estado: tuple = (
+            self.mapa.caminho_do_binario or self.mapa.indice, grafo_em_camadas.camada_base, grafo_em_camadas.limites, self.dpi, self.diretorio
+        )
+
+        if self.processos == 1 or len(imagens) == 1:
+            for nome_do_arquivo, caminho in imagens:
+                yield ImagensEmLote._gerar_imagem((self.mapa.indice, *estado[1:]), nome_do_arquivo, caminho)
+            return
+
+        tamanho_do_lote: int = ceil(len(imagens) / (self.processos * self.LOTES_POR_PROCESSO))
+        lotes: list[list[tuple[str, list[int]]]] = [imagens[inicio:inicio + tamanho_do_lote] for inicio in range(0, len(imagens), tamanho_do_lote)]
+
+        executor: 'ProcessPoolExecutor' = ProcessPoolExecutor(
+            max_workers=min(self.processos, len(lotes)),
+            initializer=ImagensEmLote._inicializar_processo,
+            initargs=estado
+        )
+
+        try:
+            futuros: list = [executor.submit(ImagensEmLote._gerar_lote, lote) for lote in lotes]
+
+            for futuro in as_completed(futuros):
+                yield from futuro.result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    # Metódo privado
+    @staticmethod
+    def _inicializar_processo(fonte_do_indice: 'str | IndiceDeAdjacencia', camada_base: 'np.ndarray', limites: tuple[float, float, float, float], dpi: int, diretorio: str) -> None:
+        """
+        Carrega em um processo do pool, uma única vez por processo, tudo o que é preciso para gerar as imagens.
+
+        Parâmetros
+        ----------
+        fonte_do_indice : str | IndiceDeAdjacencia
+            O caminho do mapa compilado, que é mapeado em memória, ou o próprio índice de adjacência.
+        camada_base : np.ndarray
+            A imagem do mapa sem nenhum caminho destacado, em RGBA.
+        limites : tuple[float, float, float, float]
+            Os limites dos eixos da camada base.
+        dpi : int
+            A resolução das imagens, em pontos por polegada.
+        diretorio : str
+            O diretório em que as imagens são gravadas.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        if isinstance(fonte_do_indice, str):
+            fonte_do_indice = MapaBinarioController.carregar(fonte_do_indice)
+
+        ImagensEmLote._estado_do_processo = (fonte_do_indice, camada_base, limites, dpi, diretorio)
+
+    # Metódo privado
+    @staticmethod
+    def _gerar_lote(lote: list[tuple[str, list[int]]]) -> list[str]:
+        """
+        Gera, em um processo do pool, as imagens de todas as rotas de um lote.
+
+        Parâmetros
+        ----------
+        lote : list[tuple[str, list[int]]]
+            O nome do arquivo de cada imagem e os identificadores das cidades do caminho da rota.
+
+        Retorna
+        -------
+        list[str]
+            Os caminhos das imagens gravadas.
+        """
+        return [ImagensEmLote._gerar_imagem(ImagensEmLote._estado_do_processo, nome_do_arquivo, caminho) for nome_do_arquivo, caminho in lote]
+
+    # Metódo privado
+    @staticmethod
+    def _gerar_imagem(estado: tuple, nome_do_arquivo: str, caminho: list[int]) -> str:
+        """
+        Gera e grava a imagem de uma rota.
+
+        Parâmetros
+        ----------
+        estado : tuple
+            O índice de adjacência, a camada base, os limites dos eixos, a resolução e o diretório das
+            imagens, como carregados pelo `_inicializar_processo`.
+        nome_do_arquivo : str
+            O nome do arquivo da imagem, sem a extensão.
+        caminho : list[int]
+            Os identificadores das cidades do caminho da rota.
+
+        Retorna
+        -------
+        str
+            O caminho da imagem gravada.
+        """
+        indice, camada_base, limites, dpi, diretorio = estado
+        imagem: 'np.ndarray' = GrafoController.compor_rota(camada_base, indice, limites, dpi, caminho) if len(caminho) > 1 else camada_base
+        caminho_da_imagem: str = path.join(diretorio, f"{nome_do_arquivo}.png")
+
+        GrafoController.gravar_png(imagem, caminho_da_imagem, dpi)
+        return caminho_da_imagem
@@ -0,0 +1,487 @@
+from array import array
+from hashlib import blake2b
+from math import inf
+from Exceptions.CidadeNaoEncontradaError import CidadeNaoEncontradaError
+import numpy as np
+
+class IndiceDeAdjacencia:
+    """
+    A classe IndiceDeAdjacencia guarda as conexões de um Mapa em formato compacto (CSR, "compressed sparse
+    row"), pensado para ser percorrido pelos algoritmos de busca usando apenas números inteiros.
+
+    Cada cidade recebe um identificador inteiro, na ordem em que aparece no JSON. Os vizinhos da cidade de
+    identificador `i` ocupam as posições de `deslocamentos[i]` até `deslocamentos[i + 1]` (exclusive) dos
+    vetores `vizinhos` e `pesos`. Os vetores são do módulo `array`, que armazena os números lado a lado na
+    memória em vez de como objetos Python independentes.
+
+    O índice pode ser alterado depois de construído, sem ser montado de novo. Uma estrada removida deixa a
+    sua posição no vetor `vizinhos` apontando para a própria cidade, com distância 0, o que as buscas
+    percorrem sem efeito. Essas posições vagas são reaproveitadas pelas próximas estradas da cidade, e
+    quando uma cidade não tem posição vaga os seus vizinhos ganham espaço extra de uma só vez, o que
+    dilui o custo de mover os vetores entre as próximas inserções. Quem percorre o índice para listar as
+    estradas deve, portanto, ignorar os vizinhos iguais à própria cidade.
+
+    Atributos Públicos
+    ------------------
+    nomes : Sequence[str]
+        O nome de cada cidade, indexado pelo seu identificador.
+    ids_por_nome : Mapping[str, int]
+        O identificador de cada cidade, indexado pelo seu nome.
+    deslocamentos : array
+        A posição inicial dos vizinhos de cada cidade nos vetores `vizinhos` e `pesos`, com uma posição
+        extra no final que marca o fim dos vizinhos da última cidade.
+    vizinhos : array
+        Os identificadores das cidades vizinhas, agrupados por cidade.
+    pesos : array
+        A distância até cada vizinho, alinhada com o vetor `vizinhos`.
+    coordenadas_x : array
+        A coordenada X de cada cidade, indexada pelo seu identificador.
+    coordenadas_y : array
+        A coordenada Y de cada cidade, indexada pelo seu identificador.
+    """
+    nomes: 'Sequence[str]'
+    ids_por_nome: 'Mapping[str, int]'
+    deslocamentos: 'array'
+    vizinhos: 'array'
+    pesos: 'array'
+    coordenadas_x: 'array'
+    coordenadas_y: 'array'
+
+    def __init__(self, nomes: 'Sequence[str]', ids_por_nome: 'Mapping[str, int]', deslocamentos: 'array', vizinhos: 'array', pesos: 'array', coordenadas_x: 'array', coordenadas_y: 'array') -> None:
+        """
+        Construtor da classe IndiceDeAdjacencia.
+
+        Recebe os vetores já montados. Normalmente o índice é criado por `a_partir_das_cidades`, durante o
+        carregamento de um JSON, ou pelo MapaBinarioController, a partir de um mapa compilado. Neste último
+        caso os vetores são visões (`memoryview`) do arquivo mapeado em memória, que se comportam como os
+        vetores do módulo `array` para leitura.
+
+        Parâmetros
+        ----------
+        nomes : Sequence[str]
+            O nome de cada cidade, indexado pelo seu identificador.
+        ids_por_nome : Mapping[str, int]
+            O identificador de cada cidade, indexado pelo seu nome.
+        deslocamentos : array
+            A posição inicial dos vizinhos de cada cidade, com uma posição extra no final.
+        vizinhos : array
+            Os identificadores das cidades vizinhas, agrupados por cidade.
+        pesos : array
+            A distância até cada vizinho, alinhada com o vetor `vizinhos`.
+        coordenadas_x : array
+            A coordenada X de cada cidade.
+        coordenadas_y : array
+            A coordenada Y de cada cidade.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self.nomes = nomes
+        self.ids_por_nome = ids_por_nome
+        self.deslocamentos = deslocamentos
+        self.vizinhos = vizinhos
+        self.pesos = pesos
+        self.coordenadas_x = coordenadas_x
+        self.coordenadas_y = coordenadas_y
+
+    @classmethod
+    def a_partir_das_cidades(cls, todas_as_cidades: dict[str, 'Cidade']) -> 'IndiceDeAdjacencia':
+        """
+        Constrói o índice a partir das cidades já instanciadas de um Mapa.
+
+        As distâncias são guardadas como inteiros de 64 bits quando todas são inteiras, como no mapa padrão,
+        e como ponto flutuante caso contrário.
+
+        Parâmetros
+        ----------
+        todas_as_cidades : dict[str, Cidade]
+            O dicionário de cidades do Mapa, com as vizinhanças e coordenadas já aplicadas.
+
+        Retorna
+        -------
+        IndiceDeAdjacencia
+            O índice com as conexões e coordenadas das cidades.
+        """
+        nomes: list[str] = [cidade.nome for cidade in todas_as_cidades.values()]
+        ids_por_nome: dict[str, int] = {nome: identificador for identificador, nome in enumerate(nomes)}
+
+        todas_as_distancias: list[int | float] = [distancia for cidade in todas_as_cidades.values() for distancia in cidade.vizinhas.values()]
+        tipo_dos_pesos: str = 'q' if all(isinstance(distancia, int) for distancia in todas_as_distancias) else 'd'
+
+        deslocamentos: 'array' = array('q', [0])
+        vizinhos: 'array' = array('i')
+        coordenadas_x: 'array' = array('d')
+        coordenadas_y: 'array' = array('d')
+
+        for cidade in todas_as_cidades.values():
+            vizinhos.extend(ids_por_nome[nome_de_vizinho] for nome_de_vizinho in cidade.vizinhas)
+            deslocamentos.append(len(vizinhos))
+            coordenada_x, coordenada_y = cidade.ponto
+            coordenadas_x.append(coordenada_x)
+            coordenadas_y.append(coordenada_y)
+
+        return cls(nomes, ids_por_nome, deslocamentos, vizinhos, array(tipo_dos_pesos, todas_as_distancias), coordenadas_x, coordenadas_y)
+
+    def __len__(self) -> int:
+        """
+        Retorna a quantidade de cidades do índice.
+
+        Retorna
+        -------
+        int
+            A quantidade de cidades do índice.
+        """
+        return len(self.nomes)
+
+    def id_da_cidade(self, nome: str) -> int:
+        """
+        Retorna o identificador inteiro da cidade com o nome especificado.
+
+        Parâmetros
+        ----------
+        nome : str
+            O nome da cidade, já capitalizado.
+
+        Retorna
+        -------
+        int
+            O identificador da cidade no índice.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se a cidade especificada não estiver no índice.
+        """
+        try:
+            return self.ids_por_nome[nome]
+        except KeyError:
+            raise CidadeNaoEncontradaError(f"A cidade '{nome}' não foi encontrada no mapa.")
+
+    def nomes_das_cidades(self, identificadores: list[int]) -> list[str]:
+        """
+        Converte uma lista de identificadores, como um caminho encontrado por uma busca, em nomes de cidades.
+
+        Parâmetros
+        ----------
+        identificadores : list[int]
+            Os identificadores das cidades.
+
+        Retorna
+        -------
+        list[str]
+            Os nomes das cidades, na mesma ordem dos identificadores.
+        """
+        nomes: 'Sequence[str]' = self.nomes
+        return [nomes[identificador] for identificador in identificadores]
+
+    def distancia_da_estrada(self, cidade_a: int, cidade_b: int) -> int | float:
+        """
+        Retorna a distância da estrada que liga duas cidades.
+
+        Parâmetros
+        ----------
+        cidade_a : int
+            O identificador de uma das cidades.
+        cidade_b : int
+            O identificador da outra cidade.
+
+        Retorna
+        -------
+        int | float
+            A distância da estrada, ou infinito se as cidades não forem vizinhas.
+        """
+        if cidade_a == cidade_b:
+            return inf
+
+        return min(
+            (self.pesos[posicao] for posicao in range(self.deslocamentos[cidade_a], self.deslocamentos[cidade_a + 1]) if self.vizinhos[posicao] == cidade_b),
+            default=inf
+        )
+
+    def tornar_mutavel(self) -> None:
+        """
+        Copia para a memória os vetores e os nomes de um índice carregado de um mapa compilado, para que ele
+        possa ser alterado.
+
+        Os vetores de um mapa compilado são visões somente leitura do arquivo mapeado em memória. Depois da
+        cópia, o índice deixa de depender do arquivo. Em um índice construído a partir de um JSON, este
+        método não faz nada.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        for atributo in ("deslocamentos", "vizinhos", "pesos", "coordenadas_x", "coordenadas_y"):
+            vetor: 'array | memoryview' = getattr(self, atributo)
+            if isinstance(vetor, memoryview):
+                setattr(self, atributo, array(vetor.format, vetor.tobytes()))
+
+        if not isinstance(self.nomes, list):
+            self.nomes = list(self.nomes)
+            self.ids_por_nome = {nome: identificador for identificador, nome in enumerate(self.nomes)}
+
+    def definir_distancia_da_estrada(self, cidade_a: int, cidade_b: int, distancia: int | float) -> None:
+        """
+        Define a distância da estrada entre duas cidades, nos dois sentidos, criando a estrada se ela ainda
+        não existir.
+
+        A estrada existente é alterada no próprio lugar. Uma estrada nova ocupa uma posição vaga de cada
+        cidade, deixada por uma estrada removida, ou abre espaço nos vetores quando não houver nenhuma. Se a
+        distância não for inteira e o índice guardar as distâncias como inteiros, o vetor de pesos passa a
+        ser de ponto flutuante.
+
+        Parâmetros
+        ----------
+        cidade_a : int
+            O identificador de uma das cidades.
+        cidade_b : int
+            O identificador da outra cidade.
+        distancia : int | float
+            A nova distância da estrada.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        if isinstance(distancia, float) and self.tipo_dos_pesos() != 'd':
+            self.pesos = array('d', self.pesos)
+
+        for cidade, vizinha in ((cidade_a, cidade_b), (cidade_b, cidade_a)):
+            posicao: int | None = self._posicao_da_estrada(cidade, vizinha)
+
+            if posicao is None:
+                posicao = self._posicao_vaga(cidade)
+                self.vizinhos[posicao] = vizinha
+
+            self.pesos[posicao] = distancia
+
+    def remover_estrada(self, cidade_a: int, cidade_b: int) -> None:
+        """
+        Remove a estrada entre duas cidades, nos dois sentidos, deixando as suas posições vagas.
+
+        Parâmetros
+        ----------
+        cidade_a : int
+            O identificador de uma das cidades.
+        cidade_b : int
+            O identificador da outra cidade.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        for cidade, vizinha in ((cidade_a, cidade_b), (cidade_b, cidade_a)):
+            for posicao in range(self.deslocamentos[cidade], self.deslocamentos[cidade + 1]):
+                if self.vizinhos[posicao] == vizinha:
+                    self.vizinhos[posicao] = cidade
+                    self.pesos[posicao] = 0
+
+    def definir_coordenadas(self, identificador: int, coordenada_x: float, coordenada_y: float) -> None:
+        """
+        Define as coordenadas de uma cidade do índice.
+
+        Parâmetros
+        ----------
+        identificador : int
+            O identificador da cidade.
+        coordenada_x : float
+            A nova coordenada X da cidade.
+        coordenada_y : float
+            A nova coordenada Y da cidade.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self.coordenadas_x[identificador] = coordenada_x
+        self.coordenadas_y[identificador] = coordenada_y
+
+    def adicionar_cidade(self, nome: str, coordenada_x: float = 0.0, coordenada_y: float = 0.0) -> int:
+        """
+        Acrescenta uma cidade sem estradas ao final do índice.
+
+        Parâmetros
+        ----------
+        nome : str
+            O nome da cidade, já capitalizado.
+        coordenada_x : float, opcional
+            A coordenada X da cidade. O padrão é 0.0.
+        coordenada_y : float, opcional
+            A coordenada Y da cidade. O padrão é 0.0.
+
+        Retorna
+        -------
+        int
+            O identificador da nova cidade.
+        """
+        identificador: int = len(self.nomes)
+
+        self.nomes.append(nome)
+        self.ids_por_nome[nome] = identificador
+        self.deslocamentos.append(self.deslocamentos[-1])
+        self.coordenadas_x.append(coordenada_x)
+        self.coordenadas_y.append(coordenada_y)
+
+        return identificador
+
+    def remover_cidade(self, identificador: int) -> None:
+        """
+        Remove uma cidade e todas as suas estradas do índice.
+
+        Os vetores são montados de novo, já sem as posições vagas, e as cidades seguintes à removida passam
+        a ter o identificador anterior ao que tinham.
+
+        Parâmetros
+        ----------
+        identificador : int
+            O identificador da cidade removida.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        deslocamentos: 'array' = array('q', [0])
+        vizinhos: 'array' = array('i')
+        pesos: 'array' = array(self.tipo_dos_pesos())
+
+        for cidade in range(len(self.nomes)):
+            if cidade == identificador:
+                continue
+
+            for posicao in range(self.deslocamentos[cidade], self.deslocamentos[cidade + 1]):
+                vizinha: int = self.vizinhos[posicao]
+
+                if vizinha != cidade and vizinha != identificador:
+                    vizinhos.append(vizinha - 1 if vizinha > identificador else vizinha)
+                    pesos.append(self.pesos[posicao])
+
+            deslocamentos.append(len(vizinhos))
+
+        del self.nomes[identificador]
+        del self.coordenadas_x[identificador]
+        del self.coordenadas_y[identificador]
+
+        self.ids_por_nome = {nome: cidade for cidade, nome in enumerate(self.nomes)}
+        self.deslocamentos = deslocamentos
+        self.vizinhos = vizinhos
+        self.pesos = pesos
+
+    def tipo_dos_pesos(self) -> str:
+        """
+        Retorna o código de tipo do módulo `array` usado pelo vetor de pesos.
+
+        Retorna
+        -------
+        str
+            'q' se as distâncias forem inteiras, ou 'd' se forem de ponto flutuante.
+        """
+        return self.pesos.format if isinstance(self.pesos, memoryview) else self.pesos.typecode
+
+    def calcular_hash_do_conteudo(self) -> str:
+        """
+        Calcula um resumo (BLAKE2b) do conteúdo do índice: nomes, conexões, distâncias e coordenadas.
+
+        Dois índices com o mesmo conteúdo têm o mesmo resumo, tenham sido construídos a partir de um JSON ou
+        carregados de um mapa compilado, e qualquer alteração em uma cidade ou estrada muda o resumo.
+
+        Retorna
+        -------
+        str
+            O resumo do conteúdo, em hexadecimal.
+        """
+        resumo: 'blake2b' = blake2b(digest_size=16)
+
+        resumo.update("".join(nome + "\0" for nome in self.nomes).encode("utf-8"))
+
+        resumo.update(self.tipo_dos_pesos().encode())
+        for vetor in (self.deslocamentos, self.vizinhos, self.pesos, self.coordenadas_x, self.coordenadas_y):
+            resumo.update(vetor)
+
+        return resumo.hexdigest()
+
+    def listar_estradas(self) -> tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+        """
+        Lista todas as estradas do índice de uma só vez, em vetores do NumPy, sem percorrer as cidades uma a
+        uma no Python.
+
+        Cada estrada aparece nos vizinhos das suas duas cidades, e as posições vagas apontam para a própria
+        cidade, então apenas as posições com a cidade menor que a vizinha são mantidas: uma por estrada, sem
+        as vagas. Os vetores são cópias, que não mudam com as alterações seguintes do índice.
+
+        Retorna
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            O identificador da cidade menor de cada estrada, o da cidade maior e a distância da estrada,
+            ordenados pela cidade menor e, para a mesma cidade, na ordem do vetor `vizinhos`.
+        """
+        deslocamentos: 'np.ndarray' = np.asarray(memoryview(self.deslocamentos))
+        vizinhos: 'np.ndarray' = np.asarray(memoryview(self.vizinhos)).astype(np.int64)
+        pesos: 'np.ndarray' = np.asarray(memoryview(self.pesos))
+
+        cidades: 'np.ndarray' = np.repeat(np.arange(len(self.nomes), dtype=np.int64), np.diff(deslocamentos))
+        unicas: 'np.ndarray' = cidades < vizinhos
+
+        return cidades[unicas], vizinhos[unicas], pesos[unicas]
+
+    # Metódo privado
+    def _posicao_da_estrada(self, cidade: int, vizinha: int) -> int | None:
+        """
+        Retorna a posição da estrada de uma cidade até uma vizinha nos vetores `vizinhos` e `pesos`.
+
+        Parâmetros
+        ----------
+        cidade : int
+            O identificador da cidade.
+        vizinha : int
+            O identificador da vizinha.
+
+        Retorna
+        -------
+        int | None
+            A posição da estrada, ou None se as cidades não forem vizinhas.
+        """
+        for posicao in range(self.deslocamentos[cidade], self.deslocamentos[cidade + 1]):
+            if self.vizinhos[posicao] == vizinha and vizinha != cidade:
+                return posicao
+
+        return None
+
+    # Metódo privado
+    def _posicao_vaga(self, cidade: int) -> int:
+        """
+        Retorna uma posição vaga entre os vizinhos de uma cidade, abrindo espaço nos vetores se necessário.
+
+        Quando a cidade não tem nenhuma posição vaga, os seus vizinhos ganham tantas posições vagas quanto
+        já ocupavam (pelo menos uma), de modo que as próximas estradas da mesma cidade não precisem mover os
+        vetores outra vez.
+
+        Parâmetros
+        ----------
+        cidade : int
+            O identificador da cidade.
+
+        Retorna
+        -------
+        int
+            A posição vaga.
+        """
+        inicio, fim = self.deslocamentos[cidade], self.deslocamentos[cidade + 1]
+
+        for posicao in range(inicio, fim):
+            if self.vizinhos[posicao] == cidade:
+                return posicao
+
+        espaco_extra: int = max(1, fim - inicio)
+
+        self.vizinhos[fim:fim] = array('i', [cidade]) * espaco_extra
+        self.pesos[fim:fim] = array(self.tipo_dos_pesos(), [0]) * espaco_extra
+        self.deslocamentos[cidade + 1:] = array('q', map(espaco_extra.__add__, self.deslocamentos[cidade + 1:]))
+
+        return fim
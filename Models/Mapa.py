@@ -1,7 +1,18 @@
+from contextlib import nullcontext
+from math import hypot, inf
+from weakref import WeakSet
 from Models.Cidade import Cidade
+from Models.IndiceDeAdjacencia import IndiceDeAdjacencia
+from Models.CidadesDoIndice import CidadesDoIndice
+from Models.ArmazemDeArvores import ArmazemDeArvores
 from Controllers.MapaController import MapaController
+from Controllers.MapaBinarioController import MapaBinarioController
 from Controllers.CidadeController import CidadeController
+from Controllers.HeuristicaController import HeuristicaController
+from Controllers.HierarquiaDeContracaoController import HierarquiaDeContracaoController
+from Controllers.PontosDeReferenciaController import PontosDeReferenciaController
 from Exceptions.CidadeNaoEncontradaError import CidadeNaoEncontradaError
+from Exceptions.EstradaNaoEncontradaError import EstradaNaoEncontradaError
 
 class Mapa:
     """
@@ -9,13 +20,43 @@ class Mapa:
     cidades, bem como suas cidades vizinhas, e as distâncias entre elas.
     É a classe responsável em organizar o nome de cada cidade e suas
     relações entre si.
+
+    Além dos objetos Cidade, o Mapa mantém um IndiceDeAdjacencia, construído uma única vez no carregamento,
+    com as mesmas conexões em formato compacto e identificadas por números inteiros. É sobre esse índice
+    que os algoritmos de busca da classe Rota trabalham. Quando o mapa é carregado da versão compilada,
+    `caminho_do_binario` guarda o caminho do arquivo mapeado em memória. As árvores de caminhos mínimos
+    calculadas sobre o índice ficam guardadas em `arvores_de_caminhos_minimos`. Depois do carregamento, as
+    cidades ficam ligadas ao índice e não guardam mais as próprias vizinhas e coordenadas: elas as leem
+    do índice, que é a única cópia das conexões do mapa.
+
+    O mapa pode ser alterado depois de carregado, com a criação, remoção ou mudança de distância de
+    estradas, a criação ou remoção de cidades e a mudança das coordenadas de uma cidade. Cada alteração é aplicada no próprio índice, e por isso
+    aparece também nas vizinhas das cidades, incrementa `versao` e descarta apenas o que ela afeta: as
+    árvores de caminhos mínimos são reparadas, as rotas dos caches em `caches_de_rotas` que continuam
+    corretas são mantidas, e a hierarquia de contração e os pontos de referência só são descartados
+    quando deixam de valer. As alterações não devem ser feitas enquanto outras threads calculam rotas no
+    mesmo mapa.
+
+    Quando o mapa recebe uma instância de Estatisticas, o tempo de cada fase do carregamento e do preparo
+    da hierarquia de contração e dos pontos de referência é registrado nela.
     """
 
     caminho_pro_json: str = "Assets/Json/mapa_padrao.json"
     lista_de_nomes_de_cidades: list[str]
-    todas_as_cidades: dict[str, 'Cidade'] = {}
+    todas_as_cidades: dict[str, 'Cidade']
+    indice: 'IndiceDeAdjacencia'
+    caminho_do_binario: str = None
+    arvores_de_caminhos_minimos: 'ArmazemDeArvores'
+    versao: int = 0
+    caches_de_rotas: 'WeakSet[CacheDeRotas]'
+    estatisticas: 'Estatisticas' = None
+    _escala_admissivel: float = None
+    _hash_do_conteudo: str = None
+    _estradas: tuple['np.ndarray', 'np.ndarray', 'np.ndarray'] = None
+    _hierarquia_de_contracao: 'HierarquiaDeContracao' = None
+    _pontos_de_referencia: 'PontosDeReferencia' = None
 
-    def __init__(self, caminho_pro_json: str = "") -> None:
+    def __init__(self, caminho_pro_json: str = "", carregamento_incremental: bool = False, usar_binario: bool = False, estatisticas: 'Estatisticas' = None) -> None:
         """
         Construtor da classe Mapa.
 
@@ -28,6 +69,20 @@ class Mapa:
         caminho_pro_json : str, opcional
             O caminho para o JSON correspondente ao Mapa que o usuário deseja calcular rotas. Deixar vazio 
             importa automaticamente o JSON do mapa da Romênia, placeholder da aplicação.
+        carregamento_incremental : bool, opcional
+            Se True, o JSON é lido em blocos e cada cidade é carregada assim que é lida, sem manter o
+            documento inteiro na memória, o que é indicado para mapas muito grandes. Arquivos com extensão
+            ".jsonl", no formato de uma cidade por linha, são sempre carregados dessa forma. O padrão é
+            False, que lê e analisa o arquivo inteiro de uma só vez, o que é mais rápido.
+        usar_binario : bool, opcional
+            Se True, o mapa é carregado da sua versão compilada (".rmap", ao lado do JSON), mapeada em
+            memória sem cópia. A versão compilada é gerada automaticamente quando não existe ou quando o
+            JSON é mais recente que ela. Caminhos terminados em ".rmap" são sempre carregados dessa forma.
+            O padrão é False.
+        estatisticas : Estatisticas, opcional
+            As estatísticas em que são registrados os tempos das fases do carregamento e do preparo dos
+            dados do mapa. O carregamento é executado sob o `perfilar` delas. O padrão é None, que não
+            mede nada.
 
         Retorna
         -------
@@ -37,11 +92,14 @@ class Mapa:
         if caminho_pro_json:
             self.caminho_pro_json = caminho_pro_json
 
-        self.lista_de_nomes_de_cidades = MapaController._pegar_nomes_de_todas_as_cidades_do_json(self.caminho_pro_json)
+        self.caches_de_rotas = WeakSet()
+        self.estatisticas = estatisticas
 
-        self._definir_todas_as_cidades()
-        self._relacionar_todos_os_vizinhos()
-        self._aplicar_coordenadas_em_cada_cidade()
+        with estatisticas.perfilar() if estatisticas is not None else nullcontext():
+            if usar_binario or self.caminho_pro_json.endswith(MapaBinarioController.EXTENSAO):
+                self._carregar_binario()
+            else:
+                self._carregar_json(carregamento_incremental)
 
     def pegar_cidade_pelo_nome(self, nome: str) -> 'Cidade':
         """
@@ -70,64 +128,874 @@ class Mapa:
         except KeyError:
             raise CidadeNaoEncontradaError(f"A cidade '{nome}' não foi encontrada no mapa.")
     
+    def pegar_id_da_cidade_pelo_nome(self, nome: str) -> int:
+        """
+        Retorna o identificador inteiro da cidade no índice de adjacência do mapa.
+
+        Este método capitaliza automaticamente o nome antes de procurar a cidade correspondente.
+
+        Parâmetros
+        ----------
+        nome : str
+            O nome da cidade.
+
+        Retorna
+        -------
+        int
+            O identificador da cidade no IndiceDeAdjacencia deste mapa.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se a cidade especificada não for encontrada no mapa.
+        """
+        return self.indice.id_da_cidade(nome.title())
+
+    def escala_admissivel_das_coordenadas(self) -> float:
+        """
+        Retorna o fator de escala que converte distâncias euclidianas entre coordenadas em uma estimativa
+        admissível das distâncias do mapa.
+
+        O fator é calculado uma única vez pelo HeuristicaController e reaproveitado pelas buscas A*
+        seguintes feitas sobre este mapa.
+
+        Retorna
+        -------
+        float
+            O fator de escala admissível para as coordenadas deste mapa.
+        """
+        if self._escala_admissivel is None:
+            self._escala_admissivel = HeuristicaController.calcular_escala_admissivel(self)
+
+        return self._escala_admissivel
+
+    def arvore_de_caminhos_minimos(self, nome_da_origem: str) -> 'ArvoreDeCaminhosMinimos':
+        """
+        Retorna a árvore de caminhos mínimos a partir de uma cidade, com os menores caminhos até todas as
+        outras.
+
+        A árvore é calculada na primeira chamada para a cidade e guardada no armazém de árvores do mapa,
+        de onde é reaproveitada nas chamadas seguintes e pelas rotas que partem ou chegam nessa cidade,
+        enquanto couber no limite de memória do armazém. Este método capitaliza automaticamente o nome
+        antes de procurar a cidade correspondente.
+
+        Parâmetros
+        ----------
+        nome_da_origem : str
+            O nome da cidade de origem.
+
+        Retorna
+        -------
+        ArvoreDeCaminhosMinimos
+            A árvore de caminhos mínimos da cidade.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se a cidade especificada não for encontrada no mapa.
+        """
+        return self.arvores_de_caminhos_minimos.pegar(self.pegar_id_da_cidade_pelo_nome(nome_da_origem))
+
+    def hierarquia_de_contracao(self) -> 'HierarquiaDeContracao':
+        """
+        Retorna a hierarquia de contração do mapa, usada pelo modo "hierarquia_de_contracao" da classe Rota.
+
+        Na primeira chamada, a hierarquia é carregada do arquivo ".rch" ao lado do arquivo do mapa. Se o
+        arquivo não existir ou tiver sido gerado para um mapa com outro conteúdo, a hierarquia é construída
+        e gravada nesse arquivo, o que pode levar bastante tempo em mapas grandes. Se não for possível
+        gravar o arquivo, ou se o mapa tiver sido alterado depois de carregado e não corresponder mais ao
+        arquivo do mapa, a hierarquia é usada apenas em memória. As chamadas seguintes reaproveitam a
+        mesma hierarquia.
+
+        Retorna
+        -------
+        HierarquiaDeContracao
+            A hierarquia de contração do mapa.
+        """
+        if self._hierarquia_de_contracao is None:
+            with self._medir_fase("hierarquia_de_contracao"):
+                caminho_da_hierarquia: str = HierarquiaDeContracaoController.caminho_da_hierarquia(self.caminho_pro_json)
+
+                if HierarquiaDeContracaoController.precisa_construir(caminho_da_hierarquia, self.hash_do_conteudo()):
+                    hierarquia: 'HierarquiaDeContracao' = HierarquiaDeContracaoController.construir(self.indice, self.hash_do_conteudo())
+
+                    try:
+                        if self.versao == 0:
+                            HierarquiaDeContracaoController.escrever(hierarquia, caminho_da_hierarquia)
+                    except OSError:
+                        pass
+                else:
+                    hierarquia = HierarquiaDeContracaoController.carregar(caminho_da_hierarquia)
+
+            self._hierarquia_de_contracao = hierarquia
+
+        return self._hierarquia_de_contracao
+
+    def pontos_de_referencia(self, quantidade: int = PontosDeReferenciaController.QUANTIDADE_PADRAO) -> 'PontosDeReferencia':
+        """
+        Retorna os pontos de referência do mapa, usados pela heurística ALT do modo "alt" da classe Rota.
+
+        Na primeira chamada, os pontos são carregados do arquivo ".ralt" ao lado do arquivo do mapa. Se o
+        arquivo não existir ou tiver sido gerado para um mapa com outro conteúdo ou outra quantidade de pontos,
+        os pontos são escolhidos e gravados nesse arquivo. Se não for possível gravar o arquivo, ou se o mapa
+        tiver sido alterado depois de carregado, os pontos são usados apenas em memória. As chamadas seguintes
+        com a mesma quantidade reaproveitam os mesmos pontos.
+
+        Parâmetros
+        ----------
+        quantidade : int, opcional
+            A quantidade de pontos de referência. O padrão é 8.
+
+        Retorna
+        -------
+        PontosDeReferencia
+            Os pontos de referência do mapa e as suas distâncias até todas as cidades.
+        """
+        if self._pontos_de_referencia is None or len(self._pontos_de_referencia) != min(quantidade, len(self.indice)):
+            with self._medir_fase("pontos_de_referencia"):
+                caminho_dos_pontos: str = PontosDeReferenciaController.caminho_dos_pontos(self.caminho_pro_json)
+
+                if PontosDeReferenciaController.precisa_escolher(caminho_dos_pontos, self.hash_do_conteudo(), min(quantidade, len(self.indice))):
+                    pontos: 'PontosDeReferencia' = PontosDeReferenciaController.escolher(self.indice, self.hash_do_conteudo(), quantidade)
+
+                    try:
+                        if self.versao == 0:
+                            PontosDeReferenciaController.escrever(pontos, caminho_dos_pontos)
+                    except OSError:
+                        pass
+                else:
+                    pontos = PontosDeReferenciaController.carregar(caminho_dos_pontos)
+
+            self._pontos_de_referencia = pontos
+
+        return self._pontos_de_referencia
+
+    def hash_do_conteudo(self) -> str:
+        """
+        Retorna um resumo do conteúdo do mapa, que identifica a versão das cidades e estradas carregadas.
+
+        O resumo é calculado pelo IndiceDeAdjacencia na primeira chamada e reaproveitado nas seguintes. É
+        usado como parte da chave do CacheDeRotas, de modo que rotas calculadas em um mapa nunca sejam
+        devolvidas para um mapa com conteúdo diferente.
+
+        Retorna
+        -------
+        str
+            O resumo do conteúdo do mapa, em hexadecimal.
+        """
+        if self._hash_do_conteudo is None:
+            self._hash_do_conteudo = self.indice.calcular_hash_do_conteudo()
+
+        return self._hash_do_conteudo
+
+    def estradas(self) -> tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+        """
+        Retorna todas as estradas do mapa em vetores do NumPy, uma vez cada, como listadas pelo
+        IndiceDeAdjacencia.
+
+        Os vetores são listados na primeira chamada e reaproveitados nas seguintes, até a próxima alteração
+        do mapa. São somente leitura e servem para desenhar o mapa ou montar outras representações dele,
+        como o grafo do NetworkX da classe Grafo, sem percorrer as vizinhas de cada cidade.
+
+        Retorna
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            O identificador da cidade menor de cada estrada, o da cidade maior e a distância da estrada.
+        """
+        if self._estradas is None:
+            estradas: tuple['np.ndarray', 'np.ndarray', 'np.ndarray'] = self.indice.listar_estradas()
+            for vetor in estradas:
+                vetor.flags.writeable = False
+
+            self._estradas = estradas
+
+        return self._estradas
+
+    def adicionar_estrada(self, nome_da_cidade_a: str, nome_da_cidade_b: str, distancia: int | float) -> None:
+        """
+        Cria uma estrada de mão dupla entre duas cidades do mapa.
+
+        Os menores caminhos que a nova estrada não encurta continuam valendo: as árvores de caminhos
+        mínimos são reparadas e as rotas em cache que comprovadamente continuam sendo as menores são
+        mantidas. Os pontos de referência e a hierarquia de contração são descartados.
+
+        Parâmetros
+        ----------
+        nome_da_cidade_a : str
+            O nome de uma das cidades.
+        nome_da_cidade_b : str
+            O nome da outra cidade.
+        distancia : int | float
+            A distância da estrada.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se alguma das cidades não for encontrada no mapa.
+        ValueError
+            Se as cidades forem a mesma, se já existir estrada entre elas ou se a distância for negativa.
+        """
+        cidade_a, cidade_b = self._pegar_ids_da_estrada(nome_da_cidade_a, nome_da_cidade_b)
+
+        if cidade_a == cidade_b:
+            raise ValueError("Uma estrada precisa ligar duas cidades diferentes.")
+        if self.indice.distancia_da_estrada(cidade_a, cidade_b) != inf:
+            raise ValueError(f"Já existe estrada entre '{nome_da_cidade_a}' e '{nome_da_cidade_b}'.")
+
+        self._alterar_estrada(cidade_a, cidade_b, distancia)
+
+    def alterar_distancia_da_estrada(self, nome_da_cidade_a: str, nome_da_cidade_b: str, distancia: int | float) -> None:
+        """
+        Altera a distância da estrada entre duas cidades do mapa, nos dois sentidos.
+
+        As rotas em cache que não usam a estrada são mantidas quando ela fica mais longa, e também quando
+        fica mais curta se for possível comprovar que ela não oferece um caminho menor. As árvores de
+        caminhos mínimos são reparadas, e os pontos de referência só são descartados quando a estrada fica
+        mais curta.
+
+        Parâmetros
+        ----------
+        nome_da_cidade_a : str
+            O nome de uma das cidades.
+        nome_da_cidade_b : str
+            O nome da outra cidade.
+        distancia : int | float
+            A nova distância da estrada.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se alguma das cidades não for encontrada no mapa.
+        EstradaNaoEncontradaError
+            Se não existir estrada entre as duas cidades.
+        ValueError
+            Se a distância for negativa.
+        """
+        cidade_a, cidade_b = self._pegar_ids_da_estrada(nome_da_cidade_a, nome_da_cidade_b)
+
+        if self.indice.distancia_da_estrada(cidade_a, cidade_b) == inf:
+            raise EstradaNaoEncontradaError(f"Não existe estrada entre '{nome_da_cidade_a}' e '{nome_da_cidade_b}'.")
+
+        self._alterar_estrada(cidade_a, cidade_b, distancia)
+
+    def remover_estrada(self, nome_da_cidade_a: str, nome_da_cidade_b: str) -> None:
+        """
+        Remove a estrada entre duas cidades do mapa.
+
+        As rotas em cache que não passavam pela estrada são mantidas, as árvores de caminhos mínimos são
+        reparadas e os pontos de referência continuam valendo. A hierarquia de contração é descartada.
+
+        Parâmetros
+        ----------
+        nome_da_cidade_a : str
+            O nome de uma das cidades.
+        nome_da_cidade_b : str
+            O nome da outra cidade.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se alguma das cidades não for encontrada no mapa.
+        EstradaNaoEncontradaError
+            Se não existir estrada entre as duas cidades.
+        """
+        cidade_a, cidade_b = self._pegar_ids_da_estrada(nome_da_cidade_a, nome_da_cidade_b)
+
+        if self.indice.distancia_da_estrada(cidade_a, cidade_b) == inf:
+            raise EstradaNaoEncontradaError(f"Não existe estrada entre '{nome_da_cidade_a}' e '{nome_da_cidade_b}'.")
+
+        self._alterar_estrada(cidade_a, cidade_b, None)
+
+    def adicionar_cidade(self, nome: str, coordenadas: dict[str, float] = None) -> None:
+        """
+        Cria uma cidade ainda sem estradas no mapa.
+
+        Todas as rotas em cache e as árvores de caminhos mínimos continuam valendo. Os pontos de referência
+        e a hierarquia de contração são descartados.
+
+        Parâmetros
+        ----------
+        nome : str
+            O nome da cidade. É capitalizado automaticamente.
+        coordenadas : dict[str, float], opcional
+            As coordenadas x e y da cidade. O padrão é None, que aplica as coordenadas {x: 0.0, y: 0.0}.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+
+        Lança
+        ------
+        ValueError
+            Se já existir uma cidade com o mesmo nome.
+        """
+        nome = nome.title()
+        coordenadas = coordenadas or {"x": 0.0, "y": 0.0}
+
+        if nome in self.indice.ids_por_nome:
+            raise ValueError(f"A cidade '{nome}' já existe no mapa.")
+
+        def todas_continuam_validas(caminho: tuple[str, ...], distancia: int) -> bool:
+            return True
+
+        hash_antigo: str = self._hash_do_conteudo
+        self._preparar_alteracao()
+
+        self.indice.adicionar_cidade(nome, coordenadas["x"], coordenadas["y"])
+
+        if not isinstance(self.todas_as_cidades, CidadesDoIndice):
+            self.todas_as_cidades[nome] = Cidade(nome, self.indice)
+            self.lista_de_nomes_de_cidades.append(nome)
+
+        self.arvores_de_caminhos_minimos.acrescentar_cidade()
+        self._hierarquia_de_contracao = None
+        self._pontos_de_referencia = None
+
+        self._concluir_alteracao(hash_antigo, todas_continuam_validas)
+
+    def definir_coordenadas(self, nome: str, coordenadas: dict[str, float]) -> None:
+        """
+        Altera as coordenadas de uma cidade do mapa.
+
+        As coordenadas não alteram nenhuma distância, então todas as rotas em cache, as árvores de caminhos
+        mínimos, os pontos de referência e a hierarquia de contração continuam valendo. Apenas o fator de
+        escala admissível das coordenadas é descartado.
+
+        Parâmetros
+        ----------
+        nome : str
+            O nome da cidade. É capitalizado automaticamente.
+        coordenadas : dict[str, float]
+            As novas coordenadas x e y da cidade.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se a cidade não for encontrada no mapa.
+        """
+        identificador: int = self.pegar_id_da_cidade_pelo_nome(nome)
+
+        def todas_continuam_validas(caminho: tuple[str, ...], distancia: int) -> bool:
+            return True
+
+        hash_antigo: str = self._hash_do_conteudo
+        self._preparar_alteracao()
+
+        self.indice.definir_coordenadas(identificador, float(coordenadas["x"]), float(coordenadas["y"]))
+        self._escala_admissivel = None
+
+        self._concluir_alteracao(hash_antigo, todas_continuam_validas)
+
+    def remover_cidade(self, nome: str) -> None:
+        """
+        Remove uma cidade do mapa, junto com todas as suas estradas.
+
+        As cidades seguintes à removida mudam de identificador no índice, então as árvores de caminhos
+        mínimos, os pontos de referência e a hierarquia de contração são descartados. As rotas em cache que
+        não passavam pela cidade são mantidas.
+
+        Parâmetros
+        ----------
+        nome : str
+            O nome da cidade. É capitalizado automaticamente.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se a cidade não for encontrada no mapa.
+        """
+        identificador: int = self.pegar_id_da_cidade_pelo_nome(nome)
+        nome = self.indice.nomes[identificador]
+
+        def nao_passam_pela_cidade(caminho: tuple[str, ...], distancia: int) -> bool:
+            return nome not in caminho
+
+        hash_antigo: str = self._hash_do_conteudo
+        self._preparar_alteracao()
+
+        self.indice.remover_cidade(identificador)
+
+        if isinstance(self.todas_as_cidades, CidadesDoIndice):
+            self.todas_as_cidades.descartar(nome)
+        else:
+            del self.todas_as_cidades[nome]
+            self.lista_de_nomes_de_cidades.remove(nome)
+
+        self.arvores_de_caminhos_minimos.limpar()
+        self._hierarquia_de_contracao = None
+        self._pontos_de_referencia = None
+
+        self._concluir_alteracao(hash_antigo, nao_passam_pela_cidade)
+
+    # Metódo privado
+    def _pegar_ids_da_estrada(self, nome_da_cidade_a: str, nome_da_cidade_b: str) -> tuple[int, int]:
+        """
+        Retorna os identificadores das duas cidades de uma estrada.
+
+        Parâmetros
+        ----------
+        nome_da_cidade_a : str
+            O nome de uma das cidades.
+        nome_da_cidade_b : str
+            O nome da outra cidade.
+
+        Retorna
+        -------
+        tuple[int, int]
+            Os identificadores das duas cidades no índice.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se alguma das cidades não for encontrada no mapa.
+        """
+        return self.pegar_id_da_cidade_pelo_nome(nome_da_cidade_a), self.pegar_id_da_cidade_pelo_nome(nome_da_cidade_b)
+
+    # Metódo privado
+    def _alterar_estrada(self, cidade_a: int, cidade_b: int, distancia: int | float | None) -> None:
+        """
+        Cria, altera ou remove a estrada entre duas cidades e atualiza tudo o que depende dela.
+
+        Quando a estrada fica mais longa ou é removida, nenhuma distância do mapa diminui, então os pontos
+        de referência e o fator de escala das coordenadas continuam admissíveis, e toda rota que não passa
+        pela estrada continua sendo a menor. Quando a estrada fica mais curta ou é criada, uma rota que não
+        passa por ela só é mantida se os limites inferiores de distância calculados antes da alteração
+        comprovarem que nenhum caminho pela estrada é menor.
+
+        Parâmetros
+        ----------
+        cidade_a : int
+            O identificador de uma das cidades.
+        cidade_b : int
+            O identificador da outra cidade.
+        distancia : int | float | None
+            A nova distância da estrada, ou None para removê-la.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+
+        Lança
+        ------
+        ValueError
+            Se a distância for negativa.
+        """
+        if distancia is not None and distancia < 0:
+            raise ValueError("A distância de uma estrada não pode ser negativa.")
+
+        nova_distancia: int | float = inf if distancia is None else distancia
+        distancia_anterior: int | float = self.indice.distancia_da_estrada(cidade_a, cidade_b)
+
+        if nova_distancia == distancia_anterior:
+            return
+
+        ficou_mais_curta: bool = nova_distancia < distancia_anterior
+        nome_a, nome_b = self.indice.nomes[cidade_a], self.indice.nomes[cidade_b]
+
+        limites_inferiores: list[callable] = []
+        if ficou_mais_curta and self._pontos_de_referencia is not None:
+            limites_inferiores.append(HeuristicaController.criar_heuristica_alt(self, self._pontos_de_referencia))
+        if ficou_mais_curta and self._escala_admissivel:
+            limites_inferiores.append(HeuristicaController.criar_heuristica_euclidiana(self, self._escala_admissivel))
+
+        def limite_inferior(origem: int, destino: int) -> float:
+            return max((heuristica(origem, destino) for heuristica in limites_inferiores), default=0)
+
+        def continua_valida(caminho: tuple[str, ...], distancia_da_rota: int) -> bool:
+            if nome_a in caminho and nome_b in caminho and abs(caminho.index(nome_a) - caminho.index(nome_b)) == 1:
+                return False
+            if not ficou_mais_curta:
+                return True
+
+            ids_por_nome: 'Mapping[str, int]' = self.indice.ids_por_nome
+            origem, destino = ids_por_nome[caminho[0]], ids_por_nome[caminho[-1]]
+            menor_caminho_pela_estrada: float = nova_distancia + min(
+                limite_inferior(origem, cidade_a) + limite_inferior(cidade_b, destino),
+                limite_inferior(origem, cidade_b) + limite_inferior(cidade_a, destino)
+            )
+
+            return menor_caminho_pela_estrada >= distancia_da_rota
+
+        hash_antigo: str = self._hash_do_conteudo
+        self._preparar_alteracao()
+
+        if distancia is None:
+            self.indice.remover_estrada(cidade_a, cidade_b)
+        else:
+            self.indice.definir_distancia_da_estrada(cidade_a, cidade_b, distancia)
+
+        self.arvores_de_caminhos_minimos.reparar_estrada(cidade_a, cidade_b)
+        self._hierarquia_de_contracao = None
+
+        if ficou_mais_curta:
+            self._pontos_de_referencia = None
+            self._escala_admissivel = self._escala_com_a_estrada(cidade_a, cidade_b, nova_distancia)
+
+        self._concluir_alteracao(hash_antigo, continua_valida)
+
+    # Metódo privado
+    def _escala_com_a_estrada(self, cidade_a: int, cidade_b: int, distancia: int | float) -> float | None:
+        """
+        Atualiza o fator de escala admissível das coordenadas com uma estrada que ficou mais curta ou foi
+        criada, sem avaliar de novo todas as estradas do mapa.
+
+        Parâmetros
+        ----------
+        cidade_a : int
+            O identificador de uma das cidades da estrada.
+        cidade_b : int
+            O identificador da outra cidade da estrada.
+        distancia : int | float
+            A nova distância da estrada.
+
+        Retorna
+        -------
+        float | None
+            O novo fator de escala, ou None se ele ainda não tinha sido calculado ou era 0.0, casos em que
+            será calculado do zero na próxima vez em que for usado.
+        """
+        if not self._escala_admissivel:
+            return None
+
+        distancia_em_linha_reta: float = hypot(
+            self.indice.coordenadas_x[cidade_a] - self.indice.coordenadas_x[cidade_b],
+            self.indice.coordenadas_y[cidade_a] - self.indice.coordenadas_y[cidade_b]
+        )
+
+        if distancia_em_linha_reta > 0:
+            return min(self._escala_admissivel, distancia / distancia_em_linha_reta)
+
+        return self._escala_admissivel
+
+    # Metódo privado
+    def _preparar_alteracao(self) -> None:
+        """
+        Prepara o índice para ser alterado, copiando para a memória os vetores de um mapa compilado.
+
+        Depois da cópia, o mapa deixa de corresponder ao arquivo compilado, que não é mais informado em
+        `caminho_do_binario`.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self.indice.tornar_mutavel()
+        self.caminho_do_binario = None
+
+        if isinstance(self.todas_as_cidades, CidadesDoIndice):
+            self.lista_de_nomes_de_cidades = self.indice.nomes
+
+    # Metódo privado
+    def _concluir_alteracao(self, hash_antigo: str | None, rota_continua_valida: callable) -> None:
+        """
+        Registra uma nova versão do mapa e transfere para ela as rotas em cache que continuam corretas.
+
+        Parâmetros
+        ----------
+        hash_antigo : str | None
+            O resumo do conteúdo do mapa antes da alteração, ou None se ele não chegou a ser calculado, caso
+            em que nenhuma rota dessa versão foi guardada em cache.
+        rota_continua_valida : callable
+            Uma função que recebe o caminho de uma rota, como tupla de nomes de cidades, e a sua distância,
+            e retorna True se a rota continua sendo o menor caminho depois da alteração.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self.versao += 1
+        self._hash_do_conteudo = None
+        self._estradas = None
+
+        if hash_antigo is None:
+            return
+
+        for cache_de_rotas in list(self.caches_de_rotas):
+            if len(cache_de_rotas):
+                cache_de_rotas.revalidar(hash_antigo, self.hash_do_conteudo(), rota_continua_valida)
+
+    # Metódo privado
+    def _medir_fase(self, nome: str) -> 'AbstractContextManager':
+        """
+        Retorna o gerenciador de contexto que mede uma fase nas estatísticas do mapa, ou um que não faz
+        nada se o mapa não tiver estatísticas.
+
+        Parâmetros
+        ----------
+        nome : str
+            O nome da fase.
+
+        Retorna
+        -------
+        AbstractContextManager
+            O gerenciador de contexto da fase.
+        """
+        if self.estatisticas is None:
+            return nullcontext()
+        return self.estatisticas.fase(nome)
+
     # Metódo privado
-    def _definir_todas_as_cidades(self) -> None:
+    def _carregar_json(self, carregamento_incremental: bool) -> None:
         """
-        Separa e instancia todas as cidades determinadas pelo JSON passado para a instância atual. 
-        Pelo padrão da aplicação, seriam todas as primeiras chaves imediatas do JSON.
+        Carrega as cidades do JSON da instância atual, constrói o índice de adjacência e liga as cidades
+        a ele.
+
+        Parâmetros
+        ----------
+        carregamento_incremental : bool
+            Se True, ou se o arquivo tiver extensão ".jsonl", o JSON é lido em blocos, uma cidade por vez.
 
         Retorna
         -------
         None
             Este método não retorna nada.
         """
-        for nome_de_cidade in self.lista_de_nomes_de_cidades:
-            self.todas_as_cidades[nome_de_cidade] = Cidade(nome_de_cidade)
+        if carregamento_incremental or self.caminho_pro_json.endswith(".jsonl"):
+            with self._medir_fase("cidades"):
+                self._carregar_cidades(MapaController._iterar_cidades_do_json(self.caminho_pro_json))
+        else:
+            with self._medir_fase("leitura"):
+                cidades_em_dicionario: dict[str, dict] = MapaController._converter_json_em_dicionario(self.caminho_pro_json)
+            with self._medir_fase("cidades"):
+                self._carregar_cidades(cidades_em_dicionario.items())
+            del cidades_em_dicionario
+
+        with self._medir_fase("indice"):
+            self.indice = IndiceDeAdjacencia.a_partir_das_cidades(self.todas_as_cidades)
+
+            for cidade in self.todas_as_cidades.values():
+                cidade.ligar_ao_indice(self.indice)
+        self.arvores_de_caminhos_minimos = ArmazemDeArvores(self.indice)
 
     # Metódo privado
-    def _relacionar_todos_os_vizinhos(self) -> None:
+    def _carregar_binario(self) -> None:
         """
-        Aplica relação de vizinhança para todas as cidades definidas na instância atual.
+        Carrega o mapa da sua versão compilada, mapeada em memória.
+
+        Se o caminho da instância atual for um JSON, a versão compilada ao lado dele é usada, e é gerada
+        novamente antes do carregamento sempre que o MapaBinarioController indicar que ela está ausente ou
+        desatualizada. As cidades não são instanciadas no carregamento: o dicionário de cidades passa a ser
+        uma visão que monta cada Cidade a partir do índice na primeira vez em que ela é acessada.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        if self.caminho_pro_json.endswith(MapaBinarioController.EXTENSAO):
+            caminho_do_binario: str = self.caminho_pro_json
+        else:
+            caminho_do_binario = MapaBinarioController.caminho_do_binario(self.caminho_pro_json)
+
+            if MapaBinarioController.precisa_compilar(self.caminho_pro_json, caminho_do_binario):
+                self._carregar_json(carregamento_incremental=True)
+                with self._medir_fase("compilacao"):
+                    MapaBinarioController.escrever(self.indice, caminho_do_binario)
+
+        with self._medir_fase("mapeamento"):
+            self.indice = MapaBinarioController.carregar(caminho_do_binario)
+        self.caminho_do_binario = caminho_do_binario
+        self.arvores_de_caminhos_minimos = ArmazemDeArvores(self.indice)
+        self.todas_as_cidades = CidadesDoIndice(self.indice)
+        self.lista_de_nomes_de_cidades = self.indice.nomes
+
+    # Metódo privado
+    def _carregar_cidades(self, cidades_do_json: 'Iterable[tuple[str, dict]]') -> None:
+        """
+        Instancia todas as cidades do JSON, relaciona seus vizinhos e aplica suas coordenadas em uma única
+        passagem pelo conteúdo do arquivo.
+
+        Pelo padrão da aplicação, as cidades são as primeiras chaves imediatas do JSON. Como uma cidade pode
+        citar como vizinha outra que só aparece mais adiante no arquivo, a vizinha é instanciada assim que
+        é citada, e ao final é verificado se todas as cidades citadas foram de fato declaradas.
+
+        Durante a passagem, cada cidade guarda apenas as vizinhas da sua própria declaração. Assim, uma
+        cidade declarada mais de uma vez tem as vizinhas e as coordenadas substituídas pelas da última
+        declaração e mantém a posição da primeira, como no `json.loads`. As estradas só são registradas nos
+        dois sentidos ao final, por `_completar_estradas_de_mao_dupla`.
+
+        Parâmetros
+        ----------
+        cidades_do_json : Iterable[tuple[str, dict]]
+            Os pares de nome de cidade e conteúdo correspondente no JSON, na ordem do arquivo.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se alguma cidade for citada como vizinha sem ter sido declarada no JSON.
+        """
+        self.todas_as_cidades = {}
+        self.lista_de_nomes_de_cidades = []
+        cidades_declaradas: set[str] = set()
+
+        for nome_de_cidade, dados_da_cidade in cidades_do_json:
+            cidade_avaliada: Cidade = self._definir_cidade(nome_de_cidade)
+
+            if nome_de_cidade in cidades_declaradas:
+                cidade_avaliada.vizinhas.clear()
+            else:
+                cidades_declaradas.add(nome_de_cidade)
+                self.lista_de_nomes_de_cidades.append(nome_de_cidade)
+
+            self._relacionar_vizinhos(cidade_avaliada, dados_da_cidade["Vizinhos"])
+            self._aplicar_coordenadas(cidade_avaliada, dados_da_cidade)
+
+        nao_declaradas: set[str] = set(self.todas_as_cidades) - cidades_declaradas
+        if nao_declaradas:
+            # Uma cidade citada apenas por uma declaração substituída depois não faz parte do mapa.
+            citadas: set[str] = {
+                nome_de_vizinho for nome in self.lista_de_nomes_de_cidades for nome_de_vizinho in self.todas_as_cidades[nome].vizinhas
+            }
+            citadas_sem_declaracao: list[str] = [
+                nome for nome in self.todas_as_cidades if nome in nao_declaradas and self.todas_as_cidades[nome].nome in citadas
+            ]
+
+            if citadas_sem_declaracao:
+                raise CidadeNaoEncontradaError(f"A cidade '{citadas_sem_declaracao[0]}' não foi encontrada no mapa.")
+
+        # Cidades citadas antes de serem declaradas entraram no dicionário fora da ordem do JSON, e as citadas
+        # apenas por declarações substituídas ficam de fora.
+        self.todas_as_cidades = {nome: self.todas_as_cidades[nome] for nome in self.lista_de_nomes_de_cidades}
+        self._completar_estradas_de_mao_dupla()
+
+    # Metódo privado
+    def _completar_estradas_de_mao_dupla(self) -> None:
+        """
+        Registra nos dois sentidos as estradas declaradas por apenas uma das suas cidades no JSON.
+
+        Quando as duas cidades declaram a mesma estrada com distâncias diferentes, vale a distância da
+        cidade que aparece depois no JSON, como se cada cidade fosse relacionada na ordem do arquivo pelo
+        CidadeController.definir_vizinhos.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        cidades_por_nome: dict[str, 'Cidade'] = self.todas_as_cidades
+        if any(nome != cidade.nome for nome, cidade in cidades_por_nome.items()):
+            cidades_por_nome = {cidade.nome: cidade for cidade in self.todas_as_cidades.values()}
+
+        for cidade in self.todas_as_cidades.values():
+            for nome_de_vizinho, distancia_ate_vizinha in cidade.vizinhas.items():
+                cidade_vizinha: 'Cidade' = cidades_por_nome[nome_de_vizinho]
+                distancia_de_volta: int | None = cidade_vizinha.vizinhas.get(cidade.nome)
+
+                # Uma divergência que ainda resta só pode ser com uma vizinha que aparece depois no JSON, já
+                # que as anteriores resolveram as suas ao serem percorridas.
+                if distancia_de_volta is None:
+                    CidadeController.definir_vizinhos(cidade, cidade_vizinha, distancia_ate_vizinha)
+                elif distancia_de_volta != distancia_ate_vizinha:
+                    CidadeController.definir_vizinhos(cidade, cidade_vizinha, distancia_de_volta)
+
+    # Metódo privado
+    def _definir_cidade(self, nome_de_cidade: str) -> 'Cidade':
+        """
+        Retorna a cidade com o nome especificado, instanciando-a se ela ainda não existir no mapa.
+
+        Parâmetros
+        ----------
+        nome_de_cidade : str
+            O nome da cidade, como aparece no JSON.
+
+        Retorna
+        -------
+        Cidade
+            A cidade correspondente ao nome.
+        """
+        cidade: 'Cidade' = self.todas_as_cidades.get(nome_de_cidade)
+
+        if cidade is None:
+            cidade = Cidade(nome_de_cidade)
+            self.todas_as_cidades[nome_de_cidade] = cidade
+
+        return cidade
+
+    # Metódo privado
+    def _relacionar_vizinhos(self, cidade_avaliada: 'Cidade', vizinhos: dict[str, int]) -> None:
+        """
+        Aplica a relação de vizinhança entre uma cidade e todas as vizinhas listadas para ela no JSON.
 
         Como determinado no JSON, as cidades possuem outras cidades, vizinhas. Esse é o método
         responsável por estabelecer, de acordo com a lógica necessária para a aplicação, a
-        estrutura de dados correspondente à esse conceito.
+        estrutura de dados correspondente à esse conceito. A vizinha só é registrada na cidade
+        avaliada; o sentido contrário é registrado ao final do carregamento.
+
+        Parâmetros
+        ----------
+        cidade_avaliada : Cidade
+            A cidade cujas vizinhas serão relacionadas.
+        vizinhos : dict[str, int]
+            O conteúdo da chave "Vizinhos" da cidade no JSON, com o nome de cada vizinha e a distância
+            até ela.
 
         Retorna
         -------
         None
             Este método não retorna nada.
         """
-        cidades_em_dicionario: dict[str, object] = MapaController._converter_json_em_dicionario(self.caminho_pro_json)
+        for nome_de_vizinho, distancia_ate_vizinha in vizinhos.items():
+            cidade_vizinha: Cidade = self._definir_cidade(nome_de_vizinho)
 
-        for essa_cidade in self.todas_as_cidades:
-            for nome_de_vizinho in cidades_em_dicionario[essa_cidade]["Vizinhos"]:
-                cidade_avaliada: Cidade = self.todas_as_cidades[essa_cidade]
-                cidade_vizinha: Cidade = self.todas_as_cidades[nome_de_vizinho]
-                distancia_ate_vizinha: int = cidades_em_dicionario[cidade_avaliada.nome]["Vizinhos"][nome_de_vizinho]
-                
-                CidadeController.definir_vizinhos(cidade_avaliada, cidade_vizinha, distancia_ate_vizinha)
+            cidade_avaliada.vizinhas[cidade_vizinha.nome] = distancia_ate_vizinha
 
     # Metódo privado
-    def _aplicar_coordenadas_em_cada_cidade(self) -> None:
+    def _aplicar_coordenadas(self, cidade_avaliada: 'Cidade', dados_da_cidade: dict[str, object]) -> None:
         """
-        Aplica coordenadas para todas as cidades definidas na instância atual.
+        Aplica à cidade as coordenadas definidas para ela no JSON.
 
-        Este método itera sobre todas as cidades definidas na instância atual e aplica coordenadas 
-        a cada uma delas. Se uma cidade não tiver coordenadas definidas no JSON, são aplicadas 
-        coordenadas padrão de {x: 0.0, y: 0.0}.
+        Se a cidade não tiver coordenadas definidas no JSON, são aplicadas coordenadas padrão de
+        {x: 0.0, y: 0.0}.
+
+        Parâmetros
+        ----------
+        cidade_avaliada : Cidade
+            A cidade que receberá as coordenadas.
+        dados_da_cidade : dict[str, object]
+            O conteúdo da cidade no JSON.
 
         Retorna
         -------
         None
             Este método não retorna nada.
         """
-        cidades_em_dicionario: dict[str, object] = MapaController._converter_json_em_dicionario(self.caminho_pro_json)
-
-        for essa_cidade in self.todas_as_cidades:
-            try:
-                coordenadas: dict[str, float] = cidades_em_dicionario[essa_cidade]["Coordenada"]
-            except KeyError:
-                coordenadas = {"x": 0.0, "y": 0.0}
+        try:
+            coordenadas: dict[str, float] = dados_da_cidade["Coordenada"]
+        except KeyError:
+            coordenadas = {"x": 0.0, "y": 0.0}
 
-            CidadeController.definir_coordenadas(self.todas_as_cidades[essa_cidade], coordenadas)
+        CidadeController.definir_coordenadas(cidade_avaliada, coordenadas)
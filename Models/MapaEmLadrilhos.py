@@ -0,0 +1,353 @@
+from math import ceil, log2, sqrt
+from os import makedirs, path, replace
+from tempfile import mkstemp
+from Models.GradeEspacial import GradeEspacial
+from Controllers.GrafoController import GrafoController
+import numpy as np
+
+class MapaEmLadrilhos:
+    """
+    A classe MapaEmLadrilhos divide o desenho de um Mapa em ladrilhos quadrados de tamanho fixo, em vários
+    níveis de aproximação, no esquema z/x/y dos mapas da web: no nível `z`, a região do mapa é dividida em
+    2^z colunas e 2^z linhas de ladrilhos, com a coluna `x` contada da esquerda e a linha `y` contada de cima.
+    Assim, mapas grandes podem ser vistos por partes, cada uma legível, sem uma única imagem enorme.
+
+    As estradas e as cidades são indexadas uma única vez, cada uma em uma GradeEspacial, e cada ladrilho
+    desenha apenas as que tocam a sua região. O tamanho das cidades, a largura das estradas e a presença dos
+    nomes e das distâncias dependem apenas do nível, então ladrilhos vizinhos sempre se encaixam.
+
+    Os ladrilhos são guardados em disco, em `diretorio_do_cache`, em um diretório por versão do conteúdo do
+    mapa, e só são desenhados quando pedidos pela primeira vez. Depois de uma alteração no mapa, os índices
+    são refeitos e os ladrilhos passam a ser procurados no diretório da nova versão, sendo desenhados de
+    novo conforme forem pedidos.
+
+    Atributos Públicos
+    ------------------
+    mapa : Mapa
+        O mapa desenhado.
+    tamanho : int
+        O lado de cada ladrilho, em pixels.
+    nivel_maximo : int
+        O nível de maior aproximação.
+    diretorio_do_cache : str
+        O diretório em que os ladrilhos são guardados.
+    origem : tuple[float, float]
+        O canto inferior esquerdo da região quadrada do mapa dividida em ladrilhos.
+    lado : float
+        O lado da região do mapa dividida em ladrilhos.
+    """
+    # Alterar o desenho dos ladrilhos exige incrementar esta versão, que invalida os ladrilhos em disco.
+    VERSAO_DO_DESENHO: int = 1
+    TAMANHO_PADRAO: int = 256
+    DIRETORIO_PADRAO_DO_CACHE: str = path.join("Assets", "Images", "Ladrilhos")
+    NIVEL_MAXIMO_PERMITIDO: int = 20
+    # Fração do lado do mapa deixada livre em cada lado, como a folga das estradas no desenho do Grafo.
+    FOLGA: float = 0.05
+    # Distância típica entre cidades vizinhas, em pixels, no nível máximo padrão e a partir da qual os nomes
+    # das cidades e as distâncias das estradas são desenhados.
+    ESPACAMENTO_NO_NIVEL_MAXIMO: float = 160.0
+    ESPACAMENTO_PARA_NOMES: float = 64.0
+    ESPACAMENTO_PARA_DISTANCIAS: float = 128.0
+    # Faixa em volta de cada ladrilho, em pixels, cujas cidades e estradas também são desenhadas, para que as
+    # etiquetas cortadas pela borda continuem no ladrilho vizinho.
+    MARGEM_DAS_ETIQUETAS: float = 48.0
+
+    mapa: 'Mapa'
+    tamanho: int
+    nivel_maximo: int
+    diretorio_do_cache: str
+    origem: tuple[float, float]
+    lado: float
+    _versao_do_mapa: int = None
+    _coordenadas: 'np.ndarray'
+    _segmentos: 'np.ndarray'
+    _distancias: 'np.ndarray'
+    _grade_das_cidades: 'GradeEspacial'
+    _grade_das_estradas: 'GradeEspacial'
+    _espacamento: float
+
+    def __init__(self, mapa: 'Mapa', tamanho: int = TAMANHO_PADRAO, nivel_maximo: int = None, diretorio_do_cache: str = DIRETORIO_PADRAO_DO_CACHE) -> None:
+        """
+        Construtor da classe MapaEmLadrilhos.
+
+        Parâmetros
+        ----------
+        mapa : Mapa
+            O mapa que será desenhado.
+        tamanho : int, opcional
+            O lado de cada ladrilho, em pixels. O padrão é 256.
+        nivel_maximo : int, opcional
+            O nível de maior aproximação. O padrão é None, que escolhe o primeiro nível em que a distância
+            típica entre cidades vizinhas chega a `ESPACAMENTO_NO_NIVEL_MAXIMO` pixels.
+        diretorio_do_cache : str, opcional
+            O diretório em que os ladrilhos são guardados. O padrão é "Assets/Images/Ladrilhos".
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+
+        Lança
+        ------
+        ValueError
+            Se o nível máximo estiver fora do intervalo de 0 a `NIVEL_MAXIMO_PERMITIDO`.
+        """
+        self.mapa = mapa
+        self.tamanho = tamanho
+        self.diretorio_do_cache = diretorio_do_cache
+        self._atualizar_indices()
+
+        if nivel_maximo is None:
+            nivel_maximo = max(0, ceil(log2(MapaEmLadrilhos.ESPACAMENTO_NO_NIVEL_MAXIMO / self._espacamento_em_pixels(0))))
+            nivel_maximo = min(nivel_maximo, MapaEmLadrilhos.NIVEL_MAXIMO_PERMITIDO)
+        if not 0 <= nivel_maximo <= MapaEmLadrilhos.NIVEL_MAXIMO_PERMITIDO:
+            raise ValueError(f"O nível máximo deve estar entre 0 e {MapaEmLadrilhos.NIVEL_MAXIMO_PERMITIDO}.")
+
+        self.nivel_maximo = nivel_maximo
+
+    def obter_ladrilho(self, nivel: int, coluna: int, linha: int) -> str:
+        """
+        Retorna o caminho do arquivo PNG de um ladrilho, desenhando-o e gravando-o no cache se ele ainda não
+        existir para a versão atual do mapa.
+
+        Parâmetros
+        ----------
+        nivel : int
+            O nível de aproximação do ladrilho, o `z`.
+        coluna : int
+            A coluna do ladrilho, o `x`, contada da esquerda.
+        linha : int
+            A linha do ladrilho, o `y`, contada de cima.
+
+        Retorna
+        -------
+        str
+            O caminho do arquivo do ladrilho.
+
+        Lança
+        ------
+        ValueError
+            Se o ladrilho não existir: o nível fora do intervalo de 0 a `nivel_maximo`, ou a coluna ou a
+            linha fora do intervalo de 0 a 2^nivel - 1.
+        """
+        self._validar_ladrilho(nivel, coluna, linha)
+        self._atualizar_indices()
+
+        caminho_do_ladrilho: str = path.join(
+            self.diretorio_do_cache, f"{self.mapa.hash_do_conteudo()}_v{MapaEmLadrilhos.VERSAO_DO_DESENHO}", str(nivel), str(coluna), f"{linha}.png"
+        )
+
+        if not path.exists(caminho_do_ladrilho):
+            self._gravar_ladrilho(self.renderizar_ladrilho(nivel, coluna, linha), caminho_do_ladrilho)
+
+        return caminho_do_ladrilho
+
+    def gerar_ladrilhos(self, niveis: 'Iterable[int]' = None) -> 'Iterator[str]':
+        """
+        Obtém todos os ladrilhos de cada nível, desenhando os que ainda não estiverem no cache.
+
+        Parâmetros
+        ----------
+        niveis : Iterable[int], opcional
+            Os níveis cujos ladrilhos são obtidos. O padrão é None, que obtém os de todos os níveis. Cada nível
+            `z` tem 4^z ladrilhos.
+
+        Retorna
+        -------
+        Iterator[str]
+            O caminho de cada ladrilho, nível a nível, coluna a coluna.
+
+        Lança
+        ------
+        ValueError
+            Se algum nível estiver fora do intervalo de 0 a `nivel_maximo`.
+        """
+        for nivel in range(self.nivel_maximo + 1) if niveis is None else niveis:
+            for coluna in range(2 ** nivel):
+                for linha in range(2 ** nivel):
+                    yield self.obter_ladrilho(nivel, coluna, linha)
+
+    def renderizar_ladrilho(self, nivel: int, coluna: int, linha: int) -> 'np.ndarray':
+        """
+        Desenha um ladrilho, sem consultar nem alterar o cache em disco.
+
+        Parâmetros
+        ----------
+        nivel : int
+            O nível de aproximação do ladrilho, o `z`.
+        coluna : int
+            A coluna do ladrilho, o `x`, contada da esquerda.
+        linha : int
+            A linha do ladrilho, o `y`, contada de cima.
+
+        Retorna
+        -------
+        np.ndarray
+            A imagem do ladrilho, em RGBA.
+
+        Lança
+        ------
+        ValueError
+            Se o ladrilho não existir.
+        """
+        self._validar_ladrilho(nivel, coluna, linha)
+        self._atualizar_indices()
+
+        lado_do_ladrilho: float = self.lado / 2 ** nivel
+        minimo_x: float = self.origem[0] + coluna * lado_do_ladrilho
+        maximo_y: float = self.origem[1] + self.lado - linha * lado_do_ladrilho
+        limites: tuple[float, float, float, float] = (minimo_x, minimo_x + lado_do_ladrilho, maximo_y - lado_do_ladrilho, maximo_y)
+
+        espacamento: float = self._espacamento_em_pixels(nivel)
+        com_nomes: bool = espacamento >= MapaEmLadrilhos.ESPACAMENTO_PARA_NOMES
+        com_distancias: bool = espacamento >= MapaEmLadrilhos.ESPACAMENTO_PARA_DISTANCIAS
+        tamanho_das_cidades, largura_das_estradas = MapaEmLadrilhos._dimensoes_do_desenho(espacamento)
+
+        margem_em_pixels: float = sqrt(tamanho_das_cidades) / 2 + largura_das_estradas
+        if com_nomes or com_distancias:
+            margem_em_pixels = max(margem_em_pixels, MapaEmLadrilhos.MARGEM_DAS_ETIQUETAS)
+        margem: float = margem_em_pixels * lado_do_ladrilho / self.tamanho
+        regiao: tuple[float, float, float, float] = (limites[0] - margem, limites[2] - margem, limites[1] + margem, limites[3] + margem)
+
+        cidades: 'np.ndarray' = self._grade_das_cidades.consultar(*regiao)
+        estradas: 'np.ndarray' = self._grade_das_estradas.consultar(*regiao)
+
+        if not len(cidades) and not len(estradas):
+            return np.full((self.tamanho, self.tamanho, 4), 255, dtype=np.uint8)
+
+        return GrafoController.desenhar_ladrilho(
+            limites, self.tamanho, self._segmentos[estradas], self._coordenadas[cidades], tamanho_das_cidades, largura_das_estradas,
+            nomes=[self.mapa.indice.nomes[cidade] for cidade in cidades] if com_nomes else None,
+            distancias=self._distancias[estradas].tolist() if com_distancias else None
+        )
+
+    # Metódo privado
+    def _atualizar_indices(self) -> None:
+        """
+        Indexa as cidades e as estradas do mapa, se ainda não foram indexadas na versão atual do mapa.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        if self._versao_do_mapa == self.mapa.versao:
+            return
+
+        indice: 'IndiceDeAdjacencia' = self.mapa.indice
+        self._coordenadas = np.column_stack((np.asarray(memoryview(indice.coordenadas_x)), np.asarray(memoryview(indice.coordenadas_y)))).astype(np.float64)
+
+        origens, destinos, self._distancias = self.mapa.estradas()
+        self._segmentos = np.stack((self._coordenadas[origens], self._coordenadas[destinos]), axis=1)
+
+        minimos: 'np.ndarray' = self._coordenadas.min(axis=0) if len(indice) else np.zeros(2)
+        maximos: 'np.ndarray' = self._coordenadas.max(axis=0) if len(indice) else np.zeros(2)
+        extensao: float = float((maximos - minimos).max())
+        self.lado = extensao * (1 + 2 * MapaEmLadrilhos.FOLGA) or 1.0
+        centro: 'np.ndarray' = (minimos + maximos) / 2
+        self.origem = (float(centro[0]) - self.lado / 2, float(centro[1]) - self.lado / 2)
+        self._espacamento = self.lado / sqrt(max(len(indice), 1))
+
+        self._grade_das_cidades = GradeEspacial(np.hstack((self._coordenadas, self._coordenadas)), self.origem, self.lado)
+        self._grade_das_estradas = GradeEspacial(
+            np.hstack((self._segmentos.min(axis=1), self._segmentos.max(axis=1))), self.origem, self.lado
+        )
+        self._versao_do_mapa = self.mapa.versao
+
+    # Metódo privado
+    def _espacamento_em_pixels(self, nivel: int) -> float:
+        """
+        Retorna a distância típica entre cidades vizinhas, em pixels, em um nível: o lado do quadrado que
+        cada cidade ocuparia se as cidades estivessem distribuídas de maneira uniforme pelo mapa.
+
+        Parâmetros
+        ----------
+        nivel : int
+            O nível de aproximação.
+
+        Retorna
+        -------
+        float
+            A distância típica, em pixels.
+        """
+        return self._espacamento * self.tamanho * 2 ** nivel / self.lado
+
+    # Metódo privado
+    @staticmethod
+    def _dimensoes_do_desenho(espacamento: float) -> tuple[float, float]:
+        """
+        Retorna o tamanho das cidades e a largura das estradas para a distância típica entre cidades de um
+        nível, sem passar do tamanho e da largura do desenho do Grafo. Nos níveis em que as cidades teriam
+        menos de um pixel, elas não são desenhadas, para não encobrirem as estradas.
+
+        Parâmetros
+        ----------
+        espacamento : float
+            A distância típica entre cidades vizinhas, em pixels.
+
+        Retorna
+        -------
+        tuple[float, float]
+            O tamanho das cidades, em pixels quadrados, e a largura das estradas, em pixels.
+        """
+        diametro_das_cidades: float = min(0.3 * espacamento, 22.0) if 0.3 * espacamento >= 1.0 else 0.0
+        largura_das_estradas: float = min(max(0.04 * espacamento, 0.3), 3.0)
+
+        return diametro_das_cidades ** 2, largura_das_estradas
+
+    # Metódo privado
+    def _validar_ladrilho(self, nivel: int, coluna: int, linha: int) -> None:
+        """
+        Verifica se um ladrilho existe.
+
+        Parâmetros
+        ----------
+        nivel : int
+            O nível de aproximação do ladrilho.
+        coluna : int
+            A coluna do ladrilho.
+        linha : int
+            A linha do ladrilho.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+
+        Lança
+        ------
+        ValueError
+            Se o ladrilho não existir.
+        """
+        if not 0 <= nivel <= self.nivel_maximo:
+            raise ValueError(f"O nível deve estar entre 0 e {self.nivel_maximo}.")
+        if not (0 <= coluna < 2 ** nivel and 0 <= linha < 2 ** nivel):
+            raise ValueError(f"O ladrilho {nivel}/{coluna}/{linha} não existe: no nível {nivel}, a coluna e a linha vão de 0 a {2 ** nivel - 1}.")
+
+    # Metódo privado
+    def _gravar_ladrilho(self, imagem: 'np.ndarray', caminho_do_ladrilho: str) -> None:
+        """
+        Grava um ladrilho em disco, primeiro em um arquivo temporário, que então substitui o definitivo, para
+        que nenhum ladrilho seja lido gravado pela metade.
+
+        Parâmetros
+        ----------
+        imagem : np.ndarray
+            A imagem do ladrilho, em RGBA.
+        caminho_do_ladrilho : str
+            O caminho do arquivo do ladrilho.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        diretorio: str = path.dirname(caminho_do_ladrilho)
+        makedirs(diretorio, exist_ok=True)
+
+        descritor, caminho_temporario = mkstemp(suffix=".tmp", dir=diretorio)
+
+        with open(descritor, 'wb') as arquivo:
+            GrafoController.gravar_png(imagem, arquivo, GrafoController.DPI_DOS_LADRILHOS)
+
+        replace(caminho_temporario, caminho_do_ladrilho)
@@ -0,0 +1,283 @@
+from csv import writer
+from math import inf
+import numpy as np
+from Models.Mapa import Mapa
+from Controllers.MatrizDeDistanciasController import MatrizDeDistanciasController
+from Exceptions.CidadeNaoEncontradaError import CidadeNaoEncontradaError
+from Exceptions.MapaAlteradoError import MapaAlteradoError
+
+class MatrizDeDistancias:
+    """
+    A classe MatrizDeDistancias armazena a menor distância entre todos os pares de cidades de um Mapa,
+    calculada uma única vez na criação da instância.
+
+    As consultas de distância, de linha e de coluna apenas leem a matriz já calculada. As linhas e colunas
+    são visões somente leitura da matriz, sem cópia, com as cidades na mesma ordem de `nomes`.
+
+    A matriz corresponde à versão do mapa em que foi calculada: os nomes e os identificadores das cidades
+    são copiados na criação, e consultas e exportações feitas depois de uma alteração no mapa lançam
+    MapaAlteradoError, em vez de devolverem distâncias de cidades renumeradas.
+
+    Atributos Públicos
+    ------------------
+    mapa : Mapa
+        O mapa cujas distâncias foram calculadas.
+    metodo : str
+        O método usado no cálculo: "dijkstra" ou "floyd_warshall".
+    nomes : list[str]
+        O nome das cidades na ordem das linhas e colunas da matriz, copiado do mapa na criação.
+    versao_do_mapa : int
+        A `versao` do mapa em que a matriz foi calculada.
+    distancias : np.ndarray
+        A matriz de distâncias, somente leitura, em que a linha `i` guarda as distâncias a partir da cidade
+        `nomes[i]`. Pares de cidades sem caminho entre si ficam com distância infinita.
+    """
+    mapa: 'Mapa'
+    metodo: str
+    nomes: list[str]
+    versao_do_mapa: int
+    distancias: 'np.ndarray'
+    _ids_por_nome: dict[str, int]
+
+    def __init__(self, mapa: 'Mapa', metodo: str = None) -> None:
+        """
+        Construtor da classe MatrizDeDistancias.
+
+        Parâmetros
+        ----------
+        mapa : Mapa
+            O mapa cujas distâncias serão calculadas.
+        metodo : str, opcional
+            O método de cálculo, dentre os listados em `MatrizDeDistanciasController.METODOS`. O padrão é
+            None, que usa o Floyd-Warshall vetorizado em mapas pequenos ou densos e o Dijkstra repetido a
+            partir de cada cidade nos demais.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+
+        Lança
+        ------
+        ValueError
+            Se o método informado não for suportado.
+        """
+        if metodo is None:
+            metodo = MatrizDeDistanciasController.escolher_metodo(mapa.indice)
+        if metodo not in MatrizDeDistanciasController.METODOS:
+            raise ValueError(f"Método '{metodo}' não suportado. Use um destes: {', '.join(MatrizDeDistanciasController.METODOS)}.")
+
+        self.mapa = mapa
+        self.metodo = metodo
+        self.nomes = list(mapa.indice.nomes)
+        self.versao_do_mapa = mapa.versao
+        self._ids_por_nome = {nome: cidade for cidade, nome in enumerate(self.nomes)}
+
+        if metodo == "floyd_warshall":
+            self.distancias = MatrizDeDistanciasController.calcular_com_floyd_warshall(mapa.indice)
+        else:
+            self.distancias = MatrizDeDistanciasController.calcular_com_dijkstra(mapa.indice)
+
+        self.distancias.flags.writeable = False
+
+    def distancia(self, nome_da_cidade_inicial: str, nome_da_cidade_final: str) -> float:
+        """
+        Retorna a menor distância entre duas cidades.
+
+        Parâmetros
+        ----------
+        nome_da_cidade_inicial : str
+            O nome da cidade inicial.
+        nome_da_cidade_final : str
+            O nome da cidade final.
+
+        Retorna
+        -------
+        float
+            A menor distância entre as duas cidades, ou infinito se não houver caminho entre elas.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se alguma das cidades não for encontrada na matriz.
+        MapaAlteradoError
+            Se o mapa foi alterado depois do cálculo da matriz.
+        """
+        return float(self.distancias[self._pegar_id_da_cidade(nome_da_cidade_inicial), self._pegar_id_da_cidade(nome_da_cidade_final)])
+
+    def linha(self, nome_da_cidade: str) -> 'np.ndarray':
+        """
+        Retorna as distâncias a partir de uma cidade até todas as outras.
+
+        Parâmetros
+        ----------
+        nome_da_cidade : str
+            O nome da cidade de partida.
+
+        Retorna
+        -------
+        np.ndarray
+            Uma visão somente leitura da linha da cidade, na ordem de `nomes`.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se a cidade não for encontrada na matriz.
+        MapaAlteradoError
+            Se o mapa foi alterado depois do cálculo da matriz.
+        """
+        return self.distancias[self._pegar_id_da_cidade(nome_da_cidade)]
+
+    def coluna(self, nome_da_cidade: str) -> 'np.ndarray':
+        """
+        Retorna as distâncias de todas as cidades até uma cidade.
+
+        Parâmetros
+        ----------
+        nome_da_cidade : str
+            O nome da cidade de chegada.
+
+        Retorna
+        -------
+        np.ndarray
+            Uma visão somente leitura da coluna da cidade, na ordem de `nomes`.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se a cidade não for encontrada na matriz.
+        MapaAlteradoError
+            Se o mapa foi alterado depois do cálculo da matriz.
+        """
+        return self.distancias[:, self._pegar_id_da_cidade(nome_da_cidade)]
+
+    def exportar_npy(self, caminho: str) -> None:
+        """
+        Salva a matriz de distâncias no formato binário do NumPy (".npy").
+
+        A ordem das linhas e colunas é a de `nomes`, que não é gravada no arquivo.
+
+        Parâmetros
+        ----------
+        caminho : str
+            O caminho do arquivo que será escrito.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+
+        Lança
+        ------
+        MapaAlteradoError
+            Se o mapa foi alterado depois do cálculo da matriz.
+        """
+        self._verificar_versao_do_mapa()
+        np.save(caminho, self.distancias)
+
+    def exportar_csv(self, caminho: str) -> None:
+        """
+        Salva a matriz de distâncias em um arquivo CSV, com o nome das cidades na primeira linha e na
+        primeira coluna.
+
+        Distâncias inteiras são escritas sem casas decimais, e pares sem caminho ficam com a célula vazia.
+
+        Parâmetros
+        ----------
+        caminho : str
+            O caminho do arquivo que será escrito.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+
+        Lança
+        ------
+        MapaAlteradoError
+            Se o mapa foi alterado depois do cálculo da matriz.
+        """
+        self._verificar_versao_do_mapa()
+
+        with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+            escritor = writer(arquivo)
+            escritor.writerow(["", *self.nomes])
+
+            for nome, linha in zip(self.nomes, self.distancias):
+                escritor.writerow([nome, *(MatrizDeDistancias._formatar_distancia(distancia) for distancia in linha.tolist())])
+
+    # Metódo privado
+    def _pegar_id_da_cidade(self, nome: str) -> int:
+        """
+        Retorna a linha e a coluna de uma cidade na matriz, pelos identificadores copiados na criação.
+
+        Assim como no Mapa, o nome é capitalizado antes da busca.
+
+        Parâmetros
+        ----------
+        nome : str
+            O nome da cidade.
+
+        Retorna
+        -------
+        int
+            A posição da cidade nas linhas e nas colunas da matriz.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se a cidade não estiver na matriz.
+        MapaAlteradoError
+            Se o mapa foi alterado depois do cálculo da matriz.
+        """
+        self._verificar_versao_do_mapa()
+
+        try:
+            return self._ids_por_nome[nome.title()]
+        except KeyError:
+            raise CidadeNaoEncontradaError(f"A cidade '{nome}' não foi encontrada no mapa.")
+
+    # Metódo privado
+    def _verificar_versao_do_mapa(self) -> None:
+        """
+        Verifica se o mapa continua na versão em que a matriz foi calculada.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+
+        Lança
+        ------
+        MapaAlteradoError
+            Se o mapa foi alterado depois do cálculo da matriz.
+        """
+        if self.mapa.versao != self.versao_do_mapa:
+            raise MapaAlteradoError(
+                f"O mapa foi alterado depois do cálculo da matriz de distâncias (versão {self.versao_do_mapa}, "
+                f"agora {self.mapa.versao}). Calcule uma nova matriz."
+            )
+
+    # Metódo privado
+    @staticmethod
+    def _formatar_distancia(distancia: float) -> str | int | float:
+        """
+        Formata uma distância para o CSV.
+
+        Parâmetros
+        ----------
+        distancia : float
+            A distância que será formatada.
+
+        Retorna
+        -------
+        str | int | float
+            Uma string vazia se a distância for infinita, um inteiro se ela não tiver parte decimal, ou a
+            própria distância nos demais casos.
+        """
+        if distancia == inf:
+            return ""
+        if distancia.is_integer():
+            return int(distancia)
+
+        return distancia
@@ -0,0 +1,58 @@
+class PontosDeReferencia:
+    """
+    A classe PontosDeReferencia guarda as cidades escolhidas como pontos de referência ("landmarks") de um
+    mapa e a menor distância de cada ponto até todas as cidades, usadas pela heurística ALT da busca A*.
+
+    Como as estradas do mapa são de mão dupla, a distância de um ponto até uma cidade é igual à distância
+    da cidade até o ponto, então um único vetor por ponto serve para os dois sentidos.
+
+    Atributos Públicos
+    ------------------
+    hash_do_mapa : str
+        O resumo do conteúdo do mapa em que as distâncias foram calculadas, como retornado por
+        `Mapa.hash_do_conteudo`.
+    cidades : array
+        Os identificadores das cidades escolhidas como pontos de referência, na ordem de escolha.
+    distancias : list[array]
+        Para cada ponto de referência, a menor distância até cada cidade, indexada pelo identificador da
+        cidade, ou infinito se a cidade não for alcançável a partir do ponto.
+    """
+    hash_do_mapa: str
+    cidades: 'array'
+    distancias: list['array']
+
+    def __init__(self, hash_do_mapa: str, cidades: 'array', distancias: list['array']) -> None:
+        """
+        Construtor da classe PontosDeReferencia.
+
+        Recebe os vetores já montados. Normalmente os pontos são criados pelo PontosDeReferenciaController,
+        seja pela escolha dos pontos em um mapa ou pela leitura de pontos gravados em arquivo.
+
+        Parâmetros
+        ----------
+        hash_do_mapa : str
+            O resumo do conteúdo do mapa em que as distâncias foram calculadas.
+        cidades : array
+            Os identificadores das cidades escolhidas como pontos de referência.
+        distancias : list[array]
+            Para cada ponto de referência, a menor distância até cada cidade.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self.hash_do_mapa = hash_do_mapa
+        self.cidades = cidades
+        self.distancias = distancias
+
+    def __len__(self) -> int:
+        """
+        Retorna a quantidade de pontos de referência.
+
+        Retorna
+        -------
+        int
+            A quantidade de pontos de referência.
+        """
+        return len(self.cidades)
@@ -1,12 +1,32 @@
+from contextlib import nullcontext
+from logging import getLogger, DEBUG, INFO
+from time import perf_counter
 from Models.Mapa import Mapa
 from Models.Cidade import Cidade
+from Models.CacheDeRotas import CacheDeRotas
 from Controllers.CidadeController import CidadeController
+from Controllers.RotaController import RotaController
+from Controllers.HeuristicaController import HeuristicaController
+from Controllers.HierarquiaDeContracaoController import HierarquiaDeContracaoController
+from Exceptions.RotaNaoEncontradaError import RotaNaoEncontradaError
+
+REGISTRADOR: 'Logger' = getLogger(__name__)
 
 class Rota:
     """
     A classe Rota armazena uma lista contendo o nome de todas as cidades que foram percorridas do ponto
     inicial até o final, além de toda a distância percorrida até chegar lá.
 
+    Todo o estado de uma rota pertence à própria instância, e as buscas apenas leem o Mapa. Assim, um mesmo
+    Mapa já carregado pode atender a várias rotas calculadas ao mesmo tempo, em threads diferentes.
+
+    Cada rota calculada é registrada pelo `logging`, no registrador "Models.Rota": o evento "rota_criada",
+    no nível INFO, ou "rota_nao_encontrada", também no nível INFO, precedido do evento "criando_rota" no
+    nível DEBUG. Os eventos trazem no `extra` os campos `evento`, `algoritmo`, `cidade_inicial`,
+    `cidade_final` e `duracao_ms`, e as rotas criadas também `distancia`, `cidades_no_caminho` e
+    `nos_expandidos`. O registro é desativado por padrão e pode ser ativado pelo RegistroController; sem
+    ele, nenhuma mensagem é formatada e o tempo da rota nem é medido.
+
     Atributos Públicos
     ------------------
     mapa_da_rota : 'Mapa'
@@ -21,14 +41,49 @@ class Rota:
     distancia_percorrida : int
         A distância total percorrida ao longo da rota, em quilômetros.
         O padrão é 0.
+    algoritmo : str
+        O algoritmo usado para traçar a rota. Pode ser "dijkstra", "a_estrela", "bidirecional",
+        "bidirecional_a_estrela", "alt" ou "hierarquia_de_contracao", que encontram o menor caminho, ou
+        "profundidade", a busca em profundidade original, que para no primeiro caminho encontrado. O modo
+        "alt" é o A* com a heurística dos pontos de referência do mapa, que não depende das coordenadas,
+        e o modo "hierarquia_de_contracao" usa a hierarquia pré-processada do mapa. Os dois preparam os
+        dados do mapa na primeira rota, se ainda não existirem. O padrão é "dijkstra".
+    heuristica : callable
+        A heurística usada pelos algoritmos "a_estrela", "bidirecional_a_estrela" e "alt". O padrão é None,
+        que usa a heurística euclidiana, ou a heurística ALT no algoritmo "alt".
+    nos_expandidos : int
+        A quantidade de cidades expandidas pela busca até encontrar a cidade final. Permite comparar o
+        trabalho feito pelo A* com o feito pelo Dijkstra. É 0 quando a rota vem do cache. O padrão é 0.
+    usar_cache : bool
+        Se a rota reaproveita resultados já calculados: o cache de rotas compartilhado e as árvores de
+        caminhos mínimos guardadas no mapa. O padrão é True.
+    estatisticas : Estatisticas
+        As estatísticas em que o trabalho e o tempo de cada fase do cálculo da rota são registrados. O
+        padrão é None, que não mede nada.
+
+    Atributos de Classe
+    -------------------
+    cache_de_rotas : CacheDeRotas
+        O cache compartilhado por todas as rotas, consultado apenas pelos algoritmos de menor caminho com a
+        heurística padrão, cuja distância não depende do algoritmo escolhido. Pode ser substituído por um
+        cache de outra capacidade. Todo cache em que uma rota é guardada fica registrado no mapa da rota,
+        que mantém nele as rotas não afetadas quando é alterado.
     """
+    ALGORITMOS: tuple[str, ...] = ("dijkstra", "a_estrela", "bidirecional", "bidirecional_a_estrela", "alt", "hierarquia_de_contracao", "profundidade")
+
     mapa_da_rota: 'Mapa'
     cidade_inicial: 'Cidade'
     nome_da_cidade_final: str
-    caminho: list[str] = []
-    distancia_percorrida: int = 0
-
-    def __init__(self, mapa_da_rota: 'Mapa', nome_da_cidade_inicial: str, nome_da_cidade_final: str) -> None:
+    caminho: list[str]
+    distancia_percorrida: int
+    algoritmo: str
+    heuristica: callable
+    nos_expandidos: int
+    usar_cache: bool
+    estatisticas: 'Estatisticas'
+    cache_de_rotas: 'CacheDeRotas' = CacheDeRotas()
+
+    def __init__(self, mapa_da_rota: 'Mapa', nome_da_cidade_inicial: str, nome_da_cidade_final: str, algoritmo: str = "dijkstra", heuristica: callable = None, usar_cache: bool = True, estatisticas: 'Estatisticas' = None) -> None:
         """
         Construtor da classe Rota.
 
@@ -43,12 +98,48 @@ class Rota:
             O nome da cidade inicial da rota.
         nome_da_cidade_final : str
             O nome da cidade final da rota.
+        algoritmo : str, opcional
+            O algoritmo de busca usado para traçar a rota, dentre os listados em `Rota.ALGORITMOS`.
+            O padrão é "dijkstra".
+        heuristica : callable, opcional
+            A heurística usada pelos algoritmos com A*, que recebe o identificador de uma cidade e o da
+            cidade final no índice de adjacência do mapa e retorna a estimativa de distância restante.
+            O padrão é None, que usa a heurística euclidiana do HeuristicaController com o fator de
+            escala admissível do mapa, ou a heurística ALT com os pontos de referência do mapa no
+            algoritmo "alt".
+        usar_cache : bool, opcional
+            Se True, a rota é procurada no cache de rotas e nas árvores de caminhos mínimos já guardadas
+            no mapa antes de ser calculada, e é guardada no cache depois. Esses resultados só são usados
+            pelos algoritmos de menor caminho sem heurística personalizada. O padrão é True.
+        estatisticas : Estatisticas, opcional
+            As estatísticas em que são contadas as operações das buscas e os acertos de cache e medidos
+            os tempos das fases da rota. O cálculo da rota é executado sob o `perfilar` delas. O padrão é
+            None, que não mede nada e deixa as buscas sem nenhuma contagem.
 
         Retorna
         -------
         None
             Este método não retorna nada.
+
+        Lança
+        ------
+        ValueError
+            Se o algoritmo informado não for suportado.
+        CidadeNaoEncontradaError
+            Se alguma das cidades não for encontrada no mapa.
+        RotaNaoEncontradaError
+            Se não existir caminho entre as duas cidades.
         """
+        if algoritmo not in self.ALGORITMOS:
+            raise ValueError(f"Algoritmo '{algoritmo}' não suportado. Use um destes: {', '.join(self.ALGORITMOS)}.")
+
+        self.algoritmo = algoritmo
+        self.heuristica = heuristica
+        self.usar_cache = usar_cache
+        self.estatisticas = estatisticas
+        self.caminho = []
+        self.distancia_percorrida = 0
+        self.nos_expandidos = 0
         self.mapa_da_rota = mapa_da_rota
         self.cidade_inicial = self.mapa_da_rota.pegar_cidade_pelo_nome(nome_da_cidade_inicial.title())
         self.nome_da_cidade_final = nome_da_cidade_final.title()
@@ -99,7 +190,47 @@ class Rota:
             True se o nome da cidade final estiver presente no caminho da rota, False se estiver ausente.
         """
         return self.nome_da_cidade_final in self.caminho
-    
+
+    def calcular_alternativas(self, quantidade: int) -> list[tuple[list[str], int]]:
+        """
+        Calcula rotas alternativas entre as cidades inicial e final desta rota, pelo algoritmo de Yen.
+
+        As alternativas não repetem cidades e são retornadas da menor para a maior distância, começando
+        pelo menor caminho. As buscas de desvio usam o A* com a heurística desta rota nos algoritmos
+        "a_estrela", "bidirecional_a_estrela" e "alt", e o Dijkstra nos demais.
+
+        Parâmetros
+        ----------
+        quantidade : int
+            A quantidade máxima de rotas retornadas, incluindo o menor caminho.
+
+        Retorna
+        -------
+        list[tuple[list[str], int]]
+            Até `quantidade` rotas, cada uma como lista de nomes de cidades da inicial até a final, junto
+            da sua distância. Menos rotas são retornadas se o mapa não tiver caminhos diferentes suficientes.
+
+        Lança
+        ------
+        RotaNaoEncontradaError
+            Se não existir caminho entre as duas cidades.
+        """
+        mapa: 'Mapa' = self.mapa_da_rota
+        indice: 'IndiceDeAdjacencia' = mapa.indice
+        origem: int = mapa.pegar_id_da_cidade_pelo_nome(self.cidade_inicial.nome)
+        destino: int = mapa.pegar_id_da_cidade_pelo_nome(self.nome_da_cidade_final)
+
+        heuristica: callable = None
+        if self.algoritmo in ("a_estrela", "bidirecional_a_estrela"):
+            heuristica = self.heuristica or HeuristicaController.criar_heuristica_euclidiana(mapa)
+        elif self.algoritmo == "alt":
+            heuristica = self.heuristica or HeuristicaController.criar_heuristica_alt(mapa)
+
+        return [
+            (indice.nomes_das_cidades(caminho_em_ids), distancia)
+            for caminho_em_ids, distancia in RotaController.buscar_k_menores_caminhos(indice, origem, destino, quantidade, heuristica)
+        ]
+
     # Método privado
     def _nome_da_penultima_cidade_no_caminho(self) -> str:
         """
@@ -157,14 +288,141 @@ class Rota:
         Rota
             A rota gerada, representada como uma instância da classe Rota.
         """
-        print("Criando nova rota...")
-
-        rota = self._caminhar(mapa, self, cidade_inicial)
-
-        print("Rota criada com sucesso: " + str(rota))
+        registrar: bool = REGISTRADOR.isEnabledFor(INFO)
+        if registrar:
+            campos: dict[str, object] = {"algoritmo": self.algoritmo, "cidade_inicial": cidade_inicial.nome, "cidade_final": self.nome_da_cidade_final}
+            if REGISTRADOR.isEnabledFor(DEBUG):
+                REGISTRADOR.debug("Criando nova rota de %s até %s...", cidade_inicial.nome, self.nome_da_cidade_final, extra={"evento": "criando_rota", **campos})
+            inicio: float = perf_counter()
+
+        try:
+            with self.estatisticas.perfilar() if self.estatisticas is not None else nullcontext():
+                if self.algoritmo == "profundidade":
+                    with self._medir_fase("busca"):
+                        rota = self._caminhar(mapa, self, cidade_inicial)
+                else:
+                    rota = self._caminhar_pelo_menor_caminho(mapa, cidade_inicial)
+        except RotaNaoEncontradaError:
+            if registrar:
+                REGISTRADOR.info(
+                    "Não existe rota entre %s e %s.", cidade_inicial.nome, self.nome_da_cidade_final,
+                    extra={"evento": "rota_nao_encontrada", **campos, "duracao_ms": (perf_counter() - inicio) * 1000}
+                )
+            raise
+
+        if registrar:
+            REGISTRADOR.info("Rota criada com sucesso: %s", rota, extra={
+                "evento": "rota_criada",
+                **campos,
+                "duracao_ms": (perf_counter() - inicio) * 1000,
+                "distancia": rota.distancia_percorrida,
+                "cidades_no_caminho": len(rota.caminho),
+                "nos_expandidos": rota.nos_expandidos
+            })
 
         return rota
     
+    # Método privado
+    def _caminhar_pelo_menor_caminho(self, mapa: 'Mapa', cidade_inicial: 'Cidade') -> 'Rota':
+        """
+        Traça a rota pelo menor caminho entre a cidade inicial e a cidade final.
+
+        Este método delega a busca ao algoritmo do RotaController escolhido para esta rota e armazena o
+        caminho, a distância e a quantidade de cidades expandidas nesta instância de Rota. Se a rota já
+        estiver no cache de rotas, ou se o mapa já tiver guardado a árvore de caminhos mínimos da cidade
+        inicial ou da final, ela é reaproveitada sem nenhuma busca.
+
+        Parâmetros
+        ----------
+        mapa : Mapa
+            O mapa no qual a rota está sendo criada.
+        cidade_inicial : Cidade
+            A cidade inicial da rota.
+
+        Retorna
+        -------
+        Rota
+            A rota atualizada com o menor caminho encontrado.
+        """
+        indice: 'IndiceDeAdjacencia' = mapa.indice
+        origem: int = mapa.pegar_id_da_cidade_pelo_nome(cidade_inicial.nome)
+        destino: int = mapa.pegar_id_da_cidade_pelo_nome(self.nome_da_cidade_final)
+
+        estatisticas: 'Estatisticas | None' = self.estatisticas
+        usar_cache: bool = self.usar_cache and self.heuristica is None
+        arvore: 'ArvoreDeCaminhosMinimos | None' = None
+
+        if usar_cache:
+            with self._medir_fase("cache"):
+                rota_em_cache: tuple[list[str], int] | None = self.cache_de_rotas.buscar(cidade_inicial.nome, self.nome_da_cidade_final, mapa.hash_do_conteudo())
+
+                if rota_em_cache is None:
+                    arvore = mapa.arvores_de_caminhos_minimos.buscar(origem) or mapa.arvores_de_caminhos_minimos.buscar(destino)
+
+            if estatisticas is not None:
+                if rota_em_cache is not None or arvore is not None:
+                    estatisticas.acertos_de_cache += 1
+                else:
+                    estatisticas.falhas_de_cache += 1
+
+            if rota_em_cache is not None:
+                self.caminho, self.distancia_percorrida = rota_em_cache
+                return self
+
+        with self._medir_fase("preparo"):
+            if self.algoritmo in ("a_estrela", "bidirecional_a_estrela"):
+                heuristica: callable = self.heuristica or HeuristicaController.criar_heuristica_euclidiana(mapa)
+            elif self.algoritmo == "alt":
+                heuristica = self.heuristica or HeuristicaController.criar_heuristica_alt(mapa)
+            elif self.algoritmo == "hierarquia_de_contracao" and arvore is None:
+                hierarquia: 'HierarquiaDeContracao' = mapa.hierarquia_de_contracao()
+
+        with self._medir_fase("busca"):
+            if arvore is not None and arvore.origem == origem:
+                resultado = arvore.caminho_ate(destino), arvore.distancia_ate(destino), 0
+            elif arvore is not None:
+                resultado = arvore.caminho_ate(origem)[::-1], arvore.distancia_ate(origem), 0
+            elif self.algoritmo in ("a_estrela", "alt"):
+                resultado = RotaController.buscar_com_a_estrela(indice, origem, destino, heuristica, estatisticas=estatisticas)
+            elif self.algoritmo == "bidirecional":
+                resultado = RotaController.buscar_bidirecional(indice, origem, destino, estatisticas=estatisticas)
+            elif self.algoritmo == "bidirecional_a_estrela":
+                resultado = RotaController.buscar_bidirecional(indice, origem, destino, heuristica, estatisticas=estatisticas)
+            elif self.algoritmo == "hierarquia_de_contracao":
+                resultado = HierarquiaDeContracaoController.buscar(hierarquia, indice, origem, destino, estatisticas)
+            else:
+                resultado = RotaController.buscar_com_dijkstra(indice, origem, destino, estatisticas=estatisticas)
+
+        with self._medir_fase("reconstrucao"):
+            caminho_em_ids, self.distancia_percorrida, self.nos_expandidos = resultado
+            self.caminho = indice.nomes_das_cidades(caminho_em_ids)
+
+            if usar_cache:
+                self.cache_de_rotas.guardar(cidade_inicial.nome, self.nome_da_cidade_final, mapa.hash_do_conteudo(), self.caminho, self.distancia_percorrida)
+                mapa.caches_de_rotas.add(self.cache_de_rotas)
+
+        return self
+
+    # Método privado
+    def _medir_fase(self, nome: str) -> 'AbstractContextManager':
+        """
+        Retorna o gerenciador de contexto que mede uma fase nas estatísticas da rota, ou um que não faz
+        nada se a rota não tiver estatísticas.
+
+        Parâmetros
+        ----------
+        nome : str
+            O nome da fase.
+
+        Retorna
+        -------
+        AbstractContextManager
+            O gerenciador de contexto da fase.
+        """
+        if self.estatisticas is None:
+            return nullcontext()
+        return self.estatisticas.fase(nome)
+
     # Método privado
     def _caminhar(self, mapa: 'Mapa', qual_rota: 'Rota', qual_cidade: 'Cidade') -> 'Rota':
         """
@@ -0,0 +1,209 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from math import ceil
+from os import cpu_count
+from Models.Mapa import Mapa
+from Controllers.RotaController import RotaController
+from Controllers.MapaBinarioController import MapaBinarioController
+
+class RotasEmLote:
+    """
+    A classe RotasEmLote calcula os menores caminhos de uma lista grande de pares (cidade inicial, cidade
+    final) de um mesmo Mapa, como as matrizes de origem e destino usadas em logística.
+
+    Em vez de criar uma Rota por par, os pares são agrupados pela cidade inicial, e cada grupo é resolvido
+    por uma única busca de Dijkstra que continua até alcançar todos os destinos do grupo. Os grupos são
+    distribuídos entre processos de um `ProcessPoolExecutor`, e os resultados são devolvidos conforme cada
+    lote de grupos termina, sem esperar pelos demais.
+
+    Cada processo recebe o índice de adjacência do mapa uma única vez, ao ser iniciado. Se o mapa foi
+    carregado da versão compilada, os processos recebem apenas o caminho do arquivo e o mapeiam em memória
+    por conta própria, compartilhando as mesmas páginas com o processo principal.
+
+    Atributos Públicos
+    ------------------
+    mapa : Mapa
+        O mapa no qual as rotas serão calculadas.
+    processos : int
+        A quantidade de processos usados no cálculo. Com 1, as rotas são calculadas no próprio processo.
+    """
+    # Quantidade aproximada de lotes enviados a cada processo, para equilibrar a carga entre eles.
+    LOTES_POR_PROCESSO: int = 4
+
+    mapa: 'Mapa'
+    processos: int
+    # Índice de adjacência carregado em cada processo do pool pelo `_inicializar_processo`.
+    _indice_do_processo: 'IndiceDeAdjacencia' = None
+
+    def __init__(self, mapa: 'Mapa', processos: int = None) -> None:
+        """
+        Construtor da classe RotasEmLote.
+
+        Parâmetros
+        ----------
+        mapa : Mapa
+            O mapa no qual as rotas serão calculadas.
+        processos : int, opcional
+            A quantidade de processos usados no cálculo. O padrão é None, que usa a quantidade de
+            processadores da máquina.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self.mapa = mapa
+        self.processos = processos or cpu_count() or 1
+
+    def calcular(self, pares: 'Iterable[tuple[str, str]]') -> 'Iterator[tuple[str, str, list[str] | None, int | None]]':
+        """
+        Calcula o menor caminho de cada par (cidade inicial, cidade final), devolvendo os resultados
+        conforme ficam prontos.
+
+        Os resultados não seguem a ordem dos pares recebidos, e sim a ordem em que os lotes terminam. Pares
+        repetidos geram um resultado para cada repetição.
+
+        Parâmetros
+        ----------
+        pares : Iterable[tuple[str, str]]
+            Os pares de nomes da cidade inicial e da cidade final de cada rota.
+
+        Retorna
+        -------
+        Iterator[tuple[str, str, list[str] | None, int | None]]
+            Para cada par, o nome da cidade inicial, o nome da cidade final, o caminho percorrido e a
+            distância total. O caminho e a distância são None quando não existe rota entre as cidades.
+
+        Lança
+        ------
+        CidadeNaoEncontradaError
+            Se alguma das cidades não for encontrada no mapa. A verificação é feita antes de qualquer
+            rota ser calculada.
+        """
+        grupos: list[tuple[int, list[int]]] = self._agrupar_por_cidade_inicial(pares)
+
+        if not grupos:
+            return
+
+        if self.processos == 1 or len(grupos) == 1:
+            for cidade_inicial, cidades_finais in grupos:
+                yield from RotasEmLote._calcular_grupo(self.mapa.indice, cidade_inicial, cidades_finais)
+            return
+
+        tamanho_do_lote: int = ceil(len(grupos) / (self.processos * self.LOTES_POR_PROCESSO))
+        lotes: list[list[tuple[int, list[int]]]] = [grupos[inicio:inicio + tamanho_do_lote] for inicio in range(0, len(grupos), tamanho_do_lote)]
+
+        executor: 'ProcessPoolExecutor' = ProcessPoolExecutor(
+            max_workers=min(self.processos, len(lotes)),
+            initializer=RotasEmLote._inicializar_processo,
+            initargs=(self.mapa.caminho_do_binario or self.mapa.indice,)
+        )
+
+        try:
+            futuros: list = [executor.submit(RotasEmLote._calcular_lote, lote) for lote in lotes]
+
+            for futuro in as_completed(futuros):
+                yield from futuro.result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    # Metódo privado
+    def _agrupar_por_cidade_inicial(self, pares: 'Iterable[tuple[str, str]]') -> list[tuple[int, list[int]]]:
+        """
+        Converte os nomes dos pares em identificadores e agrupa as cidades finais pela cidade inicial.
+
+        Parâmetros
+        ----------
+        pares : Iterable[tuple[str, str]]
+            Os pares de nomes da cidade inicial e da cidade final de cada rota.
+
+        Retorna
+        -------
+        list[tuple[int, list[int]]]
+            Cada identificador de cidade inicial com a lista dos identificadores das suas cidades finais,
+            na ordem em que as cidades iniciais aparecem pela primeira vez.
+        """
+        grupos: dict[int, list[int]] = {}
+
+        for nome_da_cidade_inicial, nome_da_cidade_final in pares:
+            cidade_inicial: int = self.mapa.pegar_id_da_cidade_pelo_nome(nome_da_cidade_inicial)
+            cidade_final: int = self.mapa.pegar_id_da_cidade_pelo_nome(nome_da_cidade_final)
+            grupos.setdefault(cidade_inicial, []).append(cidade_final)
+
+        return list(grupos.items())
+
+    # Metódo privado
+    @staticmethod
+    def _inicializar_processo(fonte_do_indice: 'str | IndiceDeAdjacencia') -> None:
+        """
+        Carrega o índice de adjacência do mapa em um processo do pool, uma única vez por processo.
+
+        Parâmetros
+        ----------
+        fonte_do_indice : str | IndiceDeAdjacencia
+            O caminho do mapa compilado, que é mapeado em memória, ou o próprio índice de adjacência.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        if isinstance(fonte_do_indice, str):
+            fonte_do_indice = MapaBinarioController.carregar(fonte_do_indice)
+
+        RotasEmLote._indice_do_processo = fonte_do_indice
+
+    # Metódo privado
+    @staticmethod
+    def _calcular_lote(lote: list[tuple[int, list[int]]]) -> list[tuple[str, str, list[str] | None, int | None]]:
+        """
+        Calcula, em um processo do pool, as rotas de todos os grupos de um lote.
+
+        Parâmetros
+        ----------
+        lote : list[tuple[int, list[int]]]
+            Os grupos do lote, cada um com o identificador da cidade inicial e os das cidades finais.
+
+        Retorna
+        -------
+        list[tuple[str, str, list[str] | None, int | None]]
+            Os resultados de todos os pares do lote, no formato devolvido por `calcular`.
+        """
+        resultados: list[tuple[str, str, list[str] | None, int | None]] = []
+
+        for cidade_inicial, cidades_finais in lote:
+            resultados.extend(RotasEmLote._calcular_grupo(RotasEmLote._indice_do_processo, cidade_inicial, cidades_finais))
+
+        return resultados
+
+    # Metódo privado
+    @staticmethod
+    def _calcular_grupo(indice: 'IndiceDeAdjacencia', cidade_inicial: int, cidades_finais: list[int]) -> list[tuple[str, str, list[str] | None, int | None]]:
+        """
+        Calcula as rotas de uma cidade inicial até todas as suas cidades finais com uma única busca.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência do mapa.
+        cidade_inicial : int
+            O identificador da cidade inicial do grupo.
+        cidades_finais : list[int]
+            Os identificadores das cidades finais do grupo.
+
+        Retorna
+        -------
+        list[tuple[str, str, list[str] | None, int | None]]
+            Os resultados dos pares do grupo, no formato devolvido por `calcular`.
+        """
+        distancias, antecessores = RotaController.buscar_a_partir_de_uma_origem(indice, cidade_inicial, set(cidades_finais))
+        nome_da_cidade_inicial: str = indice.nomes[cidade_inicial]
+        resultados: list[tuple[str, str, list[str] | None, int | None]] = []
+
+        for cidade_final in cidades_finais:
+            if cidade_final in distancias:
+                caminho: list[str] = indice.nomes_das_cidades(RotaController._reconstruir_caminho(antecessores, cidade_final))
+                resultados.append((nome_da_cidade_inicial, indice.nomes[cidade_final], caminho, distancias[cidade_final]))
+            else:
+                resultados.append((nome_da_cidade_inicial, indice.nomes[cidade_final], None, None))
+
+        return resultados
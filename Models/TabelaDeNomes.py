@@ -0,0 +1,181 @@
+from collections.abc import Mapping, Sequence
+
+class TabelaDeNomes(Sequence):
+    """
+    A classe TabelaDeNomes dá acesso aos nomes das cidades guardados em um mapa compilado, sem precisar
+    decodificar todos eles ao carregar o arquivo.
+
+    Os nomes ficam concatenados em um único bloco de texto UTF-8, e o nome da cidade de identificador `i`
+    ocupa os bytes de `deslocamentos[i]` até `deslocamentos[i + 1]`. Uma permutação dos identificadores em
+    ordem alfabética de nome permite encontrar o identificador de um nome por busca binária, também sem
+    montar um dicionário com todos os nomes.
+
+    Atributos Públicos
+    ------------------
+    ids_por_nome : IdsPorNome
+        Uma visão de dicionário somente leitura que associa cada nome ao identificador da cidade.
+    """
+    ids_por_nome: 'IdsPorNome'
+
+    def __init__(self, deslocamentos: 'memoryview', ordem_alfabetica: 'memoryview', texto: 'memoryview') -> None:
+        """
+        Construtor da classe TabelaDeNomes.
+
+        Parâmetros
+        ----------
+        deslocamentos : memoryview
+            A posição inicial de cada nome no bloco de texto, com uma posição extra no final.
+        ordem_alfabetica : memoryview
+            Os identificadores das cidades, ordenados pelo nome.
+        texto : memoryview
+            O bloco de bytes com todos os nomes concatenados, codificados em UTF-8.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self._deslocamentos = deslocamentos
+        self._ordem_alfabetica = ordem_alfabetica
+        self._texto = texto
+        self.ids_por_nome = IdsPorNome(self)
+
+    def __len__(self) -> int:
+        """
+        Retorna a quantidade de nomes da tabela.
+
+        Retorna
+        -------
+        int
+            A quantidade de nomes da tabela.
+        """
+        return len(self._deslocamentos) - 1
+
+    def __getitem__(self, identificador: int | slice) -> str | list[str]:
+        """
+        Retorna o nome da cidade de identificador especificado, decodificando-o do bloco de texto.
+
+        Parâmetros
+        ----------
+        identificador : int | slice
+            O identificador da cidade, ou um intervalo de identificadores.
+
+        Retorna
+        -------
+        str | list[str]
+            O nome da cidade, ou a lista de nomes do intervalo.
+
+        Lança
+        ------
+        IndexError
+            Se o identificador estiver fora da tabela.
+        """
+        if isinstance(identificador, slice):
+            return [self[indice] for indice in range(*identificador.indices(len(self)))]
+
+        if identificador < 0:
+            identificador += len(self)
+        if not 0 <= identificador < len(self):
+            raise IndexError("Identificador de cidade fora da tabela de nomes.")
+
+        return str(self._texto[self._deslocamentos[identificador]:self._deslocamentos[identificador + 1]], "utf-8")
+
+    def id_do_nome(self, nome: str) -> int:
+        """
+        Retorna o identificador da cidade com o nome especificado, por busca binária na ordem alfabética.
+
+        Parâmetros
+        ----------
+        nome : str
+            O nome da cidade.
+
+        Retorna
+        -------
+        int
+            O identificador da cidade, ou -1 se o nome não estiver na tabela.
+        """
+        inicio, fim = 0, len(self._ordem_alfabetica)
+
+        while inicio < fim:
+            meio: int = (inicio + fim) // 2
+            identificador: int = self._ordem_alfabetica[meio]
+            nome_do_meio: str = self[identificador]
+
+            if nome_do_meio == nome:
+                return identificador
+            if nome_do_meio < nome:
+                inicio = meio + 1
+            else:
+                fim = meio
+
+        return -1
+
+class IdsPorNome(Mapping):
+    """
+    A classe IdsPorNome é uma visão de dicionário somente leitura, do nome de cada cidade para o seu
+    identificador, apoiada na busca binária de uma TabelaDeNomes.
+    """
+
+    def __init__(self, tabela: 'TabelaDeNomes') -> None:
+        """
+        Construtor da classe IdsPorNome.
+
+        Parâmetros
+        ----------
+        tabela : TabelaDeNomes
+            A tabela de nomes consultada pela visão.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self._tabela = tabela
+
+    def __getitem__(self, nome: str) -> int:
+        """
+        Retorna o identificador da cidade com o nome especificado.
+
+        Parâmetros
+        ----------
+        nome : str
+            O nome da cidade.
+
+        Retorna
+        -------
+        int
+            O identificador da cidade.
+
+        Lança
+        ------
+        KeyError
+            Se o nome não estiver na tabela.
+        """
+        identificador: int = self._tabela.id_do_nome(nome)
+
+        if identificador < 0:
+            raise KeyError(nome)
+
+        return identificador
+
+    def __iter__(self) -> 'Iterator[str]':
+        """
+        Percorre os nomes da tabela, na ordem dos identificadores.
+
+        Retorna
+        -------
+        Iterator[str]
+            Os nomes das cidades.
+        """
+        return iter(self._tabela)
+
+    def __len__(self) -> int:
+        """
+        Retorna a quantidade de nomes da tabela.
+
+        Retorna
+        -------
+        int
+            A quantidade de nomes da tabela.
+        """
+        return len(self._tabela)
@@ -0,0 +1,93 @@
+from collections.abc import Mapping
+
+class VizinhasDaCidade(Mapping):
+    """
+    A classe VizinhasDaCidade é uma visão de dicionário somente leitura, do nome de cada vizinha de uma
+    cidade para a distância até ela, lida diretamente dos vetores de um IndiceDeAdjacencia.
+
+    É o que a propriedade `vizinhas` de uma Cidade ligada ao índice retorna. A visão não copia nada: cada
+    consulta percorre as posições da cidade nos vetores `vizinhos` e `pesos`, ignorando as posições vagas,
+    então ela sempre reflete as alterações feitas no índice. A visão é presa ao identificador que a cidade
+    tinha quando foi criada, por isso não deve ser guardada de uma remoção de cidade para outra, que
+    renumera as cidades seguintes do índice.
+    """
+    __slots__ = ("_indice", "_identificador")
+
+    def __init__(self, indice: 'IndiceDeAdjacencia', identificador: int) -> None:
+        """
+        Construtor da classe VizinhasDaCidade.
+
+        Parâmetros
+        ----------
+        indice : IndiceDeAdjacencia
+            O índice de adjacência de onde as vizinhas são lidas.
+        identificador : int
+            O identificador da cidade no índice.
+
+        Retorna
+        -------
+        None
+            Este método não retorna nada.
+        """
+        self._indice = indice
+        self._identificador = identificador
+
+    def __getitem__(self, nome: str) -> int | float:
+        """
+        Retorna a distância até a vizinha com o nome especificado.
+
+        Parâmetros
+        ----------
+        nome : str
+            O nome da vizinha.
+
+        Retorna
+        -------
+        int | float
+            A distância até a vizinha.
+
+        Lança
+        ------
+        KeyError
+            Se a cidade com esse nome não for vizinha desta cidade.
+        """
+        indice: 'IndiceDeAdjacencia' = self._indice
+        vizinha: int | None = indice.ids_por_nome.get(nome)
+
+        if vizinha is not None and vizinha != self._identificador:
+            for posicao in range(indice.deslocamentos[self._identificador], indice.deslocamentos[self._identificador + 1]):
+                if indice.vizinhos[posicao] == vizinha:
+                    return indice.pesos[posicao]
+
+        raise KeyError(nome)
+
+    def __iter__(self) -> 'Iterator[str]':
+        """
+        Percorre os nomes das vizinhas, na ordem em que aparecem no índice.
+
+        Retorna
+        -------
+        Iterator[str]
+            Os nomes das vizinhas.
+        """
+        indice: 'IndiceDeAdjacencia' = self._indice
+        nomes: 'Sequence[str]' = indice.nomes
+
+        for posicao in range(indice.deslocamentos[self._identificador], indice.deslocamentos[self._identificador + 1]):
+            vizinha: int = indice.vizinhos[posicao]
+            if vizinha != self._identificador:
+                yield nomes[vizinha]
+
+    def __len__(self) -> int:
+        """
+        Retorna a quantidade de vizinhas da cidade.
+
+        Retorna
+        -------
+        int
+            A quantidade de vizinhas, sem contar as posições vagas.
+        """
+        indice: 'IndiceDeAdjacencia' = self._indice
+        vizinhos: 'array' = indice.vizinhos
+
+        return sum(1 for posicao in range(indice.deslocamentos[self._identificador], indice.deslocamentos[self._identificador + 1]) if vizinhos[posicao] != self._identificador)
@@ -0,0 +1,77 @@
+from os import path
+from random import Random
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Controllers.HeuristicaController import HeuristicaController
+from Controllers.HierarquiaDeContracaoController import HierarquiaDeContracaoController
+from Controllers.PontosDeReferenciaController import PontosDeReferenciaController
+from Controllers.RotaController import RotaController
+from Models.Mapa import Mapa
+
+class TestAlgoritmosDeRota(TestCase):
+    """
+    Testa se os algoritmos de menor caminho encontram, em um mapa geométrico aleatório pequeno, caminhos
+    válidos com a mesma distância do Dijkstra.
+    """
+    def setUp(self) -> None:
+        diretorio: 'TemporaryDirectory' = TemporaryDirectory()
+        self.addCleanup(diretorio.cleanup)
+
+        self.caminho_pro_json: str = path.join(diretorio.name, "geometrico.json")
+        GeradorDeMapasController.escrever_json(GeradorDeMapasController.gerar_geometrico_aleatorio(150, vizinhos_por_cidade=4), self.caminho_pro_json)
+        self.mapa: 'Mapa' = Mapa(self.caminho_pro_json)
+
+        aleatorio: Random = Random(11)
+        self.pares: list[tuple[int, int]] = [tuple(aleatorio.sample(range(len(self.mapa.indice)), 2)) for _ in range(150)]
+
+    def _conferir(self, busca: callable) -> None:
+        indice: 'IndiceDeAdjacencia' = self.mapa.indice
+
+        for origem, destino in self.pares:
+            caminho, distancia, _ = busca(origem, destino)
+            _, distancia_do_dijkstra, _ = RotaController.buscar_com_dijkstra(indice, origem, destino)
+
+            self.assertEqual(distancia, distancia_do_dijkstra)
+            self.assertEqual((caminho[0], caminho[-1]), (origem, destino))
+            self.assertEqual(sum(indice.distancia_da_estrada(a, b) for a, b in zip(caminho, caminho[1:])), distancia)
+
+    def test_bidirecional_igual_ao_dijkstra(self) -> None:
+        heuristica: callable = HeuristicaController.criar_heuristica_euclidiana(self.mapa)
+
+        self._conferir(lambda origem, destino: RotaController.buscar_bidirecional(self.mapa.indice, origem, destino))
+        self._conferir(lambda origem, destino: RotaController.buscar_bidirecional(self.mapa.indice, origem, destino, heuristica))
+
+    def test_hierarquia_de_contracao_igual_ao_dijkstra(self) -> None:
+        hierarquia: 'HierarquiaDeContracao' = self.mapa.hierarquia_de_contracao()
+
+        self._conferir(lambda origem, destino: HierarquiaDeContracaoController.buscar(hierarquia, self.mapa.indice, origem, destino))
+
+    def test_hierarquia_de_contracao_gravada_em_arquivo(self) -> None:
+        self.mapa.hierarquia_de_contracao()
+        caminho_da_hierarquia: str = HierarquiaDeContracaoController.caminho_da_hierarquia(self.caminho_pro_json)
+        self.assertFalse(HierarquiaDeContracaoController.precisa_construir(caminho_da_hierarquia, self.mapa.hash_do_conteudo()))
+
+        hierarquia: 'HierarquiaDeContracao' = HierarquiaDeContracaoController.carregar(caminho_da_hierarquia)
+
+        self._conferir(lambda origem, destino: HierarquiaDeContracaoController.buscar(hierarquia, self.mapa.indice, origem, destino))
+
+    def test_alt_igual_ao_dijkstra(self) -> None:
+        for quantidade in (1, PontosDeReferenciaController.QUANTIDADE_PADRAO):
+            heuristica: callable = HeuristicaController.criar_heuristica_alt(self.mapa, self.mapa.pontos_de_referencia(quantidade))
+
+            self._conferir(lambda origem, destino: RotaController.buscar_com_a_estrela(self.mapa.indice, origem, destino, heuristica))
+
+    def test_alt_admissivel(self) -> None:
+        heuristica: callable = HeuristicaController.criar_heuristica_alt(self.mapa)
+        arvore: 'ArvoreDeCaminhosMinimos' = self.mapa.arvore_de_caminhos_minimos(self.mapa.indice.nomes[0])
+
+        for cidade in range(len(self.mapa.indice)):
+            self.assertLessEqual(heuristica(cidade, arvore.origem), arvore.distancia_ate(cidade))
+
+    def test_pontos_de_referencia_gravados_em_arquivo(self) -> None:
+        pontos: 'PontosDeReferencia' = self.mapa.pontos_de_referencia()
+        carregados: 'PontosDeReferencia' = Mapa(self.caminho_pro_json).pontos_de_referencia()
+
+        self.assertEqual(list(carregados.cidades), list(pontos.cidades))
+        self.assertEqual([list(distancias) for distancias in carregados.distancias], [list(distancias) for distancias in pontos.distancias])
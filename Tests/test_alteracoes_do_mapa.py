@@ -0,0 +1,115 @@
+from os import path
+from random import Random
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Controllers.RotaController import RotaController
+from Exceptions.RotaNaoEncontradaError import RotaNaoEncontradaError
+from Models.ArvoreDeCaminhosMinimos import ArvoreDeCaminhosMinimos
+from Models.CacheDeRotas import CacheDeRotas
+from Models.Mapa import Mapa
+from Models.Rota import Rota
+
+class TestAlteracoesDoMapa(TestCase):
+    """
+    Testa se, depois de cada tipo de alteração do mapa, as rotas mantidas no cache e as árvores de caminhos
+    mínimos reparadas respondem o mesmo que uma busca feita do zero no mapa alterado.
+    """
+    ALGORITMOS: tuple[str, ...] = ("dijkstra", "a_estrela", "alt", "hierarquia_de_contracao")
+
+    def setUp(self) -> None:
+        diretorio: 'TemporaryDirectory' = TemporaryDirectory()
+        self.addCleanup(diretorio.cleanup)
+
+        caminho_pro_json: str = path.join(diretorio.name, "geometrico.json")
+        GeradorDeMapasController.escrever_json(GeradorDeMapasController.gerar_geometrico_aleatorio(120, vizinhos_por_cidade=4), caminho_pro_json)
+        self.mapa: 'Mapa' = Mapa(caminho_pro_json)
+
+        cache_original: 'CacheDeRotas' = Rota.cache_de_rotas
+        Rota.cache_de_rotas = CacheDeRotas()
+        self.addCleanup(setattr, Rota, "cache_de_rotas", cache_original)
+
+        aleatorio: Random = Random(5)
+        nomes: list[str] = list(self.mapa.lista_de_nomes_de_cidades)
+        self.pares: list[tuple[str, str]] = [tuple(aleatorio.sample(nomes, 2)) for _ in range(60)]
+        self.origens: list[str] = aleatorio.sample(nomes, 4)
+
+        # Prepara tudo o que as alterações precisam manter ou descartar: rotas em cache, árvores guardadas,
+        # pontos de referência, hierarquia de contração e o fator de escala das coordenadas.
+        for nome in self.origens:
+            self.mapa.arvore_de_caminhos_minimos(nome)
+        for (inicio, fim), algoritmo in zip(self.pares, aleatorio.choices(TestAlteracoesDoMapa.ALGORITMOS, k=len(self.pares))):
+            Rota(self.mapa, inicio, fim, algoritmo=algoritmo, usar_cache=False)
+            Rota(self.mapa, inicio, fim)
+
+        self.caminho: list[str] = Rota(self.mapa, *self.pares[0]).caminho
+
+    def _distancia_do_zero(self, inicio: str, fim: str) -> int | None:
+        try:
+            return RotaController.buscar_com_dijkstra(self.mapa.indice, self.mapa.pegar_id_da_cidade_pelo_nome(inicio), self.mapa.pegar_id_da_cidade_pelo_nome(fim))[1]
+        except RotaNaoEncontradaError:
+            return None
+
+    def _distancia_da_rota(self, inicio: str, fim: str, algoritmo: str) -> int | None:
+        try:
+            return Rota(self.mapa, inicio, fim, algoritmo=algoritmo).distancia_percorrida
+        except RotaNaoEncontradaError:
+            return None
+
+    def _conferir(self) -> None:
+        existentes: 'Mapping[str, int]' = self.mapa.indice.ids_por_nome
+        pares: list[tuple[str, str]] = [(inicio, fim) for inicio, fim in self.pares if inicio in existentes and fim in existentes]
+        acertos_antes: int = Rota.cache_de_rotas.acertos
+
+        for inicio, fim in pares:
+            esperada: int | None = self._distancia_do_zero(inicio, fim)
+
+            for algoritmo in TestAlteracoesDoMapa.ALGORITMOS:
+                self.assertEqual(self._distancia_da_rota(inicio, fim, algoritmo), esperada, (inicio, fim, algoritmo))
+
+        self.assertGreater(Rota.cache_de_rotas.acertos, acertos_antes)
+
+        for nome in self.origens:
+            arvore: 'ArvoreDeCaminhosMinimos | None' = self.mapa.arvores_de_caminhos_minimos.buscar(existentes.get(nome, -1))
+            if arvore is None:
+                continue
+
+            do_zero: 'ArvoreDeCaminhosMinimos' = ArvoreDeCaminhosMinimos(self.mapa.indice, arvore.origem)
+            self.assertEqual(list(arvore.distancias), list(do_zero.distancias))
+
+            for cidade, antecessor in enumerate(arvore.antecessores):
+                if antecessor != -1:
+                    self.assertEqual(arvore.distancias[cidade], arvore.distancias[antecessor] + self.mapa.indice.distancia_da_estrada(antecessor, cidade))
+
+    def test_adicionar_estrada(self) -> None:
+        self.mapa.adicionar_estrada(self.pares[1][0], self.pares[1][1], 1)
+        self._conferir()
+
+    def test_encurtar_estrada(self) -> None:
+        cidade_a, cidade_b = self.caminho[len(self.caminho) // 2 - 1:len(self.caminho) // 2 + 1]
+        self.mapa.alterar_distancia_da_estrada(cidade_a, cidade_b, 1)
+        self._conferir()
+
+    def test_alongar_estrada(self) -> None:
+        cidade_a, cidade_b = self.caminho[len(self.caminho) // 2 - 1:len(self.caminho) // 2 + 1]
+        self.mapa.alterar_distancia_da_estrada(cidade_a, cidade_b, 10 ** 6)
+        self._conferir()
+
+    def test_remover_estrada(self) -> None:
+        cidade_a, cidade_b = self.caminho[len(self.caminho) // 2 - 1:len(self.caminho) // 2 + 1]
+        self.mapa.remover_estrada(cidade_a, cidade_b)
+        self._conferir()
+
+    def test_adicionar_cidade(self) -> None:
+        self.mapa.adicionar_cidade("Nova")
+        self.mapa.adicionar_estrada("Nova", self.pares[2][0], 1)
+        self.mapa.adicionar_estrada("Nova", self.pares[2][1], 1)
+        self._conferir()
+
+    def test_remover_cidade(self) -> None:
+        self.mapa.remover_cidade(self.caminho[len(self.caminho) // 2])
+        self._conferir()
+
+    def test_definir_coordenadas(self) -> None:
+        self.mapa.definir_coordenadas(self.caminho[len(self.caminho) // 2], {"x": 10.0 ** 6, "y": 10.0 ** 6})
+        self._conferir()
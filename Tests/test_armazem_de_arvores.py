@@ -0,0 +1,38 @@
+from unittest import TestCase
+from Models.ArmazemDeArvores import ArmazemDeArvores
+from Models.Mapa import Mapa
+
+class TestArmazemDeArvores(TestCase):
+    """
+    Testa o limite de memória do ArmazemDeArvores sobre o mapa padrão da Romênia.
+    """
+    def setUp(self) -> None:
+        self.mapa: 'Mapa' = Mapa()
+        tamanho_de_uma_arvore: int = self.mapa.arvore_de_caminhos_minimos("Arad").tamanho_em_bytes()
+
+        self.armazem: 'ArmazemDeArvores' = ArmazemDeArvores(self.mapa.indice, limite_de_bytes=2 * tamanho_de_uma_arvore)
+        self.mapa.arvores_de_caminhos_minimos = self.armazem
+
+    def test_pegar_descarta_a_arvore_usada_ha_mais_tempo(self) -> None:
+        arad, bucharest, sibiu = (self.mapa.pegar_id_da_cidade_pelo_nome(nome) for nome in ("Arad", "Bucharest", "Sibiu"))
+
+        self.armazem.pegar(arad)
+        self.armazem.pegar(bucharest)
+        self.armazem.pegar(arad)
+        self.armazem.pegar(sibiu)
+
+        self.assertIn(arad, self.armazem)
+        self.assertNotIn(bucharest, self.armazem)
+        self.assertEqual(self.armazem.remocoes, 1)
+
+    def test_acrescentar_cidade_respeita_o_limite(self) -> None:
+        arad, bucharest = self.mapa.pegar_id_da_cidade_pelo_nome("Arad"), self.mapa.pegar_id_da_cidade_pelo_nome("Bucharest")
+        self.armazem.pegar(arad)
+        self.armazem.pegar(bucharest)
+
+        self.mapa.adicionar_cidade("Nova")
+
+        self.assertLessEqual(self.armazem.bytes_em_uso, self.armazem.limite_de_bytes)
+        self.assertEqual(len(self.armazem), 1)
+        self.assertIn(bucharest, self.armazem)
+        self.assertEqual(self.armazem.bytes_em_uso, self.armazem.buscar(bucharest).tamanho_em_bytes())
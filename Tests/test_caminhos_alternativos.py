@@ -0,0 +1,55 @@
+from unittest import TestCase
+from Models.Mapa import Mapa
+from Models.Rota import Rota
+
+class TestCaminhosAlternativos(TestCase):
+    """
+    Testa as rotas alternativas do algoritmo de Yen no mapa padrão da Romênia, comparadas a todos os caminhos
+    sem repetição de cidades, enumerados por força bruta.
+    """
+    def setUp(self) -> None:
+        self.mapa: 'Mapa' = Mapa()
+
+    def _todos_os_caminhos(self, inicio: str, fim: str) -> list[tuple[tuple[str, ...], int]]:
+        caminhos: list[tuple[tuple[str, ...], int]] = []
+
+        def percorrer(caminho: list[str], distancia: int) -> None:
+            if caminho[-1] == fim:
+                caminhos.append((tuple(caminho), distancia))
+                return
+
+            for vizinha, distancia_ate_vizinha in self.mapa.todas_as_cidades[caminho[-1]].vizinhas.items():
+                if vizinha not in caminho:
+                    percorrer(caminho + [vizinha], distancia + distancia_ate_vizinha)
+
+        percorrer([inicio], 0)
+        return sorted(caminhos, key=lambda caminho: caminho[1])
+
+    def _conferir(self, alternativas: list[tuple[list[str], int]], todos: list[tuple[tuple[str, ...], int]]) -> None:
+        distancias: list[int] = [distancia for _, distancia in alternativas]
+        caminhos: list[tuple[str, ...]] = [tuple(caminho) for caminho, _ in alternativas]
+
+        self.assertEqual(distancias, sorted(distancias))
+        self.assertEqual(len(set(caminhos)), len(caminhos))
+        self.assertEqual(distancias, [distancia for _, distancia in todos[:len(alternativas)]])
+
+        distancia_por_caminho: dict[tuple[str, ...], int] = dict(todos)
+        for caminho, distancia in zip(caminhos, distancias):
+            self.assertEqual(distancia_por_caminho[caminho], distancia)
+
+    def test_alternativas_em_ordem_e_sem_repeticao(self) -> None:
+        todos: list[tuple[tuple[str, ...], int]] = self._todos_os_caminhos("Arad", "Bucharest")
+
+        for algoritmo in ("dijkstra", "a_estrela", "alt"):
+            alternativas: list[tuple[list[str], int]] = Rota(self.mapa, "Arad", "Bucharest", algoritmo=algoritmo).calcular_alternativas(10)
+
+            self.assertEqual(len(alternativas), 10)
+            self.assertEqual(alternativas[0][1], 418)
+            self._conferir(alternativas, todos)
+
+    def test_todas_as_alternativas(self) -> None:
+        todos: list[tuple[tuple[str, ...], int]] = self._todos_os_caminhos("Zerind", "Oradea")
+        alternativas: list[tuple[list[str], int]] = Rota(self.mapa, "Zerind", "Oradea").calcular_alternativas(len(todos) + 5)
+
+        self.assertEqual(len(alternativas), len(todos))
+        self._conferir(alternativas, todos)
@@ -0,0 +1,85 @@
+from io import StringIO
+from json import JSONDecodeError
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from Controllers.MapaController import MapaController
+from Models.Mapa import Mapa
+from Exceptions.CidadeNaoEncontradaError import CidadeNaoEncontradaError
+
+class TestCarregamentoDoMapa(TestCase):
+    """
+    Testa se o carregamento incremental do JSON do mapa chega ao mesmo resultado do carregamento completo,
+    que usa o `json.loads`, inclusive em arquivos com cidades repetidas ou com conteúdo após o objeto.
+    """
+    CIDADE_REPETIDA: str = (
+        '{"A": {"Vizinhos": {"B": 1}}, "B": {"Vizinhos": {}},'
+        ' "A": {"Vizinhos": {}, "Coordenada": {"x": 1, "y": 2}}}'
+    )
+
+    def setUp(self) -> None:
+        self.diretorio: 'TemporaryDirectory' = TemporaryDirectory()
+        self.addCleanup(self.diretorio.cleanup)
+
+    def _escrever(self, conteudo: str) -> str:
+        caminho_pro_json: str = path.join(self.diretorio.name, "mapa.json")
+        with open(caminho_pro_json, "w", encoding="utf-8") as arquivo:
+            arquivo.write(conteudo)
+        return caminho_pro_json
+
+    def _carregar_dos_dois_jeitos(self, conteudo: str) -> list['Mapa']:
+        caminho_pro_json: str = self._escrever(conteudo)
+        return [Mapa(caminho_pro_json, carregamento_incremental=incremental) for incremental in (False, True)]
+
+    def test_cidade_repetida_vale_a_ultima_declaracao(self) -> None:
+        for mapa in self._carregar_dos_dois_jeitos(TestCarregamentoDoMapa.CIDADE_REPETIDA):
+            self.assertEqual(mapa.lista_de_nomes_de_cidades, ["A", "B"])
+            self.assertEqual(list(mapa.indice.nomes), ["A", "B"])
+            self.assertEqual(dict(mapa.todas_as_cidades["A"].vizinhas), {})
+            self.assertEqual(dict(mapa.todas_as_cidades["B"].vizinhas), {})
+            self.assertEqual(mapa.todas_as_cidades["A"].ponto, (1.0, 2.0))
+
+    def test_vizinha_citada_so_por_declaracao_substituida(self) -> None:
+        for mapa in self._carregar_dos_dois_jeitos('{"A": {"Vizinhos": {"Z": 1}}, "A": {"Vizinhos": {}}}'):
+            self.assertEqual(mapa.lista_de_nomes_de_cidades, ["A"])
+
+    def test_distancias_divergentes_valem_as_da_cidade_seguinte(self) -> None:
+        conteudo: str = '{"A": {"Vizinhos": {"B": 1, "C": 4}}, "B": {"Vizinhos": {"A": 2}}, "C": {"Vizinhos": {}}}'
+
+        for mapa in self._carregar_dos_dois_jeitos(conteudo):
+            self.assertEqual(dict(mapa.todas_as_cidades["A"].vizinhas), {"B": 2, "C": 4})
+            self.assertEqual(dict(mapa.todas_as_cidades["B"].vizinhas), {"A": 2})
+            self.assertEqual(dict(mapa.todas_as_cidades["C"].vizinhas), {"A": 4})
+
+    def test_vizinha_nao_declarada_com_cidade_repetida(self) -> None:
+        caminho_pro_json: str = self._escrever(
+            '{"A": {"Vizinhos": {"B": 1}}, "A": {"Vizinhos": {"C": 2}}, "B": {"Vizinhos": {}}}'
+        )
+
+        for incremental in (False, True):
+            with self.assertRaisesRegex(CidadeNaoEncontradaError, "'C'"):
+                Mapa(caminho_pro_json, carregamento_incremental=incremental)
+
+    def test_conteudo_apos_o_objeto(self) -> None:
+        caminho_pro_json: str = self._escrever('{"A": {"Vizinhos": {}}} lixo')
+
+        for incremental in (False, True):
+            with self.assertRaises(JSONDecodeError):
+                Mapa(caminho_pro_json, carregamento_incremental=incremental)
+
+        # Conteúdo após um bloco inteiro de espaços, lido em outra chamada ao arquivo.
+        with self.assertRaises(JSONDecodeError):
+            list(MapaController._iterar_cidades_do_json(self._escrever('{}' + " " * 16 + "x"), tamanho_do_bloco=4))
+
+    def test_espacos_apos_o_objeto(self) -> None:
+        for mapa in self._carregar_dos_dois_jeitos('{"A": {"Vizinhos": {}}}\n \t\r\n'):
+            self.assertEqual(mapa.lista_de_nomes_de_cidades, ["A"])
+
+    def test_conteudo_invalido_nao_le_o_restante_do_arquivo(self) -> None:
+        cidades: str = ", ".join(f'"C{numero}": {{"Vizinhos": {{}}}}' for numero in range(1_000))
+        arquivo: 'StringIO' = StringIO('{"A": {"Vizinhos": {"B": tru}}, ' + cidades + "}")
+
+        with self.assertRaises(JSONDecodeError):
+            list(MapaController._iterar_cidades_do_objeto(arquivo, 64))
+
+        self.assertLessEqual(arquivo.tell(), 128)
@@ -0,0 +1,47 @@
+from unittest import TestCase
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from Controllers.CidadeController import CidadeController
+from Models.Cidade import Cidade
+from Models.Grafo import Grafo
+from Models.Mapa import Mapa
+
+class TestCoordenadasDaCidade(TestCase):
+    """
+    Testa se as coordenadas das cidades de um mapa carregado só são alteradas pelo Mapa, que as grava no
+    índice de adjacência lido pelo desenho e pelas heurísticas.
+    """
+    def setUp(self) -> None:
+        self.mapa: 'Mapa' = Mapa()
+
+    def test_cidade_ligada_ao_indice_nao_aceita_coordenadas(self) -> None:
+        cidade: 'Cidade' = self.mapa.pegar_cidade_pelo_nome("Arad")
+        ponto_original: tuple[float, float] = cidade.ponto
+
+        with self.assertRaises(TypeError):
+            CidadeController.definir_coordenadas(cidade, {"x": 1.0, "y": 2.0})
+
+        self.assertEqual(cidade.ponto, ponto_original)
+
+    def test_cidade_fora_do_indice_aceita_coordenadas(self) -> None:
+        cidade: 'Cidade' = Cidade("Nova")
+        CidadeController.definir_coordenadas(cidade, {"x": 1, "y": 2})
+
+        self.assertEqual(cidade.coordenadas, {"x": 1.0, "y": 2.0})
+
+    def test_mapa_grava_as_coordenadas_no_indice(self) -> None:
+        versao: int = self.mapa.versao
+        self.mapa.escala_admissivel_das_coordenadas()
+
+        self.mapa.definir_coordenadas("arad", {"x": 1.5, "y": -2.5})
+
+        identificador: int = self.mapa.pegar_id_da_cidade_pelo_nome("Arad")
+        self.assertEqual(self.mapa.pegar_cidade_pelo_nome("Arad").ponto, (1.5, -2.5))
+        self.assertEqual((self.mapa.indice.coordenadas_x[identificador], self.mapa.indice.coordenadas_y[identificador]), (1.5, -2.5))
+        self.assertEqual(self.mapa.versao, versao + 1)
+        self.assertIsNone(self.mapa._escala_admissivel)
+
+        grafo: 'Grafo' = Grafo(self.mapa, vetorizado=False)
+        plt.close("all")
+        self.assertEqual(grafo.atributos_do_desenho["pos"]["Arad"], (1.5, -2.5))
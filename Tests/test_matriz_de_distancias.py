@@ -0,0 +1,55 @@
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from Models.Mapa import Mapa
+from Models.MatrizDeDistancias import MatrizDeDistancias
+from Exceptions.CidadeNaoEncontradaError import CidadeNaoEncontradaError
+from Exceptions.MapaAlteradoError import MapaAlteradoError
+
+class TestMatrizDeDistancias(TestCase):
+    """
+    Testa a MatrizDeDistancias sobre o mapa padrão da Romênia, inclusive depois de alterações no mapa.
+    """
+    def setUp(self) -> None:
+        self.mapa: 'Mapa' = Mapa()
+        self.matriz: 'MatrizDeDistancias' = MatrizDeDistancias(self.mapa)
+
+    def test_distancia_no_mapa_padrao(self) -> None:
+        self.assertEqual(self.matriz.distancia("Zerind", "Bucharest"), 493)
+        self.assertEqual(self.matriz.distancia("zerind", "bucharest"), 493)
+
+    def test_cidade_inexistente(self) -> None:
+        with self.assertRaises(CidadeNaoEncontradaError):
+            self.matriz.distancia("Zerind", "Atlantida")
+
+    def test_remover_cidade_invalida_a_matriz(self) -> None:
+        self.mapa.remover_cidade("Arad")
+
+        with self.assertRaises(MapaAlteradoError):
+            self.matriz.distancia("Zerind", "Bucharest")
+        with self.assertRaises(MapaAlteradoError):
+            self.matriz.linha("Zerind")
+
+        self.assertEqual(MatrizDeDistancias(self.mapa).distancia("Zerind", "Bucharest"), 500)
+
+    def test_adicionar_cidade_invalida_a_matriz(self) -> None:
+        self.mapa.adicionar_cidade("Nova")
+
+        with self.assertRaises(MapaAlteradoError):
+            self.matriz.distancia("Nova", "Arad")
+        with self.assertRaises(MapaAlteradoError):
+            self.matriz.coluna("Arad")
+
+        with TemporaryDirectory() as diretorio:
+            with self.assertRaises(MapaAlteradoError):
+                self.matriz.exportar_csv(path.join(diretorio, "matriz.csv"))
+            with self.assertRaises(MapaAlteradoError):
+                self.matriz.exportar_npy(path.join(diretorio, "matriz.npy"))
+
+    def test_nomes_sao_uma_copia(self) -> None:
+        nomes: list[str] = list(self.matriz.nomes)
+
+        self.mapa.adicionar_cidade("Nova")
+
+        self.assertEqual(self.matriz.nomes, nomes)
+        self.assertEqual(len(self.matriz.nomes), self.matriz.distancias.shape[0])
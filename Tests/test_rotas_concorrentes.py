@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+from os import path
+from random import Random
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from Controllers.GeradorDeMapasController import GeradorDeMapasController
+from Exceptions.RotaNaoEncontradaError import RotaNaoEncontradaError
+from Models.CacheDeRotas import CacheDeRotas
+from Models.Mapa import Mapa
+from Models.Rota import Rota
+
+class TestRotasConcorrentes(TestCase):
+    """
+    Versão reduzida do Benchmarks.estresse_rotas_concorrentes: as mesmas rotas calculadas em série e em um
+    pool de threads, que compartilham um único Mapa e um cache de rotas pequeno, devem ter o mesmo resultado.
+    """
+    ALGORITMOS: tuple[str, ...] = ("dijkstra", "a_estrela", "bidirecional", "bidirecional_a_estrela", "alt", "hierarquia_de_contracao")
+
+    def setUp(self) -> None:
+        diretorio: 'TemporaryDirectory' = TemporaryDirectory()
+        self.addCleanup(diretorio.cleanup)
+
+        caminho_pro_json: str = path.join(diretorio.name, "geometrico.json")
+        GeradorDeMapasController.escrever_json(GeradorDeMapasController.gerar_geometrico_aleatorio(300, vizinhos_por_cidade=4), caminho_pro_json)
+        self.mapa: 'Mapa' = Mapa(caminho_pro_json)
+
+        cache_original: 'CacheDeRotas' = Rota.cache_de_rotas
+        Rota.cache_de_rotas = CacheDeRotas(capacidade=32)
+        self.addCleanup(setattr, Rota, "cache_de_rotas", cache_original)
+
+    def _calcular(self, consulta: tuple[str, str, str], usar_cache: bool) -> tuple[str, str, int] | str:
+        try:
+            rota: 'Rota' = Rota(self.mapa, *consulta[:2], algoritmo=consulta[2], usar_cache=usar_cache)
+            return rota.caminho[0], rota.caminho[-1], rota.distancia_percorrida
+        except RotaNaoEncontradaError as erro:
+            return type(erro).__name__
+
+    def test_rotas_em_paralelo_iguais_as_em_serie(self) -> None:
+        aleatorio: Random = Random(7)
+        pares: list[tuple[str, str]] = [tuple(aleatorio.sample(self.mapa.lista_de_nomes_de_cidades, 2)) for _ in range(40)]
+        # Os pares se repetem, em ambos os sentidos, para que o cache compartilhado seja consultado e esvaziado.
+        consultas: list[tuple[str, str, str]] = [
+            (*(par if aleatorio.random() < 0.5 else par[::-1]), aleatorio.choice(TestRotasConcorrentes.ALGORITMOS))
+            for par in aleatorio.choices(pares, k=400)
+        ]
+
+        em_serie: list[tuple[str, str, int] | str] = [self._calcular(consulta, False) for consulta in consultas]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            em_paralelo: list[tuple[str, str, int] | str] = list(executor.map(lambda consulta: self._calcular(consulta, True), consultas))
+
+        self.assertEqual(em_paralelo, em_serie)
+        self.assertGreater(Rota.cache_de_rotas.acertos, 0)
@@ -1,13 +1,17 @@
 from Models.Mapa import Mapa
 from Models.Rota import Rota
 from Models.Grafo import Grafo
+from Models.GrafoEmCamadas import GrafoEmCamadas
 from Views.HomeView import Home
+from Controllers.RegistroController import RegistroController
 
 def main():
+    RegistroController.ativar()
+
     mapa: 'Mapa' = Mapa()
 
-    grafo_inicial: 'Grafo' = Grafo(mapa)
-    grafo_inicial.exibir_grafo_em_png("grafo_inicial")
+    grafo_em_camadas: 'GrafoEmCamadas' = GrafoEmCamadas(mapa)
+    grafo_em_camadas.exibir_grafo_em_png("grafo_inicial")
 
     home: 'Home' = Home()
 
@@ -16,8 +20,9 @@ def main():
 
     rota: 'Rota' = Rota(mapa, nome_da_cidade_inicial, nome_da_cidade_final)
 
+    grafo_em_camadas.exibir_rota_em_png(rota.caminho, "grafo_finalizado")
+
     grafo: 'Grafo' = Grafo(mapa, rota.caminho)
-    grafo.exibir_grafo_em_png("grafo_finalizado")
     grafo.exibir_grafo_em_janela()
 
 if __name__ == "__main__":